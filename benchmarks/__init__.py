@@ -0,0 +1 @@
+"""Benchmarks for git viewer."""
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_code_search [--files 100000] [--worktree]
+# Gera uma arvore de N arquivos (git fast-import) e mede o `git grep` em
+# stream na revisao, em modo serial e paralelo: tempo ate o primeiro lote,
+# tempo total e vazao em MB/s. Com --worktree faz checkout e mede tambem os
+# arquivos locais.
+from __future__ import annotations
+
+import argparse
+import random
+import subprocess
+import tempfile
+import threading
+import time
+
+from viewer.core.code_search import GREP_WORKERS, GrepQuery, GrepResults, resolve_search_rev, run_code_search
+
+WORDS = ("alpha", "beta", "gamma", "delta", "render", "parse", "buffer", "token", "cache", "index")
+NEEDLE = "needle_marker"
+
+
+def _build_repo(path: str, files: int) -> int:
+    subprocess.run(["git", "init", "-q", path], check=True)
+    rng = random.Random(files)
+    chunks: list[bytes] = [
+        b"commit refs/heads/main\n",
+        b"committer Bench <bench@example.com> 1600000000 +0000\n",
+        b"data 7\narvore\n",
+    ]
+    total = 0
+    for index in range(files):
+        lines = [" ".join(rng.choice(WORDS) for _ in range(8)) for _ in range(12)]
+        if index % 97 == 0:
+            lines[rng.randrange(len(lines))] += f" {NEEDLE}"
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        total += len(data)
+        name = f"pkg{index % 50:02d}/mod{index // 50 % 40:02d}/file{index}.py"
+        chunks.append(f"M 100644 inline {name}\n".encode("utf-8"))
+        chunks.append(b"data %d\n%s\n" % (len(data), data))
+    subprocess.run(["git", "-C", path, "fast-import", "--quiet"], input=b"".join(chunks), check=True)
+    subprocess.run(["git", "-C", path, "symbolic-ref", "HEAD", "refs/heads/main"], check=True)
+    return total
+
+
+def _measure(repo: str, query: GrepQuery, parallel: bool, total_bytes: int, label: str) -> GrepResults:
+    results = GrepResults()
+    first: list[float] = []
+    started = time.perf_counter()
+
+    def on_batch(groups: list) -> None:
+        if not first:
+            first.append(time.perf_counter() - started)
+        results.add(groups)
+
+    run_code_search(repo, query, on_batch, threading.Event(), parallel=parallel)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label}: primeiro lote {first[0] * 1000 if first else 0:.0f} ms, total {elapsed:.2f}s, "
+        f"{total_bytes / 1e6 / elapsed:.0f} MB/s, {results.hit_count} ocorrencias em {len(results.files)} arquivos"
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--worktree", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as repo:
+        started = time.perf_counter()
+        total_bytes = _build_repo(repo, args.files)
+        print(f"arvore gerada em {time.perf_counter() - started:.1f}s: {args.files} arquivos, {total_bytes / 1e6:.0f} MB")
+        print(f"workers no modo paralelo: {GREP_WORKERS}")
+
+        query = GrepQuery(pattern=NEEDLE, rev=resolve_search_rev(repo, "HEAD"))
+        serial = _measure(repo, query, False, total_bytes, "revisao, serial")
+        parallel = _measure(repo, query, True, total_bytes, "revisao, paralelo")
+        print(f"mesmos resultados: {serial.files == parallel.files and serial.hit_lines == parallel.hit_lines}")
+        _measure(repo, GrepQuery(pattern="render parse", rev=query.rev), True, total_bytes, "revisao, paralelo, muitas")
+
+        if args.worktree:
+            subprocess.run(["git", "-C", repo, "checkout", "-q", "-f", "main"], check=True)
+            worktree = GrepQuery(pattern=NEEDLE)
+            _measure(repo, worktree, False, total_bytes, "arquivos locais, serial")
+            _measure(repo, worktree, True, total_bytes, "arquivos locais, paralelo")
+
+
+if __name__ == "__main__":
+    main()
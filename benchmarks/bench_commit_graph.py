@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_commit_graph [--branches 10000] [--depth 20]
+# Monta um historico sintetico com muitas branches concorrentes (commits
+# intercalados como no `git log` por data) e mede o layout de lanes pagina a
+# pagina e a consulta das trilhas de uma janela visivel.
+from __future__ import annotations
+
+import argparse
+import hashlib
+import statistics
+import time
+
+from viewer.core.commit_graph import CommitGraph
+from viewer.core.commit_store import CommitStore
+
+PAGE_SIZE = 1000
+WINDOW_ROWS = 60
+
+
+def _hash(name: str) -> str:
+    return hashlib.sha1(name.encode("utf-8")).hexdigest()
+
+
+def _history(branches: int, depth: int, trunk: int) -> CommitStore:
+    store = CommitStore()
+    # Octopus merge of the first branches on top of everything else.
+    store.append(_hash("octopus"), "octopus", "", tuple(_hash(f"b{index}-0") for index in range(8)))
+    for level in range(depth):
+        for branch in range(branches):
+            parent = f"b{branch}-{level + 1}" if level + 1 < depth else "t0"
+            store.append(_hash(f"b{branch}-{level}"), f"branch {branch} level {level}", "", (_hash(parent),))
+    for index in range(trunk):
+        parents = (_hash(f"t{index + 1}"),) if index + 1 < trunk else ()
+        store.append(_hash(f"t{index}"), f"trunk {index}", "", parents)
+    return store
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Layout incremental do grafo de commits.")
+    parser.add_argument("--branches", type=int, default=10_000)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--trunk", type=int, default=50_000)
+    args = parser.parse_args()
+    store = _history(args.branches, args.depth, args.trunk)
+    print(f"{len(store)} commits, {args.branches} branches concorrentes")
+
+    graph = CommitGraph()
+    page = CommitStore()
+    page_times: list[float] = []
+    total_start = time.perf_counter()
+    for start in range(0, len(store), PAGE_SIZE):
+        page.extend(store.take(range(start, min(start + PAGE_SIZE, len(store)))))
+        page_start = time.perf_counter()
+        graph.extend(page)
+        page_times.append((time.perf_counter() - page_start) * 1000)
+    total = time.perf_counter() - total_start
+    print(
+        f"layout: total {total:.2f} s | pagina p50 {statistics.median(page_times):.1f} ms"
+        f" | pior pagina {max(page_times):.1f} ms | largura {graph.width} lanes"
+    )
+
+    window_times: list[float] = []
+    tracks = 0
+    for top in range(0, len(graph) - WINDOW_ROWS, max(len(graph) // 200, 1)):
+        window_start = time.perf_counter()
+        visible = graph.tracks_between(top, top + WINDOW_ROWS)
+        for track in visible:
+            graph.track_points(track)
+        window_times.append((time.perf_counter() - window_start) * 1000)
+        tracks = max(tracks, len(visible))
+    print(
+        f"janela de {WINDOW_ROWS} linhas: p50 {statistics.median(window_times):.2f} ms"
+        f" | pior {max(window_times):.2f} ms | ate {tracks} trilhas visiveis"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_commit_list [--samples 200]
+# Com display mede o redraw real do VirtualListbox (Canvas + update); sem
+# display mede so a parte em Python (viewport + formatacao das linhas).
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import tkinter as tk
+from typing import Callable
+
+from viewer.core.virtual_list import ListViewport
+
+SIZES = (10_000, 100_000, 1_000_000)
+VISIBLE_ROWS = 40
+
+
+def _row_text(index: int) -> str:
+    return f"{index * 2654435761 % (1 << 28):07x} | Commit sintetico numero {index}"
+
+
+def _measure(step: Callable[[int], None], size: int, samples: int) -> list[float]:
+    rng = random.Random(size)
+    timings: list[float] = []
+    for sample in range(samples):
+        # Alterna saltos aleatorios (scrollbar) e passos curtos (roda do mouse).
+        target = rng.randrange(size) if sample % 2 else -1
+        start = time.perf_counter()
+        step(target)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _headless_step(size: int) -> Callable[[int], None]:
+    viewport = ListViewport()
+    viewport.set_visible(VISIBLE_ROWS)
+    viewport.set_size(size)
+
+    def step(target: int) -> None:
+        if target < 0:
+            viewport.scroll_by(3)
+        else:
+            viewport.scroll_to(target)
+        for index in viewport.visible_range():
+            _row_text(index)
+
+    return step
+
+
+def _tk_step(root: tk.Tk, size: int) -> Callable[[int], None]:
+    from viewer.ui.ui_virtual_list import VirtualListbox
+
+    for child in root.winfo_children():
+        child.destroy()
+    listbox = VirtualListbox(root, row_text=_row_text)
+    listbox.pack(fill="both", expand=True)
+    listbox.set_size(size)
+    root.update()
+
+    def step(target: int) -> None:
+        if target < 0:
+            listbox.yview("scroll", "3", "units")
+        else:
+            listbox.yview("moveto", str(target / size))
+        root.update_idletasks()
+
+    return step
+
+
+def _report(label: str, size: int, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:8} {size:>9} linhas: p50 {statistics.median(ordered):7.3f} ms | "
+        f"p95 {p95:7.3f} ms | max {ordered[-1]:7.3f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Latencia de rolagem da lista virtual de commits.")
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    try:
+        root: tk.Tk | None = tk.Tk()
+        root.geometry(f"600x{VISIBLE_ROWS * 18}")
+    except tk.TclError:
+        root = None
+        print("Sem display: medindo apenas viewport + formatacao.")
+    for size in SIZES:
+        _report("python", size, _measure(_headless_step(size), size, args.samples))
+        if root is not None:
+            _report("tk", size, _measure(_tk_step(root, size), size, args.samples))
+    if root is not None:
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_commit_store [--commits 1000000]
+# Compara memoria e tempo de montagem de list[CommitSummary] com CommitStore,
+# alimentando os dois a partir das mesmas paginas de `git log` sinteticas.
+from __future__ import annotations
+
+import argparse
+import gc
+import hashlib
+import time
+import tracemalloc
+from typing import Callable
+
+from viewer.core.commit_store import CommitStore
+from viewer.core.git_client import FIELD_SEP, RECORD_SEP, iter_log_records
+from viewer.core.models import CommitSummary
+
+PAGE_SIZE = 1000
+
+
+def _pages(total: int) -> list[str]:
+    pages: list[str] = []
+    for start in range(0, total, PAGE_SIZE):
+        records = []
+        for index in range(start, min(start + PAGE_SIZE, total)):
+            commit_hash = hashlib.sha1(index.to_bytes(8, "little")).hexdigest()
+            records.append(f"{commit_hash}{FIELD_SEP}Ajusta modulo {index % 977} para o caso {index}{RECORD_SEP}\n")
+        pages.append("".join(records))
+    return pages
+
+
+def _build_list(pages: list[str]) -> list[CommitSummary]:
+    summaries: list[CommitSummary] = []
+    for page in pages:
+        summaries.extend(CommitSummary(commit_hash=h, subject=s) for h, s, _author, _parents in iter_log_records(page))
+    return summaries
+
+
+def _build_store(pages: list[str]) -> CommitStore:
+    store = CommitStore()
+    for page in pages:
+        chunk = CommitStore()
+        for commit_hash, subject, _author, _parents in iter_log_records(page):
+            chunk.append(commit_hash, subject)
+        store.extend(chunk)
+    return store
+
+
+def _measure(label: str, build: Callable[[list[str]], object], pages: list[str]) -> object:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(pages)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:22} retido {current / 1e6:8.1f} MB | pico {peak / 1e6:8.1f} MB | montagem {elapsed:6.2f} s")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Memoria de list[CommitSummary] vs CommitStore.")
+    parser.add_argument("--commits", type=int, default=1_000_000)
+    args = parser.parse_args()
+    pages = _pages(args.commits)
+    print(f"{args.commits} commits em paginas de {PAGE_SIZE}")
+    summaries = _measure("list[CommitSummary]", _build_list, pages)
+    del summaries
+    store = _measure("CommitStore", _build_store, pages)
+    assert isinstance(store, CommitStore)
+    probe = hashlib.sha1((args.commits // 2).to_bytes(8, "little")).hexdigest()
+    start = time.perf_counter()
+    store.index_of(probe)
+    print(f"indice hash -> linha montado no primeiro lookup em {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    for _ in range(100_000):
+        store.index_of(probe)
+    lookup = (time.perf_counter() - start) / 100_000 * 1e6
+    print(f"CommitStore.nbytes {store.nbytes / 1e6:.1f} MB | index_of {lookup:.2f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_file_history [--revisions 5000] [--lines 400]
+# Gera um repositorio temporario (git fast-import) com um arquivo de N
+# revisoes e um rename no meio; mede o stream unico do historico, o passo
+# entre revisoes lendo do buffer e, para comparar, um `git show` por passo.
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+
+from viewer.core.file_history import FileHistory, stream_file_history
+
+SHOW_SAMPLES = 50
+
+
+def _build_repo(path: str, revisions: int, lines: int) -> str:
+    subprocess.run(["git", "init", "-q", path], check=True)
+    rng = random.Random(revisions)
+    content = [f"linha {index} valor {rng.random():.6f}" for index in range(lines)]
+    chunks: list[bytes] = []
+    name = "src/antigo.py"
+    for revision in range(revisions):
+        for _ in range(3):
+            content[rng.randrange(lines)] = f"linha alterada na revisao {revision} {rng.random():.6f}"
+        data = ("\n".join(content) + "\n").encode("utf-8")
+        message = f"revisao {revision}\n".encode("utf-8")
+        commands = []
+        if revision == revisions // 2:
+            commands.append(f"D {name}\n".encode("utf-8"))
+            name = "src/novo.py"
+        chunks.append(b"commit refs/heads/main\n")
+        chunks.append(f"committer Bench <bench@example.com> {1_600_000_000 + revision * 60} +0000\n".encode("utf-8"))
+        chunks.append(b"data %d\n%s" % (len(message), message))
+        chunks.extend(commands)
+        chunks.append(f"M 100644 inline {name}\n".encode("utf-8"))
+        chunks.append(b"data %d\n%s\n" % (len(data), data))
+    subprocess.run(["git", "-C", path, "fast-import", "--quiet"], input=b"".join(chunks), check=True)
+    subprocess.run(["git", "-C", path, "symbolic-ref", "HEAD", "refs/heads/main"], check=True)
+    return name
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--revisions", type=int, default=5000)
+    parser.add_argument("--lines", type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as repo:
+        started = time.perf_counter()
+        path = _build_repo(repo, args.revisions, args.lines)
+        print(f"repositorio gerado em {time.perf_counter() - started:.1f}s ({args.revisions} revisoes)")
+
+        history = FileHistory(path)
+        first_batch: list[float] = []
+        started = time.perf_counter()
+
+        def on_batch(_count: int) -> None:
+            if not first_batch:
+                first_batch.append(time.perf_counter() - started)
+
+        stream_file_history(repo, "HEAD", path, history, on_batch, threading.Event())
+        total = time.perf_counter() - started
+        renames = sum(1 for revision in history.revisions if revision.old_path)
+        print(f"stream: primeira revisao {first_batch[0] * 1000:.0f} ms, completo {total:.2f}s")
+        print(f"revisoes: {len(history)} (renames seguidos: {renames}), buffer {history.nbytes / 1e6:.1f} MB")
+
+        steps: list[float] = []
+        for index in range(len(history)):
+            step_start = time.perf_counter()
+            history.patch_text(index)
+            steps.append((time.perf_counter() - step_start) * 1000)
+        print(f"passo pelo buffer: p50 {statistics.median(steps):.3f} ms, p99 {_percentile(steps, 0.99):.3f} ms")
+
+        rng = random.Random(0)
+        shows: list[float] = []
+        for index in rng.sample(range(len(history)), min(SHOW_SAMPLES, len(history))):
+            revision = history.revisions[index]
+            step_start = time.perf_counter()
+            subprocess.run(
+                ["git", "-C", repo, "show", "--format=", revision.commit_hash, "--", revision.path],
+                check=True,
+                capture_output=True,
+            )
+            shows.append((time.perf_counter() - step_start) * 1000)
+        print(f"git show por passo: p50 {statistics.median(shows):.1f} ms, p99 {_percentile(shows, 0.99):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# Uso: python3 -m benchmarks.bench_repo_scan [--dirs 200000] [--fanout 8] [--root /caminho]
+# Gera uma arvore temporaria com N diretorios, alguns repositorios (.git
+# diretorio e gitfile) e pastas node_modules; mede a varredura fria, a
+# revalidacao pelo cache de mtime e, para comparar, um os.walk simples.
+# Com --root mede uma arvore existente (ex.: a pasta de projetos).
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from viewer.core.repo_scanner import DEFAULT_SCAN_IGNORES, SCAN_WORKERS, ScanCache, ScanStats, scan_repos
+
+
+def _build_tree(root: str, dirs: int, fanout: int) -> int:
+    # Breadth-first, so the tree has the requested size and a realistic depth.
+    queue = [root]
+    created = 0
+    repos = 0
+    index = 0
+    while created < dirs:
+        parent = queue[index]
+        index += 1
+        for child in range(fanout):
+            if created >= dirs:
+                break
+            path = os.path.join(parent, f"d{child}")
+            os.mkdir(path)
+            created += 1
+            queue.append(path)
+            if created % 997 == 0:
+                os.mkdir(os.path.join(path, ".git"))
+                repos += 1
+            elif created % 1999 == 0:
+                with open(os.path.join(path, ".git"), "w", encoding="utf-8") as handle:
+                    handle.write("gitdir: /tmp/principal/.git/worktrees/x\n")
+                repos += 1
+            elif created % 101 == 0:
+                os.makedirs(os.path.join(path, "node_modules", "pacote", "lib"))
+    return repos
+
+
+def _walk(root: str) -> int:
+    count = 0
+    for _dirpath, dirnames, _filenames in os.walk(root):
+        count += 1
+        dirnames[:] = [name for name in dirnames if name not in DEFAULT_SCAN_IGNORES and name != ".git"]
+    return count
+
+
+def _report(label: str, stats: ScanStats) -> None:
+    rate = stats.directories / stats.elapsed if stats.elapsed else 0.0
+    print(
+        f"{label}: {stats.directories} diretorios, {stats.repos} repositorios, "
+        f"{stats.cached} do cache, {stats.elapsed:.2f}s ({rate:,.0f} dir/s)"
+    )
+
+
+def _measure(root: str, workers: int) -> None:
+    cache = ScanCache()
+    _report(f"fria ({workers} threads)", scan_repos(root, cache=cache, workers=workers))
+    _report("revalidacao (cache)", scan_repos(root, cache=cache, workers=workers))
+    _report("1 thread, sem cache", scan_repos(root, workers=1))
+    started = time.perf_counter()
+    count = _walk(root)
+    print(f"os.walk: {count} diretorios, {time.perf_counter() - started:.2f}s")
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+    stats = scan_repos(root, cancel=cancel, workers=workers)
+    print(f"cancelada apos 50 ms: parou em {stats.elapsed * 1000:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dirs", type=int, default=200_000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=SCAN_WORKERS)
+    parser.add_argument("--root", default="")
+    args = parser.parse_args()
+
+    if args.root:
+        _measure(args.root, args.workers)
+        return
+    with tempfile.TemporaryDirectory() as root:
+        started = time.perf_counter()
+        repos = _build_tree(root, args.dirs, args.fanout)
+        print(f"arvore gerada em {time.perf_counter() - started:.1f}s ({args.dirs} diretorios, {repos} repositorios)")
+        _measure(root, args.workers)
+
+
+if __name__ == "__main__":
+    main()
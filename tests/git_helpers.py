@@ -0,0 +1,17 @@
+import os
+import subprocess
+
+# A fixed identity, so commits work without a global git config.
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t", GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+
+
+def git(repo: str, *args: str, stdin: str | None = None) -> str:
+    result = subprocess.run(
+        ["git", "-C", repo, *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=GIT_ENV,
+        check=True,
+    )
+    return result.stdout
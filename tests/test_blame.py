@@ -0,0 +1,90 @@
+import unittest
+
+from viewer.core.blame import BlameCache, BlameParser, BlameResult, carry_to_parent
+from viewer.core.models import BlameCommit, BlameRange
+
+A = "a" * 40
+B = "b" * 40
+C = "c" * 40
+ZERO = "0" * 40
+
+INCREMENTAL_OUTPUT = f"""{A} 1 1 2
+author Ana
+author-mail <ana@example.com>
+author-time 1700000000
+author-tz +0000
+summary primeiro
+previous {B} antigo.py
+filename novo.py
+{B} 3 3 1
+author Bob
+author-time 1600000000
+summary base
+boundary
+filename novo.py
+{A} 5 4 1
+filename novo.py
+"""
+
+
+class TestBlame(unittest.TestCase):
+    def test_parser_reads_incremental_groups(self) -> None:
+        parser = BlameParser()
+        ranges = [found for line in INCREMENTAL_OUTPUT.splitlines() if (found := parser.feed(line))]
+        self.assertEqual(
+            ranges,
+            [BlameRange(A, 1, 1, 2), BlameRange(B, 3, 3, 1), BlameRange(A, 5, 4, 1)],
+        )
+        self.assertEqual(parser.commits[A], BlameCommit("Ana", 1700000000, "primeiro", f"{B} antigo.py"))
+        self.assertEqual(parser.commits[B].previous, "")
+
+        result = BlameResult()
+        result.add(list(reversed(ranges)), parser.commits)
+        self.assertEqual(result.line_count(), 4)
+        self.assertEqual(result.range_at(2), BlameRange(A, 1, 1, 2))
+        self.assertEqual(result.range_at(4), BlameRange(A, 5, 4, 1))
+        self.assertIsNone(result.range_at(5))
+
+    def test_carry_to_parent_moves_untouched_lines(self) -> None:
+        # Child has 8 lines; it rewrote line 3 (one line for two) and added 7-8.
+        ranges = [
+            BlameRange(B, 1, 1, 2),
+            BlameRange(A, 3, 3, 1),
+            BlameRange(C, 4, 4, 3),
+            BlameRange(A, 7, 7, 2),
+        ]
+        diff_text = "\n".join(
+            [
+                "diff --git a/f b/f",
+                "@@ -3,2 +3 @@",
+                "-x",
+                "-y",
+                "+z",
+                "@@ -6,0 +7,2 @@",
+                "+n1",
+                "+n2",
+            ]
+        )
+        moved, spans = carry_to_parent(ranges, A, diff_text, 8)
+        self.assertEqual(moved, [BlameRange(B, 1, 1, 2), BlameRange(C, 4, 5, 3)])
+        self.assertEqual(spans, [(3, 4)])
+
+    def test_uncommitted_lines_are_dropped_for_head(self) -> None:
+        ranges = [BlameRange(ZERO, 1, 1, 1), BlameRange(B, 1, 2, 2)]
+        moved, spans = carry_to_parent(ranges, ZERO, "@@ -0,0 +1 @@\n+novo", 3)
+        self.assertEqual(moved, [BlameRange(B, 1, 1, 2)])
+        self.assertEqual(spans, [])
+
+    def test_cache_evicts_oldest(self) -> None:
+        cache = BlameCache(max_entries=2)
+        cache.put("a", BlameResult())
+        cache.put("b", BlameResult())
+        cache.get("a")
+        cache.put("c", BlameResult())
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
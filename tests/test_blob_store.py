@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from viewer.core.blob_store import TEXT_PAGE_MAX_BYTES, BlobFile
+
+
+class TestBlobFile(unittest.TestCase):
+    def _blob(self, data: bytes) -> BlobFile:
+        handle, path = tempfile.mkstemp()
+        os.write(handle, data)
+        os.close(handle)
+        blob = BlobFile(path)
+        self.addCleanup(os.remove, path)
+        self.addCleanup(blob.close)
+        return blob
+
+    def test_text_pages_walk_forward_and_back(self) -> None:
+        blob = self._blob(b"".join(f"linha {i}\n".encode() for i in range(10)))
+        text, end = blob.text_page(0, 4)
+        self.assertEqual(text.splitlines(), ["linha 0", "linha 1", "linha 2", "linha 3"])
+        text, second_end = blob.text_page(end, 4)
+        self.assertEqual(text.splitlines()[0], "linha 4")
+        self.assertEqual(blob.previous_text_offset(end, 4), 0)
+        self.assertEqual(blob.previous_text_offset(blob.size, 2), second_end)
+        self.assertEqual(blob.line_start(end + 3), end)
+        self.assertFalse(blob.is_binary())
+
+    def test_long_line_pages_in_bounded_steps(self) -> None:
+        blob = self._blob(b"x" * (4 * TEXT_PAGE_MAX_BYTES))
+        offset = pages = 0
+        while offset < blob.size:
+            text, end = blob.text_page(offset, 40)
+            self.assertEqual(len(text), end - offset)
+            self.assertEqual(end - offset, TEXT_PAGE_MAX_BYTES)
+            offset = end
+            pages += 1
+        self.assertEqual(pages, 4)
+        self.assertEqual(blob.line_start(100), 0)
+        self.assertEqual(blob.line_start(TEXT_PAGE_MAX_BYTES + 100), TEXT_PAGE_MAX_BYTES + 100)
+        self.assertEqual(blob.previous_text_offset(2 * TEXT_PAGE_MAX_BYTES, 40), TEXT_PAGE_MAX_BYTES)
+
+    def test_hex_page_aligns_rows(self) -> None:
+        blob = self._blob(bytes(range(40)))
+        text, end = blob.hex_page(20, 2)
+        lines = text.splitlines()
+        self.assertEqual(end, 40)
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("000000000010  10 11 12"))
+        self.assertTrue(lines[1].endswith("| !\"#$%&'|"))
+        self.assertTrue(blob.is_binary())
+
+    def test_empty_blob(self) -> None:
+        blob = self._blob(b"")
+        self.assertEqual(blob.text_page(0, 10), ("", 0))
+        self.assertEqual(blob.hex_page(0, 10), ("", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from viewer.core.branch_compare import CompareCache, CompareResult, parse_compare_numstat
+
+
+class TestBranchCompare(unittest.TestCase):
+    def test_numstat_totals_count_binary_files(self) -> None:
+        stats, totals = parse_compare_numstat("3\t1\tsrc/a.py\n-\t-\tlogo.png\n0\t7\tdocs/old name.md\n")
+        self.assertEqual([entry["path"] for entry in stats], ["src/a.py", "logo.png", "docs/old name.md"])
+        self.assertTrue(stats[1]["binary"])
+        self.assertEqual(totals, {"files": 3, "added": 3, "deleted": 8, "binary": 1})
+
+    def test_cache_keeps_only_finished_results(self) -> None:
+        cache = CompareCache(max_entries=1)
+        partial = CompareResult(origin="feat", dest="main", origin_sha="a" * 40, dest_sha="b" * 40, commits=[])
+        cache.put(partial)
+        self.assertIsNone(cache.get("a" * 40, "b" * 40))
+        partial.conflict_paths = []
+        cache.put(partial)
+        self.assertIs(cache.get("a" * 40, "b" * 40), partial)
+        cache.put(CompareResult(origin="x", dest="y", origin_sha="c" * 40, dest_sha="d" * 40, conflict_paths=["a.py"]))
+        self.assertIsNone(cache.get("a" * 40, "b" * 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
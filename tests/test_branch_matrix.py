@@ -0,0 +1,24 @@
+import unittest
+
+from viewer.core.branch_matrix import MatrixCache, MatrixRow
+
+
+class TestBranchMatrix(unittest.TestCase):
+    def test_cache_is_keyed_by_sha_pair(self) -> None:
+        cache = MatrixCache(max_entries=2)
+        row = MatrixRow(branch="feat", branch_sha="b" * 40, ahead=2, behind=1, conflict_paths=("a.py",))
+        cache.put("t" * 40, row)
+        renamed = cache.get("t" * 40, "feature", "b" * 40)
+        self.assertEqual(renamed, MatrixRow("feature", "b" * 40, 2, 1, ("a.py",)))
+        self.assertIsNone(cache.get("u" * 40, "feat", "b" * 40))
+
+    def test_cache_evicts_oldest_pair(self) -> None:
+        cache = MatrixCache(max_entries=2)
+        for sha in ("1", "2", "3"):
+            cache.put("t", MatrixRow(branch=sha, branch_sha=sha, ahead=0, behind=0, conflict_paths=()))
+        self.assertIsNone(cache.get("t", "1", "1"))
+        self.assertIsNotNone(cache.get("t", "3", "3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
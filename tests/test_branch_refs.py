@@ -0,0 +1,39 @@
+import unittest
+
+from viewer.core.branch_refs import build_for_each_ref_args, filter_branch_refs, parse_branch_refs
+
+SHA = "a" * 40
+OUTPUT = "\n".join(
+    [
+        f"refs/heads/main\x1fmain\x1f{SHA}\x1f1700000000\x1forigin/main\x1fahead 1\x1f*\x1f0 0",
+        f"refs/heads/feat/x\x1ffeat/x\x1f{SHA}\x1f1800000000\x1f\x1f\x1f \x1f3 1",
+        f"refs/remotes/origin/HEAD\x1forigin\x1f{SHA}\x1f1700000000\x1f\x1f\x1f \x1f0 0",
+        f"refs/remotes/origin/main\x1forigin/main\x1f{SHA}\x1f1600000000\x1f\x1f\x1f \x1f0 1",
+    ]
+)
+
+
+class TestBranchRefs(unittest.TestCase):
+    def test_parse_skips_remote_head_symref(self) -> None:
+        refs = parse_branch_refs(OUTPUT)
+        self.assertEqual([ref.name for ref in refs], ["main", "feat/x", "origin/main"])
+        self.assertTrue(refs[0].is_head)
+        self.assertEqual((refs[0].upstream, refs[0].upstream_track), ("origin/main", "ahead 1"))
+        self.assertEqual((refs[1].ahead, refs[1].behind), (3, 1))
+        self.assertTrue(refs[2].is_remote)
+
+    def test_parse_without_ahead_behind_field(self) -> None:
+        line = f"refs/heads/main\x1fmain\x1f{SHA}\x1f1700000000\x1f\x1f\x1f*"
+        (ref,) = parse_branch_refs(line)
+        self.assertIsNone(ref.ahead)
+        self.assertNotIn("ahead-behind", build_for_each_ref_args(False)[1])
+
+    def test_filter_and_sort_in_process(self) -> None:
+        refs = parse_branch_refs(OUTPUT)
+        self.assertEqual([ref.name for ref in filter_branch_refs(refs, "MAIN")], ["main", "origin/main"])
+        self.assertEqual([ref.name for ref in filter_branch_refs(refs, include_remotes=False)], ["feat/x", "main"])
+        self.assertEqual([ref.name for ref in filter_branch_refs(refs, sort="data")], ["feat/x", "main", "origin/main"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from git_helpers import git
+from viewer.core.cherry_pick import (
+    apply_commits,
+    cherry_pick_commits,
+    cherry_pick_in_progress,
+    count_todo,
+    parse_batch_check,
+    resume_cherry_pick,
+)
+
+
+def _commit(repo: str, name: str, content: str, message: str) -> str:
+    with open(os.path.join(repo, name), "w", encoding="utf-8") as handle:
+        handle.write(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD").strip()
+
+
+def _repo(tmp: str) -> str:
+    git(tmp, "init", "-q", "-b", "main")
+    # The cherry-picks run by the code under test do not get GIT_ENV.
+    git(tmp, "config", "user.name", "t")
+    git(tmp, "config", "user.email", "t@t")
+    _commit(tmp, "a.txt", "base\n", "base")
+    return tmp
+
+
+class TestCherryPick(unittest.TestCase):
+    def test_batch_check_splits_found_and_missing(self) -> None:
+        output = "a" * 40 + " commit\nzzz^{commit} missing\n" + "a" * 40 + " commit\n"
+        found, missing = parse_batch_check(output, ["a1", "zzz", "HEAD"])
+        self.assertEqual(found, ["a" * 40])
+        self.assertEqual(missing, ["zzz"])
+
+    def test_batch_check_counts_unanswered_tokens_as_missing(self) -> None:
+        found, missing = parse_batch_check("b" * 40 + " tree\n", ["b1", "c1"])
+        self.assertEqual((found, missing), ([], ["b1", "c1"]))
+
+    def test_todo_counts_pending_picks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "todo")
+            self.assertIsNone(count_todo(path))
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("pick 1234567 um\npick 89abcde dois\n# comentario\n\n")
+            self.assertEqual(count_todo(path), 2)
+
+    def test_apply_orders_selection_and_skips_merged_commits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = _repo(tmp)
+            git(repo, "checkout", "-q", "-b", "outra")
+            first = _commit(repo, "b.txt", "um\n", "um")
+            second = _commit(repo, "b.txt", "um\ndois\n", "dois")
+            third = _commit(repo, "b.txt", "um\ndois\ntres\n", "tres")
+            git(repo, "checkout", "-q", "main")
+            _commit(repo, "a.txt", "main\n", "main")
+            git(repo, "merge", "-q", "--no-ff", "-m", "merge um", first)
+
+            stages: list[str] = []
+            result = apply_commits(repo, [third, first, second], on_stage=stages.append)
+            self.assertEqual((result.applied, result.total, result.skipped), (2, 2, 1))
+            self.assertFalse(result.stopped)
+            self.assertEqual(git(repo, "log", "-3", "--format=%s").splitlines(), ["tres", "dois", "merge um"])
+            self.assertEqual(stages[-1], "Aplicando 2 commit(s)...")
+
+    def test_cancelled_sequence_is_aborted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = _repo(tmp)
+            git(repo, "checkout", "-q", "-b", "outra")
+            commits = [_commit(repo, f"f{index}.txt", f"{index}\n", f"c{index}") for index in range(120)]
+            git(repo, "checkout", "-q", "main")
+            start = git(repo, "rev-parse", "HEAD").strip()
+
+            cancel = threading.Event()
+            result = cherry_pick_commits(repo, commits, lambda _done, _total: cancel.set(), cancel)
+            self.assertTrue(result.cancelled and result.aborted)
+            self.assertEqual(result.applied, 0)
+            self.assertFalse(cherry_pick_in_progress(repo))
+            self.assertEqual(git(repo, "rev-parse", "HEAD").strip(), start)
+            self.assertEqual(git(repo, "status", "--porcelain"), "")
+
+    def test_cancelled_resume_keeps_the_applied_commits(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = _repo(tmp)
+            git(repo, "checkout", "-q", "-b", "outra")
+            commits = [_commit(repo, "a.txt", "outra\n", "conflito")]
+            commits += [_commit(repo, f"f{index}.txt", f"{index}\n", f"c{index}") for index in range(120)]
+            git(repo, "checkout", "-q", "main")
+            start = _commit(repo, "a.txt", "main\n", "main")
+            self.assertTrue(cherry_pick_commits(repo, commits).stopped)
+            with open(os.path.join(repo, "a.txt"), "w", encoding="utf-8") as handle:
+                handle.write("resolvido\n")
+            git(repo, "add", "a.txt")
+
+            cancel = threading.Event()
+            result = resume_cherry_pick(repo, "continue", lambda _done, _total: cancel.set(), cancel)
+            self.assertTrue(result.cancelled)
+            self.assertFalse(cherry_pick_in_progress(repo))
+            kept = int(git(repo, "rev-list", "--count", f"{start}..HEAD"))
+            self.assertEqual(kept, result.applied)
+            self.assertGreater(kept, 0)
+            self.assertEqual(git(repo, "status", "--porcelain"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from viewer.core.code_search import GrepParser, GrepResults
+
+REV = "f" * 40
+OUTPUT = (
+    f"{REV}:src/a.py\x0012\x00def render():\n"
+    f"{REV}:src/a.py\x0040\x00    render(x)\n"
+    f"{REV}:src/b.py\x003\x00render = None\n"
+).encode("utf-8")
+
+
+class TestCodeSearch(unittest.TestCase):
+    def test_parser_emits_whole_files_across_chunks(self) -> None:
+        parser = GrepParser(prefix=f"{REV}:")
+        groups = []
+        # Odd chunk size splits records and paths mid-way.
+        for start in range(0, len(OUTPUT), 7):
+            groups.extend(parser.feed(OUTPUT[start : start + 7]))
+        self.assertEqual(groups, [("src/a.py", [(12, "def render():"), (40, "    render(x)")])])
+        self.assertEqual(parser.close(), [("src/b.py", [(3, "render = None")])])
+
+    def test_results_rows_group_hits_under_files(self) -> None:
+        results = GrepResults()
+        results.add([("src/a.py", [(12, "def render():"), (40, "    render(x)")])])
+        results.add([("src/b.py", [(3, "render = None")])])
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results.hit_count, 3)
+        self.assertEqual(results.row_text(0), "src/a.py (2)")
+        self.assertEqual(results.row_text(4), "         3: render = None")
+        self.assertEqual(results.location(0), ("src/a.py", None))
+        self.assertEqual(results.location(2), ("src/a.py", 40))
+        self.assertEqual(results.location(4), ("src/b.py", 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
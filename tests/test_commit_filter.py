@@ -0,0 +1,95 @@
+import hashlib
+import unittest
+
+from viewer.core.commit_filter import author_matcher, filter_loaded, narrows
+from viewer.core.commit_store import CommitStore
+from viewer.core.models import CommitFilters, CommitInfo
+
+
+def _hash(index: int) -> str:
+    return hashlib.sha1(str(index).encode("utf-8")).hexdigest()
+
+
+def _details(index: int, subject: str, body: str) -> CommitInfo:
+    return CommitInfo(
+        commit_hash=_hash(index),
+        author="",
+        date="",
+        subject=subject,
+        body=body,
+        file_stats=(),
+        total_added=0,
+        total_deleted=0,
+    )
+
+
+class TestNarrows(unittest.TestCase):
+    def test_appending_text_or_adding_author_narrows(self) -> None:
+        base = CommitFilters(text="fix", path="app.py")
+        self.assertTrue(narrows(base, CommitFilters(text="fix login", path="app.py")))
+        self.assertTrue(narrows(base, CommitFilters(text="fix", author="ana", path="app.py")))
+        self.assertTrue(narrows(CommitFilters(author="an"), CommitFilters(author="ana.s")))
+
+    def test_widening_or_other_fields_go_back_to_git(self) -> None:
+        base = CommitFilters(text="fix login")
+        self.assertFalse(narrows(base, CommitFilters(text="fix")))
+        self.assertFalse(narrows(base, CommitFilters(text="fix login", path="app.py")))
+        self.assertFalse(narrows(CommitFilters(), CommitFilters(author="^ana")))
+        self.assertFalse(narrows(CommitFilters(author="ana"), CommitFilters(author="bob")))
+        # Diff searches (-S/-G) never narrow from loaded subjects.
+        self.assertFalse(narrows(CommitFilters(), CommitFilters(text="fix", search_mode="S")))
+        self.assertFalse(narrows(CommitFilters(text="f", search_mode="G"), CommitFilters(text="fix", search_mode="G")))
+
+    def test_author_dot_matches_any_character(self) -> None:
+        matcher = author_matcher("ana.s")
+        assert matcher is not None
+        self.assertIsNotNone(matcher.search("Ana <ana_s@x.io>"))
+        self.assertIsNone(author_matcher("ana*"))
+
+    def test_author_is_literal_next_to_a_message_text(self) -> None:
+        # --fixed-strings for the text makes git match --author literally.
+        matcher = author_matcher("ana.s", literal=True)
+        assert matcher is not None
+        self.assertIsNone(matcher.search("Ana <ana_s@x.io>"))
+        self.assertIsNotNone(matcher.search("Ana <ana.s@x.io>"))
+        self.assertTrue(narrows(CommitFilters(author="a.b"), CommitFilters(text="fix", author="a.bc")))
+        self.assertTrue(narrows(CommitFilters(), CommitFilters(text="fix", author="^ana")))
+        self.assertTrue(narrows(CommitFilters(author="a.b"), CommitFilters(text="fix", author="a.b")))
+        self.assertTrue(narrows(CommitFilters(text="f", author="a*"), CommitFilters(text="fix", author="a*b")))
+
+
+class TestFilterLoaded(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = CommitStore()
+        self.store.append(_hash(0), "fix login", "Ana <ana@x.io>")
+        self.store.append(_hash(1), "docs", "Bob <bob@x.io>")
+        self.store.append(_hash(2), "refactor", "Ana <ana@x.io>")
+        self.store.append(_hash(3), "tests", "Ana <ana@x.io>")
+
+    def test_author_only_is_decided_locally(self) -> None:
+        result = filter_loaded(self.store, CommitFilters(), CommitFilters(author="Ana"), {})
+        self.assertEqual(result.rows, [0, 2, 3])
+        self.assertEqual(result.pending, [])
+
+    def test_text_uses_subjects_then_cached_bodies(self) -> None:
+        details = {
+            _hash(2): _details(2, "refactor", "also fixes login"),
+            _hash(3): _details(3, "tests", "nothing here"),
+        }
+        result = filter_loaded(self.store, CommitFilters(), CommitFilters(text="login", author="Ana"), details)
+        self.assertEqual(result.rows, [0, 2])
+        # Row 1 fails the author and row 3 has a cached body, so nothing waits on git.
+        self.assertEqual(result.pending, [])
+        result = filter_loaded(self.store, CommitFilters(), CommitFilters(text="login"), details)
+        self.assertEqual(result.pending, [1])
+
+    def test_author_rechecked_when_text_makes_it_literal(self) -> None:
+        store = CommitStore()
+        store.append(_hash(0), "fix", "axb <a@x.io>")
+        store.append(_hash(1), "fix", "a.b <a@x.io>")
+        result = filter_loaded(store, CommitFilters(author="a.b"), CommitFilters(text="fix", author="a.b"), {})
+        self.assertEqual(result.rows, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
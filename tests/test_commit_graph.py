@@ -0,0 +1,76 @@
+import hashlib
+import unittest
+
+from viewer.core.commit_graph import CHECKPOINT_ROWS, CommitGraph
+from viewer.core.commit_store import CommitStore
+
+
+def _hash(name: object) -> str:
+    return hashlib.sha1(str(name).encode("utf-8")).hexdigest()
+
+
+def _store(rows: list[tuple[str, tuple[str, ...]]]) -> CommitStore:
+    store = CommitStore()
+    for name, parents in rows:
+        store.append(_hash(name), name, "", tuple(_hash(parent) for parent in parents))
+    return store
+
+
+class TestCommitGraph(unittest.TestCase):
+    def test_merge_and_octopus_lanes(self) -> None:
+        # m merges a+b; o is an octopus over c, d, e which all sit on base.
+        graph = CommitGraph()
+        graph.extend(
+            _store(
+                [
+                    ("m", ("a", "b")),
+                    ("a", ("o",)),
+                    ("b", ("o",)),
+                    ("o", ("c", "d", "e")),
+                    ("c", ("base",)),
+                    ("d", ("base",)),
+                    ("e", ("base",)),
+                    ("base", ()),
+                ]
+            )
+        )
+        self.assertEqual([graph.node_lane(row) for row in range(8)], [0, 0, 1, 0, 0, 1, 2, 0])
+        self.assertEqual(graph.width, 3)
+        self.assertEqual(graph.open_lanes, 0)
+        # m -> b leaves lane 0 and runs down lane 1 straight into b.
+        self.assertEqual(graph.track_points(1), [(0, 0), (1, 1), (1, 1), (2, 1)])
+
+    def test_pages_never_relayout_earlier_rows(self) -> None:
+        rows = []
+        for index in range(2000):
+            parents = (f"c{index + 1}",) if index % 7 else (f"c{index + 1}", f"side{index}")
+            rows.append((f"c{index}", parents))
+            if not index % 7:
+                rows.append((f"side{index}", (f"c{index + 3}",)))
+        store = _store(rows)
+        whole = CommitGraph()
+        whole.extend(store)
+        paged = CommitGraph()
+        page = CommitStore()
+        for start in range(0, len(store), 300):
+            page.extend(store.take(range(start, min(start + 300, len(store)))))
+            before = [paged.node_lane(row) for row in range(len(paged))]
+            paged.extend(page)
+            self.assertEqual([paged.node_lane(row) for row in range(len(before))], before)
+        self.assertEqual(
+            [paged.node_lane(row) for row in range(len(paged))],
+            [whole.node_lane(row) for row in range(len(whole))],
+        )
+        # Checkpointed lookups find exactly the tracks a full scan would.
+        for top in (0, CHECKPOINT_ROWS - 3, 1000, len(store) - 40):
+            bottom = top + 40
+            expected = []
+            for track in range(len(whole._track_starts)):
+                points = whole.track_points(track)
+                if points[0][0] <= bottom and points[-1][0] >= top:
+                    expected.append(track)
+            self.assertEqual(sorted(whole.tracks_between(top, bottom)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
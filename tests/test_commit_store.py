@@ -0,0 +1,62 @@
+import hashlib
+import unittest
+
+from viewer.core.commit_store import CommitStore
+from viewer.core.models import CommitSummary
+
+
+def _hash(index: int) -> str:
+    return hashlib.sha1(str(index).encode("utf-8")).hexdigest()
+
+
+class TestCommitStore(unittest.TestCase):
+    def test_rows_round_trip(self) -> None:
+        store = CommitStore([CommitSummary(_hash(0), "primeiro"), CommitSummary(_hash(1), "acentuação ✓")])
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store[1], CommitSummary(_hash(1), "acentuação ✓"))
+        self.assertEqual(store[-2].subject, "primeiro")
+        self.assertEqual(store.short_hash_at(1), _hash(1)[:7])
+        self.assertEqual([summary.commit_hash for summary in store], [_hash(0), _hash(1)])
+        with self.assertRaises(IndexError):
+            store[2]
+
+    def test_bulk_extend_keeps_hash_index(self) -> None:
+        store = CommitStore()
+        for page_start in range(0, 3000, 500):
+            page = CommitStore()
+            for index in range(page_start, page_start + 500):
+                page.append(_hash(index), f"commit {index}")
+            store.extend(page)
+        self.assertEqual(len(store), 3000)
+        for index in (0, 499, 500, 1777, 2999):
+            self.assertEqual(store.index_of(_hash(index)), index)
+            self.assertEqual(store.subject_at(index), f"commit {index}")
+        self.assertIsNone(store.index_of(_hash(3000)))
+        self.assertIsNone(store.index_of("not-a-hash"))
+        self.assertIn(_hash(42), store)
+
+    def test_duplicate_hash_keeps_first_row(self) -> None:
+        store = CommitStore()
+        store.append(_hash(1), "a")
+        store.append(_hash(1), "b")
+        self.assertEqual(store.index_of(_hash(1)), 0)
+        with self.assertRaises(ValueError):
+            store.append("ab" * 32, "sha256 misturado")
+
+    def test_subject_and_author_search_then_take(self) -> None:
+        store = CommitStore()
+        store.append(_hash(0), "abc", "Ana")
+        store.append(_hash(1), "def", "Bob")
+        store.append(_hash(2), "cdefix", "Ana")
+        # "cd" spans rows 0 and 1 in the pool and must not match there.
+        self.assertEqual(store.subject_rows("cd"), [2])
+        self.assertEqual(store.subject_rows("def"), [1, 2])
+        self.assertEqual(store.author_rows(lambda name: name == "Ana"), [0, 2])
+        subset = store.take([2, 1])
+        self.assertEqual([summary.subject for summary in subset], ["cdefix", "def"])
+        self.assertEqual(subset.author_at(0), "Ana")
+        self.assertEqual(subset.index_of(_hash(1)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
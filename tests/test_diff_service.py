@@ -0,0 +1,111 @@
+import queue
+import threading
+import time
+import unittest
+from typing import Callable
+
+from viewer.core.diff_service import DiffService
+
+
+class _Loop:
+    # Stand-in for the Tk main loop: callbacks queued by workers run on ticks.
+    def __init__(self) -> None:
+        self.pending: queue.Queue[Callable[[], None]] = queue.Queue()
+        self.ticks = 0
+
+    def dispatch(self, callback: Callable[[], None]) -> None:
+        self.pending.put(callback)
+
+    def run_until(self, predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            while not self.pending.empty():
+                self.pending.get_nowait()()
+            self.ticks += 1
+            time.sleep(0.005)
+
+
+class TestDiffService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = _Loop()
+        self.service = DiffService(self.loop.dispatch)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+
+    def test_ui_loop_keeps_ticking_during_slow_load(self) -> None:
+        results: list[str] = []
+
+        def slow_loader() -> str:
+            time.sleep(0.3)
+            return "patch"
+
+        start = time.monotonic()
+        self.service.request("patch", "key", slow_loader, results.append)
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.loop.run_until(lambda: bool(results))
+        self.assertEqual(results, ["patch"])
+        self.assertGreater(self.loop.ticks, 20)
+
+    def test_stale_request_is_not_delivered(self) -> None:
+        results: list[str] = []
+
+        def loader(value: str, delay: float) -> Callable[[], str]:
+            def run() -> str:
+                time.sleep(delay)
+                return value
+
+            return run
+
+        self.service.request("patch", "a", loader("a", 0.1), results.append)
+        self.service.request("patch", "b", loader("b", 0.0), results.append)
+        self.loop.run_until(lambda: not self.service.is_loading("a") and not self.service.is_loading("b"))
+        self.loop.run_until(lambda: False, timeout=0.05)
+        self.assertEqual(results, ["b"])
+
+    def test_queued_request_is_cancelled(self) -> None:
+        service = DiffService(self.loop.dispatch, max_workers=1)
+        release = threading.Event()
+        calls: list[str] = []
+        results: list[str] = []
+
+        def blocker() -> str:
+            release.wait(2)
+            return "blocker"
+
+        def loader(value: str) -> Callable[[], str]:
+            def run() -> str:
+                calls.append(value)
+                return value
+
+            return run
+
+        service.request("other", "blocker", blocker, results.append)
+        service.request("patch", "a", loader("a"), results.append)
+        service.request("patch", "b", loader("b"), results.append)
+        release.set()
+        self.loop.run_until(lambda: "b" in results)
+        service.shutdown()
+        self.assertEqual(calls, ["b"])
+
+    def test_prefetch_is_shared_with_request(self) -> None:
+        calls: list[int] = []
+        prefetched: list[str] = []
+        results: list[str] = []
+        gate = threading.Event()
+
+        def loader() -> str:
+            calls.append(1)
+            gate.wait(2)
+            return "patch"
+
+        self.service.prefetch("key", loader, prefetched.append)
+        self.service.request("patch", "key", loader, results.append)
+        gate.set()
+        self.loop.run_until(lambda: bool(results) and bool(prefetched))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["patch"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,31 @@
+import os
+import random
+import tempfile
 import unittest
 
-from viewer.core.diff_utils import build_read_mode_diff, parse_diff_data
+from git_helpers import git
+from viewer.core.diff_utils import (
+    align_diff_rows,
+    build_patch_for_line,
+    build_patch_for_lines,
+    parse_diff_data,
+)
+from viewer.core.models import AlignedRow, DiffData, DiffLineInfo
+
+
+def _mutate(rng: random.Random, lines: list[str]) -> list[str]:
+    result = list(lines)
+    for _ in range(rng.randint(1, 6)):
+        op = rng.choice(("add", "remove", "replace"))
+        pos = rng.randint(0, len(result))
+        if op == "add" or not result:
+            result[pos:pos] = [rng.choice("abcxyz") for _ in range(rng.randint(1, 3))]
+        elif op == "remove":
+            del result[min(pos, len(result) - 1) : pos + rng.randint(1, 2)]
+        else:
+            index = min(pos, len(result) - 1)
+            result[index] = rng.choice("ABCXYZ")
+    return result
 
 
 class TestDiffUtils(unittest.TestCase):
@@ -21,12 +46,118 @@ class TestDiffUtils(unittest.TestCase):
         lines = data.hunks[0].lines
         self.assertEqual([line.line_type for line in lines], ["removed", "added", "context", "added"])
 
-    def test_build_read_mode_diff(self) -> None:
-        diff_text = "\n".join(f"line {idx}" for idx in range(20))
-        preview, truncated = build_read_mode_diff(diff_text, threshold=10, max_lines=6)
-        self.assertTrue(truncated)
-        self.assertIn("linhas omitidas", preview)
-        self.assertTrue(preview.endswith("\n"))
+
+class TestBuildPatchForLines(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = self._tmp.name
+        git(self.repo, "init", "-q")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, lines: list[str]) -> None:
+        with open(os.path.join(self.repo, "file.txt"), "w", encoding="utf-8") as handle:
+            handle.write("".join(f"{line}\n" for line in lines))
+
+    def _reset(self, old: list[str], new: list[str]) -> None:
+        self._write(old)
+        git(self.repo, "add", "file.txt")
+        git(self.repo, "commit", "-q", "--allow-empty", "-m", "base")
+        self._write(new)
+
+    def _apply(self, patch: str, reverse: bool) -> None:
+        args = ["apply", "--recount", "--unidiff-zero", "--cached"]
+        if reverse:
+            args.append("-R")
+        git(self.repo, *args, stdin=patch)
+
+    def _index(self) -> str:
+        return git(self.repo, "show", ":file.txt")
+
+    def _changed_lines(self, diff_text: str) -> tuple[DiffData, list[DiffLineInfo]]:
+        data = parse_diff_data(diff_text)
+        return data, [info for hunk in data.hunks for info in hunk.lines if info.line_type != "context"]
+
+    def test_range_matches_line_by_line(self) -> None:
+        rng = random.Random(1234)
+        for _ in range(25):
+            old = [rng.choice("abcdxyz") for _ in range(rng.randint(0, 12))]
+            new = _mutate(rng, old)
+            self._reset(old, new)
+            data, changed = self._changed_lines(git(self.repo, "diff", "--unified=0", "--", "file.txt"))
+            if not changed:
+                continue
+            self._apply(build_patch_for_lines(data, changed) or "", reverse=False)
+            self.assertEqual(self._index(), "".join(f"{line}\n" for line in new))
+            git(self.repo, "reset", "-q", "--", "file.txt")
+
+            subset = [info for info in changed if rng.random() < 0.6] or changed[:1]
+
+            self._apply(build_patch_for_lines(data, subset) or "", reverse=False)
+            range_index = self._index()
+
+            git(self.repo, "reset", "-q", "--", "file.txt")
+            for info in reversed(subset):
+                self._apply(build_patch_for_line(data, info) or "", reverse=False)
+            self.assertEqual(range_index, self._index(), msg=f"old={old} new={new} subset={subset}")
+
+            git(self.repo, "add", "file.txt")
+            staged, staged_changed = self._changed_lines(
+                git(self.repo, "diff", "--cached", "--unified=0", "--", "file.txt")
+            )
+            unstage = [info for info in staged_changed if rng.random() < 0.6] or staged_changed[:1]
+            self._apply(build_patch_for_lines(staged, unstage, reverse=True) or "", reverse=True)
+            range_index = self._index()
+
+            git(self.repo, "add", "file.txt")
+            for info in reversed(unstage):
+                self._apply(build_patch_for_line(staged, info, reverse=True) or "", reverse=True)
+            self.assertEqual(range_index, self._index(), msg=f"old={old} new={new} unstage={unstage}")
+
+    def test_full_selection_stages_whole_file(self) -> None:
+        self._reset(["a", "b", "c", "d"], ["a", "B", "X", "c", "e"])
+        data, changed = self._changed_lines(git(self.repo, "diff", "--unified=0", "--", "file.txt"))
+        self._apply(build_patch_for_lines(data, changed) or "", reverse=False)
+        self.assertEqual(self._index(), "a\nB\nX\nc\ne\n")
+
+    def test_context_only_selection_returns_none(self) -> None:
+        data = parse_diff_data("@@ -1,1 +1,1 @@\n line\n")
+        self.assertIsNone(build_patch_for_lines(data, data.hunks[0].lines))
+
+
+class TestAlignDiffRows(unittest.TestCase):
+    def test_runs_are_paired_per_hunk(self) -> None:
+        diff = "\n".join(
+            [
+                "@@ -1,5 +1,5 @@",
+                " a",
+                "-b",
+                "-c",
+                "+B",
+                " d",
+                "-e",
+                "+E",
+                "+F",
+                "@@ -20,0 +21,1 @@",
+                "+novo",
+            ]
+        )
+        rows = align_diff_rows(parse_diff_data(diff))
+        self.assertEqual(
+            rows,
+            [
+                AlignedRow("hunk", 0, "@@ -1,5 +1,5 @@", 0, "@@ -1,5 +1,5 @@"),
+                AlignedRow("context", 1, "a", 1, "a"),
+                AlignedRow("changed", 2, "b", 2, "B"),
+                AlignedRow("removed", 3, "c", 0, ""),
+                AlignedRow("context", 4, "d", 3, "d"),
+                AlignedRow("changed", 5, "e", 4, "E"),
+                AlignedRow("added", 0, "", 5, "F"),
+                AlignedRow("hunk", 0, "@@ -20,0 +21,1 @@", 0, "@@ -20,0 +21,1 @@"),
+                AlignedRow("added", 0, "", 21, "novo"),
+            ],
+        )
 
 
 if __name__ == "__main__":
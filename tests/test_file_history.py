@@ -0,0 +1,66 @@
+import io
+import unittest
+
+from viewer.core.file_history import FileHistory, FileHistoryCache, FileHistoryParser
+
+A = "a" * 40
+B = "b" * 40
+C = "c" * 40
+
+LOG_OUTPUT = (
+    f"\x1e{A}\x1fAna\x1f2024-01-02 10:00:00 +0000\x1fajusta\0\n"
+    ":100644 100644 1111111 2222222 M\0novo.py\0\0diff --git a/novo.py b/novo.py\n"
+    "--- a/novo.py\n"
+    "+++ b/novo.py\n"
+    "@@ -1 +1 @@\n"
+    "-x\n"
+    "+y\n"
+    f"\x1e{B}\x1fBob\x1f2024-01-01 10:00:00 +0000\x1frenomeia\0\n"
+    ":100644 100644 3333333 1111111 R090\0antigo.py\0novo.py\0\0diff --git a/antigo.py b/novo.py\n"
+    "similarity index 90%\n"
+    "rename from antigo.py\n"
+    "rename to novo.py\n"
+    f"\x1e{C}\x1fAna\x1f2023-12-31 10:00:00 +0000\x1fcria\0\n"
+    ":000000 100644 0000000 3333333 A\0antigo.py\0\0diff --git a/antigo.py b/antigo.py\n"
+    "+\x1e linha com separador\n"
+).encode("utf-8")
+
+
+class TestFileHistory(unittest.TestCase):
+    def test_parser_indexes_patches_per_revision(self) -> None:
+        history = FileHistory("novo.py")
+        self.addCleanup(history.close)
+        parser = FileHistoryParser(history.append)
+        for line in io.BytesIO(LOG_OUTPUT):
+            parser.feed(line)
+        parser.close()
+
+        self.assertEqual([revision.commit_hash for revision in history.revisions], [A, B, C])
+        self.assertEqual([revision.status for revision in history.revisions], ["M", "R", "A"])
+        renamed = history.revisions[1]
+        self.assertEqual((renamed.old_path, renamed.path, renamed.subject), ("antigo.py", "novo.py", "renomeia"))
+        self.assertEqual(history.revisions[2].path, "antigo.py")
+        self.assertTrue(history.patch_text(0).startswith("diff --git a/novo.py b/novo.py\n"))
+        self.assertTrue(history.patch_text(0).endswith("+y\n"))
+        self.assertIn("rename from antigo.py", history.patch_text(1))
+        self.assertTrue(history.patch_text(2).endswith("\n+\x1e linha com separador\n"))
+
+    def test_cache_budget_evicts_least_recent(self) -> None:
+        histories = []
+        for index in range(3):
+            history = FileHistory(f"f{index}")
+            self.addCleanup(history.close)
+            history.buffer.write(b"x" * 1000)
+            histories.append(history)
+        cache = FileHistoryCache(max_bytes=2500)
+        cache.put("a", histories[0])
+        cache.put("b", histories[1])
+        cache.get("a")
+        cache.put("c", histories[2])
+        self.assertIs(cache.get("a"), histories[0])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.nbytes, 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
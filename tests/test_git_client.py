@@ -1,6 +1,9 @@
+import sys
+import tempfile
 import unittest
 
-from viewer.core.git_client import parse_numstat
+from viewer.core.git_client import build_log_args, parse_numstat, run_git_buffered
+from viewer.core.models import CommitFilters
 
 
 class TestParseNumstat(unittest.TestCase):
@@ -28,5 +31,29 @@ class TestParseNumstat(unittest.TestCase):
         self.assertEqual(stats[2].deleted, 1)
 
 
+class TestRunGitBuffered(unittest.TestCase):
+    def test_large_stderr_does_not_block_stdout(self) -> None:
+        # A shell alias that fills the stderr pipe before writing stdout.
+        script = "import sys; sys.stderr.write('x' * (1 << 20)); sys.stdout.write('fim\\n')"
+        alias = f'alias.ruido=!"{sys.executable}" -c "{script}"'
+        with tempfile.TemporaryDirectory() as repo:
+            buffer = run_git_buffered(repo, ["-c", alias, "ruido"])
+        self.assertEqual(buffer.text(), "fim\n")
+        buffer.close()
+
+
+class TestBuildLogArgs(unittest.TestCase):
+    def test_search_mode_moves_text_to_pickaxe(self) -> None:
+        message = build_log_args(50, 0, CommitFilters(text="token", author="ana"))
+        self.assertIn("--grep=token", message)
+        self.assertIn("--all-match", message)
+
+        content = build_log_args(50, 0, CommitFilters(text="token", author="ana", search_mode="S"))
+        self.assertIn("-Stoken", content)
+        self.assertNotIn("--grep=token", content)
+        self.assertNotIn("--all-match", content)
+        self.assertIn("-Gto+ken", build_log_args(50, 0, CommitFilters(text="to+ken", search_mode="G")))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from viewer.core.highlight import HighlightCache, highlight_diff_lines, lexer_for_path
+
+
+class TestHighlight(unittest.TestCase):
+    def test_lexer_registry(self) -> None:
+        self.assertEqual(lexer_for_path("src/app.PY").name, "python")  # type: ignore[union-attr]
+        self.assertEqual(lexer_for_path("web/index.tsx").name, "javascript")  # type: ignore[union-attr]
+        self.assertIsNone(lexer_for_path("README"))
+
+    def test_python_tokens(self) -> None:
+        lexer = lexer_for_path("a.py")
+        assert lexer is not None
+        line = 'def f(): return "x # y" + 10  # fim'
+        kinds = [(line[start:end], kind) for start, end, kind in lexer.lex_line(line)]
+        self.assertEqual(
+            kinds,
+            [("def", "keyword"), ("return", "keyword"), ('"x # y"', "string"), ("10", "number"), ("# fim", "comment")],
+        )
+
+    def test_diff_lines_skip_prefix_and_meta(self) -> None:
+        lexer = lexer_for_path("a.py")
+        assert lexer is not None
+        text = "\n".join(["    10 - import os", "... (5 linhas omitidas) ...", "    11 + pass", "    12   x = 1"])
+        spans = highlight_diff_lines(lexer, 40, text)
+        self.assertEqual(
+            spans,
+            ((40, ((9, 15, "keyword"),)), (42, ((9, 13, "keyword"),)), (43, ((13, 14, "number"),))),
+        )
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        cache = HighlightCache(max_entries=2)
+        cache.put("a", ())
+        cache.put("b", ())
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", ())
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
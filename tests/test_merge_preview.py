@@ -0,0 +1,40 @@
+import unittest
+
+from viewer.core.merge_preview import ConflictPredictor, parse_legacy_merge_tree, parse_write_tree_output
+
+LEGACY = """changed in both
+  base   100644 df967b96a579e45a18b8251732d16804b2e56a55 f
+  our    100644 cbb9aa30a6518a54df04c4d7b62e5c5e2864eafc f
+  their  100644 c7747099cf9e073babc68f52cdfb4d280ba5689f f
+@@ -1 +1,5 @@
++<<<<<<< .our
+ mainline
++=======
++feat
++>>>>>>> .their
+added in remote
+  their  100644 d00491fd7e5bb6fa28c517a0bb32b8b506539d4d notes.md
+@@ -0,0 +1,2 @@
++doc
++<<<<<<< exemplo
+"""
+
+
+class TestMergePreview(unittest.TestCase):
+    def test_write_tree_output_lists_conflicted_paths(self) -> None:
+        output = "t" * 40 + "\0src/a.py\0docs/b c.md\0\0" + "1\0src/a.py\0CONFLICT (contents)\0msg\n\0"
+        self.assertEqual(parse_write_tree_output(output), ["src/a.py", "docs/b c.md"])
+        self.assertEqual(parse_write_tree_output("t" * 40 + "\0"), [])
+
+    def test_legacy_output_ignores_markers_in_content(self) -> None:
+        self.assertEqual(parse_legacy_merge_tree(LEGACY), ["f"])
+
+    def test_cached_by_sha_triple(self) -> None:
+        predictor = ConflictPredictor(max_entries=1)
+        predictor._store(("b", "o", "t"), ["f"])
+        self.assertEqual(predictor.predict("/nao/existe", "b", "o", "t"), ["f"])
+        self.assertIsNone(predictor.cached("b", "t", "o"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+from viewer.core import patch_buffer
+from viewer.core.diff_utils import PatchRenderState, advance_render_state, render_patch_lines
+from viewer.core.patch_buffer import PatchBuffer, build_read_mode_view
+
+
+class _FakeText:
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+
+    def insert(self, _index: str, text: str, *_tags: object) -> None:
+        self.chunks.append(text)
+
+
+def _sample_patch(hunks: int) -> str:
+    lines = ["diff --git a/f.txt b/f.txt", "--- a/f.txt", "+++ b/f.txt"]
+    for index in range(hunks):
+        start = index * 10 + 1
+        lines.append(f"@@ -{start},2 +{start},2 @@")
+        lines.extend([f"-old {index}", f"+new {index}", f" same {index}"])
+    return "\n".join(lines) + "\n"
+
+
+class TestPatchBuffer(unittest.TestCase):
+    def test_lines_round_trip(self) -> None:
+        text = "alpha\nbeta\ngama sem quebra"
+        buffer = PatchBuffer.from_text(text)
+        self.assertEqual(buffer.line_count, 3)
+        self.assertEqual(buffer.lines(1, 3), ["beta", "gama sem quebra"])
+        self.assertEqual(buffer.text(), text)
+
+    def test_chunked_writes_spill_to_disk(self) -> None:
+        with mock.patch.object(patch_buffer, "SPOOL_MAX_BYTES", 64):
+            buffer = PatchBuffer()
+            payload = "".join(f"linha {index}\n" for index in range(200)).encode("utf-8")
+            for pos in range(0, len(payload), 7):
+                buffer.write(payload[pos : pos + 7])
+            buffer.finish()
+            self.assertTrue(buffer._file._rolled)
+        self.assertEqual(buffer.line_count, 200)
+        self.assertEqual(buffer.lines(150, 152), ["linha 150", "linha 151"])
+
+    def test_read_mode_view_expands_in_chunks(self) -> None:
+        buffer = PatchBuffer.from_text("".join(f"{index}\n" for index in range(100)))
+        view = build_read_mode_view(buffer, threshold=50, max_lines=10)
+        assert view is not None
+        self.assertEqual(view.head_lines(), [str(index) for index in range(5)])
+        self.assertEqual(view.tail_lines(), [str(index) for index in range(95, 100)])
+        self.assertEqual(view.take_chunk(40), [str(index) for index in range(5, 45)])
+        self.assertEqual(view.omitted, 50)
+        self.assertEqual(len(view.take_chunk(1000)), 50)
+        self.assertEqual(view.omitted, 0)
+        self.assertIsNone(build_read_mode_view(buffer, threshold=200, max_lines=10))
+
+    def test_advance_state_matches_render(self) -> None:
+        lines = _sample_patch(30).splitlines()
+        rendered = PatchRenderState()
+        render_patch_lines(_FakeText(), lines, rendered, show_file_headers=False, word_diff=False)  # type: ignore[arg-type]
+        skipped = PatchRenderState()
+        advance_render_state(skipped, lines, word_diff=False)
+        self.assertEqual(rendered, skipped)
+
+    def test_tail_anchor_gives_the_same_tail_state(self) -> None:
+        lines = _sample_patch(30).splitlines()
+        buffer = PatchBuffer.from_text(_sample_patch(30))
+        view = build_read_mode_view(buffer, threshold=10, max_lines=20)
+        assert view is not None
+        full = PatchRenderState()
+        advance_render_state(full, lines[: view.tail_start], word_diff=False)
+        with mock.patch.object(patch_buffer, "SCAN_CHUNK_LINES", 3):
+            anchor = view.tail_anchor()
+            self.assertTrue(lines[anchor].startswith("@@"))
+            self.assertGreater(anchor, view.tail_start - 5)
+            scanned = PatchRenderState()
+            advance_render_state(scanned, lines[: view.head_end], word_diff=False)
+            for chunk in buffer.line_chunks(anchor, view.tail_start, size=3):
+                advance_render_state(scanned, chunk, word_diff=False)
+        self.assertEqual(scanned, full)
+        self.assertIsNone(buffer.rfind_line((b"@@",), 0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
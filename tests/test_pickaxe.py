@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from git_helpers import git
+from viewer.core.commit_store import CommitStore
+from viewer.core.models import CommitFilters
+from viewer.core.pickaxe import SEARCH_MODE_PICKAXE, PickaxeCache, PickaxeResult, resolve_tip, search_content
+
+
+def _commit(repo: str, content: str, message: str) -> None:
+    with open(os.path.join(repo, "arquivo.txt"), "w", encoding="utf-8") as handle:
+        handle.write(content)
+    git(repo, "add", "arquivo.txt")
+    git(repo, "commit", "-q", "-m", message)
+
+
+def _hashes(store: CommitStore) -> list[str]:
+    return [summary.commit_hash for summary in store]
+
+
+class TestPickaxe(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo = self._tmp.name
+        git(self.repo, "init", "-q")
+        _commit(self.repo, "inicio\n", "um")
+        _commit(self.repo, "inicio\nagulha\n", "dois")
+        _commit(self.repo, "inicio\nagulha\nfim\n", "tres")
+        self.filters = CommitFilters(text="agulha", search_mode=SEARCH_MODE_PICKAXE)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _search(self, previous: PickaxeResult | None = None, cancel: threading.Event | None = None) -> PickaxeResult:
+        tip = resolve_tip(self.repo, self.filters)
+        return search_content(self.repo, self.filters, tip, previous, lambda *_args: None, cancel or threading.Event())
+
+    def _log_s(self) -> list[str]:
+        return git(self.repo, "log", "-Sagulha", "--format=%H").split()
+
+    def test_full_scan_matches_log_s(self) -> None:
+        result = self._search()
+        self.assertTrue(result.complete)
+        self.assertEqual(result.scanned, 3)
+        self.assertEqual(_hashes(result.matches), self._log_s())
+
+    def test_resume_scans_only_new_commits(self) -> None:
+        first = self._search()
+        _commit(self.repo, "inicio\nfim\n", "quatro")
+        resumed = self._search(first)
+        self.assertEqual(resumed.scanned, 1)
+        self.assertEqual(_hashes(resumed.matches), self._log_s())
+
+    def test_rewritten_history_scans_everything(self) -> None:
+        first = self._search()
+        git(self.repo, "reset", "-q", "--hard", "HEAD~2")
+        _commit(self.repo, "inicio\noutra\n", "dois bis")
+        result = self._search(first)
+        self.assertEqual(result.scanned, 2)
+        self.assertEqual(_hashes(result.matches), self._log_s())
+        self.assertEqual(_hashes(result.matches), [])
+
+    def test_cancelled_search_is_incomplete(self) -> None:
+        cancel = threading.Event()
+        cancel.set()
+        result = self._search(cancel=cancel)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.scanned, 0)
+
+
+class TestPickaxeCache(unittest.TestCase):
+    def test_keeps_only_complete_results_and_evicts_oldest(self) -> None:
+        cache = PickaxeCache(max_entries=2)
+        cache.put("parcial", PickaxeResult(tip="a", matches=CommitStore(), scanned=1))
+        self.assertIsNone(cache.get("parcial"))
+        for key in ("a", "b"):
+            cache.put(key, PickaxeResult(tip=key, matches=CommitStore(), scanned=1, complete=True))
+        cache.get("a")
+        cache.put("c", PickaxeResult(tip="c", matches=CommitStore(), scanned=1, complete=True))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(len(cache), 2)
+
+    def test_filters_key_as_used_by_the_history_tab(self) -> None:
+        cache = PickaxeCache()
+        key = ("/repo", CommitFilters(text="agulha", search_mode=SEARCH_MODE_PICKAXE))
+        result = PickaxeResult(tip="a", matches=CommitStore(), scanned=1, complete=True)
+        cache.put(key, result)
+        self.assertIs(cache.get(("/repo", CommitFilters(text="agulha", search_mode=SEARCH_MODE_PICKAXE))), result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import time
+import unittest
+
+from viewer.core.repo_dashboard import (
+    BUSY_INTERVAL,
+    IDLE_INTERVAL_MAX,
+    RepoDashboard,
+    RepoStatus,
+    next_interval,
+    parse_status_v2,
+)
+
+OUTPUT = (
+    "# branch.oid b211215b62816f12a285e0408762384ef9920945\n"
+    "# branch.head main\n"
+    "# branch.upstream origin/main\n"
+    "# branch.ab +2 -1\n"
+    "1 .M N... 100644 100644 100644 d004 d004 src/app.py\n"
+    "2 R. N... 100644 100644 100644 aaaa aaaa R100 novo.py\tvelho.py\n"
+    "? notas.txt\n"
+)
+
+
+class TestRepoDashboard(unittest.TestCase):
+    def test_porcelain_v2_branch_and_counts(self) -> None:
+        status = parse_status_v2("/repo", OUTPUT, 10.0)
+        self.assertEqual((status.branch, status.upstream), ("main", "origin/main"))
+        self.assertEqual((status.ahead, status.behind, status.changes), (2, 1, 3))
+        self.assertTrue(status.busy)
+
+    def test_quiet_repo_backs_off_until_it_changes(self) -> None:
+        clean = RepoStatus(path="/repo", branch="main")
+        self.assertEqual(next_interval(None, clean, 0.0), BUSY_INTERVAL)
+        interval = BUSY_INTERVAL
+        for _ in range(10):
+            interval = next_interval(clean, clean, interval)
+        self.assertEqual(interval, IDLE_INTERVAL_MAX)
+        moved = RepoStatus(path="/repo", branch="feature")
+        self.assertEqual(next_interval(clean, moved, interval), BUSY_INTERVAL)
+
+    def test_only_due_repos_are_polled(self) -> None:
+        now = [100.0]
+        dashboard = RepoDashboard(clock=lambda: now[0])
+        dashboard.record(RepoStatus(path="/a"))
+        self.assertEqual(dashboard.due_paths(["/a", "/b"]), ["/b"])
+        self.assertEqual(dashboard.due_paths(["/a", "/b"], force=True), ["/a", "/b"])
+        now[0] += BUSY_INTERVAL
+        self.assertEqual(dashboard.due_paths(["/a"]), ["/a"])
+        dashboard.retain(["/b"])
+        self.assertIsNone(dashboard.get("/a"))
+
+    def test_shutdown_forgets_polls_in_flight(self) -> None:
+        release = threading.Event()
+        results: list[RepoStatus] = []
+
+        def loader(path: str) -> RepoStatus:
+            release.wait(5)
+            return RepoStatus(path=path)
+
+        dashboard = RepoDashboard(workers=1, loader=loader)
+        self.assertEqual(dashboard.poll(["/a", "/b"], results.append), 2)
+        self.assertEqual(dashboard.due_paths(["/a", "/b"]), [])
+        dashboard.shutdown()
+        release.set()
+        self.assertEqual(dashboard.due_paths(["/a", "/b"]), ["/a", "/b"])
+        time.sleep(0.05)
+        self.assertEqual(results, [])
+        self.assertIsNone(dashboard.get("/a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
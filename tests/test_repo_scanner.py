@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from viewer.core.repo_scanner import (
+    KIND_REPO,
+    KIND_SUBMODULE,
+    KIND_WORKTREE,
+    ScanCache,
+    compile_ignore_rules,
+    gitfile_kind,
+    parse_ignore_rules,
+    scan_repos,
+)
+
+
+class TestRepoScanner(unittest.TestCase):
+    def test_ignore_rules_take_names_and_globs(self) -> None:
+        rules = parse_ignore_rules("node_modules, *.egg-info\nbuild, node_modules")
+        self.assertEqual(rules, ("node_modules", "*.egg-info", "build"))
+        is_ignored = compile_ignore_rules(rules)
+        self.assertTrue(is_ignored("node_modules"))
+        self.assertTrue(is_ignored("pacote.egg-info"))
+        self.assertFalse(is_ignored("src"))
+
+    def test_gitfile_kind(self) -> None:
+        self.assertEqual(gitfile_kind("gitdir: /repo/.git/worktrees/feature\n"), KIND_WORKTREE)
+        self.assertEqual(gitfile_kind("gitdir: ../.git/modules/lib\n"), KIND_SUBMODULE)
+        self.assertEqual(gitfile_kind("outra coisa"), "")
+
+    def test_scan_finds_repos_prunes_ignored_and_revalidates(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "app", ".git"))
+            os.makedirs(os.path.join(root, "app", "lib"))
+            with open(os.path.join(root, "app", "lib", ".git"), "w", encoding="utf-8") as handle:
+                handle.write("gitdir: ../.git/modules/lib\n")
+            os.makedirs(os.path.join(root, "web", "node_modules", "pacote", ".git"))
+            cache = ScanCache()
+            found: list[tuple[str, str]] = []
+            stats = scan_repos(root, ("node_modules",), cache, lambda repo: found.append((repo.path, repo.kind)))
+            self.assertEqual(
+                sorted(found),
+                [(os.path.join(root, "app"), KIND_REPO), (os.path.join(root, "app", "lib"), KIND_SUBMODULE)],
+            )
+            self.assertEqual((stats.repos, stats.cached), (2, 0))
+
+            again = scan_repos(root, ("node_modules",), cache)
+            self.assertEqual(again.cached, again.directories)
+            os.makedirs(os.path.join(root, "novo", ".git"))
+            os.utime(root, ns=(0, 1))
+            changed = scan_repos(root, ("node_modules",), cache)
+            self.assertEqual(changed.repos, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+
+from git_helpers import git
+from viewer.core.commit_store import CommitStore
+from viewer.core.models import CommitFilters
+from viewer.core.repo_session import RepoSession, RepoSessionCache
+
+
+def _session(path: str, patch: str = "") -> RepoSession:
+    return RepoSession(
+        repo_path=path,
+        refs_signature=(),
+        filters=CommitFilters(),
+        commits=CommitStore(),
+        commit_window=None,
+        commit_graph=None,
+        no_more_commits=True,
+        full_patch_cache={"abc": patch} if patch else {},
+    )
+
+
+class TestRepoSession(unittest.TestCase):
+    def test_least_recent_session_is_evicted_past_the_count(self) -> None:
+        cache = RepoSessionCache(max_sessions=2)
+        for path in ("/a", "/b", "/c"):
+            cache.put(_session(path))
+        self.assertNotIn("/a", cache)
+        self.assertIsNotNone(cache.take("/b"))
+        self.assertNotIn("/b", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_byte_budget_evicts_and_take_releases_bytes(self) -> None:
+        base = _session("/vazio").nbytes
+        cache = RepoSessionCache(max_bytes=1000 + 2 * base)
+        cache.put(_session("/a", "x" * 600))
+        cache.put(_session("/b", "y" * 300))
+        self.assertEqual(cache.nbytes, 900 + 2 * base)
+        cache.put(_session("/c", "z" * 300))
+        self.assertNotIn("/a", cache)
+        cache.take("/b")
+        self.assertEqual(cache.nbytes, 300 + base)
+        cache.put(_session("/d", "w" * 2000))
+        self.assertNotIn("/d", cache)
+
+    def test_signature_moves_with_a_new_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as repo:
+            git(repo, "init", "-q")
+            git(repo, "commit", "-q", "--allow-empty", "-m", "um")
+            cache = RepoSessionCache()
+            before = cache.signature(repo)
+            self.assertEqual(cache.signature(repo), before)
+            git(repo, "commit", "-q", "--allow-empty", "-m", "dois")
+            self.assertNotEqual(cache.signature(repo), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from viewer.core.models import TreeEntry
+from viewer.core.revision_tree import TreeCache, is_binary, parse_ls_tree
+
+BLOB = "a" * 40
+TREE = "b" * 40
+SUB = "c" * 40
+OUTPUT = (
+    f"100644 blob {BLOB}     120\tzeta.txt\0"
+    f"040000 tree {TREE}       -\tsrc\0"
+    f"160000 commit {SUB}       -\tvendor\0"
+    f"100644 blob {BLOB}       7\talpha name.md\0"
+).encode("utf-8")
+
+
+class TestRevisionTree(unittest.TestCase):
+    def test_parse_ls_tree_lists_directories_first(self) -> None:
+        entries = parse_ls_tree(OUTPUT)
+        self.assertEqual([entry.name for entry in entries], ["src", "alpha name.md", "vendor", "zeta.txt"])
+        self.assertEqual(entries[0], TreeEntry("src", "tree", TREE, "040000", -1))
+        self.assertEqual(entries[1].size, 7)
+        self.assertEqual(entries[2].kind, "commit")
+        self.assertEqual(entries[2].size, -1)
+
+    def test_cache_evicts_oldest_trees_by_entry_count(self) -> None:
+        cache = TreeCache(max_entries=4)
+        entry = TreeEntry("f", "blob", BLOB, "100644", 1)
+        cache.put("t1", [entry, entry])
+        cache.put("t2", [entry])
+        self.assertIsNotNone(cache.get("t1"))
+        cache.put("t3", [entry, entry])
+        self.assertIsNone(cache.get("t2"))
+        self.assertIsNotNone(cache.get("t1"))
+        self.assertEqual(len(cache), 2)
+
+    def test_is_binary_probes_for_nul(self) -> None:
+        self.assertFalse(is_binary(b"texto\n"))
+        self.assertTrue(is_binary(b"PNG\0\x01"))
+
+
+if __name__ == "__main__":
+    unittest.main()
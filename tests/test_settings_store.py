@@ -0,0 +1,21 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from viewer.core.repo_scanner import DEFAULT_SCAN_IGNORES
+from viewer.core.settings_store import load_settings, save_settings
+
+
+class TestSettingsStore(unittest.TestCase):
+    def test_scan_ignore_defaults_only_when_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "settings.json"
+            path.write_text(json.dumps({"theme": "dark"}), encoding="utf-8")
+            self.assertEqual(load_settings(path)["scan_ignore"], list(DEFAULT_SCAN_IGNORES))
+            save_settings(path, {"scan_ignore": []})
+            self.assertEqual(load_settings(path)["scan_ignore"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from viewer.core.stash_store import StashDiffCache, parse_stash_log
+
+OUTPUT = (
+    "\x1e" + "a" * 40 + "\x1fstash@{0}\x1fWIP on main: b211215 main\x1f1700000000\n\n"
+    "1\t0\tf\n-\t-\tlogo.png\n"
+    "\x1e" + "b" * 40 + "\x1fstash@{1}\x1fOn main: experimento\x1f1690000000\n\n"
+    "4\t2\tsrc/a.py\n"
+)
+
+
+class TestStashStore(unittest.TestCase):
+    def test_log_yields_stats_per_stash(self) -> None:
+        first, second = parse_stash_log(OUTPUT)
+        self.assertEqual((first.ref, first.commit_hash), ("stash@{0}", "a" * 40))
+        self.assertEqual((first.files, first.added, first.deleted, first.binary), (2, 1, 0, 1))
+        self.assertEqual(second.label, "stash@{1}: On main: experimento (1 arquivo(s), +4/-2)")
+
+    def test_diff_cache_is_keyed_by_commit(self) -> None:
+        cache = StashDiffCache(max_entries=1)
+        cache.put("a" * 40, "diff a")
+        self.assertEqual(cache.get("a" * 40), "diff a")
+        cache.put("b" * 40, "diff b")
+        self.assertIsNone(cache.get("a" * 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from viewer.core.virtual_list import ListViewport
+
+
+class TestListViewport(unittest.TestCase):
+    def test_scroll_is_clamped_to_content(self) -> None:
+        viewport = ListViewport()
+        viewport.set_visible(10)
+        viewport.set_size(1_000_000)
+        self.assertTrue(viewport.moveto(0.5))
+        self.assertEqual(viewport.visible_range(), range(500_000, 500_010))
+        viewport.scroll_by(10_000_000)
+        self.assertEqual(viewport.top, 999_990)
+        self.assertEqual(viewport.fractions()[1], 1.0)
+        viewport.set_size(5)
+        self.assertEqual(viewport.top, 0)
+        self.assertEqual(viewport.visible_range(), range(0, 5))
+
+    def test_see_keeps_index_on_screen(self) -> None:
+        viewport = ListViewport()
+        viewport.set_visible(10)
+        viewport.set_size(100)
+        viewport.see(25)
+        self.assertEqual(viewport.top, 16)
+        viewport.see(3)
+        self.assertEqual(viewport.top, 3)
+        self.assertFalse(viewport.see(7))
+        self.assertEqual(viewport.index_at(2), 5)
+        self.assertIsNone(viewport.index_at(-1))
+
+    def test_extended_selection(self) -> None:
+        viewport = ListViewport()
+        viewport.set_size(20)
+        viewport.select(4)
+        viewport.select(7, "extend")
+        self.assertEqual(viewport.curselection(), (4, 5, 6, 7))
+        viewport.select(2, "extend")
+        self.assertEqual(viewport.curselection(), (2, 3, 4))
+        viewport.select(10, "toggle")
+        viewport.select(3, "toggle")
+        self.assertEqual(viewport.curselection(), (2, 4, 10))
+        viewport.set_size(4)
+        self.assertEqual(viewport.curselection(), (2,))
+
+
+if __name__ == "__main__":
+    unittest.main()
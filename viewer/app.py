@@ -5,29 +5,70 @@ import argparse
 import os
 import threading
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import messagebox
 from tkinter import ttk
 
-from .core.diff_utils import build_read_mode_diff
+from .core.blame import BlameCache
+from .core.commit_filter import CommitWindow
+from .core.commit_graph import CommitGraph
+from .core.commit_store import CommitStore
+from .core.diff_service import DiffService
+from .core.file_history import FileHistoryCache
+from .core.diff_utils import (
+    PatchRenderState,
+    advance_render_state,
+    align_diff_rows,
+    parse_diff_data,
+    render_patch_lines,
+    render_patch_to_widget,
+)
 from .core.git_client import is_git_repo, load_commit_summaries
-from .core.models import CommitFilters, CommitInfo, CommitSummary, DiffData, DiffLineInfo
+from .core.highlight import TOKEN_KINDS, HighlightCache, Lexer, LineSpans, highlight_diff_lines, lexer_for_path
+from .core.models import AlignedRow, CommitFilters, CommitInfo, CommitSummary, DiffData, DiffLineInfo
+from .core.patch_buffer import PatchBuffer, ReadModeView, build_read_mode_view
+from .core.blob_store import BlobStore
+from .core.branch_compare import CompareCache
+from .core.branch_matrix import MatrixCache
+from .core.branch_refs import BranchRefCache
+from .core.merge_preview import ConflictPredictor
+from .core.pickaxe import PickaxeCache
+from .core.repo_dashboard import RepoDashboard
+from .core.repo_scanner import DEFAULT_SCAN_IGNORES, ScanCache
+from .core.repo_session import RepoSessionCache
+from .core.stash_store import StashDiffCache
+from .core.revision_tree import TreeCache
 from .core.settings_store import get_settings_path, load_settings, normalize_repo_path, save_settings
+from .ui.ui_blame import BlameMixin
+from .ui.ui_blob_viewer import BlobViewerMixin
+from .ui.ui_branch_list import BranchListMixin
+from .ui.ui_branch_matrix import BranchMatrixMixin
 from .ui.ui_branches import BranchesTabMixin
+from .ui.ui_code_search import CodeSearchTabMixin
 from .ui.ui_commit import CommitTabMixin
+from .ui.ui_file_history import FileHistoryMixin
 from .ui.ui_global import GlobalBarMixin
 from .ui.ui_history import HistoryTabMixin
+from .ui.ui_repo_scan import RepoScanMixin
 from .ui.ui_repos import ReposTabMixin
 from .ui.ui_settings import SettingsTabMixin
+from .ui.ui_side_by_side import SideBySideDiffView
+from .ui.ui_virtual_list import VirtualListbox
 from .ui.ui_stash import StashMixin
+from .ui.ui_tree_browser import TreeBrowserMixin
 
 
 RECENT_REPOS_LIMIT = 20
 FAVORITE_REPOS_LIMIT = 50
 READ_MODE_THRESHOLD = 1200
 READ_MODE_MAX_LINES = 400
+READ_MODE_CHUNK_LINES = 400
+READ_MORE_MARK = "read_more"
+HIGHLIGHT_SCOPE_TAG = "syn_scope"
+HIGHLIGHT_FRAME_BUDGET_MS = 8
+HIGHLIGHT_BATCH_LINES = 16
 
 
 class CommitsViewer(
@@ -35,15 +76,23 @@ class CommitsViewer(
     HistoryTabMixin,
     BranchesTabMixin,
     CommitTabMixin,
+    CodeSearchTabMixin,
     ReposTabMixin,
     SettingsTabMixin,
     StashMixin,
+    BlameMixin,
+    FileHistoryMixin,
+    TreeBrowserMixin,
+    BlobViewerMixin,
+    BranchMatrixMixin,
+    BranchListMixin,
+    RepoScanMixin,
     tk.Tk,
 ):
     def __init__(self, repo_path: str, summaries: list[CommitSummary], patch_limit: int, commit_limit: int) -> None:
         super().__init__()
         self.repo_path = repo_path
-        self.commit_summaries = summaries
+        self.commit_summaries = CommitStore(summaries)
         self.patch_limit = patch_limit
         self.commit_limit = commit_limit
         self.fetch_interval_sec = 60
@@ -52,6 +101,8 @@ class CommitsViewer(
         self.tag_list: list[str] = []
         self.word_diff_var = tk.BooleanVar(value=False)
         self.read_mode_var = tk.BooleanVar(value=True)
+        self.side_by_side_var = tk.BooleanVar(value=False)
+        self.side_by_side_views: dict[str, SideBySideDiffView] = {}
         self.diff_scope_var = tk.StringVar(value="Unstaged")
         self.worktree_diff_data: DiffData | None = None
         self.worktree_line_map: dict[int, DiffLineInfo] = {}
@@ -62,7 +113,7 @@ class CommitsViewer(
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
-        self.patch_cache: dict[tuple[str, str], str] = {}
+        self.patch_cache: dict[tuple[str, str], str | PatchBuffer] = {}
         self.full_patch_cache: dict[str, str] = {}
         self.selected_file_by_commit: dict[str, int] = {}
         self.current_commit_hash: str | None = None
@@ -80,16 +131,44 @@ class CommitsViewer(
         self.worktree_diff_cache: dict[tuple[object, ...], str] = {}
         self.compare_diff_cache: dict[tuple[object, ...], str] = {}
         self._async_tokens: dict[str, int] = {}
+        self.diff_service = DiffService(lambda callback: self.after(0, callback))
+        self.read_mode_views: dict[str, tuple[ReadModeView, PatchRenderState, bool, bool, tk.StringVar | None]] = {}
+        self.syntax_highlight = True
+        self.highlight_cache = HighlightCache()
+        self.highlight_sources: dict[str, tuple[Hashable, Lexer]] = {}
+        self.highlight_jobs: dict[str, str] = {}
+        self.highlight_hooks: set[str] = set()
         self.commit_list_epoch = 0
+        self.commit_window: CommitWindow | None = None
+        self.commit_graph: CommitGraph | None = None
+        self.blame_cache = BlameCache()
+        self.file_history_cache = FileHistoryCache()
+        self.pickaxe_cache = PickaxeCache()
+        self.tree_cache = TreeCache()
+        self.blob_store = BlobStore()
+        self.compare_cache = CompareCache()
+        self.conflict_predictor = ConflictPredictor()
+        self.branch_matrix_cache = MatrixCache()
+        self.branch_ref_cache = BranchRefCache()
+        self.stash_diff_cache = StashDiffCache()
+        self.repo_dashboard = RepoDashboard()
+        self.repo_dashboard_job: str | None = None
+        self.repo_scan_cache = ScanCache()
+        self.repo_sessions = RepoSessionCache()
+        self.content_search_cancel: threading.Event | None = None
+        self.filter_debounce_job: str | None = None
         self.loading_commits = False
         self.status_loading = False
         self.branches_loading = False
         self.commit_details_pending: set[str] = set()
         self.status_signature = ""
+        self.status_entries: list[dict[str, str | bool]] = []
         self.settings_path = get_settings_path()
         self.settings_data: dict[str, object] = {}
         self.recent_repos: list[str] = []
         self.favorite_repos: list[str] = []
+        self.scan_root = ""
+        self.scan_ignore: list[str] = list(DEFAULT_SCAN_IGNORES)
         self.theme_name = "light"
         self.ui_font_family = ""
         self.ui_font_size = 0
@@ -103,6 +182,7 @@ class CommitsViewer(
         self._build_tabs()
         self._apply_theme_settings()
         self._bind_shortcuts()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._populate_commit_list()
         if self.repo_path and is_git_repo(self.repo_path):
             self._set_repo_path(self.repo_path, initial=True)
@@ -117,18 +197,21 @@ class CommitsViewer(
         self.history_tab = ttk.Frame(self.tabs)
         self.branches_tab = ttk.Frame(self.tabs)
         self.branch_tab = ttk.Frame(self.tabs)
+        self.search_tab = ttk.Frame(self.tabs)
         self.settings_tab = ttk.Frame(self.tabs)
 
         self.tabs.add(self.repos_tab, text="Repositórios")
         self.tabs.add(self.history_tab, text="Histórico")
         self.tabs.add(self.branches_tab, text="Comparar")
         self.tabs.add(self.branch_tab, text="Commit")
+        self.tabs.add(self.search_tab, text="Busca")
         self.tabs.add(self.settings_tab, text="Configurações")
 
         self._build_repos_tab()
         self._build_history_tab()
         self._build_branches_tab()
         self._build_branch_tab()
+        self._build_search_tab()
         self._build_settings_tab()
 
     def _toggle_word_diff(self) -> None:
@@ -148,6 +231,46 @@ class CommitsViewer(
             return False
         return bool(self.word_diff_var.get())
 
+    def _side_by_side_enabled(self) -> bool:
+        return bool(self.side_by_side_var.get()) if hasattr(self, "side_by_side_var") else False
+
+    def _patch_word_diff(self) -> bool:
+        # Side-by-side rows come from DiffData, which needs a plain patch.
+        return self._word_diff_enabled() and not self._side_by_side_enabled()
+
+    def _toggle_side_by_side(self) -> None:
+        if self._word_diff_enabled():
+            self.patch_cache.clear()
+            self.full_patch_cache.clear()
+        if hasattr(self, "_refresh_history_patch_view"):
+            self._refresh_history_patch_view()
+        if hasattr(self, "_refresh_compare_diff"):
+            self._refresh_compare_diff()
+
+    def _attach_side_by_side(self, widget: tk.Text, scrollbar: ttk.Scrollbar) -> None:
+        info = widget.grid_info()
+        view = SideBySideDiffView(widget.master, (widget, scrollbar))
+        view.grid(row=info["row"], column=info["column"], columnspan=2, sticky="nsew")
+        view.grid_remove()
+        self.side_by_side_views[str(widget)] = view
+        palette = getattr(self, "theme_palette", None)
+        if palette:
+            for pane in view.panes:
+                self._apply_text_widget_theme(pane, palette)
+                self._apply_diff_tags(pane, palette)
+
+    def _show_diff_message(self, widget: tk.Text, message: str) -> None:
+        side = self.side_by_side_views.get(str(widget))
+        if side is not None:
+            side.deactivate()
+        self._set_text(widget, message)
+
+    def _has_pending_read_mode(self, widget: tk.Text) -> bool:
+        side = self.side_by_side_views.get(str(widget))
+        if side is not None and side.active:
+            return side.omitted > 0
+        return str(widget) in self.read_mode_views
+
     def _bind_shortcuts(self) -> None:
         self.bind_all("<F5>", self._on_refresh_shortcut, add=True)
         self.bind_all("<Control-r>", self._on_refresh_shortcut, add=True)
@@ -156,6 +279,7 @@ class CommitsViewer(
         self.bind_all("<Control-3>", lambda _e: self._select_tab(2), add=True)
         self.bind_all("<Control-4>", lambda _e: self._select_tab(3), add=True)
         self.bind_all("<Control-5>", lambda _e: self._select_tab(4), add=True)
+        self.bind_all("<Control-6>", lambda _e: self._select_tab(5), add=True)
         self.bind_all("<Alt-Up>", lambda _e: self._navigate_lists(-1), add=True)
         self.bind_all("<Alt-Down>", lambda _e: self._navigate_lists(1), add=True)
         self.bind_all("<Control-Return>", self._on_commit_shortcut, add=True)
@@ -186,6 +310,9 @@ class CommitsViewer(
             return
         self._reload_commits()
         self._refresh_status()
+        # F5 also covers filesystems whose directory mtimes are too coarse
+        # to notice a ref update.
+        self.branch_ref_cache.invalidate(self.repo_path)
         self._refresh_branches()
         self._update_pull_push_labels()
         if hasattr(self, "_refresh_branch_comparison"):
@@ -206,17 +333,238 @@ class CommitsViewer(
     def _read_mode_enabled(self) -> bool:
         return bool(self.read_mode_var.get()) if hasattr(self, "read_mode_var") else False
 
-    def _apply_read_mode_to_diff(self, diff_text: str) -> tuple[str, bool, int, int]:
-        total = len(diff_text.splitlines())
-        if not self._read_mode_enabled():
-            return diff_text, False, total, total
-        preview, truncated = build_read_mode_diff(
-            diff_text,
-            threshold=READ_MODE_THRESHOLD,
-            max_lines=READ_MODE_MAX_LINES,
+    def _render_diff_view(
+        self,
+        widget: tk.Text,
+        diff: str | PatchBuffer,
+        status_var: tk.StringVar | None,
+        show_file_headers: bool = False,
+        highlight: tuple[Hashable, str] | None = None,
+    ) -> None:
+        key = str(widget)
+        self.read_mode_views.pop(key, None)
+        side = self.side_by_side_views.get(key)
+        if side is not None:
+            if self._side_by_side_enabled():
+                self.highlight_sources.pop(key, None)
+                self._show_side_by_side(key, side, diff, status_var)
+                return
+            self.diff_service.cancel(f"side_rows:{key}")
+            side.deactivate()
+        word_diff = self._patch_word_diff()
+        view: ReadModeView | None = None
+        if self._read_mode_enabled():
+            buffer = diff
+            if isinstance(buffer, str) and buffer.count("\n") > READ_MODE_THRESHOLD:
+                buffer = PatchBuffer.from_text(buffer)
+            if isinstance(buffer, PatchBuffer):
+                view = build_read_mode_view(buffer, threshold=READ_MODE_THRESHOLD, max_lines=READ_MODE_MAX_LINES)
+        if view is None:
+            text = diff.text() if isinstance(diff, PatchBuffer) else diff
+            render_patch_to_widget(widget, text, read_only=True, show_file_headers=show_file_headers, word_diff=word_diff)
+            if status_var is not None:
+                status_var.set("")
+            self._highlight_diff(widget, highlight)
+            return
+
+        widget.configure(state="normal")
+        widget.delete("1.0", tk.END)
+        head_state = PatchRenderState()
+        render_patch_lines(widget, view.head_lines(), head_state, show_file_headers, word_diff)
+        widget.mark_set(READ_MORE_MARK, "end-1c")
+        widget.mark_gravity(READ_MORE_MARK, "right")
+        self._insert_read_more_marker(widget, view)
+        # The tail keeps correct line numbers without rendering the middle.
+        tail_state = PatchRenderState(head_state.old_line, head_state.new_line, head_state.in_hunk)
+        for lines in view.buffer.line_chunks(view.tail_anchor(), view.tail_start):
+            advance_render_state(tail_state, lines, word_diff)
+        render_patch_lines(widget, view.tail_lines(), tail_state, show_file_headers, word_diff)
+        widget.configure(state="disabled")
+        widget.tag_bind("read_more", "<Button-1>", lambda _e: self._expand_read_mode(widget, READ_MODE_CHUNK_LINES))
+        self.read_mode_views[key] = (view, head_state, show_file_headers, word_diff, status_var)
+        self._update_read_mode_status(view, status_var)
+        self._highlight_diff(widget, highlight)
+
+    def _show_side_by_side(
+        self,
+        key: str,
+        side: SideBySideDiffView,
+        diff: str | PatchBuffer,
+        status_var: tk.StringVar | None,
+    ) -> None:
+        # Patches up to READ_MODE_THRESHOLD lines are aligned right here.
+        # Bigger ones are parsed and aligned on a DiffService worker; read
+        # mode shows the rows of the first READ_MODE_MAX_LINES lines meanwhile.
+        channel = f"side_rows:{key}"
+        line_count = diff.line_count if isinstance(diff, PatchBuffer) else diff.count("\n")
+        if line_count <= READ_MODE_THRESHOLD:
+            self.diff_service.cancel(channel)
+            text = diff.text() if isinstance(diff, PatchBuffer) else diff
+            side.show_rows(align_diff_rows(parse_diff_data(text)), None, READ_MODE_CHUNK_LINES, status_var)
+            return
+        limit: int | None = None
+        head: list[AlignedRow] = []
+        if self._read_mode_enabled():
+            limit = READ_MODE_MAX_LINES
+            if isinstance(diff, PatchBuffer):
+                head_text = diff.text_range(0, limit)
+            else:
+                head_text = "\n".join(diff.split("\n", limit)[:limit])
+            head = align_diff_rows(parse_diff_data(head_text))[:limit]
+        side.show_rows(head, limit, READ_MODE_CHUNK_LINES, status_var, complete=False)
+
+        def load() -> list[AlignedRow]:
+            text = diff.text() if isinstance(diff, PatchBuffer) else diff
+            return align_diff_rows(parse_diff_data(text))
+
+        def done(rows: object) -> None:
+            if side.active:
+                side.update_rows(rows)  # type: ignore[arg-type]
+
+        def failed(exc: Exception) -> None:
+            side.update_rows(head)
+            messagebox.showerror("Erro", str(exc))
+
+        self.diff_service.request(channel, ("side_rows", key, id(diff), self.repo_state_token), load, done, failed)
+
+    def _insert_read_more_marker(self, widget: tk.Text, view: ReadModeView) -> None:
+        position = widget.index(READ_MORE_MARK)
+        chunk = min(READ_MODE_CHUNK_LINES, view.omitted)
+        marker = f"... ({view.omitted} linhas omitidas no modo leitura, clique para carregar mais {chunk}) ...\n"
+        widget.insert(position, marker, "read_more")
+        widget.mark_set(READ_MORE_MARK, position)
+
+    def _expand_read_mode(self, widget: tk.Text, count: int | None) -> bool:
+        side = self.side_by_side_views.get(str(widget))
+        if side is not None and side.active:
+            return side.expand(count)
+        entry = self.read_mode_views.get(str(widget))
+        if entry is None or not widget.tag_ranges("read_more"):
+            return False
+        view, state, show_file_headers, word_diff, status_var = entry
+        lines = view.take_chunk(view.omitted if count is None else count)
+        widget.configure(state="normal")
+        render_patch_lines(widget, lines, state, show_file_headers, word_diff, index=READ_MORE_MARK)
+        ranges = widget.tag_ranges("read_more")
+        widget.delete(ranges[0], ranges[-1])
+        if view.omitted > 0:
+            self._insert_read_more_marker(widget, view)
+        else:
+            self.read_mode_views.pop(str(widget), None)
+        widget.configure(state="disabled")
+        self._update_read_mode_status(view, status_var)
+        if str(widget) in self.highlight_sources:
+            widget.tag_add(HIGHLIGHT_SCOPE_TAG, "1.0", tk.END)
+            self._schedule_highlight(widget)
+        return True
+
+    @staticmethod
+    def _update_read_mode_status(view: ReadModeView, status_var: tk.StringVar | None) -> None:
+        if status_var is None:
+            return
+        if view.omitted > 0:
+            status_var.set(f"Modo leitura: {view.shown}/{view.buffer.line_count} linhas")
+        else:
+            status_var.set("")
+
+    def _highlight_diff(self, widget: tk.Text, source: tuple[Hashable, str] | None) -> None:
+        key = str(widget)
+        lexer = lexer_for_path(source[1]) if source is not None else None
+        if source is None or lexer is None:
+            self.highlight_sources.pop(key, None)
+            return
+        self.highlight_sources[key] = (source[0], lexer)
+        # Any later _set_text/delete drops this tag, which retires the source.
+        widget.tag_add(HIGHLIGHT_SCOPE_TAG, "1.0", tk.END)
+        self._install_highlight_scroll_hook(widget)
+        self._schedule_highlight(widget)
+
+    def _install_highlight_scroll_hook(self, widget: tk.Text) -> None:
+        key = str(widget)
+        if key in self.highlight_hooks:
+            return
+        self.highlight_hooks.add(key)
+        previous = self.tk.splitlist(widget.cget("yscrollcommand"))
+
+        def on_scroll(first: str, last: str) -> None:
+            if previous:
+                self.tk.call(*previous, first, last)
+            self._schedule_highlight(widget)
+
+        widget.configure(yscrollcommand=on_scroll)
+
+    def _schedule_highlight(self, widget: tk.Text) -> None:
+        key = str(widget)
+        if not self.syntax_highlight or key not in self.highlight_sources or key in self.highlight_jobs:
+            return
+        self.highlight_jobs[key] = self.after_idle(lambda: self._request_highlight(widget))
+
+    def _request_highlight(self, widget: tk.Text) -> None:
+        key = str(widget)
+        self.highlight_jobs.pop(key, None)
+        source = self.highlight_sources.get(key)
+        if source is None or not self.syntax_highlight or not widget.winfo_exists():
+            return
+        if not widget.tag_ranges(HIGHLIGHT_SCOPE_TAG):
+            self.highlight_sources.pop(key, None)
+            return
+        blob_id, lexer = source
+        first = int(widget.index("@0,0").split(".")[0])
+        last = int(widget.index(f"@0,{widget.winfo_height()}").split(".")[0])
+        # Read-mode expansion shifts line numbers, so the layout is part of the key.
+        entry = self.read_mode_views.get(key)
+        layout = entry[0].shown if entry is not None else None
+        cache_key = ("highlight", blob_id, self._patch_word_diff(), layout, first, last)
+        spans = self.highlight_cache.get(cache_key)
+        if spans is not None:
+            self.diff_service.cancel(f"highlight:{key}")
+            self._apply_highlight(widget, source, spans, 0)
+            return
+        text = widget.get(f"{first}.0", f"{last}.end")
+
+        def done(result: object) -> None:
+            self.highlight_cache.put(cache_key, result)  # type: ignore[arg-type]
+            self._apply_highlight(widget, source, result, 0)  # type: ignore[arg-type]
+
+        self.diff_service.request(
+            f"highlight:{key}",
+            cache_key,
+            lambda: highlight_diff_lines(lexer, first, text),
+            done,
         )
-        shown = len(preview.splitlines())
-        return preview, truncated, shown, total
+
+    def _apply_highlight(
+        self,
+        widget: tk.Text,
+        source: tuple[Hashable, Lexer],
+        spans: tuple[LineSpans, ...],
+        start: int,
+    ) -> None:
+        if self.highlight_sources.get(str(widget)) is not source or not widget.winfo_exists():
+            return
+        deadline = time.perf_counter() + HIGHLIGHT_FRAME_BUDGET_MS / 1000
+        index = start
+        while index < len(spans):
+            ranges: dict[str, list[str]] = {}
+            for line, line_spans in spans[index : index + HIGHLIGHT_BATCH_LINES]:
+                for col_start, col_end, kind in line_spans:
+                    ranges.setdefault(kind, []).extend((f"{line}.{col_start}", f"{line}.{col_end}"))
+            for kind, indexes in ranges.items():
+                widget.tag_add(f"syn_{kind}", *indexes)
+            index += HIGHLIGHT_BATCH_LINES
+            if time.perf_counter() >= deadline:
+                break
+        if index < len(spans):
+            self.after(1, lambda: self._apply_highlight(widget, source, spans, index))
+
+    def _apply_syntax_highlight_setting(self) -> None:
+        for key in list(self.highlight_sources):
+            widget = self.nametowidget(key)
+            if self.syntax_highlight:
+                self._schedule_highlight(widget)
+            else:
+                for kind in TOKEN_KINDS:
+                    widget.tag_remove(f"syn_{kind}", "1.0", tk.END)
 
     def _toggle_read_mode(self) -> None:
         if hasattr(self, "_refresh_history_patch_view"):
@@ -282,6 +630,22 @@ class CommitsViewer(
         thread.start()
         return token
 
+    def _on_close(self) -> None:
+        # Background pools are not daemon threads and the interpreter waits
+        # for their queued work: cancel every search so only running git
+        # calls are left, then stop the dashboard before Tk goes.
+        self._cancel_content_search()
+        if hasattr(self, "_cancel_code_search"):
+            self._cancel_code_search()
+        for child in self.winfo_children():
+            # Branch matrix, blame, file history and the other windows.
+            cancel = getattr(child, "cancel", None)
+            if isinstance(cancel, threading.Event):
+                cancel.set()
+        if hasattr(self, "_stop_repo_dashboard"):
+            self._stop_repo_dashboard()
+        self.destroy()
+
     def _bump_repo_state(self) -> None:
         self.repo_state_token += 1
         if hasattr(self, "worktree_diff_cache"):
@@ -305,6 +669,9 @@ class CommitsViewer(
         self.ui_font_size = int(self.settings_data.get("ui_font_size", 0))
         self.mono_font_family = str(self.settings_data.get("mono_font_family", "")).strip()
         self.mono_font_size = int(self.settings_data.get("mono_font_size", 0))
+        self.syntax_highlight = bool(self.settings_data.get("syntax_highlight", True))
+        self.scan_root = str(self.settings_data.get("scan_root", ""))
+        self.scan_ignore = list(self.settings_data.get("scan_ignore", DEFAULT_SCAN_IGNORES))
         if len(self.recent_repos) > RECENT_REPOS_LIMIT:
             self.recent_repos = self.recent_repos[:RECENT_REPOS_LIMIT]
         if len(self.favorite_repos) > FAVORITE_REPOS_LIMIT:
@@ -333,6 +700,9 @@ class CommitsViewer(
             "ui_font_size": self.ui_font_size,
             "mono_font_family": self.mono_font_family,
             "mono_font_size": self.mono_font_size,
+            "syntax_highlight": self.syntax_highlight,
+            "scan_root": self.scan_root,
+            "scan_ignore": self.scan_ignore,
         }
         save_settings(self.settings_path, self.settings_data)
 
@@ -387,6 +757,9 @@ class CommitsViewer(
         self.ui_font_size = default_ui_size
         self.mono_font_family = default_mono_family
         self.mono_font_size = default_mono_size
+        self.syntax_highlight = True
+        if hasattr(self, "syntax_highlight_var"):
+            self.syntax_highlight_var.set(True)
         if hasattr(self, "theme_var"):
             self.theme_var.set("Claro")
         if hasattr(self, "ui_font_family_var"):
@@ -398,6 +771,7 @@ class CommitsViewer(
         if hasattr(self, "mono_font_size_var"):
             self.mono_font_size_var.set(str(self.mono_font_size))
         self._apply_theme_settings()
+        self._apply_syntax_highlight_setting()
         self._persist_settings()
 
     def _apply_theme_settings(self) -> None:
@@ -425,6 +799,10 @@ class CommitsViewer(
                 "diff_meta": "#8b949e",
                 "diff_added_bg": "#0b3d1e",
                 "diff_removed_bg": "#4b1113",
+                "syntax_keyword": "#d2a8ff",
+                "syntax_string": "#a5d6ff",
+                "syntax_comment": "#8b949e",
+                "syntax_number": "#79c0ff",
             }
         return {
             "bg": "#f6f6f6",
@@ -441,6 +819,10 @@ class CommitsViewer(
             "diff_meta": "#57606a",
             "diff_added_bg": "#dafbe1",
             "diff_removed_bg": "#ffebe9",
+            "syntax_keyword": "#8250df",
+            "syntax_string": "#0a3069",
+            "syntax_comment": "#6e7781",
+            "syntax_number": "#0550ae",
         }
 
     def _apply_tk_palette(self, palette: dict[str, str]) -> None:
@@ -509,6 +891,10 @@ class CommitsViewer(
                 continue
             self._apply_text_widget_theme(widget, palette)
             self._apply_diff_tags(widget, palette)
+        for view in self.side_by_side_views.values():
+            for pane in view.panes:
+                self._apply_text_widget_theme(pane, palette)
+                self._apply_diff_tags(pane, palette)
 
         list_widgets = [
             "commit_listbox",
@@ -518,12 +904,16 @@ class CommitsViewer(
             "compare_files_listbox",
             "favorite_listbox",
             "recent_listbox",
+            "code_search_listbox",
         ]
         for name in list_widgets:
             widget = getattr(self, name, None)
             if widget is None:
                 continue
             self._apply_listbox_theme(widget, palette)
+        graph_canvas = getattr(self, "commit_graph_canvas", None)
+        if graph_canvas is not None:
+            graph_canvas.configure_colors(palette["field_bg"], palette["text_fg"])
 
     def _apply_text_widget_theme(self, widget: tk.Text, palette: dict[str, str]) -> None:
         widget.configure(
@@ -534,7 +924,10 @@ class CommitsViewer(
             selectforeground=palette["select_fg"],
         )
 
-    def _apply_listbox_theme(self, widget: tk.Listbox, palette: dict[str, str]) -> None:
+    def _apply_listbox_theme(self, widget: tk.Listbox | VirtualListbox, palette: dict[str, str]) -> None:
+        if isinstance(widget, VirtualListbox):
+            widget.configure_colors(palette["field_bg"], palette["text_fg"], palette["select_bg"], palette["select_fg"])
+            return
         widget.configure(
             background=palette["field_bg"],
             foreground=palette["text_fg"],
@@ -548,6 +941,12 @@ class CommitsViewer(
         widget.tag_configure("meta", foreground=palette["diff_meta"])
         widget.tag_configure("added_word", foreground=palette["diff_added"], background=palette["diff_added_bg"])
         widget.tag_configure("removed_word", foreground=palette["diff_removed"], background=palette["diff_removed_bg"])
+        widget.tag_configure("read_more", foreground=palette["accent"], underline=True)
+        widget.tag_configure("filler", background=palette["bg"])
+        for kind in TOKEN_KINDS:
+            widget.tag_configure(f"syn_{kind}", foreground=palette[f"syntax_{kind}"])
+        widget.tag_raise("added_word")
+        widget.tag_raise("removed_word")
 
 
 def parse_args() -> argparse.Namespace:
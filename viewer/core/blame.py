@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from .diff_utils import parse_hunk_header_full
+from .models import BlameCommit, BlameRange
+
+BLAME_BATCH_SECONDS = 0.03
+BLAME_CACHE_ENTRIES = 32
+# Past this many holes a plain full blame of the parent is cheaper.
+MAX_PARENT_SPANS = 200
+
+
+def is_uncommitted(commit_hash: str) -> bool:
+    return bool(commit_hash) and set(commit_hash) == {"0"}
+
+
+@dataclasses.dataclass
+class BlameResult:
+    ranges: list[BlameRange] = dataclasses.field(default_factory=list)
+    commits: dict[str, BlameCommit] = dataclasses.field(default_factory=dict)
+    complete: bool = False
+
+    def add(self, ranges: list[BlameRange], commits: dict[str, BlameCommit]) -> None:
+        self.ranges.extend(ranges)
+        self.commits.update(commits)
+
+    def line_count(self) -> int:
+        return sum(blame_range.count for blame_range in self.ranges)
+
+    def range_at(self, line: int) -> BlameRange | None:
+        ordered = sorted(self.ranges, key=lambda blame_range: blame_range.final_line)
+        index = bisect_right([blame_range.final_line for blame_range in ordered], line) - 1
+        if index < 0:
+            return None
+        found = ordered[index]
+        return found if line < found.final_line + found.count else None
+
+
+class BlameParser:
+    # `git blame --incremental` prints one group per range: a header line
+    # "<hash> <source> <final> <count>", commit fields the first time a hash
+    # shows up, and a closing "filename" line.
+    def __init__(self) -> None:
+        self.commits: dict[str, BlameCommit] = {}
+        self._header: tuple[str, int, int, int] | None = None
+        self._fields: dict[str, str] = {}
+
+    def feed(self, line: str) -> BlameRange | None:
+        if self._header is None:
+            parts = line.split()
+            if len(parts) < 4:
+                return None
+            try:
+                self._header = (parts[0], int(parts[1]), int(parts[2]), int(parts[3]))
+            except ValueError:
+                return None
+            self._fields = {}
+            return None
+        key, _, value = line.partition(" ")
+        if key != "filename":
+            self._fields[key] = value
+            return None
+        commit_hash, source_line, final_line, count = self._header
+        self._header = None
+        fields = self._fields
+        if "author" in fields:
+            try:
+                author_time = int(fields.get("author-time", "0"))
+            except ValueError:
+                author_time = 0
+            self.commits[commit_hash] = BlameCommit(
+                author=fields["author"],
+                author_time=author_time,
+                summary=fields.get("summary", ""),
+                previous=fields.get("previous", ""),
+            )
+        return BlameRange(commit_hash=commit_hash, source_line=source_line, final_line=final_line, count=count)
+
+
+def stream_blame(
+    repo_path: str,
+    rev: str | None,
+    path: str,
+    on_batch: Callable[[list[BlameRange], dict[str, BlameCommit]], None],
+    cancel: threading.Event,
+    line_spans: list[tuple[int, int]] | None = None,
+) -> None:
+    # Runs on a worker thread. Ranges are handed over as git finds them: the
+    # first one right away, then in batches every BLAME_BATCH_SECONDS.
+    args = ["git", "-C", repo_path, "blame", "--incremental", "--porcelain"]
+    for first, last in line_spans or ():
+        args.append(f"-L{first},{last}")
+    if rev:
+        args.append(rev)
+    args.extend(["--", path])
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    parser = BlameParser()
+    batch: list[BlameRange] = []
+    fresh: dict[str, BlameCommit] = {}
+    sent: set[str] = set()
+    last_flush = 0.0
+    assert process.stdout is not None
+    try:
+        for raw in process.stdout:
+            if cancel.is_set():
+                process.kill()
+                break
+            found = parser.feed(raw.decode("utf-8", errors="replace").rstrip("\n"))
+            if found is None:
+                continue
+            batch.append(found)
+            if found.commit_hash not in sent and found.commit_hash in parser.commits:
+                sent.add(found.commit_hash)
+                fresh[found.commit_hash] = parser.commits[found.commit_hash]
+            now = time.perf_counter()
+            if now - last_flush >= BLAME_BATCH_SECONDS:
+                on_batch(batch, fresh)
+                batch, fresh = [], {}
+                last_flush = now
+    finally:
+        stderr = process.stderr.read().decode("utf-8", errors="replace") if process.stderr else ""
+        returncode = process.wait()
+    if cancel.is_set():
+        return
+    if returncode != 0:
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    if batch or fresh:
+        on_batch(batch, fresh)
+
+
+def carry_to_parent(
+    ranges: list[BlameRange],
+    own_commit: str,
+    diff_text: str,
+    line_count: int,
+) -> tuple[list[BlameRange], list[tuple[int, int]]]:
+    # Lines the revision did not touch keep their blame in its parent; only
+    # their numbers move. ``diff_text`` is `git diff --unified=0 parent rev`.
+    # Returns the moved ranges (parent numbering) and the parent line spans
+    # that still need `git blame -L`.
+    hunks = [parse_hunk_header_full(line) for line in diff_text.splitlines() if line.startswith("@@")]
+    segments: list[tuple[int, int, int]] = []
+    cursor = 1
+    delta = 0
+    for old_start, old_count, new_start, new_count in hunks:
+        added_first = new_start if new_count else new_start + 1
+        if added_first - 1 >= cursor:
+            segments.append((cursor, added_first - 1, delta))
+        cursor = added_first + new_count
+        delta += old_count - new_count
+    if line_count >= cursor:
+        segments.append((cursor, line_count, delta))
+    parent_count = line_count + delta
+
+    moved: list[BlameRange] = []
+    segment_index = 0
+    for blame_range in sorted(ranges, key=lambda item: item.final_line):
+        if blame_range.commit_hash == own_commit or (
+            is_uncommitted(own_commit) and is_uncommitted(blame_range.commit_hash)
+        ):
+            continue
+        first = blame_range.final_line
+        last = first + blame_range.count - 1
+        while segment_index < len(segments) and segments[segment_index][1] < first:
+            segment_index += 1
+        index = segment_index
+        while index < len(segments) and segments[index][0] <= last:
+            segment_first, segment_last, shift = segments[index]
+            piece_first = max(first, segment_first)
+            piece_last = min(last, segment_last)
+            if piece_first <= piece_last:
+                moved.append(
+                    BlameRange(
+                        commit_hash=blame_range.commit_hash,
+                        source_line=blame_range.source_line + piece_first - first,
+                        final_line=piece_first + shift,
+                        count=piece_last - piece_first + 1,
+                    )
+                )
+            index += 1
+
+    spans: list[tuple[int, int]] = []
+    next_line = 1
+    for blame_range in moved:
+        if blame_range.final_line > next_line:
+            spans.append((next_line, blame_range.final_line - 1))
+        next_line = max(next_line, blame_range.final_line + blame_range.count)
+    if next_line <= parent_count:
+        spans.append((next_line, parent_count))
+    if len(spans) > MAX_PARENT_SPANS:
+        return [], [(1, parent_count)] if parent_count else []
+    return moved, spans
+
+
+class BlameCache:
+    # Finished blames keyed by (revision, path); small LRU, UI thread only.
+    def __init__(self, max_entries: int = BLAME_CACHE_ENTRIES) -> None:
+        self._entries: OrderedDict[Hashable, BlameResult] = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: Hashable) -> BlameResult | None:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: BlameResult) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
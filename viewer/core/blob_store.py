@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .git_client import run_git
+
+# Disk budget for materialized blobs; the oldest files are removed first.
+BLOB_STORE_BYTES = 8 * 1024 * 1024 * 1024
+COPY_CHUNK_BYTES = 1024 * 1024
+HEX_ROW_BYTES = 16
+# A text page never reads past this many bytes, so a file without
+# newlines still pages in bounded steps.
+TEXT_PAGE_MAX_BYTES = 512 * 1024
+_PRINTABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+
+class BlobFile:
+    # Read-only view of a blob on disk. Pages are sliced from the mapping,
+    # so only the bytes on screen are ever copied into Python.
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap refuses empty files.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+    def read(self, offset: int, length: int) -> bytes:
+        offset = min(max(offset, 0), self.size)
+        return self._map[offset : offset + length]
+
+    def is_binary(self) -> bool:
+        return b"\0" in self.read(0, 8000)
+
+    def line_start(self, offset: int) -> int:
+        # Start of the line containing ``offset``. A line longer than one page
+        # has no start within reach, so ``offset`` itself is kept.
+        offset = min(max(offset, 0), self.size)
+        if offset == 0:
+            return 0
+        floor = max(0, offset - TEXT_PAGE_MAX_BYTES)
+        pos = self._map.rfind(b"\n", floor, offset)
+        if pos != -1:
+            return pos + 1
+        return 0 if floor == 0 else offset
+
+    def text_page(self, offset: int, max_lines: int) -> tuple[str, int]:
+        # Up to ``max_lines`` lines from ``offset`` and the offset after them.
+        limit = min(self.size, offset + TEXT_PAGE_MAX_BYTES)
+        end = offset
+        for _ in range(max_lines):
+            if end >= limit:
+                break
+            pos = self._map.find(b"\n", end, limit)
+            end = pos + 1 if pos != -1 else limit
+        return self.read(offset, end - offset).decode("utf-8", errors="replace"), end
+
+    def previous_text_offset(self, offset: int, max_lines: int) -> int:
+        floor = max(0, offset - TEXT_PAGE_MAX_BYTES)
+        start = offset
+        for _ in range(max_lines):
+            if start <= floor:
+                break
+            pos = self._map.rfind(b"\n", floor, start - 1)
+            start = pos + 1 if pos != -1 else floor
+        return start
+
+    def hex_page(self, offset: int, rows: int) -> tuple[str, int]:
+        offset -= offset % HEX_ROW_BYTES
+        data = self.read(offset, rows * HEX_ROW_BYTES)
+        lines = []
+        for start in range(0, len(data), HEX_ROW_BYTES):
+            row = data[start : start + HEX_ROW_BYTES]
+            hex_part = " ".join(f"{byte:02x}" for byte in row)
+            lines.append(f"{offset + start:012x}  {hex_part:<47}  |{row.translate(_PRINTABLE).decode('ascii')}|")
+        return "\n".join(lines), offset + len(data)
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+def resolve_blob(repo_path: str, rev: str, path: str) -> str:
+    # Blob id of ``path`` at ``rev``; a file deleted by ``rev`` is read from
+    # its first parent instead.
+    try:
+        return run_git(repo_path, ["rev-parse", "--verify", f"{rev}:{path}"]).strip()
+    except RuntimeError:
+        return run_git(repo_path, ["rev-parse", "--verify", f"{rev}^:{path}"]).strip()
+
+
+class BlobStore:
+    # Blobs written once to a private temp directory by object id. Object ids
+    # name content, so one file serves every commit and repo that has it.
+    def __init__(self, max_bytes: int = BLOB_STORE_BYTES, directory: str | None = None) -> None:
+        self.directory = directory or tempfile.mkdtemp(prefix="commits-viewer-blobs-")
+        self._max_bytes = max_bytes
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def path_for(self, object_id: str) -> str:
+        return os.path.join(self.directory, object_id)
+
+    def materialize(
+        self,
+        repo_path: str,
+        object_id: str,
+        on_progress: Callable[[int], None] | None = None,
+        cancel: threading.Event | None = None,
+    ) -> str | None:
+        # Path of the blob on disk, copying it from git on first use. Returns
+        # None when cancelled.
+        path = self.path_for(object_id)
+        with self._lock:
+            if object_id in self._files:
+                self._files.move_to_end(object_id)
+                return path
+        partial = f"{path}.{threading.get_ident()}.part"
+        process = subprocess.Popen(
+            ["git", "-C", repo_path, "cat-file", "blob", object_id],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        written = 0
+        try:
+            with open(partial, "wb") as target:
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        process.kill()
+                        return None
+                    chunk = process.stdout.read(COPY_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    target.write(chunk)
+                    written += len(chunk)
+                    if on_progress is not None:
+                        on_progress(written)
+            stderr = process.stderr.read().decode("utf-8", errors="replace").strip()
+            if process.wait() != 0:
+                raise RuntimeError(f"git falhou: {stderr or '(sem detalhes)'}")
+            os.replace(partial, path)
+        finally:
+            process.stdout.close()
+            process.stderr.close()
+            process.wait()
+            if os.path.exists(partial):
+                os.remove(partial)
+        self._add(object_id, written)
+        return path
+
+    def _add(self, object_id: str, size: int) -> None:
+        with self._lock:
+            if object_id not in self._files:
+                self._files[object_id] = size
+                self._bytes += size
+            while self._bytes > self._max_bytes and len(self._files) > 1:
+                evicted, evicted_size = self._files.popitem(last=False)
+                self._bytes -= evicted_size
+                # Open views keep their mapping; Windows refuses to delete
+                # a mapped file, so it is simply left for the final cleanup.
+                try:
+                    os.remove(self.path_for(evicted))
+                except OSError:
+                    pass
+
+    def open(self, object_id: str) -> BlobFile:
+        return BlobFile(self.path_for(object_id))
+
+    def close(self) -> None:
+        self._finalizer()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .git_client import run_git, run_git_cancellable
+from .merge_preview import ConflictPredictor
+
+COMPARE_CACHE_ENTRIES = 32
+# Order in which a comparison fills in; the UI renders after each one.
+COMPARE_STAGES = ("commits", "files", "preview")
+
+
+@dataclasses.dataclass
+class CompareResult:
+    origin: str
+    dest: str
+    origin_sha: str
+    dest_sha: str
+    commits: list[str] | None = None
+    stats: list[dict[str, object]] | None = None
+    totals: dict[str, int] | None = None
+    behind: int = 0
+    ahead: int = 0
+    # Paths merge-tree predicts will conflict; None until checked.
+    conflict_paths: list[str] | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self.conflict_paths is not None
+
+    @property
+    def conflict(self) -> bool:
+        return bool(self.conflict_paths)
+
+
+def parse_compare_numstat(output: str) -> tuple[list[dict[str, object]], dict[str, int]]:
+    stats: list[dict[str, object]] = []
+    totals = {"files": 0, "added": 0, "deleted": 0, "binary": 0}
+    for raw in output.splitlines():
+        if not raw.strip():
+            continue
+        parts = raw.split("\t", 2)
+        if len(parts) < 3:
+            continue
+        added_raw, deleted_raw, path = parts
+        is_binary = added_raw == "-" or deleted_raw == "-"
+        added = 0 if is_binary else int(added_raw)
+        deleted = 0 if is_binary else int(deleted_raw)
+        stats.append({"path": path, "added": added, "deleted": deleted, "binary": is_binary})
+        totals["files"] += 1
+        totals["added"] += added
+        totals["deleted"] += deleted
+        if is_binary:
+            totals["binary"] += 1
+    return stats, totals
+
+
+def resolve_compare_shas(repo_path: str, origin: str, dest: str) -> tuple[str, str]:
+    output = run_git(repo_path, ["rev-parse", f"{origin}^{{commit}}", f"{dest}^{{commit}}"])
+    origin_sha, dest_sha = output.split()
+    return origin_sha, dest_sha
+
+
+class CompareCache:
+    # Finished comparisons by (origin sha, dest sha); a branch that did not
+    # move compares instantly no matter how far apart the two are.
+    def __init__(self, max_entries: int = COMPARE_CACHE_ENTRIES) -> None:
+        self._results: OrderedDict[tuple[str, str], CompareResult] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, origin_sha: str, dest_sha: str) -> CompareResult | None:
+        with self._lock:
+            result = self._results.get((origin_sha, dest_sha))
+            if result is not None:
+                self._results.move_to_end((origin_sha, dest_sha))
+            return result
+
+    def put(self, result: CompareResult) -> None:
+        if not result.complete:
+            return
+        with self._lock:
+            self._results[(result.origin_sha, result.dest_sha)] = result
+            self._results.move_to_end((result.origin_sha, result.dest_sha))
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+def compare_branches(
+    repo_path: str,
+    origin: str,
+    dest: str,
+    cache: CompareCache,
+    predictor: ConflictPredictor,
+    on_stage: Callable[[CompareResult, str], None],
+    cancel: threading.Event | None = None,
+) -> CompareResult:
+    # Fills one CompareResult stage by stage, calling ``on_stage`` after each
+    # of COMPARE_STAGES. Raises GitCancelled when ``cancel`` is set.
+    origin_sha, dest_sha = resolve_compare_shas(repo_path, origin, dest)
+    cached = cache.get(origin_sha, dest_sha)
+    if cached is not None:
+        result = dataclasses.replace(cached, origin=origin, dest=dest)
+        for stage in COMPARE_STAGES:
+            on_stage(result, stage)
+        return result
+    result = CompareResult(origin=origin, dest=dest, origin_sha=origin_sha, dest_sha=dest_sha)
+
+    output = run_git_cancellable(repo_path, ["log", "--oneline", f"{dest_sha}..{origin_sha}"], cancel)
+    result.commits = [line.strip() for line in output.splitlines() if line.strip()]
+    on_stage(result, "commits")
+
+    output = run_git_cancellable(repo_path, ["diff", "--numstat", f"{dest_sha}...{origin_sha}"], cancel)
+    result.stats, result.totals = parse_compare_numstat(output)
+    on_stage(result, "files")
+
+    output = run_git_cancellable(
+        repo_path,
+        ["rev-list", "--left-right", "--count", f"{origin_sha}...{dest_sha}"],
+        cancel,
+    )
+    parts = output.split()
+    if len(parts) == 2:
+        result.behind, result.ahead = int(parts[0]), int(parts[1])
+    result.conflict_paths = predictor.predict_branches(repo_path, dest_sha, origin_sha, cancel)
+    on_stage(result, "preview")
+    cache.put(result)
+    return result
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .git_client import GitCancelled, run_git, run_git_cancellable
+from .merge_preview import ConflictPredictor
+
+# Each task only waits on git, so threads are enough to keep this many git
+# processes busy at once.
+MATRIX_WORKERS = max(2, min(8, os.cpu_count() or 1))
+MATRIX_CACHE_ENTRIES = 4096
+
+
+@dataclasses.dataclass(frozen=True)
+class MatrixRow:
+    branch: str
+    branch_sha: str
+    # Commits only in the branch / only in the target.
+    ahead: int
+    behind: int
+    conflict_paths: tuple[str, ...]
+
+
+class MatrixCache:
+    # Rows by (target sha, branch sha); names are filled in on the way out,
+    # so a renamed branch still hits.
+    def __init__(self, max_entries: int = MATRIX_CACHE_ENTRIES) -> None:
+        self._rows: OrderedDict[tuple[str, str], MatrixRow] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, target_sha: str, branch: str, branch_sha: str) -> MatrixRow | None:
+        with self._lock:
+            row = self._rows.get((target_sha, branch_sha))
+            if row is None:
+                return None
+            self._rows.move_to_end((target_sha, branch_sha))
+        return dataclasses.replace(row, branch=branch)
+
+    def put(self, target_sha: str, row: MatrixRow) -> None:
+        with self._lock:
+            self._rows[(target_sha, row.branch_sha)] = row
+            self._rows.move_to_end((target_sha, row.branch_sha))
+            while len(self._rows) > self._max_entries:
+                self._rows.popitem(last=False)
+
+
+def list_local_branches(repo_path: str) -> list[tuple[str, str]]:
+    output = run_git(repo_path, ["for-each-ref", "--format=%(refname:short)%00%(objectname)", "refs/heads"])
+    branches: list[tuple[str, str]] = []
+    for line in output.splitlines():
+        name, _, sha = line.partition("\0")
+        if name and sha:
+            branches.append((name, sha))
+    return branches
+
+
+def compute_matrix_row(
+    repo_path: str,
+    target_sha: str,
+    branch: str,
+    branch_sha: str,
+    predictor: ConflictPredictor,
+    cancel: threading.Event | None = None,
+) -> MatrixRow:
+    output = run_git_cancellable(
+        repo_path,
+        ["rev-list", "--left-right", "--count", f"{branch_sha}...{target_sha}"],
+        cancel,
+    )
+    parts = output.split()
+    ahead, behind = (int(parts[0]), int(parts[1])) if len(parts) == 2 else (0, 0)
+    # A branch already contained in the target cannot conflict.
+    paths = predictor.predict_branches(repo_path, target_sha, branch_sha, cancel) if ahead else []
+    return MatrixRow(branch=branch, branch_sha=branch_sha, ahead=ahead, behind=behind, conflict_paths=tuple(paths))
+
+
+def compute_branch_matrix(
+    repo_path: str,
+    target: str,
+    cache: MatrixCache,
+    predictor: ConflictPredictor,
+    on_row: Callable[[MatrixRow], None],
+    cancel: threading.Event | None = None,
+    workers: int = MATRIX_WORKERS,
+) -> int:
+    # Calls ``on_row`` for every other local branch as soon as its row is
+    # ready: cached rows first, then the rest in completion order. Returns
+    # the number of branches compared.
+    target_sha = run_git(repo_path, ["rev-parse", f"{target}^{{commit}}"]).strip()
+    pending: list[tuple[str, str]] = []
+    total = 0
+    for branch, branch_sha in list_local_branches(repo_path):
+        if branch == target:
+            continue
+        total += 1
+        row = cache.get(target_sha, branch, branch_sha)
+        if row is not None:
+            on_row(row)
+        else:
+            pending.append((branch, branch_sha))
+    if not pending:
+        return total
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {
+            executor.submit(compute_matrix_row, repo_path, target_sha, branch, branch_sha, predictor, cancel)
+            for branch, branch_sha in pending
+        }
+        while futures:
+            done, futures = wait(futures, timeout=0.2, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                raise GitCancelled()
+            for future in done:
+                row = future.result()
+                cache.put(target_sha, row)
+                on_row(row)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return total
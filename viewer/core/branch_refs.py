@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import os
+import threading
+
+from .git_client import FIELD_SEP, run_git
+
+_REF_FIELDS = (
+    "%(refname)",
+    "%(refname:short)",
+    "%(objectname)",
+    "%(committerdate:unix)",
+    "%(upstream:short)",
+    "%(upstream:track,nobracket)",
+    "%(HEAD)",
+)
+# `%(ahead-behind:...)` needs git 2.41; older git fails the whole command,
+# so the field is dropped after the first "unknown field name".
+_AHEAD_BEHIND_FIELD = "%(ahead-behind:HEAD)"
+BRANCH_SORTS = ("nome", "data")
+
+
+@dataclasses.dataclass(frozen=True)
+class BranchRef:
+    name: str
+    refname: str
+    object_id: str
+    committer_time: int
+    upstream: str = ""
+    # "ahead 1, behind 2", "gone" or "" as printed by %(upstream:track).
+    upstream_track: str = ""
+    is_head: bool = False
+    # Divergence from HEAD; None when git is too old to report it.
+    ahead: int | None = None
+    behind: int | None = None
+
+    @property
+    def is_remote(self) -> bool:
+        return self.refname.startswith("refs/remotes/")
+
+
+def build_for_each_ref_args(with_ahead_behind: bool) -> list[str]:
+    fields = list(_REF_FIELDS)
+    if with_ahead_behind:
+        fields.append(_AHEAD_BEHIND_FIELD)
+    return ["for-each-ref", f"--format={'%1f'.join(fields)}", "refs/heads", "refs/remotes"]
+
+
+def parse_branch_refs(output: str) -> list[BranchRef]:
+    refs: list[BranchRef] = []
+    for line in output.splitlines():
+        parts = line.split(FIELD_SEP)
+        if len(parts) < len(_REF_FIELDS):
+            continue
+        refname, name, object_id, committer_time, upstream, track, head = parts[: len(_REF_FIELDS)]
+        # refs/remotes/origin/HEAD is a symref to a branch already listed.
+        if refname.startswith("refs/remotes/") and refname.endswith("/HEAD"):
+            continue
+        ahead = behind = None
+        if len(parts) > len(_REF_FIELDS):
+            counts = parts[len(_REF_FIELDS)].split()
+            if len(counts) == 2 and counts[0].isdigit() and counts[1].isdigit():
+                ahead, behind = int(counts[0]), int(counts[1])
+        refs.append(
+            BranchRef(
+                name=name,
+                refname=refname,
+                object_id=object_id,
+                committer_time=int(committer_time) if committer_time.isdigit() else 0,
+                upstream=upstream,
+                upstream_track=track,
+                is_head=head == "*",
+                ahead=ahead,
+                behind=behind,
+            )
+        )
+    return refs
+
+
+def filter_branch_refs(
+    refs: list[BranchRef],
+    text: str = "",
+    include_remotes: bool = True,
+    sort: str = "nome",
+) -> list[BranchRef]:
+    # Runs on every keystroke of the filter, so it stays a single pass over
+    # the already-loaded refs.
+    needle = text.strip().lower()
+    selected = [
+        ref
+        for ref in refs
+        if (include_remotes or not ref.is_remote) and (not needle or needle in ref.name.lower())
+    ]
+    if sort == "data":
+        selected.sort(key=lambda ref: (-ref.committer_time, ref.name))
+    else:
+        selected.sort(key=lambda ref: (ref.is_remote, ref.name))
+    return selected
+
+
+def git_dirs(repo_path: str) -> tuple[str, str]:
+    output = run_git(repo_path, ["rev-parse", "--git-dir", "--git-common-dir"]).splitlines()
+    git_dir = os.path.join(repo_path, output[0])
+    common_dir = os.path.join(repo_path, output[1]) if len(output) > 1 else git_dir
+    return git_dir, common_dir
+
+
+def _tree_mtimes(path: str) -> list[int]:
+    # Directory mtimes only: git updates a loose ref by renaming a lock file
+    # over it, which touches the directory, so files need no stat of their own.
+    mtimes: list[int] = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            mtimes.append(os.stat(current).st_mtime_ns)
+            with os.scandir(current) as entries:
+                stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    return mtimes
+
+
+def refs_signature(git_dir: str, common_dir: str) -> tuple[int, ...]:
+    signature: list[int] = []
+    for path in (
+        os.path.join(common_dir, "packed-refs"),
+        os.path.join(common_dir, "config"),
+        os.path.join(git_dir, "HEAD"),
+    ):
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    signature.extend(_tree_mtimes(os.path.join(common_dir, "refs")))
+    return tuple(signature)
+
+
+class BranchRefCache:
+    # Branch refs per repo, reloaded only when packed-refs, the loose ref
+    # directories, HEAD or the config (upstreams) change on disk.
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[tuple[int, ...], list[BranchRef]]] = {}
+        self._dirs: dict[str, tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self.ahead_behind_supported = True
+
+    def load(self, repo_path: str) -> list[BranchRef]:
+        with self._lock:
+            dirs = self._dirs.get(repo_path)
+        if dirs is None:
+            dirs = git_dirs(repo_path)
+            with self._lock:
+                self._dirs[repo_path] = dirs
+        signature = refs_signature(*dirs)
+        with self._lock:
+            cached = self._entries.get(repo_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        refs = self._query(repo_path)
+        with self._lock:
+            self._entries[repo_path] = (signature, refs)
+        return refs
+
+    def _query(self, repo_path: str) -> list[BranchRef]:
+        if self.ahead_behind_supported:
+            try:
+                return parse_branch_refs(run_git(repo_path, build_for_each_ref_args(True)))
+            except RuntimeError as exc:
+                # An unborn HEAD also fails the field; only an unknown field
+                # means this git lacks it for good.
+                if "unknown field name" in str(exc):
+                    self.ahead_behind_supported = False
+        return parse_branch_refs(run_git(repo_path, build_for_each_ref_args(False)))
+
+    def invalidate(self, repo_path: str) -> None:
+        with self._lock:
+            self._entries.pop(repo_path, None)
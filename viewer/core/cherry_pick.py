@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import os
+import subprocess
+import threading
+import time
+from typing import Callable
+
+from .git_client import GitCancelled, run_git, run_git_cancellable
+
+# Hashes per `fetch` call; keeps the command line under the Windows limit
+# (32k chars) while a typical import still goes out in a single fetch.
+FETCH_BATCH_SIZE = 500
+RESUME_ACTIONS = ("continue", "skip")
+
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class CherryPickResult:
+    applied: int
+    total: int
+    # Stopped on a conflict (or a commit that became empty) with the
+    # sequencer state kept for `cherry-pick --continue/--skip/--abort`.
+    stopped: bool = False
+    message: str = ""
+    # Requested commits left out because HEAD already contains them.
+    skipped: int = 0
+    # Cancelled mid-sequence: the commits applied so far are kept, unless
+    # ``aborted``, when `cherry-pick --abort` put HEAD back where it was.
+    cancelled: bool = False
+    aborted: bool = False
+
+
+def parse_batch_check(output: str, tokens: list[str]) -> tuple[list[str], list[str]]:
+    # `cat-file --batch-check` answers one line per input line, in order:
+    # "<sha> commit" or "<input> missing|ambiguous".
+    found: list[str] = []
+    missing: list[str] = []
+    for token, line in zip(tokens, output.splitlines()):
+        parts = line.split()
+        if len(parts) == 2 and parts[1] == "commit":
+            if parts[0] not in found:
+                found.append(parts[0])
+        else:
+            missing.append(token)
+    missing.extend(tokens[len(output.splitlines()) :])
+    return found, missing
+
+
+def resolve_commits(repo_path: str, tokens: list[str]) -> list[str]:
+    # Abbreviated hashes and refs to full SHAs in one process; fetch only
+    # accepts full object names.
+    output = run_git(
+        repo_path,
+        ["cat-file", "--batch-check=%(objectname) %(objecttype)"],
+        input_text="".join(f"{token}^{{commit}}\n" for token in tokens),
+    )
+    found, missing = parse_batch_check(output, tokens)
+    if missing:
+        raise RuntimeError(f"Commits não encontrados na origem: {', '.join(missing)}")
+    return found
+
+
+def missing_commits(repo_path: str, commits: list[str]) -> list[str]:
+    if not commits:
+        return []
+    output = run_git(
+        repo_path,
+        ["cat-file", "--batch-check=%(objectname) %(objecttype)"],
+        input_text="".join(f"{commit}\n" for commit in commits),
+    )
+    _found, missing = parse_batch_check(output, commits)
+    return missing
+
+
+def fetch_commits(
+    repo_path: str,
+    source_path: str,
+    commits: list[str],
+    cancel: threading.Event | None = None,
+) -> int:
+    # Only what the target lacks, all hashes per fetch call.
+    wanted = missing_commits(repo_path, commits)
+    for start in range(0, len(wanted), FETCH_BATCH_SIZE):
+        run_git_cancellable(
+            repo_path,
+            ["fetch", "--quiet", "--no-tags", source_path, *wanted[start : start + FETCH_BATCH_SIZE]],
+            cancel,
+        )
+    return len(wanted)
+
+
+def order_commits(repo_path: str, commits: list[str], cancel: threading.Event | None = None) -> list[str]:
+    # Parents before children. The walk stops at HEAD, so commits HEAD
+    # already has never come out and are dropped; rev-list is read only
+    # until every requested commit has been seen.
+    wanted = set(commits)
+    seen: list[str] = []
+    process = subprocess.Popen(
+        ["git", "-C", repo_path, "rev-list", "--topo-order", "--stdin"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    assert process.stdin is not None and process.stdout is not None
+    process.stdin.write("".join(f"{commit}\n" for commit in commits) + "^HEAD\n")
+    process.stdin.close()
+    try:
+        for line in process.stdout:
+            if cancel is not None and cancel.is_set():
+                raise GitCancelled()
+            commit = line.strip()
+            if commit in wanted:
+                seen.append(commit)
+                if len(seen) == len(wanted):
+                    break
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        stderr = process.stderr.read() if process.stderr else ""
+        process.wait()
+    if len(seen) < len(wanted) and process.returncode != 0:
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    seen.reverse()
+    return seen
+
+
+def sequencer_todo_path(repo_path: str) -> str:
+    # --git-path follows linked worktrees to their own state directory.
+    return os.path.join(repo_path, run_git(repo_path, ["rev-parse", "--git-path", "sequencer/todo"]).strip())
+
+
+def count_todo(path: str) -> int | None:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            return sum(1 for line in handle if line.strip() and not line.startswith("#"))
+    except OSError:
+        return None
+
+
+def _has_cherry_pick_head(repo_path: str) -> bool:
+    # A pick stopped on its own conflict (or emptiness), not just a sequence
+    # waiting between picks.
+    try:
+        run_git(repo_path, ["rev-parse", "--quiet", "--verify", "CHERRY_PICK_HEAD"])
+    except RuntimeError:
+        return False
+    return True
+
+
+def _has_conflicts(repo_path: str) -> bool:
+    return bool(run_git(repo_path, ["diff", "--name-only", "--diff-filter=U"]).strip())
+
+
+def cherry_pick_in_progress(repo_path: str) -> bool:
+    return _has_cherry_pick_head(repo_path) or os.path.exists(os.path.dirname(sequencer_todo_path(repo_path)))
+
+
+def _stop_between_picks(process: subprocess.Popen, repo_path: str) -> str:
+    # Killing git mid-pick leaves lock files and half-written work trees.
+    # Holding index.lock instead (taken with O_EXCL, as git does) makes the
+    # next pick fail before it touches anything, so git stops on its own.
+    # While we hold it every other git command that needs the index fails
+    # too, the app's own auto-status included; it is released as soon as
+    # this git exits, which is at most one pick away.
+    lock_path = os.path.join(repo_path, run_git(repo_path, ["rev-parse", "--git-path", "index.lock"]).strip())
+    handle = None
+    while process.poll() is None and handle is None:
+        try:
+            handle = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            time.sleep(0.005)
+    try:
+        _stdout, stderr = process.communicate()
+    finally:
+        if handle is not None:
+            os.close(handle)
+            os.remove(lock_path)
+    return stderr
+
+
+def _run_sequencer(
+    repo_path: str,
+    args: list[str],
+    total: int,
+    on_progress: ProgressCallback | None,
+    cancel: threading.Event | None,
+    input_text: str | None = None,
+    keep_applied: bool = False,
+) -> CherryPickResult:
+    # One git process for the whole sequence; progress is how far
+    # .git/sequencer/todo has shrunk, polled while git runs. A cancel
+    # aborts the sequence, or with ``keep_applied`` quits it so the
+    # commits already picked stay.
+    todo_path = sequencer_todo_path(repo_path)
+    if cancel is not None and cancel.is_set():
+        raise GitCancelled()
+    process = subprocess.Popen(
+        ["git", "-C", repo_path, *args],
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        # --continue would otherwise open an editor for the message.
+        env={**os.environ, "GIT_EDITOR": "true"},
+    )
+    reported = -1
+    pending_input = input_text
+    while True:
+        try:
+            _stdout, stderr = process.communicate(pending_input, timeout=0.1)
+            break
+        except subprocess.TimeoutExpired:
+            # The input is only written on the first call.
+            pending_input = None
+            remaining = count_todo(todo_path)
+            if remaining is not None and on_progress is not None:
+                done = max(0, min(total, total - remaining))
+                if done != reported:
+                    reported = done
+                    on_progress(done, total)
+            if cancel is not None and cancel.is_set():
+                stderr = _stop_between_picks(process, repo_path)
+                if process.returncode != 0 and cherry_pick_in_progress(repo_path):
+                    if not keep_applied:
+                        # --abort puts HEAD back where the sequence started.
+                        run_git(repo_path, ["cherry-pick", "--abort"])
+                        return CherryPickResult(applied=0, total=total, cancelled=True, aborted=True)
+                    # With no CHERRY_PICK_HEAD git stopped between picks. Our
+                    # lock can also stop it between applying a pick and
+                    # committing it, which leaves CHERRY_PICK_HEAD but no
+                    # unmerged paths; reset --merge drops that half pick, as
+                    # --abort does, and --quit forgets the rest. HEAD stays.
+                    half_pick = _has_cherry_pick_head(repo_path)
+                    if not half_pick or not _has_conflicts(repo_path):
+                        remaining = count_todo(todo_path)
+                        if half_pick:
+                            run_git(repo_path, ["reset", "--merge", "HEAD"])
+                        run_git(repo_path, ["cherry-pick", "--quit"])
+                        applied = total - remaining if remaining is not None else 0
+                        return CherryPickResult(applied=max(0, applied), total=total, cancelled=True)
+                # Finished, or stopped on a conflict, before the lock was taken.
+                break
+    if process.returncode == 0:
+        if on_progress is not None:
+            on_progress(total, total)
+        return CherryPickResult(applied=total, total=total)
+    if not cherry_pick_in_progress(repo_path):
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    remaining = count_todo(todo_path)
+    applied = total - remaining if remaining is not None else 0
+    return CherryPickResult(
+        applied=max(0, applied),
+        total=total,
+        stopped=True,
+        message=stderr.strip(),
+    )
+
+
+def cherry_pick_commits(
+    repo_path: str,
+    commits: list[str],
+    on_progress: ProgressCallback | None = None,
+    cancel: threading.Event | None = None,
+) -> CherryPickResult:
+    # The list goes in over stdin, applied in the given order.
+    return _run_sequencer(
+        repo_path,
+        ["cherry-pick", "--stdin"],
+        len(commits),
+        on_progress,
+        cancel,
+        input_text="".join(f"{commit}\n" for commit in commits),
+    )
+
+
+def resume_cherry_pick(
+    repo_path: str,
+    action: str,
+    on_progress: ProgressCallback | None = None,
+    cancel: threading.Event | None = None,
+) -> CherryPickResult:
+    if action not in RESUME_ACTIONS:
+        raise ValueError(f"Ação de cherry-pick inválida: {action}")
+    # Cancelling here keeps what is applied: the picks before the conflict
+    # were already shown, and --abort would silently undo them too.
+    total = count_todo(sequencer_todo_path(repo_path)) or 1
+    return _run_sequencer(repo_path, ["cherry-pick", f"--{action}"], total, on_progress, cancel, keep_applied=True)
+
+
+def apply_commits(
+    repo_path: str,
+    commits: list[str],
+    on_stage: Callable[[str], None] | None = None,
+    on_progress: ProgressCallback | None = None,
+    cancel: threading.Event | None = None,
+) -> CherryPickResult:
+    # Topological order, then one cherry-pick for the whole list; the order
+    # the commits were selected in does not matter.
+    if on_stage is not None:
+        on_stage("Ordenando...")
+    ordered = order_commits(repo_path, commits, cancel)
+    skipped = len(commits) - len(ordered)
+    if not ordered:
+        return CherryPickResult(applied=0, total=0, skipped=skipped)
+    if cancel is not None and cancel.is_set():
+        raise GitCancelled()
+    if on_stage is not None:
+        on_stage(f"Aplicando {len(ordered)} commit(s)...")
+    result = cherry_pick_commits(repo_path, ordered, on_progress, cancel)
+    return dataclasses.replace(result, skipped=skipped)
+
+
+def import_commits(
+    repo_path: str,
+    source_path: str,
+    tokens: list[str],
+    on_stage: Callable[[str], None] | None = None,
+    on_progress: ProgressCallback | None = None,
+    cancel: threading.Event | None = None,
+) -> CherryPickResult:
+    # resolve -> fetch -> apply_commits.
+    def stage(text: str) -> None:
+        if cancel is not None and cancel.is_set():
+            raise GitCancelled()
+        if on_stage is not None:
+            on_stage(text)
+
+    stage("Resolvendo hashes...")
+    commits = resolve_commits(source_path, tokens)
+    stage(f"Buscando {len(commits)} commit(s)...")
+    fetch_commits(repo_path, source_path, commits, cancel)
+    return apply_commits(repo_path, commits, stage, on_progress, cancel)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import os
+import subprocess
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from .git_client import run_git
+
+GREP_BATCH_SECONDS = 0.05
+GREP_MAX_LINE_CHARS = 300
+GREP_WORKERS = max(1, min(8, os.cpu_count() or 1))
+# Paths per worker call in parallel mode; keeps argv well under the OS limit.
+GREP_PATHS_PER_CALL = 2000
+
+# One file with its hits as (line number, text).
+GrepGroup = tuple[str, list[tuple[int, str]]]
+
+
+@dataclasses.dataclass(frozen=True)
+class GrepQuery:
+    pattern: str
+    rev: str = ""
+    regex: bool = False
+    ignore_case: bool = False
+
+
+class GrepParser:
+    # Reads `git grep -n -z` output ("path NUL line NUL text LF") in arbitrary
+    # chunks and hands back whole files only, so hits of a file are never
+    # split between batches.
+    def __init__(self, prefix: str = "") -> None:
+        self._prefix = prefix.encode("utf-8")
+        self._pending = b""
+        self._path = ""
+        self._hits: list[tuple[int, str]] = []
+
+    def feed(self, data: bytes) -> list[GrepGroup]:
+        data = self._pending + data
+        end = data.rfind(b"\n")
+        if end < 0:
+            self._pending = data
+            return []
+        self._pending = data[end + 1 :]
+        groups: list[GrepGroup] = []
+        for record in data[:end].split(b"\n"):
+            path_bytes, _, rest = record.partition(b"\0")
+            line_bytes, _, text = rest.partition(b"\0")
+            if not line_bytes.isdigit():
+                continue
+            if self._prefix and path_bytes.startswith(self._prefix):
+                path_bytes = path_bytes[len(self._prefix) :]
+            path = path_bytes.decode("utf-8", errors="replace")
+            if path != self._path:
+                if self._hits:
+                    groups.append((self._path, self._hits))
+                self._path = path
+                self._hits = []
+            self._hits.append((int(line_bytes), text[:GREP_MAX_LINE_CHARS].decode("utf-8", errors="replace")))
+        return groups
+
+    def close(self) -> list[GrepGroup]:
+        groups = self.feed(b"\n") if self._pending else []
+        if self._hits:
+            groups.append((self._path, self._hits))
+            self._hits = []
+        return groups
+
+
+class GrepResults:
+    # Flat rows for a virtual list: each file is a header row followed by its
+    # hits. Row r is a hit when ``row_hits[r] >= 0``, else the header of file
+    # ``-row_hits[r] - 1``. Hit columns live in arrays; texts in one list.
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self.file_hit_counts = array("I")
+        self.row_hits = array("i")
+        self.hit_files = array("I")
+        self.hit_lines = array("I")
+        self.hit_texts: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.row_hits)
+
+    @property
+    def hit_count(self) -> int:
+        return len(self.hit_lines)
+
+    def add(self, groups: list[GrepGroup]) -> None:
+        for path, hits in groups:
+            file_index = len(self.files)
+            self.files.append(path)
+            self.file_hit_counts.append(len(hits))
+            self.row_hits.append(-file_index - 1)
+            for line, text in hits:
+                self.row_hits.append(len(self.hit_lines))
+                self.hit_files.append(file_index)
+                self.hit_lines.append(line)
+                self.hit_texts.append(text)
+
+    def location(self, row: int) -> tuple[str, int | None]:
+        # (path, line) of a row; headers have no line.
+        hit = self.row_hits[row]
+        if hit < 0:
+            return self.files[-hit - 1], None
+        return self.files[self.hit_files[hit]], self.hit_lines[hit]
+
+    def row_text(self, row: int) -> str:
+        hit = self.row_hits[row]
+        if hit < 0:
+            file_index = -hit - 1
+            return f"{self.files[file_index]} ({self.file_hit_counts[file_index]})"
+        return f"    {self.hit_lines[hit]:>6}: {self.hit_texts[hit]}"
+
+
+def resolve_search_rev(repo_path: str, rev: str) -> str:
+    return run_git(repo_path, ["rev-parse", "--verify", f"{rev}^{{commit}}"]).strip() if rev else ""
+
+
+def _grep_args(repo_path: str, query: GrepQuery) -> list[str]:
+    args = ["git", "-C", repo_path, "grep", "-n", "-z", "-I", "--no-color"]
+    if query.ignore_case:
+        args.append("-i")
+    args.append("-E" if query.regex else "-F")
+    args.extend(["-e", query.pattern])
+    if query.rev:
+        args.append(query.rev)
+    return args
+
+
+def _stream_grep(
+    args: list[str],
+    parser: GrepParser,
+    on_groups: Callable[[list[GrepGroup]], None],
+    cancel: threading.Event,
+) -> None:
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.stdout is not None
+    try:
+        while True:
+            if cancel.is_set():
+                process.kill()
+                break
+            data = process.stdout.read1(1 << 16)
+            if not data:
+                break
+            groups = parser.feed(data)
+            if groups:
+                on_groups(groups)
+    finally:
+        stderr = process.stderr.read().decode("utf-8", errors="replace") if process.stderr else ""
+        returncode = process.wait()
+    if cancel.is_set():
+        return
+    # git grep exits with 1 when nothing matched.
+    if returncode not in (0, 1):
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    groups = parser.close()
+    if groups:
+        on_groups(groups)
+
+
+def _list_paths(repo_path: str, rev: str) -> list[str]:
+    if rev:
+        output = run_git(repo_path, ["ls-tree", "-r", "-z", "--name-only", rev])
+    else:
+        output = run_git(repo_path, ["ls-files", "-z", "--cached"])
+    return [path for path in output.split("\0") if path]
+
+
+def run_code_search(
+    repo_path: str,
+    query: GrepQuery,
+    on_batch: Callable[[list[GrepGroup]], None],
+    cancel: threading.Event,
+    parallel: bool = False,
+) -> None:
+    # Runs on a worker thread; ``query.rev`` is a resolved commit or "" for
+    # the worktree. Whole files reach ``on_batch`` every GREP_BATCH_SECONDS.
+    # Parallel mode splits the file list into pathspec slices, greps them on
+    # several git processes at once and reports slices in path order, so the
+    # results match a single git grep.
+    prefix = f"{query.rev}:" if query.rev else ""
+    batch: list[GrepGroup] = []
+    last_flush = time.perf_counter()
+
+    def collect(groups: list[GrepGroup]) -> None:
+        nonlocal batch, last_flush
+        batch.extend(groups)
+        now = time.perf_counter()
+        if now - last_flush >= GREP_BATCH_SECONDS:
+            on_batch(batch)
+            batch = []
+            last_flush = now
+
+    base_args = _grep_args(repo_path, query)
+    if not parallel or GREP_WORKERS == 1:
+        _stream_grep(base_args, GrepParser(prefix), collect, cancel)
+    else:
+        paths = _list_paths(repo_path, query.rev)
+        size = max(1, min(GREP_PATHS_PER_CALL, -(-len(paths) // GREP_WORKERS)))
+        slices = [paths[start : start + size] for start in range(0, len(paths), size)]
+
+        def grep_slice(paths_slice: list[str]) -> list[GrepGroup]:
+            found: list[GrepGroup] = []
+            if not cancel.is_set():
+                args = [*base_args, "--", *(f":(literal){path}" for path in paths_slice)]
+                _stream_grep(args, GrepParser(prefix), found.extend, cancel)
+            return found
+
+        executor = ThreadPoolExecutor(max_workers=GREP_WORKERS)
+        try:
+            for future in [executor.submit(grep_slice, paths_slice) for paths_slice in slices]:
+                if cancel.is_set():
+                    break
+                found = future.result()
+                if found:
+                    collect(found)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    if batch and not cancel.is_set():
+        on_batch(batch)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import re
+from typing import Mapping
+
+from .commit_store import CommitStore
+from .models import CommitFilters, CommitInfo
+
+# Characters that make ``--author`` a real regex (git uses basic regex);
+# anything else is a literal except ``.``, which matches any character.
+_AUTHOR_REGEX_CHARS = frozenset("*[]^$\\")
+
+
+@dataclasses.dataclass
+class CommitWindow:
+    # Commits loaded straight from git for ``filters``; narrower filters are
+    # answered from ``store`` and only go back to git past its last row.
+    filters: CommitFilters
+    store: CommitStore
+    exhausted: bool = False
+
+
+@dataclasses.dataclass
+class LocalFilterResult:
+    # Rows of the loaded window that match, plus rows whose subject does not
+    # match the text and whose body is not cached yet (git must check those).
+    rows: list[int]
+    pending: list[int]
+
+
+def author_matcher(author: str, literal: bool = False) -> re.Pattern[str] | None:
+    if literal:
+        return re.compile(re.escape(author))
+    if any(char in _AUTHOR_REGEX_CHARS for char in author):
+        return None
+    return re.compile(".".join(re.escape(part) for part in author.split(".")))
+
+
+def author_is_literal(filters: CommitFilters) -> bool:
+    # build_log_args adds --fixed-strings for a message text, and git then
+    # matches --author literally as well.
+    return bool(filters.text) and not filters.search_mode
+
+
+def _author_narrows(base: str, author: str, base_literal: bool, literal: bool) -> bool:
+    if author == base and base_literal == literal:
+        return True
+    if author_matcher(author, literal) is None:
+        return False
+    if not base:
+        return True
+    if base not in author:
+        return False
+    if base_literal:
+        # A "." in a literal base is only kept by a literal narrowing.
+        return literal or "." not in base
+    return author_matcher(base) is not None
+
+
+def narrows(base: CommitFilters, filters: CommitFilters) -> bool:
+    # True when every commit matching ``filters`` also matches ``base``: the
+    # other fields are unchanged and text/author only grew. Git's matches for
+    # the narrower filter are then a prefix-preserving subset of the window.
+    if (filters.path, filters.since, filters.until, filters.ref, filters.repo_status, filters.search_mode) != (
+        base.path,
+        base.since,
+        base.until,
+        base.ref,
+        base.repo_status,
+        base.search_mode,
+    ):
+        return False
+    # Diff searches are not answered from loaded subjects.
+    if filters.search_mode:
+        return False
+    return base.text in filters.text and _author_narrows(
+        base.author, filters.author, author_is_literal(base), author_is_literal(filters)
+    )
+
+
+def filter_loaded(
+    store: CommitStore,
+    base: CommitFilters,
+    filters: CommitFilters,
+    details: Mapping[str, CommitInfo],
+) -> LocalFilterResult:
+    # Evaluates a narrowing of ``base`` against the rows loaded for ``base``.
+    rows: list[int] = list(range(len(store)))
+    literal = author_is_literal(filters)
+    if filters.author and (filters.author != base.author or literal != author_is_literal(base)):
+        matcher = author_matcher(filters.author, literal)
+        assert matcher is not None
+        rows = store.author_rows(lambda name: matcher.search(name) is not None)
+    if filters.text == base.text or not rows:
+        return LocalFilterResult(rows=rows, pending=[])
+    text = filters.text
+    in_subject = set(store.subject_rows(text))
+    # git --grep looks at the whole message; cached details carry the body.
+    known: dict[int, bool] = {}
+    for commit_hash, commit in details.items():
+        row = store.index_of(commit_hash)
+        if row is not None:
+            known[row] = text in commit.subject or text in commit.body
+    matched: list[int] = []
+    pending: list[int] = []
+    for row in rows:
+        if row in in_subject or known.get(row):
+            matched.append(row)
+        elif row not in known:
+            pending.append(row)
+    return LocalFilterResult(rows=matched, pending=pending)
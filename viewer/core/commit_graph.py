@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import Sequence
+
+from .commit_store import CommitStore
+
+CHECKPOINT_ROWS = 256
+
+
+class CommitGraph:
+    # Incremental lane layout for the History graph column.
+    #
+    # Every parent edge becomes a track: it leaves its child's node, runs
+    # down a fixed lane and joins the parent's node when that row arrives.
+    # Lanes never move once assigned, so a new page only appends rows and
+    # closes tracks that were still open; earlier rows are never laid out
+    # again. Freed lanes are reused leftmost first. Each row costs O(parents
+    # + log lanes); every CHECKPOINT_ROWS rows the open tracks are recorded
+    # so drawing a window only visits tracks that cross it.
+    def __init__(self) -> None:
+        self._node_lanes = array("i")
+        self._track_lanes = array("i")
+        self._track_starts = array("i")
+        self._track_ends = array("i")
+        self._track_from = array("i")
+        self._track_to = array("i")
+        self._lanes: list[int] = []
+        self._free_lanes: list[int] = []
+        self._waiting: dict[str, list[int]] = {}
+        self._checkpoint_ends = array("Q")
+        self._checkpoint_tracks = array("i")
+        self.width = 0
+
+    def __len__(self) -> int:
+        return len(self._node_lanes)
+
+    @property
+    def open_lanes(self) -> int:
+        return sum(1 for track in self._lanes if track >= 0)
+
+    def node_lane(self, row: int) -> int:
+        return self._node_lanes[row]
+
+    def extend(self, store: CommitStore) -> None:
+        # Lays out the rows of ``store`` that are not in the graph yet.
+        for row in range(len(self), len(store)):
+            parents = store.parents_at(row)
+            # With clock skew a parent can be listed above its child; that
+            # edge would never close, so it is not drawn.
+            parents = tuple(
+                parent for parent in parents if parent in self._waiting or not self._listed_before(store, parent, row)
+            )
+            self.add(store.hash_at(row), parents)
+
+    def add(self, commit_hash: str, parents: Sequence[str]) -> None:
+        row = len(self._node_lanes)
+        if row % CHECKPOINT_ROWS == 0:
+            self._checkpoint_tracks.extend(track for track in self._lanes if track >= 0)
+            self._checkpoint_ends.append(len(self._checkpoint_tracks))
+        arriving = self._waiting.pop(commit_hash, [])
+        if arriving:
+            node = min(self._track_lanes[track] for track in arriving)
+            for track in arriving:
+                lane = self._track_lanes[track]
+                self._track_ends[track] = row
+                self._track_to[track] = node
+                self._lanes[lane] = -1
+                if lane != node:
+                    heapq.heappush(self._free_lanes, lane)
+        else:
+            node = self._allocate()
+        self._node_lanes.append(node)
+        if not parents:
+            heapq.heappush(self._free_lanes, node)
+        # The first parent continues straight down the node's own lane.
+        for index, parent in enumerate(parents):
+            lane = node if index == 0 else self._allocate()
+            track = len(self._track_lanes)
+            self._track_lanes.append(lane)
+            self._track_starts.append(row)
+            self._track_ends.append(-1)
+            self._track_from.append(node)
+            self._track_to.append(lane)
+            self._lanes[lane] = track
+            self._waiting.setdefault(parent, []).append(track)
+
+    def tracks_between(self, top: int, bottom: int) -> list[int]:
+        # Tracks drawn anywhere between rows ``top`` and ``bottom`` (inclusive).
+        if not len(self._node_lanes):
+            return []
+        block = min(max(top, 0) // CHECKPOINT_ROWS, len(self._checkpoint_ends) - 1)
+        first = self._checkpoint_ends[block - 1] if block else 0
+        candidates = list(self._checkpoint_tracks[first : self._checkpoint_ends[block]])
+        begin = bisect_right(self._track_starts, block * CHECKPOINT_ROWS - 1)
+        end = bisect_right(self._track_starts, bottom)
+        candidates.extend(range(begin, end))
+        ends = self._track_ends
+        return [track for track in candidates if ends[track] < 0 or ends[track] >= top]
+
+    def track_points(self, track: int) -> list[tuple[int, int]]:
+        # Polyline as (row, lane) pairs; open tracks run to the last row.
+        start = self._track_starts[track]
+        end = self._track_ends[track]
+        lane = self._track_lanes[track]
+        source = self._track_from[track]
+        if end < 0:
+            return [(start, source), (start + 1, lane), (max(len(self._node_lanes), start + 1), lane)]
+        if end == start + 1:
+            return [(start, source), (end, self._track_to[track])]
+        return [(start, source), (start + 1, lane), (end - 1, lane), (end, self._track_to[track])]
+
+    def track_lane(self, track: int) -> int:
+        return self._track_lanes[track]
+
+    def _allocate(self) -> int:
+        if self._free_lanes:
+            lane = heapq.heappop(self._free_lanes)
+        else:
+            lane = len(self._lanes)
+            self._lanes.append(-1)
+            self.width = len(self._lanes)
+        return lane
+
+    @staticmethod
+    def _listed_before(store: CommitStore, commit_hash: str, row: int) -> bool:
+        index = store.index_of(commit_hash)
+        return index is not None and index < row
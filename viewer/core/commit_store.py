@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator, Sequence
+
+from .models import CommitSummary
+
+_MIN_SLOTS = 16
+
+
+class CommitStore:
+    # Columnar replacement for list[CommitSummary]: binary hashes packed in one
+    # bytearray, UTF-8 subjects in a shared pool with end offsets, and an
+    # open-addressing table (row + 1 per slot) for hash -> index lookups.
+    # A dict would cost ~100 bytes per commit; the slot table costs 8-16.
+    # The table catches up lazily on lookup, so appending pages stays cheap.
+    # Authors repeat a lot, so they are interned and stored as 4-byte ids;
+    # parent hashes share one binary pool, like the commit hashes.
+    def __init__(self, summaries: Iterable[CommitSummary] = ()) -> None:
+        self._hash_size = 0
+        self._hashes = bytearray()
+        self._subjects = bytearray()
+        self._subject_ends = array("Q")
+        self._author_ids = array("I")
+        self._author_names: list[str] = []
+        self._author_lookup: dict[str, int] = {}
+        self._parents = bytearray()
+        self._parent_ends = array("Q")
+        self._slots = array("i", bytes(4 * _MIN_SLOTS))
+        self._count = 0
+        self._indexed = 0
+        for summary in summaries:
+            self.append(summary.commit_hash, summary.subject)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __getitem__(self, index: int) -> CommitSummary:
+        index = self._check_index(index)
+        return CommitSummary(
+            commit_hash=self.hash_at(index),
+            subject=self.subject_at(index),
+            author=self.author_at(index),
+        )
+
+    def __iter__(self) -> Iterator[CommitSummary]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __contains__(self, commit_hash: object) -> bool:
+        return isinstance(commit_hash, str) and self.index_of(commit_hash) is not None
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self._hashes)
+            + len(self._subjects)
+            + self._subject_ends.itemsize * len(self._subject_ends)
+            + self._author_ids.itemsize * len(self._author_ids)
+            + len(self._parents)
+            + self._parent_ends.itemsize * len(self._parent_ends)
+            + self._slots.itemsize * len(self._slots)
+        )
+
+    def hash_at(self, index: int) -> str:
+        start = index * self._hash_size
+        return self._hashes[start : start + self._hash_size].hex()
+
+    def short_hash_at(self, index: int, length: int = 7) -> str:
+        start = index * self._hash_size
+        return self._hashes[start : start + (length + 1) // 2].hex()[:length]
+
+    def subject_at(self, index: int) -> str:
+        start = self._subject_ends[index - 1] if index else 0
+        return self._subjects[start : self._subject_ends[index]].decode("utf-8", errors="replace")
+
+    def author_at(self, index: int) -> str:
+        return self._author_names[self._author_ids[index]]
+
+    def parents_at(self, index: int) -> tuple[str, ...]:
+        size = self._hash_size
+        start = self._parent_ends[index - 1] if index else 0
+        end = self._parent_ends[index]
+        return tuple(self._parents[offset : offset + size].hex() for offset in range(start, end, size))
+
+    def subject_rows(self, needle: str) -> list[int]:
+        # Scans the shared UTF-8 pool with bytes.find instead of decoding each
+        # subject; matches that straddle two subjects are skipped.
+        if not needle:
+            return list(range(self._count))
+        encoded = needle.encode("utf-8")
+        pool = self._subjects
+        ends = self._subject_ends
+        rows: list[int] = []
+        position = pool.find(encoded)
+        while position >= 0:
+            row = bisect_right(ends, position)
+            if position + len(encoded) <= ends[row]:
+                rows.append(row)
+                position = pool.find(encoded, ends[row])
+            else:
+                position = pool.find(encoded, position + 1)
+        return rows
+
+    def author_rows(self, match: Callable[[str], bool]) -> list[int]:
+        # The predicate runs once per distinct author, not once per commit.
+        accepted = {author_id for author_id, name in enumerate(self._author_names) if match(name)}
+        if not accepted:
+            return []
+        return [row for row, author_id in enumerate(self._author_ids) if author_id in accepted]
+
+    def take(self, rows: Iterable[int]) -> CommitStore:
+        # Copies the given rows (in order) into a new store with byte slices.
+        subset = CommitStore()
+        subset._hash_size = size = self._hash_size
+        hashes = self._hashes
+        subjects = self._subjects
+        ends = self._subject_ends
+        author_ids = self._author_ids
+        parents = self._parents
+        parent_ends = self._parent_ends
+        hash_parts: list[bytes] = []
+        subject_parts: list[bytes] = []
+        parent_parts: list[bytes] = []
+        subset_ends = subset._subject_ends
+        subset_authors = subset._author_ids
+        subset_parent_ends = subset._parent_ends
+        total = 0
+        parent_total = 0
+        for row in rows:
+            start = ends[row - 1] if row else 0
+            hash_parts.append(hashes[row * size : (row + 1) * size])
+            subject_parts.append(subjects[start : ends[row]])
+            total += ends[row] - start
+            subset_ends.append(total)
+            subset_authors.append(author_ids[row])
+            parent_start = parent_ends[row - 1] if row else 0
+            parent_parts.append(parents[parent_start : parent_ends[row]])
+            parent_total += parent_ends[row] - parent_start
+            subset_parent_ends.append(parent_total)
+        subset._count = len(subset_ends)
+        subset._hashes = bytearray(b"".join(hash_parts))
+        subset._subjects = bytearray(b"".join(subject_parts))
+        subset._parents = bytearray(b"".join(parent_parts))
+        # Same ids, so the subset gets its own copy of the name table.
+        subset._author_names = list(self._author_names)
+        subset._author_lookup = dict(self._author_lookup)
+        return subset
+
+    def index_of(self, commit_hash: str) -> int | None:
+        try:
+            key = bytes.fromhex(commit_hash)
+        except ValueError:
+            return None
+        if not self._count or len(key) != self._hash_size:
+            return None
+        self._index_pending()
+        row = self._slots[self._find_slot(key)]
+        return row - 1 if row else None
+
+    def append(self, commit_hash: str, subject: str, author: str = "", parents: Sequence[str] = ()) -> None:
+        key = bytes.fromhex(commit_hash)
+        if not self._hash_size:
+            self._hash_size = len(key)
+        elif len(key) != self._hash_size:
+            raise ValueError(f"Hash com tamanho inesperado: {commit_hash}")
+        self._hashes += key
+        self._subjects += subject.encode("utf-8")
+        self._subject_ends.append(len(self._subjects))
+        self._author_ids.append(self._intern_author(author))
+        for parent in parents:
+            self._parents += bytes.fromhex(parent)
+        self._parent_ends.append(len(self._parents))
+        self._count += 1
+
+    def extend(self, other: CommitStore | Iterable[CommitSummary]) -> None:
+        if not isinstance(other, CommitStore):
+            for summary in other:
+                self.append(summary.commit_hash, summary.subject, summary.author)
+            return
+        if not other._count:
+            return
+        if self._hash_size and other._hash_size != self._hash_size:
+            raise ValueError("Paginas com tamanhos de hash diferentes.")
+        self._hash_size = other._hash_size
+        base = len(self._subjects)
+        self._hashes += other._hashes
+        self._subjects += other._subjects
+        self._subject_ends.extend(end + base for end in other._subject_ends)
+        parent_base = len(self._parents)
+        self._parents += other._parents
+        self._parent_ends.extend(end + parent_base for end in other._parent_ends)
+        remap = [self._intern_author(name) for name in other._author_names]
+        self._author_ids.extend(remap[author_id] for author_id in other._author_ids)
+        self._count += other._count
+
+    def _intern_author(self, author: str) -> int:
+        author_id = self._author_lookup.get(author)
+        if author_id is None:
+            author_id = len(self._author_names)
+            self._author_names.append(author)
+            self._author_lookup[author] = author_id
+        return author_id
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("commit index out of range")
+        return index
+
+    def _find_slot(self, key: bytes) -> int:
+        mask = len(self._slots) - 1
+        slot = int.from_bytes(key[:8], "little") & mask
+        size = self._hash_size
+        while True:
+            row = self._slots[slot]
+            if not row:
+                return slot
+            start = (row - 1) * size
+            if self._hashes[start : start + size] == key:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _index_pending(self) -> None:
+        if self._indexed == self._count:
+            return
+        slot_count = len(self._slots)
+        while self._count * 2 > slot_count:
+            slot_count *= 2
+        if slot_count != len(self._slots):
+            # Growing rehashes everything, so start over with a bigger table.
+            self._slots = array("i", bytes(4 * slot_count))
+            self._indexed = 0
+        size = self._hash_size
+        hashes = self._hashes
+        slots = self._slots
+        for row in range(self._indexed, self._count):
+            slot = self._find_slot(bytes(hashes[row * size : (row + 1) * size]))
+            # Duplicate hashes (history rewritten between pages) keep the first row.
+            if not slots[slot]:
+                slots[slot] = row + 1
+        self._indexed = self._count
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+
+Dispatch = Callable[[Callable[[], None]], None]
+
+
+# Runs patch loaders off the UI thread and hands results back via ``dispatch``
+# (``after`` in the app). A newer request on a channel makes older ones stale;
+# loads for the same key share one worker, so prefetched patches are reused.
+class DiffService:
+    def __init__(self, dispatch: Dispatch, max_workers: int = 3) -> None:
+        self._dispatch = dispatch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="diff")
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future[Any]] = {}
+        self._subscribers: dict[Hashable, int] = {}
+        self._generations: dict[str, int] = {}
+        self._channel_keys: dict[str, Hashable] = {}
+
+    def request(
+        self,
+        channel: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> int:
+        generation = self._generations.get(channel, 0) + 1
+        self._generations[channel] = generation
+        previous = self._channel_keys.get(channel)
+        self._channel_keys[channel] = key
+        if previous is not None and previous != key:
+            self._release(previous)
+
+        def deliver(result: Any, error: Exception | None) -> None:
+            if self._generations.get(channel) != generation:
+                return
+            if error is None:
+                on_done(result)
+            elif on_error is not None:
+                on_error(error)
+
+        self._submit(key, loader, deliver)
+        return generation
+
+    def prefetch(self, key: Hashable, loader: Callable[[], Any], on_done: Callable[[Any], None]) -> None:
+        def deliver(result: Any, error: Exception | None) -> None:
+            if error is None:
+                on_done(result)
+
+        self._submit(key, loader, deliver, track=False)
+
+    def cancel(self, channel: str) -> None:
+        self._generations[channel] = self._generations.get(channel, 0) + 1
+        key = self._channel_keys.pop(channel, None)
+        if key is not None:
+            self._release(key)
+
+    def is_loading(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._inflight
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        deliver: Callable[[Any, Exception | None], None],
+        track: bool = True,
+    ) -> None:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(loader)
+                self._inflight[key] = future
+                self._subscribers[key] = 0
+                future.add_done_callback(lambda _f, done_key=key: self._forget(done_key, _f))
+            if track:
+                self._subscribers[key] = self._subscribers.get(key, 0) + 1
+
+        def on_complete(done: Future[Any]) -> None:
+            if done.cancelled():
+                return
+            error = done.exception()
+            result = None if error is not None else done.result()
+            self._dispatch(lambda: deliver(result, error))  # type: ignore[arg-type]
+
+        future.add_done_callback(on_complete)
+
+    def _forget(self, key: Hashable, future: Future[Any]) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+                self._subscribers.pop(key, None)
+
+    def _release(self, key: Hashable) -> None:
+        # Drop a queued load nobody waits for anymore; running ones finish.
+        with self._lock:
+            if key not in self._subscribers:
+                return
+            self._subscribers[key] = max(self._subscribers[key] - 1, 0)
+            future = self._inflight.get(key) if self._subscribers[key] == 0 else None
+        if future is not None:
+            # Cancelling runs the done callbacks, which clean up _inflight.
+            future.cancel()
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import dataclasses
 import tkinter as tk
 
-from .models import DiffData, DiffHunk, DiffLineInfo
+from .models import AlignedRow, DiffData, DiffHunk, DiffLineInfo
 
 
 def parse_hunk_header(header: str) -> tuple[int, int]:
@@ -107,6 +108,42 @@ def parse_diff_data(diff_text: str) -> DiffData:
     return DiffData(header_lines=header_lines, hunks=hunks)
 
 
+def align_diff_rows(diff_data: DiffData) -> list[AlignedRow]:
+    # Pairs each run of removed lines with the added run that follows it;
+    # line number 0 marks the empty side of an unpaired row.
+    rows: list[AlignedRow] = []
+    for hunk in diff_data.hunks:
+        rows.append(AlignedRow("hunk", 0, hunk.header, 0, hunk.header))
+        removed: list[DiffLineInfo] = []
+        added: list[DiffLineInfo] = []
+
+        def flush() -> None:
+            for index in range(max(len(removed), len(added))):
+                old = removed[index] if index < len(removed) else None
+                new = added[index] if index < len(added) else None
+                if old is not None and new is not None:
+                    rows.append(AlignedRow("changed", old.old_line, old.content, new.new_line, new.content))
+                elif old is not None:
+                    rows.append(AlignedRow("removed", old.old_line, old.content, 0, ""))
+                elif new is not None:
+                    rows.append(AlignedRow("added", 0, "", new.new_line, new.content))
+            removed.clear()
+            added.clear()
+
+        for line in hunk.lines:
+            if line.line_type == "removed":
+                if added:
+                    flush()
+                removed.append(line)
+            elif line.line_type == "added":
+                added.append(line)
+            else:
+                flush()
+                rows.append(AlignedRow("context", line.old_line, line.content, line.new_line, line.content))
+        flush()
+    return rows
+
+
 def build_line_map(diff_data: DiffData) -> dict[int, DiffLineInfo]:
     line_map: dict[int, DiffLineInfo] = {}
     line_index = 1
@@ -125,23 +162,88 @@ def build_patch_for_hunk(diff_data: DiffData, hunk_index: int) -> str | None:
     return "\n".join(lines) + "\n"
 
 
-def build_patch_for_line(diff_data: DiffData, line_info: DiffLineInfo) -> str | None:
-    if line_info.line_type not in ("added", "removed"):
+def build_patch_for_line(diff_data: DiffData, line_info: DiffLineInfo, reverse: bool = False) -> str | None:
+    return build_patch_for_lines(diff_data, [line_info], reverse=reverse)
+
+
+def _collect_line_edits(
+    diff_data: DiffData,
+    selected: set[DiffLineInfo],
+    reverse: bool,
+) -> list[tuple[int, list[str], list[str]]]:
+    # Edits are expressed against the side git will patch: the old side when
+    # staging, the new side (the index) when unstaging with -R.
+    delete_type, insert_type = ("added", "removed") if reverse else ("removed", "added")
+    edits: list[tuple[int, list[str], list[str]]] = []
+    for hunk in diff_data.hunks:
+        if reverse:
+            base_start, base_count = hunk.new_start, hunk.new_count
+        else:
+            base_start, base_count = hunk.old_start, hunk.old_count
+        runs: list[tuple[int, list[str]]] = []
+        inserted: list[str] = []
+        base_line = base_start
+        for info in hunk.lines:
+            if info.line_type == delete_type:
+                if info in selected:
+                    if runs and runs[-1][0] + len(runs[-1][1]) == base_line:
+                        runs[-1][1].append(info.content)
+                    else:
+                        runs.append((base_line, [info.content]))
+                base_line += 1
+            elif info.line_type == insert_type and info in selected:
+                inserted.append(info.content)
+        hunk_edits = [(start, lines, []) for start, lines in runs]
+        if inserted:
+            # Staged additions land after the hunk's old lines; unstaged
+            # removals go back before the hunk's new lines.
+            if reverse:
+                anchor = base_start - 1 if base_count else base_start
+                if runs and runs[0][0] == anchor + 1:
+                    hunk_edits[0] = (runs[0][0], runs[0][1], inserted)
+                else:
+                    hunk_edits.insert(0, (anchor, [], inserted))
+            else:
+                anchor = base_start + base_count - 1 if base_count else base_start
+                if runs and runs[-1][0] + len(runs[-1][1]) - 1 == anchor:
+                    hunk_edits[-1] = (runs[-1][0], runs[-1][1], inserted)
+                else:
+                    hunk_edits.append((anchor, [], inserted))
+        edits.extend(hunk_edits)
+    return edits
+
+
+def build_patch_for_lines(
+    diff_data: DiffData,
+    line_infos: list[DiffLineInfo],
+    reverse: bool = False,
+) -> str | None:
+    selected = {info for info in line_infos if info.line_type in ("added", "removed")}
+    if not selected:
         return None
-    if line_info.line_type == "added":
-        old_start = line_info.old_line
-        new_start = line_info.new_line
-        old_count = 0
-        new_count = 1
-        line = f"+{line_info.content}"
-    else:
-        old_start = line_info.old_line
-        new_start = line_info.new_line
-        old_count = 1
-        new_count = 0
-        line = f"-{line_info.content}"
-    header = f"@@ -{old_start},{old_count} +{new_start},{new_count} @@"
-    lines = [*diff_data.header_lines, header, line]
+    edits = _collect_line_edits(diff_data, selected, reverse)
+    if not edits:
+        return None
+    lines = list(diff_data.header_lines)
+    delta = 0
+    for base_start, deleted, inserted in edits:
+        if not deleted:
+            result_start = base_start + delta + 1
+        elif inserted:
+            result_start = base_start + delta
+        else:
+            result_start = base_start + delta - 1
+        base_range = f"{base_start},{len(deleted)}"
+        result_range = f"{result_start},{len(inserted)}"
+        if reverse:
+            lines.append(f"@@ -{result_range} +{base_range} @@")
+            lines.extend(f"-{content}" for content in inserted)
+            lines.extend(f"+{content}" for content in deleted)
+        else:
+            lines.append(f"@@ -{base_range} +{result_range} @@")
+            lines.extend(f"-{content}" for content in deleted)
+            lines.extend(f"+{content}" for content in inserted)
+        delta += len(inserted) - len(deleted)
     return "\n".join(lines) + "\n"
 
 
@@ -155,168 +257,188 @@ def insert_line_with_word_diff(
     content: str,
     base_tag: str,
     word_diff: bool,
+    index: str = tk.END,
 ) -> None:
     if not word_diff:
         if base_tag:
-            widget.insert(tk.END, f"{prefix}{content}\n", base_tag)
+            widget.insert(index, f"{prefix}{content}\n", base_tag)
         else:
-            widget.insert(tk.END, f"{prefix}{content}\n")
+            widget.insert(index, f"{prefix}{content}\n")
         return
     if base_tag:
-        widget.insert(tk.END, prefix, base_tag)
+        widget.insert(index, prefix, base_tag)
     else:
-        widget.insert(tk.END, prefix)
-    insert_word_diff_content(widget, content, base_tag)
-    widget.insert(tk.END, "\n")
+        widget.insert(index, prefix)
+    insert_word_diff_content(widget, content, base_tag, index)
+    widget.insert(index, "\n")
 
 
-def insert_word_diff_content(widget: tk.Text, content: str, base_tag: str) -> None:
+def insert_word_diff_content(widget: tk.Text, content: str, base_tag: str, index: str = tk.END) -> None:
     markers = [
         ("{+", "+}", "added_word"),
         ("[-", "-]", "removed_word"),
         ("{-", "-}", "removed_word"),
     ]
-    index = 0
-    while index < len(content):
+    pos_index = 0
+    while pos_index < len(content):
         next_marker = None
         for opener, closer, tag in markers:
-            pos = content.find(opener, index)
+            pos = content.find(opener, pos_index)
             if pos == -1:
                 continue
             if next_marker is None or pos < next_marker[0]:
                 next_marker = (pos, opener, closer, tag)
         if next_marker is None:
-            text = content[index:]
+            text = content[pos_index:]
             if text:
                 if base_tag:
-                    widget.insert(tk.END, text, base_tag)
+                    widget.insert(index, text, base_tag)
                 else:
-                    widget.insert(tk.END, text)
+                    widget.insert(index, text)
             break
         pos, opener, closer, tag = next_marker
-        if pos > index:
+        if pos > pos_index:
             if base_tag:
-                widget.insert(tk.END, content[index:pos], base_tag)
+                widget.insert(index, content[pos_index:pos], base_tag)
             else:
-                widget.insert(tk.END, content[index:pos])
+                widget.insert(index, content[pos_index:pos])
         end = content.find(closer, pos + len(opener))
         if end == -1:
             if base_tag:
-                widget.insert(tk.END, content[pos:], base_tag)
+                widget.insert(index, content[pos:], base_tag)
             else:
-                widget.insert(tk.END, content[pos:])
+                widget.insert(index, content[pos:])
             break
         word = content[pos + len(opener) : end]
         tags = (tag, base_tag) if base_tag else (tag,)
-        widget.insert(tk.END, word, tags)
-        index = end + len(closer)
-
-
-def build_read_mode_diff(diff_text: str, *, threshold: int, max_lines: int) -> tuple[str, bool]:
-    lines = diff_text.splitlines()
-    total = len(lines)
-    if total <= threshold:
-        return diff_text, False
-    if max_lines <= 0:
-        return diff_text, False
-    head = max_lines // 2
-    tail = max_lines - head
-    if head + tail >= total:
-        return diff_text, False
-    omitted = total - head - tail
-    marker = f"... ({omitted} linhas omitidas no modo leitura) ..."
-    preview = lines[:head] + [marker] + lines[-tail:]
-    return "\n".join(preview) + "\n", True
+        widget.insert(index, word, tags)
+        pos_index = end + len(closer)
 
 
-def render_patch_to_widget(
+@dataclasses.dataclass
+class PatchRenderState:
+    old_line: int = 0
+    new_line: int = 0
+    in_hunk: bool = False
+
+
+def advance_render_state(state: PatchRenderState, lines: list[str], word_diff: bool) -> None:
+    # Mirrors the line counting of render_patch_lines without touching Tk.
+    for raw_line in lines:
+        if raw_line.startswith("diff --git"):
+            state.in_hunk = False
+        elif raw_line.startswith("index ") or raw_line.startswith("---") or raw_line.startswith("+++"):
+            continue
+        elif raw_line.startswith("@@"):
+            state.old_line, state.new_line = parse_hunk_header(raw_line)
+            state.in_hunk = True
+        elif raw_line.startswith("\\ No newline at end of file"):
+            continue
+        elif raw_line.startswith("-"):
+            state.old_line += 1
+        elif raw_line.startswith("+"):
+            state.new_line += 1
+        elif raw_line.startswith(" ") or (word_diff and state.in_hunk and line_has_word_markers(raw_line)):
+            state.old_line += 1
+            state.new_line += 1
+
+
+def render_patch_lines(
     widget: tk.Text,
-    patch: str,
-    read_only: bool,
+    lines: list[str],
+    state: PatchRenderState,
     show_file_headers: bool,
     word_diff: bool,
+    index: str = tk.END,
 ) -> None:
-    widget.configure(state="normal")
-    widget.delete("1.0", tk.END)
-
-    if not patch.strip():
-        widget.insert(tk.END, "(sem diff)")
-        if read_only:
-            widget.configure(state="disabled")
-        return
-
-    old_line = 0
-    new_line = 0
-    in_hunk = False
-
-    for raw_line in patch.splitlines():
+    for raw_line in lines:
         if raw_line.startswith("diff --git"):
-            in_hunk = False
+            state.in_hunk = False
             if show_file_headers:
                 try:
                     parts = raw_line.split()
                     path = parts[2][2:]
                 except IndexError:
                     path = raw_line
-                widget.insert(tk.END, f"\n=== {path} ===\n", "meta")
+                widget.insert(index, f"\n=== {path} ===\n", "meta")
             continue
         if raw_line.startswith("index ") or raw_line.startswith("---") or raw_line.startswith("+++"):
             continue
         if raw_line.startswith("@@"):
-            old_line, new_line = parse_hunk_header(raw_line)
-            in_hunk = True
+            state.old_line, state.new_line = parse_hunk_header(raw_line)
+            state.in_hunk = True
             continue
         if raw_line.startswith("\\ No newline at end of file"):
             continue
 
         if raw_line.startswith("-"):
-            content = raw_line[1:]
             insert_line_with_word_diff(
                 widget,
-                f"{old_line:>6} - ",
-                content,
+                f"{state.old_line:>6} - ",
+                raw_line[1:],
                 base_tag="removed",
                 word_diff=word_diff,
+                index=index,
             )
-            old_line += 1
+            state.old_line += 1
             continue
         if raw_line.startswith("+"):
-            content = raw_line[1:]
             insert_line_with_word_diff(
                 widget,
-                f"{new_line:>6} + ",
-                content,
+                f"{state.new_line:>6} + ",
+                raw_line[1:],
                 base_tag="added",
                 word_diff=word_diff,
+                index=index,
             )
-            new_line += 1
+            state.new_line += 1
             continue
         if raw_line.startswith(" "):
-            content = raw_line[1:]
             insert_line_with_word_diff(
                 widget,
-                f"{old_line:>6}   ",
-                content,
+                f"{state.old_line:>6}   ",
+                raw_line[1:],
                 base_tag="",
                 word_diff=word_diff,
+                index=index,
             )
-            old_line += 1
-            new_line += 1
+            state.old_line += 1
+            state.new_line += 1
             continue
 
-        if word_diff and in_hunk and line_has_word_markers(raw_line):
+        if word_diff and state.in_hunk and line_has_word_markers(raw_line):
             insert_line_with_word_diff(
                 widget,
-                f"{old_line:>6}   ",
+                f"{state.old_line:>6}   ",
                 raw_line,
                 base_tag="",
                 word_diff=True,
+                index=index,
             )
-            old_line += 1
-            new_line += 1
+            state.old_line += 1
+            state.new_line += 1
             continue
 
-        widget.insert(tk.END, raw_line + "\n")
+        widget.insert(index, raw_line + "\n")
+
+
+def render_patch_to_widget(
+    widget: tk.Text,
+    patch: str,
+    read_only: bool,
+    show_file_headers: bool,
+    word_diff: bool,
+) -> None:
+    widget.configure(state="normal")
+    widget.delete("1.0", tk.END)
+
+    if not patch.strip():
+        widget.insert(tk.END, "(sem diff)")
+        if read_only:
+            widget.configure(state="disabled")
+        return
+
+    render_patch_lines(widget, patch.splitlines(), PatchRenderState(), show_file_headers, word_diff)
 
     if read_only:
         widget.configure(state="disabled")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from .git_client import FIELD_SEP, RECORD_SEP
+from .models import FileRevision
+from .patch_buffer import PatchBuffer
+
+FILE_HISTORY_BATCH_SECONDS = 0.05
+# Finished histories kept across windows, counted by patch bytes.
+FILE_HISTORY_CACHE_BYTES = 64 * 1024 * 1024
+# Rough cost of one FileRevision next to its patch bytes.
+REVISION_OVERHEAD_BYTES = 400
+
+_RECORD = RECORD_SEP.encode("ascii")
+
+
+class FileHistory:
+    # Every revision of one path from a single log stream. Patches are written
+    # back to back into a spooled PatchBuffer and each revision keeps its line
+    # range, so stepping through revisions is a read instead of a `git show`.
+    # The loader thread appends while the UI reads, hence the lock.
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.revisions: list[FileRevision] = []
+        self.buffer = PatchBuffer()
+        self.complete = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.revisions)
+
+    @property
+    def nbytes(self) -> int:
+        return self.buffer.size + len(self.revisions) * REVISION_OVERHEAD_BYTES
+
+    def append(self, revision: FileRevision, patch: bytes) -> None:
+        with self._lock:
+            start = self.buffer.line_count
+            self.buffer.write(patch)
+            self.buffer.finish()
+            self.revisions.append(
+                FileRevision(
+                    commit_hash=revision.commit_hash,
+                    author=revision.author,
+                    date=revision.date,
+                    subject=revision.subject,
+                    status=revision.status,
+                    path=revision.path,
+                    old_path=revision.old_path,
+                    patch_start=start,
+                    patch_end=self.buffer.line_count,
+                )
+            )
+
+    def patch_text(self, index: int) -> str:
+        revision = self.revisions[index]
+        with self._lock:
+            return self.buffer.text_range(revision.patch_start, revision.patch_end)
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+class FileHistoryParser:
+    # Output of `git log --follow -p --raw -z` is mostly line based: a header
+    # "RS hash FS author FS date FS subject NUL", a raw line ":modes shas
+    # STATUS NUL path NUL [path NUL] NUL" whose tail is the first patch line,
+    # then the patch. Patch lines start with a diff prefix, so a line starting
+    # with RS always opens a new revision.
+    def __init__(self, on_revision: Callable[[FileRevision, bytes], None]) -> None:
+        self.on_revision = on_revision
+        self._header: list[str] | None = None
+        self._status = ""
+        self._paths: list[str] = []
+        self._patch: list[bytes] = []
+
+    def feed(self, line: bytes) -> None:
+        if line.startswith(_RECORD):
+            self._emit()
+            tokens = line.rstrip(b"\n").split(b"\0")
+            # Merges without a diff print their header straight after the last.
+            for token in tokens:
+                if token.startswith(_RECORD):
+                    self._emit()
+                    self._header = token[1:].decode("utf-8", errors="replace").split(FIELD_SEP)
+            return
+        if self._header is None:
+            return
+        if line.startswith(b":") and not self._status:
+            tokens = line.split(b"\0")
+            meta = tokens[0].split()
+            self._status = meta[-1].decode("ascii", errors="replace") if meta else "?"
+            path_count = 2 if self._status[:1] in ("R", "C") else 1
+            self._paths = [token.decode("utf-8", errors="replace") for token in tokens[1 : 1 + path_count]]
+            rest = b"\0".join(tokens[1 + path_count :]).lstrip(b"\0")
+            if rest:
+                self._patch.append(rest)
+            return
+        self._patch.append(line)
+
+    def close(self) -> None:
+        self._emit()
+
+    def _emit(self) -> None:
+        header = self._header
+        if header is None:
+            return
+        fields = (header + ["", "", "", ""])[:4]
+        paths = self._paths
+        self.on_revision(
+            FileRevision(
+                commit_hash=fields[0],
+                author=fields[1],
+                date=fields[2],
+                subject=fields[3],
+                status=self._status[:1],
+                path=paths[-1] if paths else "",
+                old_path=paths[0] if len(paths) > 1 else "",
+            ),
+            b"".join(self._patch),
+        )
+        self._header = None
+        self._status = ""
+        self._paths = []
+        self._patch = []
+
+
+def stream_file_history(
+    repo_path: str,
+    rev: str,
+    path: str,
+    history: FileHistory,
+    on_batch: Callable[[int], None],
+    cancel: threading.Event,
+) -> None:
+    # Runs on a worker thread; ``on_batch`` gets the revision count so far,
+    # first as soon as one revision is parsed and then every batch interval.
+    args = [
+        "git",
+        "-C",
+        repo_path,
+        "log",
+        "--follow",
+        "--date=iso",
+        f"--format={RECORD_SEP}%H{FIELD_SEP}%an{FIELD_SEP}%ad{FIELD_SEP}%s",
+        "-p",
+        "--raw",
+        "-z",
+        "--no-ext-diff",
+        "--no-color",
+        rev,
+        "--",
+        path,
+    ]
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    last_flush = 0.0
+
+    def on_revision(revision: FileRevision, patch: bytes) -> None:
+        nonlocal last_flush
+        history.append(revision, patch)
+        now = time.perf_counter()
+        if now - last_flush >= FILE_HISTORY_BATCH_SECONDS:
+            on_batch(len(history))
+            last_flush = now
+
+    parser = FileHistoryParser(on_revision)
+    assert process.stdout is not None
+    try:
+        for line in process.stdout:
+            if cancel.is_set():
+                process.kill()
+                break
+            parser.feed(line)
+    finally:
+        stderr = process.stderr.read().decode("utf-8", errors="replace") if process.stderr else ""
+        returncode = process.wait()
+    if cancel.is_set():
+        return
+    if returncode != 0:
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    parser.close()
+    history.complete = True
+    on_batch(len(history))
+
+
+class FileHistoryCache:
+    # Finished histories keyed by (repo, tip, path), evicted least recently
+    # used first once their bytes pass the budget. Evicted buffers are not
+    # closed: a window still showing one keeps it alive until it closes.
+    def __init__(self, max_bytes: int = FILE_HISTORY_CACHE_BYTES) -> None:
+        self._entries: OrderedDict[Hashable, FileHistory] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> FileHistory | None:
+        with self._lock:
+            history = self._entries.get(key)
+            if history is not None:
+                self._entries.move_to_end(key)
+            return history
+
+    def put(self, key: Hashable, history: FileHistory) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = history
+            self._bytes += history.nbytes
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                _key, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
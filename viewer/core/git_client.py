@@ -2,20 +2,25 @@
 from __future__ import annotations
 
 import subprocess
+import threading
+from typing import Iterator
 
+from .commit_store import CommitStore
 from .models import CommitFilters, CommitInfo, CommitSummary, FileStat
+from .patch_buffer import PatchBuffer
 
 FIELD_SEP = "\x1f"
 RECORD_SEP = "\x1e"
 
 
-def run_git(repo_path: str, args: list[str]) -> str:
+def run_git(repo_path: str, args: list[str], input_text: str | None = None) -> str:
     result = subprocess.run(
         ["git", "-C", repo_path, *args],
         check=False,
         capture_output=True,
         text=True,
         errors="replace",
+        input=input_text,
     )
     if result.returncode != 0:
         stderr = result.stderr.strip() or "(sem detalhes)"
@@ -23,6 +28,70 @@ def run_git(repo_path: str, args: list[str]) -> str:
     return result.stdout
 
 
+class GitCancelled(Exception):
+    pass
+
+
+def run_git_cancellable(
+    repo_path: str,
+    args: list[str],
+    cancel: threading.Event | None,
+    ok_returncodes: tuple[int, ...] = (0,),
+) -> str:
+    # run_git that kills git as soon as ``cancel`` is set, so a long diff or
+    # merge-tree does not outlive the view that asked for it.
+    if cancel is not None and cancel.is_set():
+        raise GitCancelled()
+    process = subprocess.Popen(
+        ["git", "-C", repo_path, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+    while True:
+        try:
+            stdout, stderr = process.communicate(timeout=0.1)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel is not None and cancel.is_set():
+                process.kill()
+                process.communicate()
+                raise GitCancelled() from None
+    if process.returncode not in ok_returncodes:
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    return stdout
+
+
+def run_git_buffered(repo_path: str, args: list[str], chunk_size: int = 1 << 16) -> PatchBuffer:
+    process = subprocess.Popen(
+        ["git", "-C", repo_path, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    buffer = PatchBuffer()
+    assert process.stdout is not None and process.stderr is not None
+    # stderr is drained alongside: git blocks once either pipe fills up, so
+    # reading it only after stdout could wait on each other forever.
+    errors: list[bytes] = []
+    drain = threading.Thread(target=lambda: errors.append(process.stderr.read()), daemon=True)
+    drain.start()
+    while True:
+        chunk = process.stdout.read(chunk_size)
+        if not chunk:
+            break
+        buffer.write(chunk)
+    buffer.finish()
+    drain.join()
+    process.stdout.close()
+    process.stderr.close()
+    stderr = b"".join(errors).decode("utf-8", errors="replace")
+    if process.wait() != 0:
+        buffer.close()
+        raise RuntimeError(f"git falhou: {stderr.strip() or '(sem detalhes)'}")
+    return buffer
+
+
 def is_git_repo(path: str) -> bool:
     result = subprocess.run(
         ["git", "-C", path, "rev-parse", "--git-dir"],
@@ -66,20 +135,23 @@ def build_log_args(limit: int, skip: int, filters: CommitFilters | None) -> list
         "log",
         f"--max-count={limit}",
         f"--skip={skip}",
-        f"--pretty=format:%H{FIELD_SEP}%s{RECORD_SEP}",
+        f"--pretty=format:%H{FIELD_SEP}%s{FIELD_SEP}%an <%ae>{FIELD_SEP}%P{RECORD_SEP}",
     ]
     if not filters:
         return args
+    message_text = filters.text if not filters.search_mode else ""
     pattern_count = 0
-    if filters.text:
+    if message_text:
         pattern_count += 1
     if filters.author:
         pattern_count += 1
     if pattern_count > 1:
         args.append("--all-match")
-    if filters.text:
+    if message_text:
         args.append("--fixed-strings")
-        args.append(f"--grep={filters.text}")
+        args.append(f"--grep={message_text}")
+    if filters.text and filters.search_mode:
+        args.append(f"-{filters.search_mode}{filters.text}")
     if filters.author:
         args.append(f"--author={filters.author}")
     if filters.since:
@@ -93,14 +165,8 @@ def build_log_args(limit: int, skip: int, filters: CommitFilters | None) -> list
     return args
 
 
-def load_commit_summaries(
-    repo_path: str,
-    limit: int,
-    skip: int = 0,
-    filters: CommitFilters | None = None,
-) -> list[CommitSummary]:
-    log_output = run_git(repo_path, build_log_args(limit, skip, filters))
-    summaries: list[CommitSummary] = []
+def iter_log_records(log_output: str) -> Iterator[tuple[str, str, str, tuple[str, ...]]]:
+    # Yields (hash, subject, "author <email>", parents); the last two are optional.
     for record in log_output.split(RECORD_SEP):
         record = record.strip("\n")
         if not record:
@@ -108,9 +174,49 @@ def load_commit_summaries(
         fields = record.split(FIELD_SEP)
         if len(fields) < 2:
             continue
-        commit_hash, subject = fields[0], fields[1]
-        summaries.append(CommitSummary(commit_hash=commit_hash, subject=subject))
-    return summaries
+        author = fields[2] if len(fields) > 2 else ""
+        parents = tuple(fields[3].split()) if len(fields) > 3 else ()
+        yield fields[0], fields[1], author, parents
+
+
+def load_commit_summaries(
+    repo_path: str,
+    limit: int,
+    skip: int = 0,
+    filters: CommitFilters | None = None,
+) -> list[CommitSummary]:
+    log_output = run_git(repo_path, build_log_args(limit, skip, filters))
+    return [
+        CommitSummary(commit_hash=commit_hash, subject=subject, author=author)
+        for commit_hash, subject, author, _parents in iter_log_records(log_output)
+    ]
+
+
+def load_commit_page(
+    repo_path: str,
+    limit: int,
+    skip: int = 0,
+    filters: CommitFilters | None = None,
+) -> CommitStore:
+    # Whole log pages go straight into the columnar store, no dataclass per row.
+    log_output = run_git(repo_path, build_log_args(limit, skip, filters))
+    page = CommitStore()
+    for commit_hash, subject, author, parents in iter_log_records(log_output):
+        page.append(commit_hash, subject, author, parents)
+    return page
+
+
+def grep_commit_messages(repo_path: str, commit_hashes: list[str], text: str) -> set[str]:
+    # Checks full messages of known commits only: --no-walk never follows
+    # parents, so this costs one object read per hash instead of a log walk.
+    if not commit_hashes:
+        return set()
+    output = run_git(
+        repo_path,
+        ["log", "--no-walk=unsorted", "--stdin", "--fixed-strings", f"--grep={text}", "--format=%H"],
+        input_text="\n".join(commit_hashes) + "\n",
+    )
+    return {line.strip() for line in output.splitlines() if line.strip()}
 
 
 def load_commit_details(repo_path: str, commit_hash: str) -> CommitInfo:
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import keyword
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+# Token kinds map to Tk tags named ``syn_<kind>``.
+TOKEN_KINDS = ("keyword", "string", "comment", "number")
+HIGHLIGHT_CACHE_ENTRIES = 512
+
+# Rendered diff lines look like "    12 + code"; the code starts after the sign.
+_DIFF_PREFIX_RE = re.compile(r" *\d+ [-+ ] ")
+
+Span = tuple[int, int, str]
+LineSpans = tuple[int, tuple[Span, ...]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Lexer:
+    name: str
+    pattern: re.Pattern[str]
+
+    def lex_line(self, line: str) -> tuple[Span, ...]:
+        spans: list[Span] = []
+        for match in self.pattern.finditer(line):
+            kind = match.lastgroup
+            if kind is None or match.start() == match.end():
+                continue
+            spans.append((match.start(), match.end(), kind))
+        return tuple(spans)
+
+
+def make_lexer(
+    name: str,
+    keywords: list[str],
+    line_comment: str | None,
+    block_comment: tuple[str, str] | None = None,
+    string_quotes: str = "\"'",
+    ignore_case: bool = False,
+) -> Lexer:
+    # Line-based on purpose: only the visible slice gets lexed, so multi-line
+    # strings and comments are matched only when they open and close on one line.
+    parts: list[str] = []
+    comments: list[str] = []
+    if block_comment is not None:
+        start, end = block_comment
+        comments.append(f"{re.escape(start)}.*?(?:{re.escape(end)}|$)")
+    if line_comment is not None:
+        comments.append(f"{re.escape(line_comment)}.*$")
+    if comments:
+        parts.append(f"(?P<comment>{'|'.join(comments)})")
+    strings = [rf"{re.escape(quote)}(?:\\.|[^{re.escape(quote)}\\])*{re.escape(quote)}?" for quote in string_quotes]
+    parts.append(f"(?P<string>{'|'.join(strings)})")
+    if keywords:
+        words = "|".join(sorted((re.escape(word) for word in keywords), key=len, reverse=True))
+        flags = "i" if ignore_case else "-i"
+        parts.append(rf"(?P<keyword>(?{flags}:\b(?:{words})\b))")
+    parts.append(r"(?P<number>\b(?:0[xX][0-9a-fA-F_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?)\b)")
+    return Lexer(name=name, pattern=re.compile("|".join(parts)))
+
+
+_LEXERS_BY_EXTENSION: dict[str, Lexer] = {}
+_LEXERS_BY_FILENAME: dict[str, Lexer] = {}
+
+
+def register_lexer(lexer: Lexer, extensions: list[str], filenames: list[str] | None = None) -> None:
+    for extension in extensions:
+        _LEXERS_BY_EXTENSION[extension.lower()] = lexer
+    for filename in filenames or []:
+        _LEXERS_BY_FILENAME[filename] = lexer
+
+
+def lexer_for_path(path: str) -> Lexer | None:
+    name = os.path.basename(path)
+    if name in _LEXERS_BY_FILENAME:
+        return _LEXERS_BY_FILENAME[name]
+    _, extension = os.path.splitext(name)
+    return _LEXERS_BY_EXTENSION.get(extension.lower())
+
+
+_C_KEYWORDS = [
+    "auto", "break", "case", "char", "const", "continue", "default", "do", "double", "else", "enum",
+    "extern", "float", "for", "goto", "if", "inline", "int", "long", "register", "return", "short",
+    "signed", "sizeof", "static", "struct", "switch", "typedef", "union", "unsigned", "void",
+    "volatile", "while", "class", "namespace", "template", "typename", "public", "private",
+    "protected", "virtual", "override", "new", "delete", "this", "true", "false", "nullptr",
+    "bool", "using", "try", "catch", "throw", "constexpr",
+]
+_JAVA_KEYWORDS = [
+    "abstract", "boolean", "break", "byte", "case", "catch", "char", "class", "const", "continue",
+    "default", "do", "double", "else", "enum", "extends", "final", "finally", "float", "for", "if",
+    "implements", "import", "instanceof", "int", "interface", "long", "new", "package", "private",
+    "protected", "public", "return", "short", "static", "super", "switch", "this", "throw", "throws",
+    "try", "void", "while", "true", "false", "null", "var", "val", "fun", "when", "override",
+    "namespace", "using", "string",
+]
+_JS_KEYWORDS = [
+    "async", "await", "break", "case", "catch", "class", "const", "continue", "default", "delete",
+    "do", "else", "export", "extends", "false", "finally", "for", "from", "function", "if", "import",
+    "in", "instanceof", "interface", "let", "new", "null", "of", "return", "static", "super",
+    "switch", "this", "throw", "true", "try", "type", "typeof", "undefined", "var", "void", "while",
+    "yield", "enum", "implements", "private", "protected", "public", "readonly",
+]
+_GO_KEYWORDS = [
+    "break", "case", "chan", "const", "continue", "default", "defer", "else", "fallthrough", "for",
+    "func", "go", "goto", "if", "import", "interface", "map", "package", "range", "return", "select",
+    "struct", "switch", "type", "var", "nil", "true", "false",
+]
+_RUST_KEYWORDS = [
+    "as", "async", "await", "break", "const", "continue", "crate", "dyn", "else", "enum", "extern",
+    "false", "fn", "for", "if", "impl", "in", "let", "loop", "match", "mod", "move", "mut", "pub",
+    "ref", "return", "self", "Self", "static", "struct", "super", "trait", "true", "type", "unsafe",
+    "use", "where", "while",
+]
+_SHELL_KEYWORDS = [
+    "if", "then", "else", "elif", "fi", "case", "esac", "for", "while", "until", "do", "done", "in",
+    "function", "return", "local", "export", "readonly", "set", "unset", "echo",
+]
+_SQL_KEYWORDS = [
+    "select", "from", "where", "insert", "into", "values", "update", "delete", "create", "table",
+    "drop", "alter", "join", "left", "right", "inner", "outer", "on", "and", "or", "not", "null",
+    "group", "by", "order", "having", "limit", "as", "distinct", "union", "index", "primary", "key",
+]
+
+register_lexer(
+    make_lexer("python", keyword.kwlist + ["self", "cls"], "#", string_quotes="\"'"),
+    [".py", ".pyw", ".pyi"],
+)
+register_lexer(make_lexer("c", _C_KEYWORDS, "//", ("/*", "*/")), [".c", ".h", ".cc", ".cpp", ".cxx", ".hpp", ".hh"])
+register_lexer(make_lexer("java", _JAVA_KEYWORDS, "//", ("/*", "*/")), [".java", ".kt", ".kts", ".cs", ".scala"])
+register_lexer(
+    make_lexer("javascript", _JS_KEYWORDS, "//", ("/*", "*/"), string_quotes="\"'`"),
+    [".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx"],
+)
+register_lexer(make_lexer("go", _GO_KEYWORDS, "//", ("/*", "*/"), string_quotes="\"'`"), [".go"])
+register_lexer(make_lexer("rust", _RUST_KEYWORDS, "//", ("/*", "*/"), string_quotes="\""), [".rs"])
+register_lexer(make_lexer("shell", _SHELL_KEYWORDS, "#"), [".sh", ".bash", ".zsh"], [".bashrc", ".profile"])
+register_lexer(make_lexer("sql", _SQL_KEYWORDS, "--", ("/*", "*/"), string_quotes="'", ignore_case=True), [".sql"])
+register_lexer(make_lexer("json", ["true", "false", "null"], None, string_quotes="\""), [".json"])
+register_lexer(make_lexer("toml", ["true", "false"], "#"), [".toml", ".ini", ".cfg"])
+register_lexer(make_lexer("yaml", ["true", "false", "null", "yes", "no"], "#"), [".yml", ".yaml"])
+
+
+def highlight_diff_lines(lexer: Lexer, first_line: int, text: str) -> tuple[LineSpans, ...]:
+    # ``text`` is the slice of a rendered diff starting at widget line
+    # ``first_line``; spans are shifted past the line-number prefix.
+    result: list[LineSpans] = []
+    for offset, line in enumerate(text.split("\n")):
+        prefix = _DIFF_PREFIX_RE.match(line)
+        if prefix is None:
+            continue
+        spans = lexer.lex_line(line[prefix.end() :])
+        if not spans:
+            continue
+        shift = prefix.end()
+        result.append((first_line + offset, tuple((start + shift, end + shift, kind) for start, end, kind in spans)))
+    return tuple(result)
+
+
+class HighlightCache:
+    def __init__(self, max_entries: int = HIGHLIGHT_CACHE_ENTRIES) -> None:
+        self._entries: OrderedDict[Hashable, tuple[LineSpans, ...]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[LineSpans, ...] | None:
+        with self._lock:
+            spans = self._entries.get(key)
+            if spans is not None:
+                self._entries.move_to_end(key)
+            return spans
+
+    def put(self, key: Hashable, spans: tuple[LineSpans, ...]) -> None:
+        with self._lock:
+            self._entries[key] = spans
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
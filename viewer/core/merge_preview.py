@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from .git_client import run_git_cancellable
+
+CONFLICT_CACHE_ENTRIES = 4096
+# merge-tree flavours, newest first. `--merge-base` needs git 2.40 and
+# `--write-tree` 2.38; older git only has the trivial three-tree mode.
+MERGE_TREE_MODES = ("merge-base", "write-tree", "legacy")
+
+
+def parse_write_tree_output(output: str) -> list[str]:
+    # `merge-tree --write-tree --name-only -z`: tree id, then one conflicted
+    # path per record, then an empty record before the messages.
+    records = output.split("\0")
+    paths: list[str] = []
+    for record in records[1:]:
+        if not record:
+            break
+        paths.append(record)
+    return paths
+
+
+def parse_legacy_merge_tree(output: str) -> list[str]:
+    # The trivial merge prints a header per path ("changed in both"), the
+    # base/our/their entries and a diff; conflicts show as "+<<<<<<< .our"
+    # hunk lines. Only that exact marker inside a path's block counts, so
+    # "<<<<<<<" in file content is not mistaken for a conflict.
+    paths: list[str] = []
+    current = ""
+    for line in output.splitlines():
+        if line and line[0] not in " +-@":
+            current = ""
+            continue
+        if not current and line.startswith(("  base ", "  our ", "  their ")):
+            parts = line.split(None, 3)
+            if len(parts) == 4:
+                current = parts[3]
+            continue
+        if current and line.startswith("+<<<<<<< .our"):
+            if not paths or paths[-1] != current:
+                paths.append(current)
+    return paths
+
+
+def _unsupported(exc: RuntimeError) -> bool:
+    message = str(exc)
+    return "unknown option" in message or "usage: git merge-tree" in message
+
+
+class ConflictPredictor:
+    # Conflicting paths for a merge, cached by the (base, ours, theirs) SHA
+    # triple. The merge-tree flavour is probed once and remembered.
+    def __init__(self, max_entries: int = CONFLICT_CACHE_ENTRIES) -> None:
+        self._results: OrderedDict[tuple[str, str, str], list[str]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.mode = MERGE_TREE_MODES[0]
+
+    def cached(self, base: str, ours: str, theirs: str) -> list[str] | None:
+        with self._lock:
+            paths = self._results.get((base, ours, theirs))
+            if paths is not None:
+                self._results.move_to_end((base, ours, theirs))
+            return paths
+
+    def _store(self, key: tuple[str, str, str], paths: list[str]) -> None:
+        with self._lock:
+            self._results[key] = paths
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+
+    def predict_branches(
+        self,
+        repo_path: str,
+        ours: str,
+        theirs: str,
+        cancel: threading.Event | None = None,
+    ) -> list[str]:
+        # Merge base first; unrelated histories have none and, as before,
+        # are reported without conflicts.
+        try:
+            base = run_git_cancellable(repo_path, ["merge-base", ours, theirs], cancel).strip()
+        except RuntimeError:
+            return []
+        return self.predict(repo_path, base, ours, theirs, cancel)
+
+    def predict(
+        self,
+        repo_path: str,
+        base: str,
+        ours: str,
+        theirs: str,
+        cancel: threading.Event | None = None,
+    ) -> list[str]:
+        key = (base, ours, theirs)
+        paths = self.cached(*key)
+        if paths is not None:
+            return paths
+        while True:
+            mode = self.mode
+            try:
+                paths = self._run(repo_path, mode, base, ours, theirs, cancel)
+                break
+            except RuntimeError as exc:
+                if mode == MERGE_TREE_MODES[-1] or not _unsupported(exc):
+                    raise
+                with self._lock:
+                    if self.mode == mode:
+                        self.mode = MERGE_TREE_MODES[MERGE_TREE_MODES.index(mode) + 1]
+        self._store(key, paths)
+        return paths
+
+    @staticmethod
+    def _run(
+        repo_path: str,
+        mode: str,
+        base: str,
+        ours: str,
+        theirs: str,
+        cancel: threading.Event | None,
+    ) -> list[str]:
+        if mode == "legacy":
+            output = run_git_cancellable(repo_path, ["merge-tree", base, ours, theirs], cancel)
+            return parse_legacy_merge_tree(output)
+        args = ["merge-tree", "--write-tree", "--name-only", "-z"]
+        if mode == "merge-base":
+            args.append(f"--merge-base={base}")
+        # Exit code 1 only means the merge has conflicts.
+        output = run_git_cancellable(repo_path, [*args, ours, theirs], cancel, ok_returncodes=(0, 1))
+        return parse_write_tree_output(output)
@@ -28,9 +28,10 @@ class CommitInfo:
 class CommitSummary:
     commit_hash: str
     subject: str
+    author: str = ""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class CommitFilters:
     text: str = ""
     author: str = ""
@@ -39,6 +40,8 @@ class CommitFilters:
     until: str = ""
     ref: str = ""
     repo_status: str = ""
+    # "" searches commit messages; "S"/"G" search diffs (git log -S / -G).
+    search_mode: str = ""
 
     def is_active(self) -> bool:
         return any([self.text, self.author, self.path, self.since, self.until, self.ref, self.repo_status])
@@ -69,3 +72,50 @@ class DiffHunk:
 class DiffData:
     header_lines: list[str]
     hunks: list[DiffHunk]
+
+
+@dataclasses.dataclass(frozen=True)
+class AlignedRow:
+    kind: str
+    old_line: int
+    old_text: str
+    new_line: int
+    new_text: str
+
+
+@dataclasses.dataclass(frozen=True)
+class BlameRange:
+    commit_hash: str
+    source_line: int
+    final_line: int
+    count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class BlameCommit:
+    author: str
+    author_time: int
+    summary: str
+    previous: str = ""
+
+
+@dataclasses.dataclass(frozen=True)
+class FileRevision:
+    commit_hash: str
+    author: str
+    date: str
+    subject: str
+    status: str
+    path: str
+    old_path: str = ""
+    patch_start: int = 0
+    patch_end: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class TreeEntry:
+    name: str
+    kind: str
+    object_id: str
+    mode: str
+    size: int = -1
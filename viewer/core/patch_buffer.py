@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Iterator
+
+# Patches up to this size stay in memory; bigger ones spill to a temp file.
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
+# Lines read per step when walking a range without holding all of it.
+SCAN_CHUNK_LINES = 4096
+
+
+class PatchBuffer:
+    # Reads seek the shared file, so they hold a lock: a worker may read the
+    # whole patch while the Tk thread reads a page of it.
+    def __init__(self) -> None:
+        self._file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        self._lock = threading.Lock()
+        self._offsets = array("Q", [0])
+        self._size = 0
+        self._open_line = False
+
+    @classmethod
+    def from_text(cls, text: str) -> PatchBuffer:
+        buffer = cls()
+        buffer.write(text.encode("utf-8"))
+        buffer.finish()
+        return buffer
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            self._file.seek(self._size)
+            self._file.write(data)
+        pos = data.find(b"\n")
+        while pos != -1:
+            self._offsets.append(self._size + pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        self._size += len(data)
+        self._open_line = self._offsets[-1] != self._size
+
+    def finish(self) -> None:
+        if self._open_line:
+            self._offsets.append(self._size)
+            self._open_line = False
+
+    @property
+    def line_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def lines(self, start: int, end: int) -> list[str]:
+        start = max(0, start)
+        end = min(end, self.line_count)
+        if start >= end:
+            return []
+        with self._lock:
+            self._file.seek(self._offsets[start])
+            data = self._file.read(self._offsets[end] - self._offsets[start])
+        return data.decode("utf-8", errors="replace").splitlines()
+
+    def text_range(self, start: int, end: int) -> str:
+        # Lines ``start`` to ``end`` as stored, newlines included.
+        start = max(0, start)
+        end = min(end, self.line_count)
+        if start >= end:
+            return ""
+        with self._lock:
+            self._file.seek(self._offsets[start])
+            data = self._file.read(self._offsets[end] - self._offsets[start])
+        return data.decode("utf-8", errors="replace")
+
+    def line_chunks(self, start: int, end: int, size: int = SCAN_CHUNK_LINES) -> Iterator[list[str]]:
+        for chunk_start in range(max(0, start), min(end, self.line_count), size):
+            yield self.lines(chunk_start, min(chunk_start + size, end))
+
+    def rfind_line(self, prefixes: tuple[bytes, ...], start: int, end: int) -> int | None:
+        # Last line in ``start``..``end`` beginning with one of ``prefixes``,
+        # searched backwards a block of raw bytes at a time.
+        start = max(0, start)
+        end = min(end, self.line_count)
+        while end > start:
+            block_start = max(start, end - SCAN_CHUNK_LINES)
+            base = self._offsets[block_start]
+            with self._lock:
+                self._file.seek(base)
+                data = b"\n" + self._file.read(self._offsets[end] - base)
+            found = max(data.rfind(b"\n" + prefix) for prefix in prefixes)
+            if found != -1:
+                return bisect_left(self._offsets, base + found)
+            end = block_start
+        return None
+
+    def text(self) -> str:
+        with self._lock:
+            self._file.seek(0)
+            data = self._file.read(self._size)
+        return data.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+@dataclasses.dataclass
+class ReadModeView:
+    buffer: PatchBuffer
+    head_end: int
+    tail_start: int
+
+    @property
+    def omitted(self) -> int:
+        return self.tail_start - self.head_end
+
+    @property
+    def shown(self) -> int:
+        return self.buffer.line_count - self.omitted
+
+    def head_lines(self) -> list[str]:
+        return self.buffer.lines(0, self.head_end)
+
+    def tail_anchor(self) -> int:
+        # Last file or hunk header among the omitted lines: the tail's line
+        # numbers only depend on what follows it.
+        found = self.buffer.rfind_line((b"@@", b"diff --git"), self.head_end, self.tail_start)
+        return self.head_end if found is None else found
+
+    def tail_lines(self) -> list[str]:
+        return self.buffer.lines(self.tail_start, self.buffer.line_count)
+
+    def take_chunk(self, size: int) -> list[str]:
+        end = min(self.head_end + max(size, 0), self.tail_start)
+        lines = self.buffer.lines(self.head_end, end)
+        self.head_end = end
+        return lines
+
+
+def build_read_mode_view(buffer: PatchBuffer, *, threshold: int, max_lines: int) -> ReadModeView | None:
+    total = buffer.line_count
+    if total <= threshold or max_lines <= 0:
+        return None
+    head = max_lines // 2
+    tail = max_lines - head
+    if head + tail >= total:
+        return None
+    return ReadModeView(buffer=buffer, head_end=head, tail_start=total - tail)
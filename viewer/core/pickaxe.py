@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import collections
+import dataclasses
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable
+
+from .commit_store import CommitStore
+from .git_client import FIELD_SEP, RECORD_SEP, iter_log_records, run_git
+from .models import CommitFilters
+
+# Commits per `git log --stdin` call: small enough for steady progress and
+# quick cancellation, large enough that process startup stays negligible.
+PICKAXE_CHUNK_COMMITS = 1000
+PICKAXE_WORKERS = max(1, min(4, os.cpu_count() or 1))
+PICKAXE_CACHE_ENTRIES = 16
+
+SEARCH_MODE_MESSAGE = ""
+SEARCH_MODE_PICKAXE = "S"
+SEARCH_MODE_REGEX = "G"
+
+
+@dataclasses.dataclass
+class PickaxeResult:
+    # Matches for one query up to ``tip``; ``scanned`` commits were diffed.
+    tip: str
+    matches: CommitStore
+    scanned: int
+    complete: bool = False
+
+
+def pickaxe_args(filters: CommitFilters) -> list[str]:
+    flag = "-G" if filters.search_mode == SEARCH_MODE_REGEX else "-S"
+    return [f"{flag}{filters.text}"]
+
+
+def _rev_list_args(filters: CommitFilters, tip: str, since_tip: str | None) -> list[str]:
+    args = ["rev-list"]
+    if filters.author:
+        args.append(f"--author={filters.author}")
+    if filters.since:
+        args.append(f"--since={filters.since}")
+    if filters.until:
+        args.append(f"--until={filters.until}")
+    args.append(tip)
+    if since_tip:
+        args.append(f"^{since_tip}")
+    if filters.path:
+        args.extend(["--", filters.path])
+    return args
+
+
+def _scan_chunk(repo_path: str, filters: CommitFilters, hashes: list[str]) -> CommitStore:
+    args = [
+        "log",
+        "--no-walk=unsorted",
+        "--stdin",
+        *pickaxe_args(filters),
+        f"--pretty=format:%H{FIELD_SEP}%s{FIELD_SEP}%an <%ae>{FIELD_SEP}%P{RECORD_SEP}",
+    ]
+    if filters.path:
+        args.extend(["--", filters.path])
+    output = run_git(repo_path, args, input_text="\n".join(hashes) + "\n")
+    page = CommitStore()
+    for commit_hash, subject, author, parents in iter_log_records(output):
+        page.append(commit_hash, subject, author, parents)
+    return page
+
+
+def resolve_tip(repo_path: str, filters: CommitFilters) -> str:
+    return run_git(repo_path, ["rev-parse", "--verify", f"{filters.ref or 'HEAD'}^{{commit}}"]).strip()
+
+
+def _is_ancestor(repo_path: str, commit: str, tip: str) -> bool:
+    # Exit status 1 (not an ancestor) and a pruned commit both land here.
+    try:
+        run_git(repo_path, ["merge-base", "--is-ancestor", commit, tip])
+    except RuntimeError:
+        return False
+    return True
+
+
+def search_content(
+    repo_path: str,
+    filters: CommitFilters,
+    tip: str,
+    previous: PickaxeResult | None,
+    on_progress: Callable[[int, int, CommitStore], None],
+    cancel: threading.Event,
+) -> PickaxeResult:
+    # Runs on a worker thread. The commit list comes from one rev-list; the
+    # diffs are searched in chunks on a few git processes at once and the
+    # chunks are reported in history order as (scanned, total, new matches).
+    # With a finished ``previous`` result whose tip is still in the history
+    # of ``tip``, only commits added since are walked and its matches follow
+    # the new ones; after a rebase or reset the whole history is scanned.
+    if previous is not None and previous.complete and previous.tip == tip:
+        return previous
+    since_tip = None
+    if previous is not None and previous.complete and _is_ancestor(repo_path, previous.tip, tip):
+        since_tip = previous.tip
+    hashes = run_git(repo_path, _rev_list_args(filters, tip, since_tip)).split()
+    total = len(hashes)
+    matches = CommitStore()
+    scanned = 0
+    chunks = [hashes[start : start + PICKAXE_CHUNK_COMMITS] for start in range(0, total, PICKAXE_CHUNK_COMMITS)]
+    executor = ThreadPoolExecutor(max_workers=PICKAXE_WORKERS)
+    # Chunks are submitted as earlier ones are consumed, never more than the
+    # workers can run: a cancel (or the app closing, which waits for queued
+    # work) then only waits for the git calls already running.
+    pending: collections.deque[Future[CommitStore]] = collections.deque()
+    next_chunk = 0
+    try:
+        for chunk in chunks:
+            if cancel.is_set():
+                break
+            while next_chunk < len(chunks) and len(pending) < PICKAXE_WORKERS:
+                pending.append(executor.submit(_scan_chunk, repo_path, filters, chunks[next_chunk]))
+                next_chunk += 1
+            page = pending.popleft().result()
+            matches.extend(page)
+            scanned += len(chunk)
+            on_progress(scanned, total, page)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    complete = scanned == total
+    if complete and since_tip is not None and previous is not None:
+        matches.extend(previous.matches)
+        on_progress(scanned, total, previous.matches)
+    return PickaxeResult(tip=tip, matches=matches, scanned=scanned, complete=complete)
+
+
+class PickaxeCache:
+    # Latest result per query (filters without the ref tip), LRU. A lookup
+    # hands back the older tip's result so the search can resume from it.
+    def __init__(self, max_entries: int = PICKAXE_CACHE_ENTRIES) -> None:
+        self._entries: OrderedDict[Hashable, PickaxeResult] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> PickaxeResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: PickaxeResult) -> None:
+        if not result.complete:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
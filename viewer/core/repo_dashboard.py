@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from .git_client import run_git
+
+# At most this many `git status` processes at once, whatever the number of
+# favorites; each worker runs one git call at a time.
+DASHBOARD_WORKERS = 4
+# Repos with local changes, divergence or a status that just changed are
+# polled every BUSY_INTERVAL seconds; quiet ones back off up to IDLE_INTERVAL_MAX.
+BUSY_INTERVAL = 15.0
+IDLE_INTERVAL_MAX = 300.0
+ERROR_INTERVAL = 120.0
+
+
+@dataclasses.dataclass(frozen=True)
+class RepoStatus:
+    path: str
+    branch: str = ""
+    upstream: str = ""
+    ahead: int = 0
+    behind: int = 0
+    changes: int = 0
+    error: str = ""
+    # Wall clock of the status call, for the "updated N ago" column.
+    checked_at: float = 0.0
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.changes or self.ahead or self.behind)
+
+    @property
+    def signature(self) -> tuple[object, ...]:
+        return (self.branch, self.upstream, self.ahead, self.behind, self.changes, self.error)
+
+
+def parse_status_v2(path: str, output: str, checked_at: float = 0.0) -> RepoStatus:
+    # `status --porcelain=v2 --branch`: "# branch.*" headers, then one line
+    # per changed, unmerged or untracked path.
+    branch = upstream = ""
+    ahead = behind = changes = 0
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head ") :]
+        elif line.startswith("# branch.upstream "):
+            upstream = line[len("# branch.upstream ") :]
+        elif line.startswith("# branch.ab "):
+            counts = line[len("# branch.ab ") :].split()
+            if len(counts) == 2:
+                ahead = abs(int(counts[0])) if counts[0].lstrip("+-").isdigit() else 0
+                behind = abs(int(counts[1])) if counts[1].lstrip("+-").isdigit() else 0
+        elif line and not line.startswith("#"):
+            changes += 1
+    return RepoStatus(
+        path=path,
+        branch=branch,
+        upstream=upstream,
+        ahead=ahead,
+        behind=behind,
+        changes=changes,
+        checked_at=checked_at,
+    )
+
+
+def load_repo_status(path: str) -> RepoStatus:
+    # --no-optional-locks: a background poll must not take index.lock in a
+    # repo someone is working in.
+    checked_at = time.time()
+    try:
+        output = run_git(path, ["--no-optional-locks", "status", "--porcelain=v2", "--branch"])
+    except RuntimeError as exc:
+        return RepoStatus(path=path, error=str(exc), checked_at=checked_at)
+    return parse_status_v2(path, output, checked_at)
+
+
+def next_interval(previous: RepoStatus | None, status: RepoStatus, interval: float) -> float:
+    if status.error:
+        return ERROR_INTERVAL
+    if status.busy or previous is None or previous.signature != status.signature:
+        return BUSY_INTERVAL
+    return min(IDLE_INTERVAL_MAX, max(interval, BUSY_INTERVAL) * 2)
+
+
+class RepoDashboard:
+    # Last status per repo plus when it is due again. poll() only submits
+    # repos that are due and not already running.
+    def __init__(
+        self,
+        workers: int = DASHBOARD_WORKERS,
+        loader: Callable[[str], RepoStatus] = load_repo_status,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._workers = workers
+        self._loader = loader
+        self._clock = clock
+        self._executor: ThreadPoolExecutor | None = None
+        self._statuses: dict[str, RepoStatus] = {}
+        self._due: dict[str, float] = {}
+        self._intervals: dict[str, float] = {}
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> RepoStatus | None:
+        with self._lock:
+            return self._statuses.get(path)
+
+    def due_paths(self, paths: list[str], force: bool = False) -> list[str]:
+        now = self._clock()
+        with self._lock:
+            return [
+                path
+                for path in paths
+                if path not in self._in_flight and (force or self._due.get(path, 0.0) <= now)
+            ]
+
+    def poll(self, paths: list[str], on_result: Callable[[RepoStatus], None], force: bool = False) -> int:
+        # on_result runs on a worker thread.
+        due = self.due_paths(paths, force)
+        if not due:
+            return 0
+        with self._lock:
+            self._in_flight.update(due)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="repo-status")
+            executor = self._executor
+        for path in due:
+            executor.submit(self._run, path, on_result)
+        return len(due)
+
+    def _run(self, path: str, on_result: Callable[[RepoStatus], None]) -> None:
+        try:
+            status = self._loader(path)
+        except Exception as exc:
+            status = RepoStatus(path=path, error=str(exc), checked_at=time.time())
+        with self._lock:
+            # Shut down meanwhile: the app may be gone, drop the result.
+            if self._executor is None:
+                return
+        self.record(status)
+        on_result(status)
+
+    def record(self, status: RepoStatus) -> None:
+        with self._lock:
+            previous = self._statuses.get(status.path)
+            interval = next_interval(previous, status, self._intervals.get(status.path, 0.0))
+            self._statuses[status.path] = status
+            self._intervals[status.path] = interval
+            self._due[status.path] = self._clock() + interval
+            self._in_flight.discard(status.path)
+
+    def retain(self, paths: list[str]) -> None:
+        # Drop repos no longer listed in favorites or recents.
+        keep = set(paths)
+        with self._lock:
+            for store in (self._statuses, self._due, self._intervals):
+                for path in [path for path in store if path not in keep]:
+                    del store[path]
+
+    def shutdown(self) -> None:
+        # Queued polls are cancelled and running ones dropped when they end,
+        # so none of them may stay marked in flight.
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._in_flight.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
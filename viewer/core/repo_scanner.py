@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import collections
+import dataclasses
+import fnmatch
+import os
+import re
+import threading
+import time
+from typing import Callable
+
+DEFAULT_SCAN_IGNORES = (
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".tox",
+    ".mypy_cache",
+    ".cache",
+    "dist",
+    "build",
+    "target",
+    ".gradle",
+    ".idea",
+)
+SCAN_WORKERS = 8
+SCAN_BATCH = 64
+# Listings kept for re-validation; past this a scan still works, it just
+# stops caching new directories.
+SCAN_CACHE_MAX_ENTRIES = 1_000_000
+
+KIND_REPO = "repositório"
+KIND_WORKTREE = "worktree"
+KIND_SUBMODULE = "submódulo"
+KIND_GITFILE = "gitfile"
+
+
+@dataclasses.dataclass(frozen=True)
+class FoundRepo:
+    path: str
+    kind: str
+
+
+@dataclasses.dataclass(frozen=True)
+class ScanStats:
+    directories: int
+    repos: int
+    cached: int
+    elapsed: float
+
+
+def parse_ignore_rules(text: str) -> tuple[str, ...]:
+    # Comma or newline separated fnmatch patterns on directory names.
+    rules = [item.strip() for item in text.replace("\n", ",").split(",")]
+    return tuple(dict.fromkeys(rule for rule in rules if rule))
+
+
+def compile_ignore_rules(rules: tuple[str, ...]) -> Callable[[str], bool]:
+    # Plain names go to a set lookup; only real globs pay for a regex, all
+    # of them folded into one, since this runs once per directory entry.
+    names = frozenset(rule for rule in rules if not any(char in rule for char in "*?["))
+    globs = [fnmatch.translate(rule) for rule in rules if rule not in names]
+    pattern = re.compile("|".join(globs)) if globs else None
+
+    def is_ignored(name: str) -> bool:
+        return name in names or (pattern is not None and pattern.match(name) is not None)
+
+    return is_ignored
+
+
+def gitfile_kind(content: str) -> str:
+    # "gitdir: <path>" pointing into another repo's worktrees/ or modules/.
+    target = content.strip()
+    if not target.startswith("gitdir:"):
+        return ""
+    target = target[len("gitdir:") :].strip().replace("\\", "/")
+    if "/worktrees/" in target:
+        return KIND_WORKTREE
+    if "/modules/" in target:
+        return KIND_SUBMODULE
+    return KIND_GITFILE
+
+
+def _read_gitfile(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as handle:
+            return gitfile_kind(handle.read(4096))
+    except OSError:
+        return ""
+
+
+def list_directory(path: str) -> tuple[tuple[str, ...], str]:
+    # Subdirectory names (symlinks not followed) and the repo kind, if any.
+    subdirs: list[str] = []
+    kind = ""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name == ".git":
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        kind = KIND_REPO
+                    elif entry.is_file(follow_symlinks=False):
+                        kind = _read_gitfile(entry.path)
+                except OSError:
+                    pass
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+            except OSError:
+                continue
+    return tuple(subdirs), kind
+
+
+class ScanCache:
+    # Listings by directory, valid while the directory's mtime is unchanged:
+    # creating, removing or renaming an entry touches the parent, so an
+    # unchanged mtime means the same subdirectories and the same .git.
+    def __init__(self, max_entries: int = SCAN_CACHE_MAX_ENTRIES) -> None:
+        self._entries: dict[str, tuple[int, tuple[str, ...], str]] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, path: str, mtime_ns: int) -> tuple[tuple[str, ...], str] | None:
+        cached = self._entries.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            return None
+        return cached[1], cached[2]
+
+    def store(self, path: str, mtime_ns: int, subdirs: tuple[str, ...], kind: str) -> None:
+        with self._lock:
+            if path in self._entries or len(self._entries) < self._max_entries:
+                self._entries[path] = (mtime_ns, subdirs, kind)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def scan_repos(
+    root: str,
+    ignore: tuple[str, ...] = DEFAULT_SCAN_IGNORES,
+    cache: ScanCache | None = None,
+    on_found: Callable[[FoundRepo], None] | None = None,
+    cancel: threading.Event | None = None,
+    workers: int = SCAN_WORKERS,
+) -> ScanStats:
+    # Breadth of the tree is shared by a pool of threads; os.scandir and
+    # os.stat release the GIL, so the directory reads overlap. Repos are
+    # descended into as well, for submodules and nested worktrees.
+    started = time.perf_counter()
+    pending: collections.deque[str] = collections.deque([os.path.abspath(root)])
+    condition = threading.Condition()
+    active = 0
+    totals = {"directories": 0, "repos": 0, "cached": 0}
+    is_ignored = compile_ignore_rules(ignore)
+
+    def visit(path: str) -> tuple[tuple[str, ...], str, bool]:
+        mtime_ns = os.stat(path).st_mtime_ns if cache is not None else 0
+        if cache is not None:
+            cached = cache.lookup(path, mtime_ns)
+            if cached is not None:
+                return cached[0], cached[1], True
+        subdirs, kind = list_directory(path)
+        if cache is not None:
+            cache.store(path, mtime_ns, subdirs, kind)
+        return subdirs, kind, False
+
+    def worker() -> None:
+        nonlocal active
+        directories = repos = cached_hits = 0
+        while True:
+            with condition:
+                while not pending and active:
+                    condition.wait()
+                if not pending or (cancel is not None and cancel.is_set()):
+                    condition.notify_all()
+                    break
+                # A share of the queue per lock round trip, not one path.
+                take = min(SCAN_BATCH, max(1, len(pending) // workers))
+                batch = [pending.pop() for _ in range(take)]
+                active += 1
+            children: list[str] = []
+            for path in batch:
+                try:
+                    subdirs, kind, from_cache = visit(path)
+                except OSError:
+                    subdirs, kind, from_cache = (), "", False
+                directories += 1
+                cached_hits += from_cache
+                if kind:
+                    repos += 1
+                    if on_found is not None:
+                        on_found(FoundRepo(path=path, kind=kind))
+                for name in subdirs:
+                    if not is_ignored(name):
+                        children.append(os.path.join(path, name))
+            with condition:
+                pending.extend(children)
+                active -= 1
+                if children:
+                    condition.notify(len(children))
+                elif not active and not pending:
+                    condition.notify_all()
+        with condition:
+            totals["directories"] += directories
+            totals["repos"] += repos
+            totals["cached"] += cached_hits
+
+    workers = max(1, workers)
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return ScanStats(
+        directories=totals["directories"],
+        repos=totals["repos"],
+        cached=totals["cached"],
+        elapsed=time.perf_counter() - started,
+    )
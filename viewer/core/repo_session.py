@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+from collections import OrderedDict
+
+from .branch_refs import git_dirs, refs_signature
+from .commit_filter import CommitWindow
+from .commit_graph import CommitGraph
+from .commit_store import CommitStore
+from .models import CommitFilters, CommitInfo
+from .patch_buffer import PatchBuffer
+
+# Repos kept warm besides the open one, and the bytes all of them may hold.
+SESSION_MAX_REPOS = 8
+SESSION_MAX_BYTES = 256 * 1024 * 1024
+# Rough cost of the entries that have no byte count of their own.
+DETAILS_ENTRY_BYTES = 2048
+STATUS_ENTRY_BYTES = 300
+GRAPH_ROW_BYTES = 32
+
+
+@dataclasses.dataclass
+class RepoSession:
+    # What the History and Commit tabs showed for one repo when another was
+    # opened. refs_signature is taken at that moment: while it still matches
+    # on the way back, the commit pages are current and need no reload.
+    repo_path: str
+    refs_signature: tuple[int, ...]
+    filters: CommitFilters
+    commits: CommitStore
+    commit_window: CommitWindow | None
+    commit_graph: CommitGraph | None
+    no_more_commits: bool
+    top_fraction: float = 0.0
+    selected_hash: str | None = None
+    patch_cache: dict[tuple[str, str], str | PatchBuffer] = dataclasses.field(default_factory=dict)
+    full_patch_cache: dict[str, str] = dataclasses.field(default_factory=dict)
+    selected_file_by_commit: dict[str, int] = dataclasses.field(default_factory=dict)
+    commit_details_cache: dict[str, CommitInfo] = dataclasses.field(default_factory=dict)
+    status_entries: list[dict[str, str | bool]] = dataclasses.field(default_factory=list)
+    status_signature: str = ""
+    branches: list[str] = dataclasses.field(default_factory=list)
+    current_branch: str = ""
+
+    @property
+    def nbytes(self) -> int:
+        size = self.commits.nbytes
+        if self.commit_window is not None and self.commit_window.store is not self.commits:
+            size += self.commit_window.store.nbytes
+        if self.commit_graph is not None:
+            size += len(self.commit_graph) * GRAPH_ROW_BYTES
+        for patch in self.patch_cache.values():
+            size += patch.size if isinstance(patch, PatchBuffer) else len(patch)
+        size += sum(len(patch) for patch in self.full_patch_cache.values())
+        size += len(self.commit_details_cache) * DETAILS_ENTRY_BYTES
+        size += len(self.status_entries) * STATUS_ENTRY_BYTES
+        return size
+
+
+class RepoSessionCache:
+    # Sessions of recently left repos, least recently used evicted first once
+    # there are more than max_sessions or their bytes pass max_bytes. A
+    # session is taken out while its repo is open, so the open repo never
+    # counts against the budget. Used from the Tk thread only, except
+    # signature(), which the switch check runs on a worker.
+    def __init__(self, max_sessions: int = SESSION_MAX_REPOS, max_bytes: int = SESSION_MAX_BYTES) -> None:
+        self._sessions: OrderedDict[str, tuple[RepoSession, int]] = OrderedDict()
+        self._dirs: dict[str, tuple[str, str]] = {}
+        self._max_sessions = max_sessions
+        self._max_bytes = max_bytes
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, repo_path: object) -> bool:
+        return repo_path in self._sessions
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def signature(self, repo_path: str) -> tuple[int, ...]:
+        # Stats only, once the git dirs are known: packed-refs, loose ref
+        # directories, HEAD and config.
+        dirs = self._dirs.get(repo_path)
+        if dirs is None:
+            dirs = git_dirs(repo_path)
+            self._dirs[repo_path] = dirs
+        return refs_signature(*dirs)
+
+    def put(self, session: RepoSession) -> None:
+        self.discard(session.repo_path)
+        size = session.nbytes
+        self._sessions[session.repo_path] = (session, size)
+        self._bytes += size
+        while self._sessions and (len(self._sessions) > self._max_sessions or self._bytes > self._max_bytes):
+            _path, (_evicted, evicted_size) = self._sessions.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def take(self, repo_path: str) -> RepoSession | None:
+        entry = self._sessions.pop(repo_path, None)
+        if entry is None:
+            return None
+        self._bytes -= entry[1]
+        return entry[0]
+
+    def discard(self, repo_path: str) -> None:
+        self.take(repo_path)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._bytes = 0
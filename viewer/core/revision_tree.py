@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import subprocess
+import threading
+from collections import OrderedDict
+
+from .git_client import run_git
+from .models import TreeEntry
+
+# Entries kept across all cached trees; a 300k-entry monorepo fits.
+TREE_CACHE_ENTRIES = 400_000
+BLOB_PREVIEW_BYTES = 256 * 1024
+# Same heuristic as git: a NUL in the first 8000 bytes means binary.
+BINARY_PROBE_BYTES = 8000
+
+
+def parse_ls_tree(output: bytes) -> list[TreeEntry]:
+    # `git ls-tree -z -l`: "mode SP type SP oid SP+ size TAB name NUL".
+    entries: list[TreeEntry] = []
+    for record in output.split(b"\0"):
+        if not record:
+            continue
+        meta, _, name = record.partition(b"\t")
+        parts = meta.split()
+        if len(parts) < 4:
+            continue
+        mode, kind, object_id, size = parts[0], parts[1], parts[2], parts[3]
+        entries.append(
+            TreeEntry(
+                name=name.decode("utf-8", errors="replace"),
+                kind=kind.decode("ascii"),
+                object_id=object_id.decode("ascii"),
+                mode=mode.decode("ascii"),
+                size=int(size) if size.isdigit() else -1,
+            )
+        )
+    # Directories first, then files, each by name, like a file manager.
+    entries.sort(key=lambda entry: (entry.kind != "tree", entry.name))
+    return entries
+
+
+class TreeCache:
+    # Tree objects never change, so listings are cached by tree id and
+    # shared by every commit that contains the same tree. LRU by entries.
+    def __init__(self, max_entries: int = TREE_CACHE_ENTRIES) -> None:
+        self._trees: OrderedDict[str, list[TreeEntry]] = OrderedDict()
+        self._max_entries = max_entries
+        self._entries = 0
+        self._lock = threading.Lock()
+
+    def get(self, tree_id: str) -> list[TreeEntry] | None:
+        with self._lock:
+            entries = self._trees.get(tree_id)
+            if entries is not None:
+                self._trees.move_to_end(tree_id)
+            return entries
+
+    def put(self, tree_id: str, entries: list[TreeEntry]) -> None:
+        with self._lock:
+            if tree_id in self._trees:
+                return
+            self._trees[tree_id] = entries
+            self._entries += len(entries)
+            while self._entries > self._max_entries and len(self._trees) > 1:
+                _tree_id, evicted = self._trees.popitem(last=False)
+                self._entries -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+
+def resolve_tree(repo_path: str, rev: str) -> str:
+    return run_git(repo_path, ["rev-parse", "--verify", f"{rev}^{{tree}}"]).strip()
+
+
+def load_tree(repo_path: str, tree_id: str, cache: TreeCache) -> list[TreeEntry]:
+    entries = cache.get(tree_id)
+    if entries is not None:
+        return entries
+    result = subprocess.run(
+        ["git", "-C", repo_path, "ls-tree", "-z", "-l", tree_id],
+        check=False,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"git falhou: {stderr or '(sem detalhes)'}")
+    entries = parse_ls_tree(result.stdout)
+    cache.put(tree_id, entries)
+    return entries
+
+
+def read_blob_head(repo_path: str, object_id: str, max_bytes: int = BLOB_PREVIEW_BYTES) -> tuple[bytes, bool]:
+    # First ``max_bytes`` of a blob and whether there is more; git is stopped
+    # once enough was read, so huge blobs cost the same as small ones.
+    process = subprocess.Popen(
+        ["git", "-C", repo_path, "cat-file", "blob", object_id],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert process.stdout is not None
+    data = process.stdout.read(max_bytes + 1)
+    truncated = len(data) > max_bytes
+    if truncated:
+        process.kill()
+    process.stdout.close()
+    returncode = process.wait()
+    if returncode != 0 and not truncated:
+        raise RuntimeError(f"git falhou: objeto {object_id} nao encontrado")
+    return data[:max_bytes], truncated
+
+
+def is_binary(data: bytes) -> bool:
+    return b"\0" in data[:BINARY_PROBE_BYTES]
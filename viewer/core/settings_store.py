@@ -5,6 +5,8 @@ import json
 import os
 from pathlib import Path
 
+from .repo_scanner import DEFAULT_SCAN_IGNORES
+
 DEFAULT_SETTINGS: dict[str, object] = {
     "commit_limit": 100,
     "fetch_interval_sec": 60,
@@ -16,6 +18,9 @@ DEFAULT_SETTINGS: dict[str, object] = {
     "ui_font_size": 0,
     "mono_font_family": "",
     "mono_font_size": 0,
+    "syntax_highlight": True,
+    "scan_root": "",
+    "scan_ignore": list(DEFAULT_SCAN_IGNORES),
 }
 
 
@@ -50,6 +55,12 @@ def _coerce_str(value: object, default: str) -> str:
     return value.strip()
 
 
+def _coerce_bool(value: object, default: bool) -> bool:
+    if not isinstance(value, bool):
+        return default
+    return value
+
+
 def _sanitize_repo_list(items: object) -> list[str]:
     if not isinstance(items, list):
         return []
@@ -66,6 +77,12 @@ def _sanitize_repo_list(items: object) -> list[str]:
     return result
 
 
+def _sanitize_str_list(items: object) -> list[str]:
+    if not isinstance(items, list):
+        return []
+    return [item.strip() for item in items if isinstance(item, str) and item.strip()]
+
+
 def load_settings(path: Path) -> dict[str, object]:
     data = dict(DEFAULT_SETTINGS)
     if not path.exists():
@@ -98,6 +115,11 @@ def load_settings(path: Path) -> dict[str, object]:
         data["ui_font_size"] = _coerce_int(raw.get("ui_font_size"), 0, minimum=0)
         data["mono_font_family"] = _coerce_str(raw.get("mono_font_family"), "")
         data["mono_font_size"] = _coerce_int(raw.get("mono_font_size"), 0, minimum=0)
+        data["syntax_highlight"] = _coerce_bool(raw.get("syntax_highlight"), True)
+        data["scan_root"] = _coerce_str(raw.get("scan_root"), "")
+        # A saved empty list means no rules; only a missing key gets defaults.
+        if "scan_ignore" in raw:
+            data["scan_ignore"] = _sanitize_str_list(raw.get("scan_ignore"))
     return data
 
 
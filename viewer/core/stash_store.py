@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections import OrderedDict
+
+from .git_client import FIELD_SEP, RECORD_SEP, run_git
+
+STASH_DIFF_CACHE_ENTRIES = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class StashEntry:
+    ref: str
+    commit_hash: str
+    subject: str
+    timestamp: int
+    files: int = 0
+    added: int = 0
+    deleted: int = 0
+    binary: int = 0
+
+    @property
+    def label(self) -> str:
+        summary = f"{self.files} arquivo(s), +{self.added}/-{self.deleted}"
+        if self.binary:
+            summary = f"{summary}, {self.binary} bin"
+        return f"{self.ref}: {self.subject} ({summary})"
+
+
+def parse_stash_log(output: str) -> list[StashEntry]:
+    entries: list[StashEntry] = []
+    for record in output.split(RECORD_SEP):
+        if not record.strip():
+            continue
+        header, _, stats = record.partition("\n")
+        parts = header.split(FIELD_SEP)
+        if len(parts) < 4:
+            continue
+        commit_hash, ref, subject, timestamp = parts[:4]
+        files = added = deleted = binary = 0
+        for line in stats.splitlines():
+            numbers = line.split("\t", 2)
+            if len(numbers) < 3:
+                continue
+            files += 1
+            if numbers[0] == "-" or numbers[1] == "-":
+                binary += 1
+            elif numbers[0].isdigit() and numbers[1].isdigit():
+                added += int(numbers[0])
+                deleted += int(numbers[1])
+        entries.append(
+            StashEntry(
+                ref=ref,
+                commit_hash=commit_hash,
+                subject=subject,
+                timestamp=int(timestamp) if timestamp.isdigit() else 0,
+                files=files,
+                added=added,
+                deleted=deleted,
+                binary=binary,
+            )
+        )
+    return entries
+
+
+def load_stashes(repo_path: str) -> list[StashEntry]:
+    # Every stash with its file counts in one reflog walk; --first-parent
+    # diffs against the commit the stash was taken on, like `stash show`.
+    try:
+        output = run_git(
+            repo_path,
+            [
+                "log",
+                "-g",
+                "--first-parent",
+                "--numstat",
+                f"--format={RECORD_SEP}%H{FIELD_SEP}%gd{FIELD_SEP}%gs{FIELD_SEP}%ct",
+                "refs/stash",
+                "--",
+            ],
+        )
+    except RuntimeError:
+        # No refs/stash yet.
+        if not run_git(repo_path, ["stash", "list"]).strip():
+            return []
+        raise
+    return parse_stash_log(output)
+
+
+class StashDiffCache:
+    # `stash show -p` output by stash commit; the commit never changes, so an
+    # entry survives stash@{n} renumbering after a push, pop or drop.
+    def __init__(self, max_entries: int = STASH_DIFF_CACHE_ENTRIES) -> None:
+        self._diffs: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, commit_hash: str) -> str | None:
+        with self._lock:
+            diff = self._diffs.get(commit_hash)
+            if diff is not None:
+                self._diffs.move_to_end(commit_hash)
+            return diff
+
+    def put(self, commit_hash: str, diff: str) -> None:
+        with self._lock:
+            self._diffs[commit_hash] = diff
+            self._diffs.move_to_end(commit_hash)
+            while len(self._diffs) > self._max_entries:
+                self._diffs.popitem(last=False)
+
+
+def load_stash_diff(repo_path: str, commit_hash: str, cache: StashDiffCache) -> str:
+    diff = cache.get(commit_hash)
+    if diff is None:
+        diff = run_git(repo_path, ["stash", "show", "-p", commit_hash])
+        cache.put(commit_hash, diff)
+    return diff
+
+
+def run_stash_action(repo_path: str, action: str, entry: StashEntry) -> None:
+    # apply/pop/drop by position, after checking the position still names the
+    # same stash; another git client may have renumbered the list.
+    try:
+        current = run_git(repo_path, ["rev-parse", "--verify", "--quiet", entry.ref]).strip()
+    except RuntimeError:
+        current = ""
+    if current != entry.commit_hash:
+        raise RuntimeError("A lista de stashes mudou; atualize e tente de novo.")
+    run_git(repo_path, ["stash", action, entry.ref])
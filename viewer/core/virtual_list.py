@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import dataclasses
+
+
+@dataclasses.dataclass
+class ListViewport:
+    # Scroll and selection state of a virtual list; the widget only draws
+    # ``visible_range()`` and never holds one item per row.
+    size: int = 0
+    top: int = 0
+    visible: int = 1
+    active: int = 0
+    anchor: int = 0
+    selection: set[int] = dataclasses.field(default_factory=set)
+
+    def set_size(self, size: int) -> None:
+        self.size = max(size, 0)
+        self.selection = {index for index in self.selection if index < self.size}
+        self.active = min(self.active, max(self.size - 1, 0))
+        self.anchor = min(self.anchor, max(self.size - 1, 0))
+        self.scroll_to(self.top)
+
+    def set_visible(self, visible: int) -> None:
+        self.visible = max(visible, 1)
+        self.scroll_to(self.top)
+
+    def max_top(self) -> int:
+        return max(self.size - self.visible, 0)
+
+    def scroll_to(self, top: int) -> bool:
+        top = max(min(top, self.max_top()), 0)
+        changed = top != self.top
+        self.top = top
+        return changed
+
+    def scroll_by(self, delta: int) -> bool:
+        return self.scroll_to(self.top + delta)
+
+    def moveto(self, fraction: float) -> bool:
+        return self.scroll_to(int(fraction * self.size))
+
+    def fractions(self) -> tuple[float, float]:
+        if self.size == 0:
+            return 0.0, 1.0
+        return self.top / self.size, min(self.top + self.visible, self.size) / self.size
+
+    def visible_range(self) -> range:
+        return range(self.top, min(self.top + self.visible, self.size))
+
+    def see(self, index: int) -> bool:
+        if index < self.top:
+            return self.scroll_to(index)
+        if index >= self.top + self.visible:
+            return self.scroll_to(index - self.visible + 1)
+        return False
+
+    def index_at(self, row: int) -> int | None:
+        index = self.top + row
+        if row < 0 or index >= self.size:
+            return None
+        return index
+
+    def select(self, index: int, mode: str = "set") -> None:
+        if not 0 <= index < self.size:
+            return
+        if mode == "toggle":
+            self.selection ^= {index}
+            self.anchor = index
+        elif mode == "extend":
+            low, high = sorted((self.anchor, index))
+            self.selection = set(range(low, high + 1))
+        else:
+            self.selection = {index}
+            self.anchor = index
+        self.active = index
+
+    def select_range(self, first: int, last: int) -> None:
+        low, high = sorted((max(first, 0), min(last, self.size - 1)))
+        self.selection.update(range(low, high + 1))
+
+    def clear_selection(self) -> None:
+        self.selection.clear()
+
+    def curselection(self) -> tuple[int, ...]:
+        return tuple(sorted(self.selection))
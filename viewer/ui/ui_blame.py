@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tkinter as tk
+from typing import Hashable
+from tkinter import messagebox, ttk
+
+from ..core.blame import BlameResult, carry_to_parent, is_uncommitted, stream_blame
+from ..core.git_client import run_git
+from ..core.models import BlameCommit, BlameRange
+
+BLAME_GUTTER_WIDTH = 36
+
+
+class BlameView(ttk.Frame):
+    # File text with a blame gutter; ranges are painted as they stream in.
+    def __init__(self, master: tk.Misc) -> None:
+        super().__init__(master)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+        self.gutter = tk.Text(self, width=BLAME_GUTTER_WIDTH, wrap="none", font="TkFixedFont", cursor="arrow")
+        self.gutter.grid(row=0, column=0, sticky="ns")
+        self.text = tk.Text(self, wrap="none", font="TkFixedFont")
+        self.text.grid(row=0, column=1, sticky="nsew", padx=(2, 0))
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        scroll.grid(row=0, column=2, sticky="ns")
+        self.scrollbar = scroll
+        # Both panes follow whichever one scrolled last.
+        self.text.configure(yscrollcommand=lambda first, last: self._sync(self.gutter, first, last))
+        self.gutter.configure(yscrollcommand=lambda first, last: self._sync(self.text, first, last))
+        for pane in (self.gutter, self.text):
+            pane.configure(state="disabled")
+        self.line_count = 0
+
+    def show_content(self, content: str) -> None:
+        lines = content.splitlines()
+        self.line_count = len(lines)
+        self._replace(self.text, "1.0", tk.END, "\n".join(lines))
+        self._replace(self.gutter, "1.0", tk.END, "\n" * max(self.line_count - 1, 0))
+
+    def paint(self, ranges: list[BlameRange], label: "BlameLabeler") -> None:
+        gutter = self.gutter
+        gutter.configure(state="normal")
+        for blame_range in ranges:
+            first = blame_range.final_line
+            last = min(first + blame_range.count - 1, self.line_count)
+            if first > last:
+                continue
+            text, tag = label(blame_range.commit_hash)
+            rows = [text] + ["" for _ in range(last - first)]
+            gutter.delete(f"{first}.0", f"{last}.end")
+            gutter.insert(f"{first}.0", "\n".join(rows))
+            gutter.tag_add(tag, f"{first}.0", f"{last + 1}.0")
+        gutter.configure(state="disabled")
+
+    def clear_gutter(self) -> None:
+        self._replace(self.gutter, "1.0", tk.END, "\n" * max(self.line_count - 1, 0))
+
+    def line_at(self, widget: tk.Text, y: int) -> int:
+        return int(widget.index(f"@0,{y}").split(".")[0])
+
+    @staticmethod
+    def _replace(widget: tk.Text, start: str, end: str, content: str) -> None:
+        widget.configure(state="normal")
+        widget.delete(start, end)
+        widget.insert("1.0", content)
+        widget.configure(state="disabled")
+
+    def _sync(self, other: tk.Text, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        if other.yview()[0] != float(first):
+            other.yview_moveto(first)
+
+    def _on_scrollbar(self, *args: str) -> None:
+        self.text.yview(*args)
+        self.gutter.yview_moveto(self.text.yview()[0])
+
+
+class BlameLabeler:
+    # Gutter text per commit; author and subject come from the commit details
+    # cache when the History tab already loaded them.
+    def __init__(self, commits: dict[str, BlameCommit], details: dict[str, object]) -> None:
+        self.commits = commits
+        self.details = details
+        self._labels: dict[str, tuple[str, str]] = {}
+
+    def __call__(self, commit_hash: str) -> tuple[str, str]:
+        cached = self._labels.get(commit_hash)
+        if cached is not None:
+            return cached
+        if is_uncommitted(commit_hash):
+            label = ("(nao commitado)", "blame_new")
+        else:
+            author, _summary, when = self.describe(commit_hash)
+            text = f"{commit_hash[:7]} {author[:14]:<14} {when}"
+            label = (text[:BLAME_GUTTER_WIDTH], "blame_odd" if int(commit_hash[:2], 16) % 2 else "blame_even")
+        self._labels[commit_hash] = label
+        return label
+
+    def describe(self, commit_hash: str) -> tuple[str, str, str]:
+        commit = self.commits.get(commit_hash)
+        details = self.details.get(commit_hash)
+        author = getattr(details, "author", "") or (commit.author if commit else "?")
+        summary = getattr(details, "subject", "") or (commit.summary if commit else "")
+        when = time.strftime("%Y-%m-%d", time.localtime(commit.author_time)) if commit and commit.author_time else ""
+        return author, summary, when
+
+
+class BlameWindow(tk.Toplevel):
+    def __init__(self, app: tk.Tk, rev: str | None, path: str) -> None:
+        super().__init__(app)
+        self.app = app
+        self.rev = rev
+        self.path = path
+        self.result = BlameResult()
+        self.cancel = threading.Event()
+        self.history: list[tuple[str | None, str]] = []
+        self.geometry("1100x700")
+
+        frame = ttk.Frame(self)
+        frame.pack(fill="both", expand=True, padx=8, pady=8)
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(1, weight=1)
+
+        header = ttk.Frame(frame)
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 6))
+        header.grid_columnconfigure(0, weight=1)
+        self.revision_var = tk.StringVar(value="")
+        ttk.Label(header, textvariable=self.revision_var).grid(row=0, column=0, sticky="w")
+        ttk.Button(header, text="Revisao pai", command=self._open_parent).grid(row=0, column=1, padx=(6, 0))
+        self.back_button = ttk.Button(header, text="Voltar", command=self._go_back, state="disabled")
+        self.back_button.grid(row=0, column=2, padx=(6, 0))
+        ttk.Button(header, text="Fechar", command=self._close).grid(row=0, column=3, padx=(6, 0))
+
+        self.view = BlameView(frame)
+        self.view.grid(row=1, column=0, sticky="nsew")
+        self.info_var = tk.StringVar(value="")
+        ttk.Label(frame, textvariable=self.info_var).grid(row=2, column=0, sticky="w", pady=(6, 0))
+
+        gutter = self.view.gutter
+        palette = getattr(app, "theme_palette", None)
+        if palette and hasattr(app, "_apply_text_widget_theme"):
+            for pane in (gutter, self.view.text):
+                app._apply_text_widget_theme(pane, palette)
+            gutter.tag_configure("blame_even", background=palette["field_bg"])
+            gutter.tag_configure("blame_odd", background=palette["bg"])
+            gutter.tag_configure("blame_new", background=palette["diff_added_bg"])
+        else:
+            gutter.tag_configure("blame_odd", background="#f6f6f6")
+            gutter.tag_configure("blame_new", background="#dafbe1")
+        gutter.bind("<Button-1>", self._show_line_info)
+        self.view.text.bind("<Button-1>", self._show_line_info, add="+")
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._load(rev, path)
+
+    def _labeler(self) -> BlameLabeler:
+        return BlameLabeler(self.result.commits, self.app.commit_details_cache)
+
+    def _describe_revision(self) -> None:
+        name = self.rev[:7] if self.rev else "arquivos locais"
+        status = "" if self.result.complete else " (carregando...)"
+        self.title(f"Blame - {self.path}")
+        self.revision_var.set(f"{self.path} @ {name}{status}")
+        self.back_button.configure(state="normal" if self.history else "disabled")
+
+    def _load(self, rev: str | None, path: str) -> None:
+        # File text and blame start together; whichever lands first paints.
+        repo_path = self.app.repo_path
+
+        def task() -> str:
+            if rev:
+                return run_git(repo_path, ["show", f"{rev}:{path}"])
+            with open(os.path.join(repo_path, path), encoding="utf-8", errors="replace") as handle:
+                return handle.read()
+
+        def success(content: str) -> None:
+            if self.winfo_exists() and (self.rev, self.path) == (rev, path):
+                self.view.show_content(content)
+                self.view.paint(self.result.ranges, self._labeler())
+
+        self.app._run_async(f"blame_content:{id(self)}", "", task, success, None)
+        self._start(rev, path, None)
+
+    def _start(
+        self,
+        rev: str | None,
+        path: str,
+        content: str | None,
+        seed: BlameResult | None = None,
+        spans: list[tuple[int, int]] | None = None,
+    ) -> None:
+        self.cancel.set()
+        self.cancel = threading.Event()
+        self.rev = rev
+        self.path = path
+        key = self.app._blame_key(rev, path)
+        cached = self.app.blame_cache.get(key) if key is not None else None
+        if content is not None:
+            self.view.show_content(content)
+        if cached is not None:
+            self.result = cached
+            self.view.paint(cached.ranges, self._labeler())
+            self._describe_revision()
+            return
+        self.result = seed or BlameResult()
+        # Ranges carried over from the child revision paint right away.
+        self.view.paint(self.result.ranges, self._labeler())
+        self._describe_revision()
+        if spans == []:
+            self._finish(self.result, key)
+            return
+        self._stream(self.result, key, spans)
+
+    def _stream(self, result: BlameResult, key: Hashable | None, spans: list[tuple[int, int]] | None) -> None:
+        cancel = self.cancel
+        repo_path = self.app.repo_path
+        rev = self.rev
+        path = self.path
+
+        def paint(ranges: list[BlameRange], commits: dict[str, BlameCommit]) -> None:
+            if cancel.is_set() or not self.winfo_exists():
+                return
+            result.add(ranges, commits)
+            self.view.paint(ranges, self._labeler())
+
+        def failed(exc: Exception) -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                messagebox.showerror("Blame", str(exc), parent=self)
+
+        def done() -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                self._finish(result, key)
+
+        def worker() -> None:
+            try:
+                stream_blame(
+                    repo_path,
+                    rev,
+                    path,
+                    lambda ranges, commits: self.app.after(0, lambda: paint(ranges, commits)),
+                    cancel,
+                    spans,
+                )
+            except Exception as exc:
+                self.app.after(0, lambda: failed(exc))
+                return
+            self.app.after(0, done)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _finish(self, result: BlameResult, key: Hashable | None) -> None:
+        result.complete = True
+        if key is not None:
+            self.app.blame_cache.put(key, result)
+        self._describe_revision()
+
+    def _open_parent(self) -> None:
+        result = self.result
+        rev = self.rev
+        path = self.path
+        if not result.complete:
+            messagebox.showinfo("Blame", "Aguarde o blame atual terminar.", parent=self)
+            return
+        own = rev or next((commit for commit in result.commits if is_uncommitted(commit)), "")
+        own_commit = result.commits.get(own)
+        if own_commit is not None and not own_commit.previous:
+            messagebox.showinfo("Blame", "O arquivo foi criado nesta revisao.", parent=self)
+            return
+        # "previous <hash> <path>" also tells where the file lived before a rename.
+        parent_path = own_commit.previous.split(" ", 1)[1] if own_commit is not None else path
+        line_count = result.line_count()
+        repo_path = self.app.repo_path
+
+        def task() -> tuple[str, str, list[BlameRange] | None, list[tuple[int, int]] | None]:
+            parent_rev = run_git(repo_path, ["rev-parse", f"{rev}^" if rev else "HEAD"]).strip()
+            content = run_git(repo_path, ["show", f"{parent_rev}:{parent_path}"])
+            if parent_path != path:
+                return parent_rev, content, None, None
+            diff_args = ["diff", "--no-ext-diff", "--unified=0", parent_rev]
+            if rev:
+                diff_args.append(rev)
+            diff_text = run_git(repo_path, [*diff_args, "--", path])
+            moved, spans = carry_to_parent(result.ranges, own, diff_text, line_count)
+            return parent_rev, content, moved, spans
+
+        def success(found: tuple[str, str, list[BlameRange] | None, list[tuple[int, int]] | None]) -> None:
+            if not self.winfo_exists() or (self.rev, self.path) != (rev, path):
+                return
+            parent_rev, content, moved, spans = found
+            self.history.append((rev, path))
+            seed = None if moved is None else BlameResult(ranges=list(moved), commits=dict(result.commits))
+            self._start(parent_rev, parent_path, content, seed, spans)
+
+        def error(exc: Exception) -> None:
+            messagebox.showerror("Blame", str(exc), parent=self)
+
+        self.app._run_async(f"blame_parent:{id(self)}", "Blame pai", task, success, error)
+
+    def _go_back(self) -> None:
+        if not self.history:
+            return
+        rev, path = self.history.pop()
+        self.view.clear_gutter()
+        self._load(rev, path)
+
+    def _show_line_info(self, event: tk.Event) -> None:
+        line = self.view.line_at(event.widget, event.y)
+        found = self.result.range_at(line)
+        if found is None:
+            self.info_var.set("")
+        elif is_uncommitted(found.commit_hash):
+            self.info_var.set(f"Linha {line}: alteracao local ainda nao commitada")
+        else:
+            author, summary, when = self._labeler().describe(found.commit_hash)
+            self.info_var.set(f"Linha {line}: {found.commit_hash[:10]} | {author} | {when} | {summary}")
+
+    def _close(self) -> None:
+        self.cancel.set()
+        self.destroy()
+
+
+class BlameMixin:
+    def _blame_key(self, rev: str | None, path: str) -> Hashable | None:
+        # Commits never change; local files are keyed by mtime and size.
+        if rev:
+            return (self.repo_path, rev, path)
+        try:
+            stat = os.stat(os.path.join(self.repo_path, path))
+        except OSError:
+            return None
+        return (self.repo_path, "worktree", path, stat.st_mtime_ns, stat.st_size)
+
+    def _open_blame_window(self, rev: str | None, path: str) -> None:
+        if not self.repo_ready or not path:
+            return
+        BlameWindow(self, rev, path)
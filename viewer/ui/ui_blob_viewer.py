@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ..core.blob_store import HEX_ROW_BYTES, BlobFile, resolve_blob
+from .ui_tree_browser import format_size
+
+TEXT_PAGE_LINES = 500
+HEX_PAGE_ROWS = 512
+VIEW_MODES = ("Texto", "Hex")
+
+
+def parse_position(value: str, size: int) -> int | None:
+    # "50%", "0x1f00" or a plain byte offset.
+    value = value.strip().lower()
+    try:
+        if value.endswith("%"):
+            return int(size * float(value[:-1]) / 100)
+        if value.startswith("0x"):
+            return int(value, 16)
+        return int(value)
+    except ValueError:
+        return None
+
+
+class BlobViewerWindow(tk.Toplevel):
+    # One blob at a revision, copied once into the app's BlobStore and then
+    # read through mmap one page at a time.
+    def __init__(self, app: tk.Tk, rev: str, path: str, object_id: str | None = None) -> None:
+        super().__init__(app)
+        self.app = app
+        self.path = path
+        self.blob: BlobFile | None = None
+        self.offset = 0
+        self.page_end = 0
+        self.cancel = threading.Event()
+        self.title(f"Conteudo - {path} @ {rev[:10]}")
+        self.geometry("1000x700")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        bar = ttk.Frame(self)
+        bar.grid(row=0, column=0, columnspan=2, sticky="ew", padx=8, pady=(8, 4))
+        bar.grid_columnconfigure(8, weight=1)
+        ttk.Label(bar, text="Modo:").grid(row=0, column=0, padx=(0, 4))
+        self.mode_var = tk.StringVar(value=VIEW_MODES[0])
+        mode_combo = ttk.Combobox(bar, textvariable=self.mode_var, values=VIEW_MODES, width=6, state="readonly")
+        mode_combo.grid(row=0, column=1, padx=(0, 8))
+        mode_combo.bind("<<ComboboxSelected>>", lambda _e: self._go_to(self.offset))
+        ttk.Button(bar, text="Inicio", command=lambda: self._go_to(0)).grid(row=0, column=2, padx=(0, 4))
+        ttk.Button(bar, text="Anterior", command=self._previous_page).grid(row=0, column=3, padx=(0, 4))
+        ttk.Button(bar, text="Proxima", command=self._next_page).grid(row=0, column=4, padx=(0, 4))
+        ttk.Button(bar, text="Fim", command=self._last_page).grid(row=0, column=5, padx=(0, 8))
+        ttk.Label(bar, text="Ir para:").grid(row=0, column=6, padx=(0, 4))
+        self.position_var = tk.StringVar()
+        position_entry = ttk.Entry(bar, textvariable=self.position_var, width=14)
+        position_entry.grid(row=0, column=7, padx=(0, 8))
+        position_entry.bind("<Return>", lambda _e: self._go_to_entry())
+        self.status_var = tk.StringVar(value="Carregando...")
+        ttk.Label(bar, textvariable=self.status_var).grid(row=0, column=8, sticky="e")
+
+        self.text = tk.Text(self, wrap="none", font="TkFixedFont", state="disabled")
+        self.text.grid(row=1, column=0, sticky="nsew", padx=(8, 0), pady=(0, 8))
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
+        scroll.grid(row=1, column=1, sticky="ns", padx=(0, 8), pady=(0, 8))
+        self.text.configure(yscrollcommand=scroll.set)
+        self.bind("<Control-Next>", lambda _e: self._next_page())
+        self.bind("<Control-Prior>", lambda _e: self._previous_page())
+
+        palette = getattr(app, "theme_palette", None)
+        if palette and hasattr(app, "_apply_text_widget_theme"):
+            app._apply_text_widget_theme(self.text, palette)
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._load(rev, path, object_id)
+
+    def _load(self, rev: str, path: str, object_id: str | None) -> None:
+        repo_path = self.app.repo_path
+        store = self.app.blob_store
+        cancel = self.cancel
+        start = self.app._perf_start("Conteudo do arquivo")
+
+        def progress(written: int) -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                self.status_var.set(f"Extraindo... {format_size(written)}")
+
+        def done(blob_id: str | None) -> None:
+            if blob_id is None or cancel.is_set() or not self.winfo_exists():
+                return
+            self.blob = self.app.blob_store.open(blob_id)
+            if self.blob.is_binary():
+                self.mode_var.set("Hex")
+            self._go_to(0)
+            self.app._perf_end("Conteudo do arquivo", start)
+
+        def failed(exc: Exception) -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                self.status_var.set("")
+                messagebox.showerror("Conteudo", str(exc), parent=self)
+
+        def worker() -> None:
+            try:
+                blob_id = object_id or resolve_blob(repo_path, rev, path)
+                last_report = [0]
+
+                def on_progress(written: int) -> None:
+                    # Every 16 MB is enough to show the copy is moving.
+                    if written - last_report[0] >= 16 * 1024 * 1024:
+                        last_report[0] = written
+                        self.app.after(0, lambda: progress(written))
+
+                if store.materialize(repo_path, blob_id, on_progress, cancel) is None:
+                    blob_id = None
+            except Exception as exc:
+                self.app.after(0, lambda: failed(exc))
+                return
+            self.app.after(0, lambda: done(blob_id))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _hex_mode(self) -> bool:
+        return self.mode_var.get() == "Hex"
+
+    def _go_to(self, offset: int, snap: bool = True) -> None:
+        # ``snap`` moves a text offset back to its line start; the end of the
+        # page on screen already is one, or the cut inside a long line.
+        blob = self.blob
+        if blob is None:
+            return
+        offset = min(max(offset, 0), max(blob.size - 1, 0))
+        if self._hex_mode():
+            content, end = blob.hex_page(offset, HEX_PAGE_ROWS)
+            offset -= offset % HEX_ROW_BYTES
+        else:
+            if snap:
+                offset = blob.line_start(offset)
+            content, end = blob.text_page(offset, TEXT_PAGE_LINES)
+        self.offset = offset
+        self.page_end = end
+        self.app._set_text(self.text, content)
+        percent = 100 * end // blob.size if blob.size else 100
+        self.status_var.set(f"bytes {offset:,}-{end:,} de {blob.size:,} ({percent}%)")
+
+    def _go_to_entry(self) -> None:
+        if self.blob is None:
+            return
+        offset = parse_position(self.position_var.get(), self.blob.size)
+        if offset is not None:
+            self._go_to(offset)
+
+    def _next_page(self) -> None:
+        if self.blob is not None and self.page_end < self.blob.size:
+            self._go_to(self.page_end, snap=False)
+
+    def _previous_page(self) -> None:
+        blob = self.blob
+        if blob is None or self.offset == 0:
+            return
+        if self._hex_mode():
+            self._go_to(self.offset - HEX_PAGE_ROWS * HEX_ROW_BYTES)
+        else:
+            self._go_to(blob.previous_text_offset(self.offset, TEXT_PAGE_LINES), snap=False)
+
+    def _last_page(self) -> None:
+        blob = self.blob
+        if blob is None:
+            return
+        if self._hex_mode():
+            self._go_to(blob.size - HEX_PAGE_ROWS * HEX_ROW_BYTES)
+        else:
+            self._go_to(blob.previous_text_offset(blob.size, TEXT_PAGE_LINES), snap=False)
+
+    def _close(self) -> None:
+        self.cancel.set()
+        if self.blob is not None:
+            self.blob.close()
+            self.blob = None
+        self.destroy()
+
+
+class BlobViewerMixin:
+    def _open_blob_viewer(self, rev: str, path: str, object_id: str | None = None) -> None:
+        if not self.repo_ready:
+            messagebox.showinfo("Conteudo", "Selecione um repositório primeiro.")
+            return
+        BlobViewerWindow(self, rev, path, object_id)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import messagebox, ttk
+
+from ..core.branch_refs import BRANCH_SORTS, BranchRef, filter_branch_refs
+from .ui_virtual_list import VirtualListbox
+
+
+def format_branch_row(ref: BranchRef) -> str:
+    marker = "*" if ref.is_head else " "
+    date = time.strftime("%Y-%m-%d", time.localtime(ref.committer_time)) if ref.committer_time else ""
+    divergence = f"+{ref.ahead}/-{ref.behind}" if ref.ahead is not None else ""
+    upstream = ref.upstream
+    if ref.upstream_track:
+        upstream = f"{upstream} [{ref.upstream_track}]"
+    return f"{marker} {ref.name:<40.40} {date:<10} {ref.object_id[:10]}  {divergence:<14} {upstream}"
+
+
+class BranchListWindow(tk.Toplevel):
+    # Local and remote branches from the app's BranchRefCache; filtering and
+    # sorting never go back to git.
+    def __init__(self, app: tk.Tk) -> None:
+        super().__init__(app)
+        self.app = app
+        self.refs: list[BranchRef] = []
+        self.visible: list[BranchRef] = []
+        self.title("Branches")
+        self.geometry("1000x600")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        bar = ttk.Frame(self)
+        bar.grid(row=0, column=0, columnspan=2, sticky="ew", padx=8, pady=(8, 4))
+        bar.grid_columnconfigure(1, weight=1)
+        ttk.Label(bar, text="Filtro:").grid(row=0, column=0, padx=(0, 4))
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(bar, textvariable=self.filter_var)
+        filter_entry.grid(row=0, column=1, sticky="ew", padx=(0, 8))
+        self.filter_var.trace_add("write", lambda *_args: self._apply_filter())
+        ttk.Label(bar, text="Ordenar:").grid(row=0, column=2, padx=(0, 4))
+        self.sort_var = tk.StringVar(value=BRANCH_SORTS[0])
+        sort_combo = ttk.Combobox(bar, textvariable=self.sort_var, values=BRANCH_SORTS, state="readonly", width=8)
+        sort_combo.grid(row=0, column=3, padx=(0, 8))
+        sort_combo.bind("<<ComboboxSelected>>", lambda _e: self._apply_filter())
+        self.remotes_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(bar, text="Remotas", variable=self.remotes_var, command=self._apply_filter).grid(
+            row=0,
+            column=4,
+        )
+        self.status_var = tk.StringVar(value="Carregando...")
+        ttk.Label(bar, textvariable=self.status_var).grid(row=1, column=0, columnspan=5, sticky="w", pady=(4, 0))
+
+        scroll = ttk.Scrollbar(self, orient="vertical")
+        self.listbox = VirtualListbox(self, row_text=self._row_text, yscrollcommand=scroll.set)
+        self.listbox.font = tkfont.nametofont("TkFixedFont")
+        self.listbox.grid(row=1, column=0, sticky="nsew", padx=(8, 0), pady=(0, 8))
+        scroll.configure(command=self.listbox.yview)
+        scroll.grid(row=1, column=1, sticky="ns", padx=(0, 8), pady=(0, 8))
+        self.listbox.bind("<Double-Button-1>", lambda _e: self._compare_selected())
+        self.listbox.bind("<Return>", lambda _e: self._compare_selected())
+        palette = getattr(app, "theme_palette", None)
+        if palette and hasattr(app, "_apply_listbox_theme"):
+            app._apply_listbox_theme(self.listbox, palette)
+        filter_entry.focus_set()
+        self._load()
+
+    def _load(self) -> None:
+        repo_path = self.app.repo_path
+        cache = self.app.branch_ref_cache
+
+        def success(refs: list[BranchRef]) -> None:
+            if self.winfo_exists():
+                self.refs = refs
+                self._apply_filter()
+
+        def error(exc: Exception) -> None:
+            if self.winfo_exists():
+                self.status_var.set("")
+                messagebox.showerror("Branches", str(exc), parent=self)
+
+        self.app._run_async(
+            f"branch_list:{id(self)}",
+            "Listar branches",
+            lambda: cache.load(repo_path),
+            success,
+            error,
+        )
+
+    def _row_text(self, row: int) -> str:
+        return format_branch_row(self.visible[row]) if row < len(self.visible) else ""
+
+    def _apply_filter(self) -> None:
+        self.visible = filter_branch_refs(
+            self.refs,
+            self.filter_var.get(),
+            include_remotes=bool(self.remotes_var.get()),
+            sort=self.sort_var.get(),
+        )
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.set_size(len(self.visible))
+        self.listbox.yview("moveto", "0")
+        self.status_var.set(f"{len(self.visible)} de {len(self.refs)} branches")
+
+    def _compare_selected(self) -> None:
+        selection = self.listbox.curselection()
+        if not selection or selection[0] >= len(self.visible):
+            return
+        ref = self.visible[selection[0]]
+        if ref.is_head:
+            return
+        self.app.branch_origin_var.set(ref.name)
+        self.app._refresh_branch_comparison()
+
+
+class BranchListMixin:
+    def _open_branch_list(self) -> None:
+        if not self.repo_ready:
+            messagebox.showinfo("Branches", "Selecione um repositório primeiro.")
+            return
+        BranchListWindow(self)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ..core.branch_matrix import MatrixRow, compute_branch_matrix
+from ..core.git_client import GitCancelled
+
+MATRIX_COLUMNS = (
+    ("ahead", "Ahead", 80),
+    ("behind", "Behind", 80),
+    ("conflicts", "Conflitos", 90),
+    ("paths", "Arquivos em conflito", 420),
+)
+
+
+class BranchMatrixWindow(tk.Toplevel):
+    # Every local branch against one target: ahead/behind and predicted
+    # conflicts, filled in as the workers finish.
+    def __init__(self, app: tk.Tk, target: str) -> None:
+        super().__init__(app)
+        self.app = app
+        self.target = target
+        self.cancel = threading.Event()
+        self.rows: dict[str, MatrixRow] = {}
+        self.sort_column = "conflicts"
+        self.title(f"Matriz de branches - {target}")
+        self.geometry("900x560")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.status_var = tk.StringVar(value="Calculando...")
+        ttk.Label(self, textvariable=self.status_var).grid(
+            row=0,
+            column=0,
+            columnspan=2,
+            sticky="w",
+            padx=8,
+            pady=(8, 4),
+        )
+
+        self.tree = ttk.Treeview(self, columns=[name for name, _label, _width in MATRIX_COLUMNS], selectmode="browse")
+        self.tree.heading("#0", text="Branch", anchor="w", command=lambda: self._sort("branch"))
+        self.tree.column("#0", width=220)
+        for name, label, width in MATRIX_COLUMNS:
+            self.tree.heading(name, text=label, anchor="w", command=lambda name=name: self._sort(name))
+            self.tree.column(name, width=width, stretch=name == "paths")
+        self.tree.grid(row=1, column=0, sticky="nsew", padx=(8, 0), pady=(0, 8))
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        scroll.grid(row=1, column=1, sticky="ns", padx=(0, 8), pady=(0, 8))
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.tag_configure("conflict", foreground="#b42318")
+        self.tree.bind("<Double-Button-1>", lambda _e: self._compare_selected())
+        self.tree.bind("<Return>", lambda _e: self._compare_selected())
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._start()
+
+    def _start(self) -> None:
+        repo_path = self.app.repo_path
+        cache = self.app.branch_matrix_cache
+        predictor = self.app.conflict_predictor
+        cancel = self.cancel
+        start = self.app._perf_start("Matriz de branches")
+
+        def add(row: MatrixRow) -> None:
+            if cancel.is_set() or not self.winfo_exists():
+                return
+            self.rows[row.branch] = row
+            self._insert(row)
+            self.status_var.set(f"Calculando... {len(self.rows)} branches")
+
+        def done(total: int) -> None:
+            if cancel.is_set() or not self.winfo_exists():
+                return
+            conflicts = sum(1 for row in self.rows.values() if row.conflict_paths)
+            self.status_var.set(f"{self.target}: {total} branches, {conflicts} com conflito previsto.")
+            self._sort(self.sort_column)
+            self.app._perf_end("Matriz de branches", start)
+
+        def failed(exc: Exception) -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                self.status_var.set("")
+                messagebox.showerror("Matriz de branches", str(exc), parent=self)
+
+        def worker() -> None:
+            try:
+                total = compute_branch_matrix(
+                    repo_path,
+                    self.target,
+                    cache,
+                    predictor,
+                    lambda row: self.app.after(0, lambda: add(row)),
+                    cancel,
+                )
+            except GitCancelled:
+                return
+            except Exception as exc:
+                self.app.after(0, lambda: failed(exc))
+                return
+            self.app.after(0, lambda: done(total))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _insert(self, row: MatrixRow) -> None:
+        paths = ", ".join(row.conflict_paths[:10])
+        if len(row.conflict_paths) > 10:
+            paths = f"{paths}, ..."
+        self.tree.insert(
+            "",
+            "end",
+            iid=row.branch,
+            text=row.branch,
+            values=(row.ahead, row.behind, len(row.conflict_paths) or "", paths),
+            tags=("conflict",) if row.conflict_paths else (),
+        )
+
+    def _sort(self, column: str) -> None:
+        # Conflicts first by default, then whatever is furthest ahead.
+        self.sort_column = column
+        keys = {
+            "branch": lambda row: row.branch,
+            "ahead": lambda row: (-row.ahead, row.branch),
+            "behind": lambda row: (-row.behind, row.branch),
+        }
+        key = keys.get(column, lambda row: (-len(row.conflict_paths), -row.ahead, row.branch))
+        for index, row in enumerate(sorted(self.rows.values(), key=key)):
+            self.tree.move(row.branch, "", index)
+
+    def _compare_selected(self) -> None:
+        branch = self.tree.focus()
+        if branch not in self.rows:
+            return
+        self.app.branch_origin_var.set(branch)
+        self.app.branch_dest_var.set(self.target)
+        self.app._refresh_branch_comparison()
+
+    def _close(self) -> None:
+        self.cancel.set()
+        self.destroy()
+
+
+class BranchMatrixMixin:
+    def _open_branch_matrix(self) -> None:
+        target = self.branch_dest_var.get().strip()
+        if not self.repo_ready or not target:
+            messagebox.showinfo("Matriz de branches", "Selecione a branch de destino.")
+            return
+        BranchMatrixWindow(self, target)
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from ..core.diff_utils import render_patch_to_widget
-from ..core.git_client import run_git
+from ..core.branch_compare import CompareResult, compare_branches
+from ..core.git_client import GitCancelled, run_git
 
 
 class BranchesTabMixin:
@@ -51,6 +52,18 @@ class BranchesTabMixin:
             column=4,
             sticky="e",
         )
+        ttk.Button(selection_frame, text="Todas contra destino", command=self._open_branch_matrix).grid(
+            row=0,
+            column=5,
+            sticky="e",
+            padx=(6, 0),
+        )
+        ttk.Button(selection_frame, text="Lista de branches", command=self._open_branch_list).grid(
+            row=0,
+            column=6,
+            sticky="e",
+            padx=(6, 0),
+        )
 
         action_frame = ttk.Frame(self.branches_tab)
         action_frame.grid(row=1, column=0, sticky="ew", padx=8)
@@ -124,9 +137,15 @@ class BranchesTabMixin:
             variable=self.read_mode_var,
             command=self._toggle_read_mode,
         ).grid(row=0, column=2, sticky="e", padx=(8, 0))
+        ttk.Checkbutton(
+            files_header,
+            text="Lado a lado",
+            variable=self.side_by_side_var,
+            command=self._toggle_side_by_side,
+        ).grid(row=0, column=3, sticky="e", padx=(8, 0))
         self.compare_read_mode_var = tk.StringVar(value="")
         ttk.Label(files_header, textvariable=self.compare_read_mode_var).grid(
-            row=0, column=3, sticky="e", padx=(8, 0)
+            row=0, column=4, sticky="e", padx=(8, 0)
         )
 
         self.compare_files_listbox = tk.Listbox(diff_frame, height=8, activestyle="dotbox")
@@ -144,6 +163,7 @@ class BranchesTabMixin:
         self.compare_diff_text.configure(yscrollcommand=diff_scroll.set)
         self.compare_diff_text.configure(font="TkFixedFont")
         self.compare_diff_text.configure(state="disabled")
+        self._attach_side_by_side(self.compare_diff_text, diff_scroll)
         palette = getattr(self, "theme_palette", None)
         if palette and hasattr(self, "_apply_text_widget_theme"):
             self._apply_text_widget_theme(self.compare_diff_text, palette)
@@ -153,6 +173,9 @@ class BranchesTabMixin:
         paned.add(diff_frame, weight=2)
 
         self.compare_file_stats_by_index: dict[int, dict[str, object]] = {}
+        self.compare_result: CompareResult | None = None
+        self.compare_cancel: threading.Event | None = None
+        self.compare_epoch = 0
 
     def _update_branch_action_branches(self) -> None:
         if not hasattr(self, "compare_origin_combo"):
@@ -184,29 +207,82 @@ class BranchesTabMixin:
     def _refresh_branch_comparison(self) -> None:
         if not hasattr(self, "compare_commits_listbox"):
             return
-        start = self._perf_start("Comparar branches")
+        self._cancel_branch_comparison()
         if not self.repo_ready:
             self._clear_branch_comparison("Selecione um repositório.")
-            self._perf_end("Comparar branches", start)
             return
         origin = self.branch_origin_var.get().strip()
         dest = self.branch_dest_var.get().strip()
         if not origin or not dest:
             self._clear_branch_comparison("Selecione origem e destino.")
-            self._perf_end("Comparar branches", start)
             return
         if origin == dest:
             self._clear_branch_comparison("Origem e destino devem ser diferentes.")
-            self._perf_end("Comparar branches", start)
             return
 
-        commits = self._load_compare_commits(origin, dest)
-        stats, totals = self._load_compare_file_stats(origin, dest)
-        self._render_compare_commits(commits)
-        self._render_compare_files(stats)
-        self._update_compare_status(origin, dest, commits, totals)
+        # Commits, files and the merge preview arrive in that order from one
+        # worker; a new selection cancels it and bumps the epoch.
+        self._clear_branch_comparison(f"{origin} → {dest} | Comparando...")
+        self.compare_commits_listbox.insert(tk.END, "(carregando...)")
         self._update_operation_preview()
-        self._perf_end("Comparar branches", start)
+        epoch = self.compare_epoch
+        cancel = threading.Event()
+        self.compare_cancel = cancel
+        repo_path = self.repo_path
+        cache = self.compare_cache
+        predictor = self.conflict_predictor
+        start = self._perf_start("Comparar branches")
+
+        def show(result: CompareResult, stage: str) -> None:
+            if epoch != self.compare_epoch:
+                return
+            if stage == "commits":
+                self._render_compare_commits(result.commits or [])
+                self.compare_status_var.set(
+                    f"{origin} → {dest} | Commits: {len(result.commits or [])} | Calculando arquivos..."
+                )
+            elif stage == "files":
+                self._render_compare_files(result.stats or [])
+                self._update_compare_status(origin, dest, result.commits or [], result.totals or {})
+            else:
+                self.compare_result = result
+                self.compare_cancel = None
+                self._mark_compare_conflicts(result.conflict_paths or [])
+                self._update_operation_preview()
+                self._perf_end("Comparar branches", start)
+
+        def failed(exc: Exception) -> None:
+            if epoch != self.compare_epoch:
+                return
+            self.compare_cancel = None
+            self._clear_branch_comparison("Falha ao comparar.")
+            self._update_operation_preview()
+            messagebox.showerror("Comparar", str(exc))
+
+        def worker() -> None:
+            try:
+                compare_branches(
+                    repo_path,
+                    origin,
+                    dest,
+                    cache,
+                    predictor,
+                    lambda result, stage: self.after(0, lambda: show(result, stage)),
+                    cancel,
+                )
+            except GitCancelled:
+                return
+            except Exception as exc:
+                self.after(0, lambda: failed(exc))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _cancel_branch_comparison(self) -> None:
+        self.compare_epoch += 1
+        self.compare_result = None
+        if self.compare_cancel is not None:
+            self.compare_cancel.set()
+            self.compare_cancel = None
 
     def _clear_branch_comparison(self, message: str) -> None:
         if hasattr(self, "compare_commits_listbox"):
@@ -214,56 +290,15 @@ class BranchesTabMixin:
         if hasattr(self, "compare_files_listbox"):
             self.compare_files_listbox.delete(0, tk.END)
         if hasattr(self, "compare_diff_text"):
-            self._set_text(self.compare_diff_text, "")
+            self._show_diff_message(self.compare_diff_text, "")
         if hasattr(self, "compare_status_var"):
             self.compare_status_var.set(message)
         self.compare_file_stats_by_index.clear()
 
-    def _load_compare_commits(self, origin: str, dest: str) -> list[str]:
-        try:
-            output = run_git(self.repo_path, ["log", "--oneline", f"{dest}..{origin}"])
-        except RuntimeError as exc:
-            messagebox.showerror("Comparar", str(exc))
-            return []
-        return [line.strip() for line in output.splitlines() if line.strip()]
-
-    def _load_compare_file_stats(self, origin: str, dest: str) -> tuple[list[dict[str, object]], dict[str, int]]:
-        try:
-            output = run_git(self.repo_path, ["diff", "--numstat", f"{dest}...{origin}"])
-        except RuntimeError as exc:
-            messagebox.showerror("Comparar", str(exc))
-            return [], {"files": 0, "added": 0, "deleted": 0, "binary": 0}
-        stats: list[dict[str, object]] = []
-        totals = {"files": 0, "added": 0, "deleted": 0, "binary": 0}
-        for raw in output.splitlines():
-            if not raw.strip():
-                continue
-            parts = raw.split("\t", 2)
-            if len(parts) < 3:
-                continue
-            added_raw, deleted_raw, path = parts
-            is_binary = added_raw == "-" or deleted_raw == "-"
-            added = 0 if is_binary else int(added_raw)
-            deleted = 0 if is_binary else int(deleted_raw)
-            stats.append(
-                {
-                    "path": path,
-                    "added": added,
-                    "deleted": deleted,
-                    "binary": is_binary,
-                }
-            )
-            totals["files"] += 1
-            totals["added"] += added
-            totals["deleted"] += deleted
-            if is_binary:
-                totals["binary"] += 1
-        return stats, totals
-
     def _render_compare_commits(self, commits: list[str]) -> None:
         self.compare_commits_listbox.delete(0, tk.END)
-        for line in commits:
-            self.compare_commits_listbox.insert(tk.END, line)
+        if commits:
+            self.compare_commits_listbox.insert(tk.END, *commits)
 
     def _render_compare_files(self, stats: list[dict[str, object]]) -> None:
         self.compare_files_listbox.delete(0, tk.END)
@@ -280,7 +315,13 @@ class BranchesTabMixin:
             self.compare_files_listbox.selection_set(0)
             self._show_compare_diff_for_index(0)
         else:
-            self._set_text(self.compare_diff_text, "(nenhuma diferença)")
+            self._show_diff_message(self.compare_diff_text, "(nenhuma diferença)")
+
+    def _mark_compare_conflicts(self, paths: list[str]) -> None:
+        conflicted = set(paths)
+        for idx, entry in self.compare_file_stats_by_index.items():
+            if str(entry["path"]) in conflicted:
+                self.compare_files_listbox.itemconfigure(idx, foreground="#b42318")
 
     def _update_compare_status(
         self,
@@ -324,51 +365,64 @@ class BranchesTabMixin:
         if not entry:
             return
         if entry.get("binary"):
-            self._set_text(self.compare_diff_text, "Arquivo binário: sem diff disponível.")
+            self._show_diff_message(self.compare_diff_text, "Arquivo binário: sem diff disponível.")
             if hasattr(self, "compare_read_mode_var"):
                 self.compare_read_mode_var.set("")
             return
         origin = self.branch_origin_var.get().strip()
         dest = self.branch_dest_var.get().strip()
         if not origin or not dest:
-            self._set_text(self.compare_diff_text, "Selecione origem e destino.")
+            self._show_diff_message(self.compare_diff_text, "Selecione origem e destino.")
             if hasattr(self, "compare_read_mode_var"):
                 self.compare_read_mode_var.set("")
             return
         path = str(entry.get("path", "")).strip()
         if not path:
             return
+        word_diff = self._patch_word_diff()
         args = ["diff", "--unified=0"]
-        if self._word_diff_enabled():
+        if word_diff:
             args.append("--word-diff=plain")
         args.append(f"{dest}...{origin}")
         args.extend(["--", path])
         cache = getattr(self, "compare_diff_cache", None)
         token = getattr(self, "repo_state_token", 0)
-        cache_key = (token, origin, dest, path, self._word_diff_enabled())
+        cache_key = (token, origin, dest, path, word_diff)
         if cache is not None and cache_key in cache:
-            diff_output = cache[cache_key]
-        else:
-            try:
-                diff_output = run_git(self.repo_path, args)
-            except RuntimeError as exc:
-                messagebox.showerror("Comparar", str(exc))
-                return
-            if cache is not None:
+            self.diff_service.cancel("compare_diff")
+            self._render_diff_view(
+                self.compare_diff_text,
+                cache[cache_key],
+                getattr(self, "compare_read_mode_var", None),
+                highlight=(("compare", self.repo_path, *cache_key), path),
+            )
+            return
+        self._show_diff_message(self.compare_diff_text, "Carregando diff...")
+        if hasattr(self, "compare_read_mode_var"):
+            self.compare_read_mode_var.set("")
+        repo_path = self.repo_path
+
+        def done(diff_output: object) -> None:
+            if cache is not None and token == getattr(self, "repo_state_token", 0):
                 cache[cache_key] = diff_output
-        display_diff, truncated, shown, total = self._apply_read_mode_to_diff(diff_output)
-        render_patch_to_widget(
-            self.compare_diff_text,
-            display_diff,
-            read_only=True,
-            show_file_headers=False,
-            word_diff=self._word_diff_enabled(),
+            self._render_diff_view(
+                self.compare_diff_text,
+                str(diff_output),
+                getattr(self, "compare_read_mode_var", None),
+                highlight=(("compare", repo_path, *cache_key), path),
+            )
+
+        def error(exc: Exception) -> None:
+            self._show_diff_message(self.compare_diff_text, "Falha ao carregar diff.")
+            messagebox.showerror("Comparar", str(exc))
+
+        self.diff_service.request(
+            "compare_diff",
+            ("compare", repo_path, *cache_key),
+            lambda: run_git(repo_path, args),
+            done,
+            error,
         )
-        if hasattr(self, "compare_read_mode_var"):
-            if truncated:
-                self.compare_read_mode_var.set(f"Modo leitura: {shown}/{total} linhas")
-            else:
-                self.compare_read_mode_var.set("")
 
     def _refresh_compare_diff(self) -> None:
         if not hasattr(self, "compare_files_listbox"):
@@ -379,6 +433,8 @@ class BranchesTabMixin:
         self._show_compare_diff_for_index(selection[0])
 
     def _update_operation_preview(self) -> None:
+        # Only reads the last comparison and status snapshot; it runs after
+        # every status refresh, so it must not call git.
         if not hasattr(self, "branch_action_status"):
             return
         if not self.repo_ready:
@@ -395,14 +451,20 @@ class BranchesTabMixin:
             self.branch_action_status.configure(text="Origem e destino devem ser diferentes.")
             self.branch_action_button.configure(state="disabled")
             return
-        if self._is_dirty():
+        if getattr(self, "status_items", None):
             self.branch_action_status.configure(text="Working tree sujo. Veja a aba Commit.")
             self.branch_action_button.configure(state="disabled")
             return
-        behind, ahead = self._get_ahead_behind_between(origin, dest)
-        conflict = self._has_potential_conflict(origin, dest)
-        conflict_label = "Conflito: sim" if conflict else "Conflito: não"
-        status_text = f"{origin} → {dest} | Ahead: {ahead} | Behind: {behind} | {conflict_label}"
+        result = getattr(self, "compare_result", None)
+        if result is None or (result.origin, result.dest) != (origin, dest):
+            self.branch_action_status.configure(text=f"{origin} → {dest} | Calculando...")
+            self.branch_action_button.configure(state="disabled")
+            return
+        if result.conflict:
+            conflict_label = f"Conflito: sim ({len(result.conflict_paths or [])} arquivo(s))"
+        else:
+            conflict_label = "Conflito: não"
+        status_text = f"{origin} → {dest} | Ahead: {result.ahead} | Behind: {result.behind} | {conflict_label}"
         self.branch_action_status.configure(text=status_text)
         action = self.branch_action_var.get()
         if action == "Squash merge" and not self.branch_message_var.get().strip():
@@ -410,26 +472,6 @@ class BranchesTabMixin:
         else:
             self.branch_action_button.configure(state="normal")
 
-    def _get_ahead_behind_between(self, origin: str, dest: str) -> tuple[int, int]:
-        try:
-            output = run_git(self.repo_path, ["rev-list", "--left-right", "--count", f"{origin}...{dest}"])
-        except RuntimeError:
-            return 0, 0
-        parts = output.strip().split()
-        if len(parts) != 2:
-            return 0, 0
-        behind = int(parts[0])
-        ahead = int(parts[1])
-        return behind, ahead
-
-    def _has_potential_conflict(self, origin: str, dest: str) -> bool:
-        try:
-            base = run_git(self.repo_path, ["merge-base", dest, origin]).strip()
-            output = run_git(self.repo_path, ["merge-tree", base, dest, origin])
-        except RuntimeError:
-            return False
-        return "<<<<<<<" in output
-
     def _run_branch_action(self) -> None:
         if not self.repo_ready:
             return
@@ -475,10 +517,26 @@ class BranchesTabMixin:
         self._refresh_branch_comparison()
 
     def _confirm_branch_action(self, origin: str, dest: str, action: str) -> bool:
-        commits = self._load_compare_commits(origin, dest)
-        stats, totals = self._load_compare_file_stats(origin, dest)
-        behind, ahead = self._get_ahead_behind_between(origin, dest)
-        conflict = self._has_potential_conflict(origin, dest)
+        result = self.compare_result
+        if result is None or (result.origin, result.dest) != (origin, dest):
+            # The button is only enabled once the comparison finished, so
+            # this is just a safety net; the cache usually answers it.
+            try:
+                result = compare_branches(
+                    self.repo_path,
+                    origin,
+                    dest,
+                    self.compare_cache,
+                    self.conflict_predictor,
+                    lambda _r, _s: None,
+                )
+            except RuntimeError as exc:
+                messagebox.showerror("Comparar", str(exc))
+                return False
+        commits = result.commits or []
+        totals = result.totals or {"files": 0, "added": 0, "deleted": 0, "binary": 0}
+        behind, ahead = result.behind, result.ahead
+        conflict_paths = result.conflict_paths or []
 
         dialog = tk.Toplevel(self)
         dialog.title("Confirmar ação")
@@ -507,8 +565,11 @@ class BranchesTabMixin:
         warnings: list[str] = []
         if behind == 0 and not commits:
             warnings.append("Nenhuma mudança da origem para aplicar.")
-        if conflict:
-            warnings.append("Conflito potencial detectado.")
+        if conflict_paths:
+            listed = ", ".join(conflict_paths[:5])
+            if len(conflict_paths) > 5:
+                listed = f"{listed} e mais {len(conflict_paths) - 5}"
+            warnings.append(f"Conflito potencial em: {listed}.")
         if action == "Rebase" and ahead > 0:
             warnings.append(f"Rebase vai reescrever {ahead} commit(s) locais.")
         if action == "Merge" and ahead > 0:
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ..core.code_search import GrepGroup, GrepQuery, GrepResults, resolve_search_rev, run_code_search
+from .ui_virtual_list import VirtualListbox
+
+WORKTREE_LABEL = "(arquivos locais)"
+
+
+class CodeSearchTabMixin:
+    def _build_search_tab(self) -> None:
+        self.search_tab.grid_columnconfigure(0, weight=1)
+        self.search_tab.grid_rowconfigure(1, weight=1)
+
+        bar = ttk.Frame(self.search_tab)
+        bar.grid(row=0, column=0, sticky="ew", pady=(0, 6))
+        bar.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(bar, text="Buscar:").grid(row=0, column=0, sticky="w", padx=(0, 4))
+        self.code_search_var = tk.StringVar()
+        search_entry = ttk.Entry(bar, textvariable=self.code_search_var)
+        search_entry.grid(row=0, column=1, sticky="ew", padx=(0, 8))
+        search_entry.bind("<Return>", lambda _e: self._start_code_search())
+
+        ttk.Label(bar, text="Revisao:").grid(row=0, column=2, sticky="w", padx=(0, 4))
+        self.code_search_rev_var = tk.StringVar(value=WORKTREE_LABEL)
+        self.code_search_rev_combo = ttk.Combobox(
+            bar,
+            textvariable=self.code_search_rev_var,
+            width=22,
+            postcommand=self._update_code_search_revs,
+        )
+        self.code_search_rev_combo.grid(row=0, column=3, sticky="w", padx=(0, 8))
+
+        self.code_search_regex_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Regex", variable=self.code_search_regex_var).grid(row=0, column=4, padx=(0, 6))
+        self.code_search_case_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Ignorar maiusculas", variable=self.code_search_case_var).grid(
+            row=0,
+            column=5,
+            padx=(0, 6),
+        )
+        self.code_search_parallel_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bar, text="Paralelo", variable=self.code_search_parallel_var).grid(
+            row=0,
+            column=6,
+            padx=(0, 8),
+        )
+        ttk.Button(bar, text="Buscar", command=self._start_code_search).grid(row=0, column=7, padx=(0, 6))
+        self.code_search_cancel_button = ttk.Button(bar, text="Cancelar", command=self._cancel_code_search)
+        self.code_search_cancel_button.grid(row=0, column=8)
+        self.code_search_cancel_button.grid_remove()
+
+        self.code_search_status_var = tk.StringVar(value="")
+        ttk.Label(bar, textvariable=self.code_search_status_var).grid(
+            row=1,
+            column=0,
+            columnspan=9,
+            sticky="w",
+            pady=(4, 0),
+        )
+
+        results_frame = ttk.Frame(self.search_tab)
+        results_frame.grid(row=1, column=0, sticky="nsew")
+        results_frame.grid_rowconfigure(0, weight=1)
+        results_frame.grid_columnconfigure(0, weight=1)
+        results_scroll = ttk.Scrollbar(results_frame, orient="vertical")
+        self.code_search_listbox = VirtualListbox(
+            results_frame,
+            row_text=self._code_search_row_text,
+            yscrollcommand=results_scroll.set,
+        )
+        self.code_search_listbox.grid(row=0, column=0, sticky="nsew")
+        results_scroll.configure(command=self.code_search_listbox.yview)
+        results_scroll.grid(row=0, column=1, sticky="ns")
+        self.code_search_listbox.bind("<Double-Button-1>", lambda _e: self._open_code_search_hit())
+        self.code_search_listbox.bind("<Return>", lambda _e: self._open_code_search_hit())
+
+        self.code_search_results = GrepResults()
+        self.code_search_cancel: threading.Event | None = None
+        self.code_search_epoch = 0
+
+    def _update_code_search_revs(self) -> None:
+        self.code_search_rev_combo.configure(values=[WORKTREE_LABEL, "HEAD", *getattr(self, "branch_list", [])])
+
+    def _code_search_row_text(self, row: int) -> str:
+        results = self.code_search_results
+        return results.row_text(row) if row < len(results) else ""
+
+    def _start_code_search(self) -> None:
+        if not self.repo_ready:
+            messagebox.showinfo("Busca", "Selecione um repositório primeiro.")
+            return
+        pattern = self.code_search_var.get()
+        if not pattern.strip():
+            return
+        self._cancel_code_search()
+        self.code_search_epoch += 1
+        epoch = self.code_search_epoch
+        cancel = threading.Event()
+        self.code_search_cancel = cancel
+        results = GrepResults()
+        self.code_search_results = results
+        self.code_search_listbox.selection_clear(0, tk.END)
+        self.code_search_listbox.set_size(0)
+        self.code_search_listbox.set_message("(buscando...)")
+        self.code_search_cancel_button.grid()
+        self.code_search_status_var.set("Buscando...")
+        rev_label = self.code_search_rev_var.get().strip()
+        rev = "" if rev_label in ("", WORKTREE_LABEL) else rev_label
+        regex = bool(self.code_search_regex_var.get())
+        ignore_case = bool(self.code_search_case_var.get())
+        parallel = bool(self.code_search_parallel_var.get())
+        repo_path = self.repo_path
+        start = self._perf_start("Busca no codigo")
+
+        def show(groups: list[GrepGroup]) -> None:
+            if epoch != self.code_search_epoch:
+                return
+            results.add(groups)
+            self.code_search_listbox.set_message("")
+            self.code_search_listbox.set_size(len(results))
+            self.code_search_status_var.set(
+                f"Buscando... {results.hit_count} ocorrencias em {len(results.files)} arquivos."
+            )
+
+        def finish(error: Exception | None) -> None:
+            if epoch != self.code_search_epoch:
+                return
+            self.code_search_cancel = None
+            self.code_search_cancel_button.grid_remove()
+            if error is not None:
+                self.code_search_listbox.set_message("")
+                self.code_search_status_var.set("")
+                messagebox.showerror("Busca", str(error))
+                return
+            suffix = " (cancelada)" if cancel.is_set() else ""
+            self.code_search_listbox.set_message("" if len(results) else "(nenhuma ocorrencia)")
+            self.code_search_status_var.set(
+                f"{results.hit_count} ocorrencias em {len(results.files)} arquivos{suffix}."
+            )
+            self._perf_end("Busca no codigo", start)
+
+        def worker() -> None:
+            try:
+                query = GrepQuery(
+                    pattern=pattern,
+                    rev=resolve_search_rev(repo_path, rev),
+                    regex=regex,
+                    ignore_case=ignore_case,
+                )
+                run_code_search(
+                    repo_path,
+                    query,
+                    lambda groups: self.after(0, lambda: show(groups)),
+                    cancel,
+                    parallel=parallel,
+                )
+            except Exception as exc:
+                self.after(0, lambda: finish(exc))
+                return
+            self.after(0, lambda: finish(None))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _cancel_code_search(self) -> None:
+        cancel = getattr(self, "code_search_cancel", None)
+        if cancel is not None:
+            cancel.set()
+
+    def _reset_code_search(self) -> None:
+        if not hasattr(self, "code_search_listbox"):
+            return
+        self._cancel_code_search()
+        self.code_search_epoch += 1
+        self.code_search_cancel = None
+        self.code_search_cancel_button.grid_remove()
+        self.code_search_results = GrepResults()
+        self.code_search_listbox.set_message("")
+        self.code_search_listbox.set_size(0)
+        self.code_search_status_var.set("")
+
+    def _open_code_search_hit(self) -> None:
+        selection = self.code_search_listbox.curselection()
+        if not selection or selection[0] >= len(self.code_search_results):
+            return
+        path, line = self.code_search_results.location(selection[0])
+        self._open_repo_file_in_vscode(path, line)
@@ -6,7 +6,7 @@ import subprocess
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from ..core.diff_utils import build_line_map, build_patch_for_hunk, build_patch_for_line, parse_diff_data, render_patch_to_widget
+from ..core.diff_utils import build_line_map, build_patch_for_hunk, build_patch_for_lines, parse_diff_data, render_patch_to_widget
 from ..core.git_client import run_git
 from ..core.models import DiffData, DiffLineInfo
 
@@ -54,6 +54,8 @@ class CommitTabMixin:
         self.status_listbox.configure(yscrollcommand=status_scroll.set)
         self.status_listbox.bind("<<ListboxSelect>>", self._on_status_select)
         self.status_listbox.bind("<Double-Button-1>", self._open_status_file_in_vscode)
+        # Right click leaves the selection alone; selecting would stage the file.
+        self.status_listbox.bind("<Button-3>", self._blame_status_file)
 
         commit_frame = ttk.Frame(left_column)
         commit_frame.grid(row=1, column=0, sticky="nsew", pady=(6, 0))
@@ -125,13 +127,13 @@ class CommitTabMixin:
             column=1,
             padx=(0, 6),
         )
-        self.stage_line_button = ttk.Button(hunk_actions, text="Stage linha", command=self._stage_selected_line)
+        self.stage_line_button = ttk.Button(hunk_actions, text="Stage linhas", command=self._stage_selected_line)
         self.stage_line_button.grid(
             row=0,
             column=2,
             padx=(0, 6),
         )
-        self.unstage_line_button = ttk.Button(hunk_actions, text="Unstage linha", command=self._unstage_selected_line)
+        self.unstage_line_button = ttk.Button(hunk_actions, text="Unstage linhas", command=self._unstage_selected_line)
         self.unstage_line_button.grid(
             row=0,
             column=3,
@@ -167,6 +169,7 @@ class CommitTabMixin:
         self._run_async("status", "Atualizar status", task, success, error)
 
     def _render_status_entries(self, entries: list[dict[str, str | bool]]) -> None:
+        self.status_entries = entries
         self.status_listbox.delete(0, tk.END)
         self.status_items.clear()
         self.status_headers = set()
@@ -288,6 +291,16 @@ class CommitTabMixin:
             return
         self._open_repo_file_in_vscode(path)
 
+    def _blame_status_file(self, event: tk.Event) -> None:
+        if self.status_listbox.size() == 0:
+            return
+        entry = self.status_items.get(self.status_listbox.nearest(event.y))
+        if not entry:
+            return
+        path = str(entry.get("path_for_git") or entry.get("path") or "").strip()
+        if path:
+            self._open_blame_window(None, path)
+
     def _apply_stage_from_selection(self) -> None:
         self.stage_sync_job = None
         selected = set(self.status_listbox.curselection())
@@ -350,7 +363,7 @@ class CommitTabMixin:
         self.worktree_diff_data = parse_diff_data(diff_raw)
         self.worktree_diff_scope = scope
         self.worktree_line_map.clear()
-        self._render_worktree_diff(diff_view, self._word_diff_enabled())
+        self._render_worktree_diff(diff_view, self._word_diff_enabled(), path)
         self._update_worktree_diff_actions()
 
     def _resolve_diff_scope(self, status: str) -> str:
@@ -399,7 +412,7 @@ class CommitTabMixin:
             cache[cache_key] = diff
         return diff
 
-    def _render_worktree_diff(self, diff_text: str, word_diff: bool) -> None:
+    def _render_worktree_diff(self, diff_text: str, word_diff: bool, path: str) -> None:
         render_patch_to_widget(
             self.worktree_diff_text,
             diff_text,
@@ -407,6 +420,10 @@ class CommitTabMixin:
             show_file_headers=False,
             word_diff=word_diff,
         )
+        if hasattr(self, "_highlight_diff"):
+            token = getattr(self, "repo_state_token", 0)
+            source = (("worktree", self.repo_path, token, self.worktree_diff_scope, path), path)
+            self._highlight_diff(self.worktree_diff_text, source)
         if word_diff or not self.worktree_diff_data:
             self.worktree_line_map.clear()
             return
@@ -425,6 +442,30 @@ class CommitTabMixin:
             return None
         return self.worktree_line_map.get(line_no)
 
+    def _get_selected_diff_lines(self) -> list[DiffLineInfo]:
+        if not self.worktree_line_map:
+            return []
+        widget = self.worktree_diff_text
+        if widget.tag_ranges(tk.SEL):
+            first = widget.index(tk.SEL_FIRST)
+            last = widget.index(tk.SEL_LAST)
+        else:
+            first = last = widget.index(tk.INSERT)
+        try:
+            first_line = int(first.split(".")[0])
+            last_line, last_col = (int(part) for part in last.split("."))
+        except ValueError:
+            return []
+        # A selection ending at column 0 does not include that line.
+        if last_line > first_line and last_col == 0:
+            last_line -= 1
+        lines: list[DiffLineInfo] = []
+        for line_no in range(first_line, last_line + 1):
+            info = self.worktree_line_map.get(line_no)
+            if info and info.line_type in ("added", "removed"):
+                lines.append(info)
+        return lines
+
     def _apply_patch(self, patch: str, reverse: bool) -> None:
         cmd = ["git", "-C", self.repo_path, "apply", "--recount", "--unidiff-zero", "--cached"]
         if reverse:
@@ -485,21 +526,23 @@ class CommitTabMixin:
         if not self.repo_ready or self.worktree_diff_scope != "unstaged":
             messagebox.showinfo("Stage", "Selecione um diff unstaged.")
             return
-        line_info = self._get_selected_diff_line()
-        if not line_info:
-            messagebox.showinfo("Stage", "Selecione uma linha do diff.")
-            return
         if not self.worktree_diff_data:
             return
-        patch = build_patch_for_line(self.worktree_diff_data, line_info)
+        line_infos = self._get_selected_diff_lines()
+        if not line_infos:
+            messagebox.showinfo("Stage", "Selecione linhas alteradas do diff.")
+            return
+        patch = build_patch_for_lines(self.worktree_diff_data, line_infos)
         if not patch:
-            messagebox.showinfo("Stage", "A linha selecionada nao e uma alteracao.")
+            messagebox.showinfo("Stage", "A selecao nao contem alteracoes.")
             return
         try:
             self._apply_patch(patch, reverse=False)
         except RuntimeError as exc:
             messagebox.showerror("Stage", str(exc))
             return
+        if hasattr(self, "_bump_repo_state"):
+            self._bump_repo_state()
         self._refresh_status()
         self._update_worktree_diff_from_selection()
 
@@ -507,21 +550,23 @@ class CommitTabMixin:
         if not self.repo_ready or self.worktree_diff_scope != "staged":
             messagebox.showinfo("Unstage", "Selecione um diff staged.")
             return
-        line_info = self._get_selected_diff_line()
-        if not line_info:
-            messagebox.showinfo("Unstage", "Selecione uma linha do diff.")
-            return
         if not self.worktree_diff_data:
             return
-        patch = build_patch_for_line(self.worktree_diff_data, line_info)
+        line_infos = self._get_selected_diff_lines()
+        if not line_infos:
+            messagebox.showinfo("Unstage", "Selecione linhas alteradas do diff.")
+            return
+        patch = build_patch_for_lines(self.worktree_diff_data, line_infos, reverse=True)
         if not patch:
-            messagebox.showinfo("Unstage", "A linha selecionada nao e uma alteracao.")
+            messagebox.showinfo("Unstage", "A selecao nao contem alteracoes.")
             return
         try:
             self._apply_patch(patch, reverse=True)
         except RuntimeError as exc:
             messagebox.showerror("Unstage", str(exc))
             return
+        if hasattr(self, "_bump_repo_state"):
+            self._bump_repo_state()
         self._refresh_status()
         self._update_worktree_diff_from_selection()
 
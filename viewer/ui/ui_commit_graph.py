@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tkinter as tk
+
+from ..core.commit_graph import CommitGraph
+
+LANE_WIDTH = 12
+GRAPH_MAX_LANES = 24
+NODE_RADIUS = 3
+LANE_COLORS = (
+    "#2f81f7",
+    "#1a7f37",
+    "#d1242f",
+    "#8250df",
+    "#bf8700",
+    "#0e8a9e",
+    "#d15704",
+    "#bf3989",
+)
+
+
+class CommitGraphCanvas(tk.Canvas):
+    # Graph column drawn beside the virtual commit list: it repaints only the
+    # rows the list reports as visible, using the same row height and top.
+    def __init__(self, master: tk.Misc) -> None:
+        super().__init__(master, width=LANE_WIDTH + 4, highlightthickness=0, borderwidth=0)
+        self.node_outline = "#1f2328"
+
+    def configure_colors(self, background: str, foreground: str) -> None:
+        self.configure(background=background)
+        self.node_outline = foreground
+
+    def draw(self, graph: CommitGraph | None, rows: range, row_height: int) -> None:
+        self.delete("all")
+        if graph is None or not len(graph):
+            return
+        lanes = max(min(graph.width, GRAPH_MAX_LANES), 1)
+        width = lanes * LANE_WIDTH + 4
+        if int(self.cget("width")) != width:
+            self.configure(width=width)
+        top = rows.start
+        bottom = min(rows.stop, len(graph))
+        if top >= bottom:
+            return
+
+        def x(lane: int) -> int:
+            return 2 + lane * LANE_WIDTH + LANE_WIDTH // 2
+
+        def y(row: int) -> int:
+            return (row - top) * row_height + row_height // 2
+
+        for track in graph.tracks_between(top, bottom):
+            points = graph.track_points(track)
+            if min(lane for _row, lane in points) >= lanes:
+                continue
+            coords = [value for row, lane in points for value in (x(lane), y(row))]
+            color = LANE_COLORS[graph.track_lane(track) % len(LANE_COLORS)]
+            self.create_line(*coords, fill=color, width=2)
+        for row in range(top, bottom):
+            lane = graph.node_lane(row)
+            if lane >= lanes:
+                continue
+            center_x, center_y = x(lane), y(row)
+            self.create_oval(
+                center_x - NODE_RADIUS,
+                center_y - NODE_RADIUS,
+                center_x + NODE_RADIUS,
+                center_y + NODE_RADIUS,
+                fill=LANE_COLORS[lane % len(LANE_COLORS)],
+                outline=self.node_outline,
+            )
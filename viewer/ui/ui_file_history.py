@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ..core.file_history import FileHistory, stream_file_history
+from ..core.git_client import run_git
+from .ui_virtual_list import VirtualListbox
+
+
+class FileHistoryWindow(tk.Toplevel):
+    # Timeline of one file: revisions stream into the list while git walks
+    # history and each selection renders from the history's patch buffer.
+    def __init__(self, app: tk.Tk, path: str, rev: str) -> None:
+        super().__init__(app)
+        self.app = app
+        self.path = path
+        self.history: FileHistory | None = None
+        self.cancel = threading.Event()
+        self.title(f"Historico - {path}")
+        self.geometry("1100x700")
+
+        container = ttk.Frame(self)
+        container.pack(fill="both", expand=True, padx=8, pady=8)
+        container.grid_columnconfigure(0, weight=1)
+        container.grid_columnconfigure(1, weight=2)
+        container.grid_rowconfigure(1, weight=1)
+
+        top_bar = ttk.Frame(container)
+        top_bar.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 6))
+        top_bar.grid_columnconfigure(0, weight=1)
+        self.status_var = tk.StringVar(value="Carregando historico...")
+        ttk.Label(top_bar, textvariable=self.status_var).grid(row=0, column=0, sticky="w")
+        ttk.Button(top_bar, text="Blame nesta revisao", command=self._blame_selected).grid(row=0, column=1, padx=(6, 0))
+        ttk.Button(top_bar, text="Fechar", command=self._close).grid(row=0, column=2, padx=(6, 0))
+        self.read_mode_var = tk.StringVar(value="")
+        ttk.Label(top_bar, textvariable=self.read_mode_var).grid(row=1, column=0, columnspan=3, sticky="w")
+
+        list_frame = ttk.Frame(container)
+        list_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 6))
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_scroll = ttk.Scrollbar(list_frame, orient="vertical")
+        self.revisions_listbox = VirtualListbox(list_frame, row_text=self._row_text, yscrollcommand=list_scroll.set)
+        self.revisions_listbox.grid(row=0, column=0, sticky="nsew")
+        list_scroll.configure(command=self.revisions_listbox.yview)
+        list_scroll.grid(row=0, column=1, sticky="ns")
+        self.revisions_listbox.bind("<<ListboxSelect>>", lambda _e: self._show_selected())
+
+        diff_frame = ttk.Frame(container)
+        diff_frame.grid(row=1, column=1, sticky="nsew")
+        diff_frame.grid_rowconfigure(0, weight=1)
+        diff_frame.grid_columnconfigure(0, weight=1)
+        self.diff_text = tk.Text(diff_frame, wrap="none", font="TkFixedFont", state="disabled")
+        self.diff_text.grid(row=0, column=0, sticky="nsew")
+        diff_scroll = ttk.Scrollbar(diff_frame, orient="vertical", command=self.diff_text.yview)
+        diff_scroll.grid(row=0, column=1, sticky="ns")
+        self.diff_text.configure(yscrollcommand=diff_scroll.set)
+
+        palette = getattr(app, "theme_palette", None)
+        if palette and hasattr(app, "_apply_text_widget_theme"):
+            app._apply_text_widget_theme(self.diff_text, palette)
+            app._apply_diff_tags(self.diff_text, palette)
+        if palette and hasattr(app, "_apply_listbox_theme"):
+            app._apply_listbox_theme(self.revisions_listbox, palette)
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._start(rev)
+
+    def _row_text(self, index: int) -> str:
+        history = self.history
+        if history is None or index >= len(history):
+            return ""
+        revision = history.revisions[index]
+        text = f"{revision.commit_hash[:7]} {revision.date[:10]} {revision.status or ' '} {revision.subject}"
+        if revision.old_path:
+            text += f"  (de {revision.old_path})"
+        return text
+
+    def _start(self, rev: str) -> None:
+        repo_path = self.app.repo_path
+        path = self.path
+        cancel = self.cancel
+        cache = self.app.file_history_cache
+
+        def update(count: int) -> None:
+            history = self.history
+            if cancel.is_set() or history is None or not self.winfo_exists():
+                return
+            first = self.revisions_listbox.size() == 0
+            self.revisions_listbox.set_size(count)
+            suffix = "" if history.complete else " (carregando...)"
+            self.status_var.set(f"{path}: {count} revisoes{suffix}")
+            if first and count:
+                self.revisions_listbox.selection_set(0)
+                self.revisions_listbox.activate(0)
+                self._show_selected()
+
+        def failed(exc: Exception) -> None:
+            if not cancel.is_set() and self.winfo_exists():
+                self.status_var.set("")
+                messagebox.showerror("Historico do arquivo", str(exc), parent=self)
+
+        def worker() -> None:
+            try:
+                tip = run_git(repo_path, ["rev-parse", "--verify", f"{rev}^{{commit}}"]).strip()
+                key = (repo_path, tip, path)
+                history = cache.get(key)
+                if history is not None:
+                    self.history = history
+                    self.app.after(0, lambda: update(len(history)))
+                    return
+                history = FileHistory(path)
+                self.history = history
+                stream_file_history(
+                    repo_path,
+                    tip,
+                    path,
+                    history,
+                    lambda count: self.app.after(0, lambda: update(count)),
+                    cancel,
+                )
+            except Exception as exc:
+                self.app.after(0, lambda: failed(exc))
+                return
+            if history.complete:
+                cache.put(key, history)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _selected_index(self) -> int | None:
+        selection = self.revisions_listbox.curselection()
+        history = self.history
+        if not selection or history is None or selection[0] >= len(history):
+            return None
+        return selection[0]
+
+    def _show_selected(self) -> None:
+        index = self._selected_index()
+        if index is None or self.history is None:
+            return
+        revision = self.history.revisions[index]
+        patch = self.history.patch_text(index) or "(sem alteracoes de conteudo nesta revisao)"
+        source = (("file_history", self.app.repo_path, revision.commit_hash, revision.path), revision.path)
+        self.app._render_diff_view(self.diff_text, patch, self.read_mode_var, show_file_headers=True, highlight=source)
+
+    def _blame_selected(self) -> None:
+        index = self._selected_index()
+        if index is None or self.history is None:
+            return
+        revision = self.history.revisions[index]
+        if revision.status == "D":
+            messagebox.showinfo("Blame", "O arquivo foi removido nesta revisao.", parent=self)
+            return
+        if hasattr(self.app, "_open_blame_window"):
+            self.app._open_blame_window(revision.commit_hash, revision.path)
+
+    def _close(self) -> None:
+        self.cancel.set()
+        self.destroy()
+
+
+class FileHistoryMixin:
+    def _open_file_history_window(self, path: str, rev: str = "HEAD") -> None:
+        if not self.repo_ready or not path:
+            return
+        FileHistoryWindow(self, path, rev)
@@ -7,7 +7,9 @@ import subprocess
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+from ..core.commit_store import CommitStore
 from ..core.git_client import is_git_repo, run_git
+from ..core.repo_session import RepoSession
 
 
 class GlobalBarMixin:
@@ -141,8 +143,15 @@ class GlobalBarMixin:
             return
         self.branches_loading = True
 
+        repo_path = self.repo_path
+
         def task() -> tuple[list[str], str]:
-            return self._get_branches(), self._get_current_branch()
+            # One for-each-ref (cached until the refs change on disk) gives
+            # the local names and the checked-out branch.
+            refs = self.branch_ref_cache.load(repo_path)
+            branches = [ref.name for ref in refs if not ref.is_remote]
+            current = next((ref.name for ref in refs if ref.is_head), "")
+            return branches, current or self._get_current_branch()
 
         def success(result: object) -> None:
             self.branches_loading = False
@@ -171,10 +180,6 @@ class GlobalBarMixin:
         self._update_operation_preview()
         self._refresh_filter_refs()
 
-    def _get_branches(self) -> list[str]:
-        output = run_git(self.repo_path, ["branch", "--format=%(refname:short)"])
-        return [line.strip() for line in output.splitlines() if line.strip()]
-
     def _get_current_branch(self) -> str:
         if not self.repo_ready:
             return ""
@@ -228,7 +233,7 @@ class GlobalBarMixin:
             return
         self._open_path_in_vscode(self.repo_path, use_goto=False)
 
-    def _open_repo_file_in_vscode(self, repo_relative_path: str) -> bool:
+    def _open_repo_file_in_vscode(self, repo_relative_path: str, line: int | None = None) -> bool:
         if not self.repo_ready or not self.repo_path:
             messagebox.showinfo("VS Code", "Selecione um repositório válido antes de abrir arquivos.")
             return False
@@ -243,6 +248,8 @@ class GlobalBarMixin:
         if not os.path.exists(abs_path):
             messagebox.showwarning("VS Code", f"Arquivo não encontrado: {repo_relative_path}")
             return False
+        if line:
+            abs_path = f"{abs_path}:{line}"
         return self._open_path_in_vscode(abs_path, use_goto=True)
 
     def _checkout_branch(self) -> bool:
@@ -335,6 +342,7 @@ class GlobalBarMixin:
 
     def _set_repo_path(self, path: str, initial: bool) -> bool:
         repo_path = os.path.abspath(path)
+        self._save_repo_session()
         if not os.path.isdir(repo_path) or not is_git_repo(repo_path):
             if not initial:
                 messagebox.showwarning("Repo", "Selecione um repositório git válido.")
@@ -348,10 +356,16 @@ class GlobalBarMixin:
         if hasattr(self, "_bump_repo_state"):
             self._bump_repo_state()
 
-        self.patch_cache.clear()
-        self.full_patch_cache.clear()
-        self.selected_file_by_commit.clear()
-        self._reload_commits()
+        session = self.repo_sessions.take(repo_path)
+        if session is not None and session.filters == self.commit_filters:
+            self._restore_repo_session(session)
+        else:
+            self.patch_cache.clear()
+            self.full_patch_cache.clear()
+            self.selected_file_by_commit.clear()
+            self._reload_commits()
+        if hasattr(self, "_reset_code_search"):
+            self._reset_code_search()
 
         self.branch_combo.configure(state="readonly")
         self._set_action_visibility(self.fetch_button, True)
@@ -363,6 +377,99 @@ class GlobalBarMixin:
         self._schedule_auto_status()
         return True
 
+    def _save_repo_session(self) -> None:
+        # The repo being left keeps its loaded pages, caches, scroll and
+        # status; the next repo starts from fresh containers.
+        if not self.repo_ready or self.loading_commits or self.commit_window is None:
+            return
+        try:
+            signature = self.repo_sessions.signature(self.repo_path)
+        except RuntimeError:
+            return
+        top, _bottom = self.commit_listbox.yview() or (0.0, 0.0)
+        self.repo_sessions.put(
+            RepoSession(
+                repo_path=self.repo_path,
+                refs_signature=signature,
+                filters=self.commit_filters,
+                commits=self.commit_summaries,
+                commit_window=self.commit_window,
+                commit_graph=self.commit_graph,
+                no_more_commits=self.no_more_commits,
+                top_fraction=top,
+                selected_hash=self.current_commit_hash,
+                patch_cache=self.patch_cache,
+                full_patch_cache=self.full_patch_cache,
+                selected_file_by_commit=self.selected_file_by_commit,
+                commit_details_cache=self.commit_details_cache,
+                status_entries=self.status_entries,
+                status_signature=self.status_signature,
+                branches=self.branch_list,
+                current_branch=self.branch_var.get(),
+            )
+        )
+        self.patch_cache = {}
+        self.full_patch_cache = {}
+        self.selected_file_by_commit = {}
+        self.commit_details_cache = {}
+        self.commit_summaries = CommitStore()
+        self.commit_window = None
+        self.commit_graph = None
+        self.current_commit_hash = None
+
+    def _restore_repo_session(self, session: RepoSession) -> None:
+        # Shows the session as it was left, then checks the refs on a worker:
+        # only a moved ref reloads the commits. Status and branches refresh
+        # as on any switch, and an unchanged status keeps the patch caches.
+        self.commit_list_epoch += 1
+        self.loading_commits = False
+        self.loading_more = False
+        self.patch_cache = session.patch_cache
+        self.full_patch_cache = session.full_patch_cache
+        self.selected_file_by_commit = session.selected_file_by_commit
+        self.commit_details_cache = session.commit_details_cache
+        self.commit_summaries = session.commits
+        self.commit_window = session.commit_window
+        self.commit_graph = session.commit_graph
+        self.commit_offset = len(session.commits)
+        self.no_more_commits = session.no_more_commits
+        self.current_commit_hash = None
+        self.status_signature = session.status_signature
+        self.branch_list = session.branches
+        self.branch_combo["values"] = session.branches
+        if session.current_branch:
+            self.branch_var.set(session.current_branch)
+
+        self.commit_listbox.set_message("")
+        self.commit_listbox.selection_clear(0, tk.END)
+        self.commit_listbox.set_size(len(session.commits))
+        self.commit_listbox.yview("moveto", str(session.top_fraction))
+        index = session.commits.index_of(session.selected_hash) if session.selected_hash else None
+        if index is None and session.commits:
+            index = 0
+        if index is not None:
+            self.commit_listbox.selection_set(index)
+            self.commit_listbox.activate(index)
+            self._show_commit(index)
+        self._render_status_entries(session.status_entries)
+        self._update_filter_status()
+
+        repo_path = self.repo_path
+        epoch = self.commit_list_epoch
+
+        def task() -> tuple[int, ...]:
+            return self.repo_sessions.signature(repo_path)
+
+        def success(signature: object) -> None:
+            if repo_path == self.repo_path and epoch == self.commit_list_epoch and signature != session.refs_signature:
+                self._reload_commits()
+
+        def error(_exc: Exception) -> None:
+            if repo_path == self.repo_path and epoch == self.commit_list_epoch:
+                self._reload_commits()
+
+        self._run_async("repo_session", "Verificar refs", task, success, error)
+
     def _set_repo_ui_no_repo(self) -> None:
         self.repo_ready = False
         if self.auto_fetch_job is not None:
@@ -377,14 +484,18 @@ class GlobalBarMixin:
             except tk.TclError:
                 pass
             self.auto_status_job = None
-        self.commit_summaries = []
+        self.commit_summaries = CommitStore()
+        self.commit_window = None
+        self.commit_graph = None
         self.commit_details_cache.clear()
         self.current_commit_hash = None
         if hasattr(self, "status_signature"):
             self.status_signature = ""
-        self.commit_listbox.delete(0, tk.END)
+        self.commit_listbox.set_size(0)
+        if hasattr(self, "_reset_code_search"):
+            self._reset_code_search()
         self._set_text(self.commit_info, "(nenhum repositório selecionado)")
-        self._set_text(self.patch_text, "")
+        self._show_diff_message(self.patch_text, "")
         self.files_listbox.delete(0, tk.END)
         self.load_patch_button.configure(state="disabled")
         self.load_patch_button.grid_remove()
@@ -460,6 +571,12 @@ class GlobalBarMixin:
         if not hasattr(self, "pull_button"):
             return
         upstream = self._get_upstream()
+        behind, ahead = self._get_ahead_behind() if upstream else (0, 0)
+        self._apply_pull_push_labels(upstream, behind, ahead)
+
+    def _apply_pull_push_labels(self, upstream: str | None, behind: int, ahead: int) -> None:
+        if not hasattr(self, "pull_button"):
+            return
         if not upstream:
             self._set_action_visibility(self.pull_button, False)
             self._set_action_visibility(self.push_button, False)
@@ -468,7 +585,6 @@ class GlobalBarMixin:
             if hasattr(self, "upstream_var"):
                 self.upstream_var.set("Upstream: (não configurado)")
             return
-        behind, ahead = self._get_ahead_behind()
         if behind > 0:
             self.pull_button.configure(text=f"Pull ({behind})", state="normal")
             self._set_action_visibility(self.pull_button, True)
@@ -490,6 +606,31 @@ class GlobalBarMixin:
             self.upstream_var.set(f"Ahead: {ahead} | Behind: {behind}")
         self._update_operation_preview()
 
+    def _refresh_repo_views(self, message: str = "") -> None:
+        # One refresh after an operation that moved HEAD: the commit list
+        # reloads once and status plus upstream divergence come from a single
+        # background task, not three passes with git on the UI thread.
+        if not self.repo_ready:
+            return
+        if hasattr(self, "_bump_repo_state"):
+            self._bump_repo_state()
+        self._reload_commits()
+
+        def task() -> tuple[list[dict[str, str | bool]], str | None, int, int]:
+            entries = self._get_status_entries()
+            upstream = self._get_upstream()
+            behind, ahead = self._get_ahead_behind() if upstream else (0, 0)
+            return entries, upstream, behind, ahead
+
+        def success(result: tuple[list[dict[str, str | bool]], str | None, int, int]) -> None:
+            entries, upstream, behind, ahead = result
+            self._render_status_entries(entries)
+            self._apply_pull_push_labels(upstream, behind, ahead)
+            if message:
+                self._set_status(message)
+
+        self._run_async("repo_views", "Atualizar repositório", task, success)
+
     @staticmethod
     def _set_action_visibility(button: ttk.Button, visible: bool) -> None:
         if visible:
@@ -2,15 +2,53 @@
 from __future__ import annotations
 
 import os
+import threading
 import tkinter as tk
+from typing import Callable
 from tkinter import filedialog, messagebox, ttk
 
+from ..core.cherry_pick import (
+    CherryPickResult,
+    apply_commits,
+    cherry_pick_in_progress,
+    import_commits,
+    resume_cherry_pick,
+)
 from ..core.diff_utils import render_patch_to_widget
-from ..core.git_client import is_git_repo, load_commit_details, load_commit_summaries, run_git
+from ..core.commit_filter import CommitWindow, filter_loaded, narrows
+from ..core.commit_graph import CommitGraph
+from ..core.commit_store import CommitStore
+from ..core.git_client import (
+    GitCancelled,
+    grep_commit_messages,
+    is_git_repo,
+    load_commit_details,
+    load_commit_page,
+    load_commit_summaries,
+    run_git,
+    run_git_buffered,
+)
 from ..core.models import CommitFilters, CommitInfo, CommitSummary, FileStat
+from ..core.patch_buffer import PatchBuffer
+from ..core.pickaxe import (
+    SEARCH_MODE_MESSAGE,
+    SEARCH_MODE_PICKAXE,
+    SEARCH_MODE_REGEX,
+    PickaxeResult,
+    resolve_tip,
+    search_content,
+)
+from .ui_commit_graph import CommitGraphCanvas
+from .ui_virtual_list import VirtualListbox
 
 
 LARGE_PATCH_THRESHOLD = 1000
+FILTER_DEBOUNCE_MS = 250
+SEARCH_MODES = {
+    "Mensagem": SEARCH_MODE_MESSAGE,
+    "Conteudo (-S)": SEARCH_MODE_PICKAXE,
+    "Regex (-G)": SEARCH_MODE_REGEX,
+}
 
 
 class HistoryTabMixin:
@@ -33,6 +71,11 @@ class HistoryTabMixin:
             row=0,
             column=1,
         )
+        ttk.Button(history_actions, text="Arvore do commit", command=self._open_tree_browser).grid(
+            row=0,
+            column=2,
+            padx=(6, 0),
+        )
 
         # Ações de merge/rebase/squash agora vivem na aba Comparar.
 
@@ -105,6 +148,18 @@ class HistoryTabMixin:
         self.filter_repo_status_combo.grid(row=1, column=5, sticky="w", padx=(0, 8), pady=4)
         self.filter_repo_status_combo.bind("<<ComboboxSelected>>", lambda _e: self._apply_commit_filters())
 
+        ttk.Label(filter_frame, text="Buscar em:").grid(row=1, column=6, sticky="w", padx=(0, 2), pady=4)
+        self.filter_search_mode_var = tk.StringVar(value="Mensagem")
+        self.filter_search_mode_combo = ttk.Combobox(
+            filter_frame,
+            textvariable=self.filter_search_mode_var,
+            state="readonly",
+            width=14,
+            values=list(SEARCH_MODES),
+        )
+        self.filter_search_mode_combo.grid(row=1, column=7, sticky="w", padx=(0, 8), pady=4)
+        self.filter_search_mode_combo.bind("<<ComboboxSelected>>", lambda _e: self._apply_commit_filters())
+
         filter_actions = ttk.Frame(filter_frame)
         filter_actions.grid(row=1, column=8, columnspan=2, sticky="e", padx=(0, 8), pady=4)
         ttk.Button(filter_actions, text="Aplicar", command=self._apply_commit_filters).grid(
@@ -116,6 +171,13 @@ class HistoryTabMixin:
             row=0,
             column=1,
         )
+        self.content_search_button = ttk.Button(
+            filter_actions,
+            text="Cancelar busca",
+            command=self._cancel_content_search,
+        )
+        self.content_search_button.grid(row=0, column=2, padx=(6, 0))
+        self.content_search_button.grid_remove()
 
         self.filter_status_var = tk.StringVar(value="Sem filtro ativo.")
         self.filter_status_label = ttk.Label(filter_frame, textvariable=self.filter_status_var)
@@ -129,6 +191,9 @@ class HistoryTabMixin:
             filter_until_entry,
         ):
             entry.bind("<Return>", lambda _e: self._apply_commit_filters())
+        # Text and author filter as you type; narrowing runs over loaded commits.
+        for variable in (self.filter_text_var, self.filter_author_var):
+            variable.trace_add("write", lambda *_args: self._schedule_live_filter())
 
         paned = ttk.PanedWindow(self.history_tab, orient="horizontal")
         paned.grid(row=1, column=0, sticky="nsew")
@@ -136,24 +201,30 @@ class HistoryTabMixin:
 
         self.left_frame = ttk.Frame(paned)
         self.left_frame.grid_rowconfigure(0, weight=1)
-        self.left_frame.grid_columnconfigure(0, weight=1)
-        self.left_frame.grid_columnconfigure(1, weight=0)
+        self.left_frame.grid_columnconfigure(0, weight=0)
+        self.left_frame.grid_columnconfigure(1, weight=1)
+        self.left_frame.grid_columnconfigure(2, weight=0)
+
+        self.commit_graph_canvas = CommitGraphCanvas(self.left_frame)
+        self.commit_graph_canvas.grid(row=0, column=0, sticky="ns")
 
-        self.commit_listbox = tk.Listbox(
+        self.commit_listbox = VirtualListbox(
             self.left_frame,
-            activestyle="dotbox",
-            selectmode="extended",
-            exportselection=False,
+            row_text=self._format_commit_row,
+            yscrollcommand=self._on_history_yscroll,
+            on_redraw=self._draw_commit_graph,
         )
-        self.commit_listbox.grid(row=0, column=0, sticky="nsew")
+        self.commit_listbox.grid(row=0, column=1, sticky="nsew")
         self.commit_listbox.bind("<<ListboxSelect>>", self._on_commit_select)
-        self.commit_listbox.bind("<MouseWheel>", self._on_history_mousewheel)
-        self.commit_listbox.bind("<Button-4>", self._on_history_mousewheel)
-        self.commit_listbox.bind("<Button-5>", self._on_history_mousewheel)
+
+        # Clicks and the wheel over the graph act on the list rows beside it.
+        self.commit_graph_canvas.bind("<Button-1>", self._on_graph_click)
+        self.commit_graph_canvas.bind("<MouseWheel>", lambda e: self._scroll_commit_list(-3 if e.delta > 0 else 3))
+        self.commit_graph_canvas.bind("<Button-4>", lambda _e: self._scroll_commit_list(-3))
+        self.commit_graph_canvas.bind("<Button-5>", lambda _e: self._scroll_commit_list(3))
 
         self.commit_scrollbar = ttk.Scrollbar(self.left_frame, orient="vertical", command=self._on_history_scrollbar)
-        self.commit_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.commit_listbox.configure(yscrollcommand=self._on_history_yscroll)
+        self.commit_scrollbar.grid(row=0, column=2, sticky="ns")
 
         self._build_right_panel()
         paned.add(self.left_frame, weight=1)
@@ -184,13 +255,31 @@ class HistoryTabMixin:
 
         self.load_patch_button = ttk.Button(
             top_actions,
-            text="Carregar patch grande",
+            text="Carregar patch completo",
             command=self._load_full_patch_for_selected_file,
             state="disabled",
         )
         self.load_patch_button.grid(row=0, column=2)
         self.load_patch_button.grid_remove()
 
+        ttk.Button(
+            top_actions,
+            text="Blame",
+            command=self._blame_selected_file,
+        ).grid(row=0, column=3, padx=(6, 0))
+
+        ttk.Button(
+            top_actions,
+            text="Historico do arquivo",
+            command=self._file_history_selected_file,
+        ).grid(row=0, column=4, padx=(6, 0))
+
+        ttk.Button(
+            top_actions,
+            text="Ver conteudo",
+            command=self._view_selected_file_content,
+        ).grid(row=0, column=5, padx=(6, 0))
+
         self.commit_info = tk.Text(self.right_frame, height=8, wrap="word")
         self.commit_info.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 4))
         self.commit_info.configure(state="disabled")
@@ -205,6 +294,7 @@ class HistoryTabMixin:
         self.files_listbox.grid(row=1, column=0, sticky="nsew")
         self.files_listbox.bind("<<ListboxSelect>>", self._on_file_select)
         self.files_listbox.bind("<Double-Button-1>", self._open_selected_file_in_vscode)
+        self.files_listbox.bind("<Button-3>", self._blame_file_at)
 
         files_scroll = ttk.Scrollbar(files_frame, orient="vertical", command=self.files_listbox.yview)
         files_scroll.grid(row=1, column=1, sticky="ns")
@@ -233,9 +323,15 @@ class HistoryTabMixin:
             variable=self.read_mode_var,
             command=self._toggle_read_mode,
         ).grid(row=0, column=2, sticky="e", padx=(8, 0))
+        ttk.Checkbutton(
+            patch_header,
+            text="Lado a lado",
+            variable=self.side_by_side_var,
+            command=self._toggle_side_by_side,
+        ).grid(row=0, column=3, sticky="e", padx=(8, 0))
         self.patch_read_mode_var = tk.StringVar(value="")
         ttk.Label(patch_header, textvariable=self.patch_read_mode_var).grid(
-            row=0, column=3, sticky="e", padx=(8, 0)
+            row=0, column=4, sticky="e", padx=(8, 0)
         )
 
         self.patch_text = tk.Text(patch_frame, wrap="none")
@@ -250,6 +346,7 @@ class HistoryTabMixin:
         self.patch_text.tag_configure("removed_word", foreground="#d1242f", background="#ffebe9")
         self.patch_text.configure(font="TkFixedFont")
         self.patch_text.configure(state="disabled")
+        self._attach_side_by_side(self.patch_text, patch_scroll)
 
     def _get_filters_from_ui(self) -> CommitFilters:
         if not hasattr(self, "filter_text_var"):
@@ -268,6 +365,7 @@ class HistoryTabMixin:
             status_value = self.filter_repo_status_var.get().strip()
             if status_value and status_value != "Todos":
                 repo_status = status_value
+        search_mode = SEARCH_MODES.get(self.filter_search_mode_var.get(), SEARCH_MODE_MESSAGE)
         return CommitFilters(
             text=self.filter_text_var.get().strip(),
             author=self.filter_author_var.get().strip(),
@@ -276,6 +374,7 @@ class HistoryTabMixin:
             until=self.filter_until_var.get().strip(),
             ref=ref,
             repo_status=repo_status,
+            search_mode=search_mode,
         )
 
     @staticmethod
@@ -298,7 +397,8 @@ class HistoryTabMixin:
         if self.commit_filters.ref:
             parts.append(f"ref='{self._shorten_filter_value(self.commit_filters.ref)}'")
         if self.commit_filters.text:
-            parts.append(f"texto='{self._shorten_filter_value(self.commit_filters.text)}'")
+            label = "conteudo" if self.commit_filters.search_mode else "texto"
+            parts.append(f"{label}='{self._shorten_filter_value(self.commit_filters.text)}'")
         if self.commit_filters.author:
             parts.append(f"autor='{self._shorten_filter_value(self.commit_filters.author)}'")
         if self.commit_filters.path:
@@ -326,11 +426,104 @@ class HistoryTabMixin:
         return True
 
     def _apply_commit_filters(self) -> None:
+        self._cancel_live_filter()
         self.commit_filters = self._get_filters_from_ui()
-        if self.repo_ready:
-            self._reload_commits()
+        if not self.repo_ready:
+            self._update_filter_status()
+            return
+        window = self.commit_window
+        if window is not None and narrows(window.filters, self.commit_filters):
+            self._filter_loaded_commits(window)
         else:
+            self._reload_commits()
+
+    def _schedule_live_filter(self) -> None:
+        self._cancel_live_filter()
+        self.filter_debounce_job = self.after(FILTER_DEBOUNCE_MS, self._run_live_filter)
+
+    def _cancel_live_filter(self) -> None:
+        if self.filter_debounce_job is None:
+            return
+        try:
+            self.after_cancel(self.filter_debounce_job)
+        except tk.TclError:
+            pass
+        self.filter_debounce_job = None
+
+    def _run_live_filter(self) -> None:
+        self.filter_debounce_job = None
+        filters = self._get_filters_from_ui()
+        # Diff searches walk the whole history; they wait for Enter/Aplicar.
+        if filters.search_mode and filters.text:
+            return
+        if filters != self.commit_filters:
+            self._apply_commit_filters()
+
+    def _filter_loaded_commits(self, window: CommitWindow) -> None:
+        # A new epoch drops in-flight pages and message checks of older filters.
+        self._cancel_content_search()
+        self.commit_list_epoch += 1
+        epoch = self.commit_list_epoch
+        self.loading_more = False
+        filters = self.commit_filters
+        if filters == window.filters:
+            self._show_filtered_commits(window, window.store, final=True)
+            return
+        start = self._perf_start("Filtro")
+        result = filter_loaded(window.store, window.filters, filters, self.commit_details_cache)
+        self._show_filtered_commits(window, window.store.take(result.rows), final=not result.pending)
+        if not result.pending:
+            self._perf_end("Filtro", start)
+            return
+        # Subjects did not settle these rows and their bodies are not cached:
+        # git reads just those messages, without walking history again.
+        hashes = [window.store.hash_at(row) for row in result.pending]
+        repo_path = self.repo_path
+
+        def task() -> set[str]:
+            return grep_commit_messages(repo_path, hashes, filters.text)
+
+        def success(found: set[str]) -> None:
+            if epoch != self.commit_list_epoch:
+                return
+            verified = [row for row, commit_hash in zip(result.pending, hashes) if commit_hash in found]
+            rows = sorted(result.rows + verified)
+            self._show_filtered_commits(window, window.store.take(rows), final=True)
+            self._perf_end("Filtro", start)
+
+        def error(exc: Exception) -> None:
+            if epoch != self.commit_list_epoch:
+                return
+            self.loading_commits = False
             self._update_filter_status()
+            messagebox.showerror("Erro", str(exc))
+
+        self._run_async("commit_filter", "", task, success, error)
+
+    def _show_filtered_commits(self, window: CommitWindow, store: CommitStore, final: bool) -> None:
+        # Git matches of a narrower filter keep their order inside the window,
+        # so the next page starts right after the rows kept here.
+        self.commit_summaries = store
+        self.loading_commits = not final
+        self.commit_offset = len(store)
+        self.no_more_commits = window.exhausted
+        selected = store.index_of(self.current_commit_hash) if self.current_commit_hash else None
+        self.commit_listbox.set_message("" if final else "(filtrando commits...)")
+        self.commit_listbox.selection_clear(0, tk.END)
+        self._update_commit_graph()
+        self.commit_listbox.set_size(len(store))
+        if selected is not None:
+            self.commit_listbox.selection_set(selected)
+            self.commit_listbox.activate(selected)
+            self.commit_listbox.see(selected)
+        elif store:
+            self.commit_listbox.yview("moveto", "0")
+            self.commit_listbox.selection_set(0)
+            self.commit_listbox.activate(0)
+            self._show_commit(0)
+        self._update_filter_status()
+        if not final:
+            self.filter_status_var.set(f"{self.filter_status_var.get()} Conferindo descricoes...")
 
     def _clear_commit_filters(self) -> None:
         if hasattr(self, "filter_text_var"):
@@ -345,44 +538,78 @@ class HistoryTabMixin:
                 self.filter_tag_var.set("(todas)")
             if hasattr(self, "filter_repo_status_var"):
                 self.filter_repo_status_var.set("Todos")
-        self.commit_filters = CommitFilters()
-        if self.repo_ready:
-            self._reload_commits()
-        else:
-            self._update_filter_status()
+            if hasattr(self, "filter_search_mode_var"):
+                self.filter_search_mode_var.set("Mensagem")
+        self._apply_commit_filters()
 
-    def _load_commit_summaries(self, skip: int = 0) -> list[CommitSummary]:
+    def _load_commit_summaries(self, skip: int = 0) -> CommitStore:
         if self.commit_filters.repo_status and not self._repo_status_matches_filter(self.commit_filters.repo_status):
-            return []
-        return load_commit_summaries(
+            return CommitStore()
+        return load_commit_page(
             self.repo_path,
             self.commit_limit,
             skip=skip,
             filters=self.commit_filters,
         )
 
+    def _format_commit_row(self, index: int) -> str:
+        store = self.commit_summaries
+        return f"{store.short_hash_at(index)} | {store.subject_at(index)}"
+
+    def _graph_applies(self) -> bool:
+        # Text/author/path/date filters drop commits from the chain, so the
+        # lanes would be wrong; a branch or tag filter keeps it whole.
+        filters = self.commit_filters
+        if filters.text or filters.author or filters.path or filters.since or filters.until:
+            return False
+        window = self.commit_window
+        return window is not None and window.store is self.commit_summaries
+
+    def _update_commit_graph(self) -> None:
+        if not self._graph_applies():
+            return
+        if self.commit_graph is None:
+            self.commit_graph = CommitGraph()
+        self.commit_graph.extend(self.commit_summaries)
+
+    def _on_graph_click(self, event: tk.Event) -> None:
+        self.commit_listbox.focus_set()
+        self.commit_listbox.event_generate("<Button-1>", x=1, y=event.y)
+
+    def _scroll_commit_list(self, delta: int) -> None:
+        self.commit_listbox.yview("scroll", str(delta), "units")
+
+    def _draw_commit_graph(self, rows: range, row_height: int) -> None:
+        if not hasattr(self, "commit_graph_canvas"):
+            return
+        graph = self.commit_graph if self._graph_applies() else None
+        self.commit_graph_canvas.draw(graph, rows, row_height)
+
     def _populate_commit_list(self) -> None:
-        self.commit_listbox.delete(0, tk.END)
-        for summary in self.commit_summaries:
-            short_hash = summary.commit_hash[:7]
-            self.commit_listbox.insert(tk.END, f"{short_hash} | {summary.subject}")
+        # Offsets first: redrawing the list may already ask for the next page.
+        self.commit_offset = len(self.commit_summaries)
+        self.no_more_commits = len(self.commit_summaries) < self.commit_limit
+        self.commit_listbox.set_message("")
+        self.commit_listbox.selection_clear(0, tk.END)
+        self.commit_listbox.set_size(len(self.commit_summaries))
+        self.commit_listbox.yview("moveto", "0")
         if self.commit_summaries:
             self.commit_listbox.selection_set(0)
+            self.commit_listbox.activate(0)
             self._show_commit(0)
-        self.commit_offset = len(self.commit_summaries)
-        self.no_more_commits = len(self.commit_summaries) < self.commit_limit
 
-    def _append_commit_summaries(self, summaries: list[CommitSummary]) -> None:
+    def _append_commit_summaries(self, summaries: CommitStore) -> None:
         if not summaries:
             self.no_more_commits = True
             return
-        for summary in summaries:
-            short_hash = summary.commit_hash[:7]
-            self.commit_listbox.insert(tk.END, f"{short_hash} | {summary.subject}")
         self.commit_summaries.extend(summaries)
         self.commit_offset = len(self.commit_summaries)
         if len(summaries) < self.commit_limit:
             self.no_more_commits = True
+        if self.commit_window is not None and self.commit_window.store is self.commit_summaries:
+            self.commit_window.exhausted = self.no_more_commits
+        self._update_commit_graph()
+        self.commit_listbox.set_size(len(self.commit_summaries))
 
     def _load_more_commits(self) -> None:
         if not self.repo_ready or self.loading_commits or self.loading_more or self.no_more_commits:
@@ -391,14 +618,14 @@ class HistoryTabMixin:
         epoch = self.commit_list_epoch
         skip = self.commit_offset
 
-        def task() -> list[CommitSummary]:
+        def task() -> CommitStore:
             return self._load_commit_summaries(skip=skip)
 
         def success(more: object) -> None:
             self.loading_more = False
             if epoch != self.commit_list_epoch:
                 return
-            self._append_commit_summaries(list(more))  # type: ignore[list-item]
+            self._append_commit_summaries(more)  # type: ignore[arg-type]
 
         def error(exc: Exception) -> None:
             self.loading_more = False
@@ -423,9 +650,6 @@ class HistoryTabMixin:
         if float(last) >= 0.98:
             self._maybe_load_more()
 
-    def _on_history_mousewheel(self, event: tk.Event) -> None:
-        self.after(0, self._maybe_load_more)
-
     def _on_commit_select(self, _event: tk.Event) -> None:
         selection = self.commit_listbox.curselection()
         if not selection:
@@ -460,7 +684,7 @@ class HistoryTabMixin:
         self._set_text(self.commit_info, "Carregando detalhes do commit...")
         self.files_listbox.delete(0, tk.END)
         self.file_stats_by_index.clear()
-        self._set_text(self.patch_text, "")
+        self._show_diff_message(self.patch_text, "")
         self.load_patch_button.configure(state="disabled")
         self.load_patch_button.grid_remove()
         self._request_commit_details(summary.commit_hash)
@@ -498,22 +722,25 @@ class HistoryTabMixin:
             self.files_listbox.selection_set(selected_index)
             self._show_file_patch(selected_index)
         else:
-            self._set_text(self.patch_text, "(nenhum arquivo alterado)")
+            self._show_diff_message(self.patch_text, "(nenhum arquivo alterado)")
             self.load_patch_button.configure(state="disabled")
             self.load_patch_button.grid_remove()
             if hasattr(self, "patch_read_mode_var"):
                 self.patch_read_mode_var.set("")
 
-    def _get_patch(self, commit_hash: str, path: str | None = None, word_diff: bool | None = None) -> str:
+    def _build_patch_args(self, commit_hash: str, path: str | None, word_diff: bool | None) -> list[str]:
         if word_diff is None:
-            word_diff = self._word_diff_enabled()
+            word_diff = self._patch_word_diff()
         args = ["show", "--unified=0", "--format="]
         if word_diff:
             args.append("--word-diff=plain")
         args.append(commit_hash)
         if path:
             args.extend(["--", path])
-        return run_git(self.repo_path, args)
+        return args
+
+    def _get_patch(self, commit_hash: str, path: str | None = None, word_diff: bool | None = None) -> str:
+        return run_git(self.repo_path, self._build_patch_args(commit_hash, path, word_diff))
 
     def _on_file_select(self, _event: tk.Event) -> None:
         selection = self.files_listbox.curselection()
@@ -532,6 +759,37 @@ class HistoryTabMixin:
             return
         self._open_repo_file_in_vscode(stat.path)
 
+    def _blame_selected_file(self) -> None:
+        selection = self.files_listbox.curselection()
+        stat = self.file_stats_by_index.get(selection[0]) if selection else None
+        if not stat or not self.current_commit_hash:
+            messagebox.showinfo("Blame", "Selecione um arquivo do commit.")
+            return
+        self._open_blame_window(self.current_commit_hash, stat.path)
+
+    def _file_history_selected_file(self) -> None:
+        selection = self.files_listbox.curselection()
+        stat = self.file_stats_by_index.get(selection[0]) if selection else None
+        if not stat or not self.current_commit_hash:
+            messagebox.showinfo("Historico do arquivo", "Selecione um arquivo do commit.")
+            return
+        self._open_file_history_window(stat.path, self.current_commit_hash)
+
+    def _view_selected_file_content(self) -> None:
+        selection = self.files_listbox.curselection()
+        stat = self.file_stats_by_index.get(selection[0]) if selection else None
+        if not stat or not self.current_commit_hash:
+            messagebox.showinfo("Conteudo", "Selecione um arquivo do commit.")
+            return
+        self._open_blob_viewer(self.current_commit_hash, stat.path)
+
+    def _blame_file_at(self, event: tk.Event) -> None:
+        if self.files_listbox.size() == 0 or not self.current_commit_hash:
+            return
+        stat = self.file_stats_by_index.get(self.files_listbox.nearest(event.y))
+        if stat:
+            self._open_blame_window(self.current_commit_hash, stat.path)
+
     def _show_file_patch(self, file_index: int) -> None:
         commit = self._get_selected_commit()
         stat = self.file_stats_by_index.get(file_index)
@@ -539,20 +797,87 @@ class HistoryTabMixin:
             return
         self.selected_file_by_commit[commit.commit_hash] = file_index
         if stat.is_binary:
-            self._set_text(self.patch_text, "Arquivo binário: sem diff disponível.")
+            self._show_diff_message(
+                self.patch_text,
+                "Arquivo binário: sem diff disponível. Use \"Ver conteudo\" para inspecionar.",
+            )
             self.load_patch_button.configure(state="disabled")
             self.load_patch_button.grid_remove()
             if hasattr(self, "patch_read_mode_var"):
                 self.patch_read_mode_var.set("")
             return
-        total_lines = stat.added + stat.deleted
         cache_key = (commit.commit_hash, stat.path)
         cached = self.patch_cache.get(cache_key)
-        if cached is None:
-            cached = self._get_patch(commit.commit_hash, stat.path)
-            self.patch_cache[cache_key] = cached
-        self._render_patch(cached)
-        if total_lines >= LARGE_PATCH_THRESHOLD:
+        if cached is not None:
+            self.diff_service.cancel("history_patch")
+            self._render_patch(cached, stat.path)
+            self._update_load_patch_button()
+            self._prefetch_neighbor_patches(commit.commit_hash, file_index)
+            return
+        self._show_diff_message(self.patch_text, "Carregando patch...")
+        self.load_patch_button.configure(state="disabled")
+        self.load_patch_button.grid_remove()
+        if hasattr(self, "patch_read_mode_var"):
+            self.patch_read_mode_var.set("")
+        start = self._perf_start("Patch")
+        commit_hash = commit.commit_hash
+        request_key = self._patch_request_key(cache_key)
+
+        def done(patch: object) -> None:
+            self._store_patch(cache_key, patch, request_key)
+            if self.current_commit_hash == commit_hash and self.selected_file_by_commit.get(commit_hash) == file_index:
+                self._render_patch(patch, stat.path)  # type: ignore[arg-type]
+                self._update_load_patch_button()
+            self._perf_end("Patch", start)
+
+        def error(exc: Exception) -> None:
+            self._show_diff_message(self.patch_text, "Falha ao carregar patch.")
+            self._perf_end("Patch", start)
+            messagebox.showerror("Erro", str(exc))
+
+        self.diff_service.request(
+            "history_patch",
+            request_key,
+            self._make_patch_loader(commit_hash, stat),
+            done,
+            error,
+        )
+        self._prefetch_neighbor_patches(commit_hash, file_index)
+
+    def _patch_request_key(self, cache_key: tuple[str, str]) -> tuple[object, ...]:
+        return ("history", self.repo_path, self.repo_state_token, self._patch_word_diff(), *cache_key)
+
+    def _make_patch_loader(self, commit_hash: str, stat: FileStat) -> Callable[[], str | PatchBuffer]:
+        args = self._build_patch_args(commit_hash, stat.path, None)
+        repo_path = self.repo_path
+        # Large patches are streamed into a spooled buffer instead of a str.
+        if stat.added + stat.deleted >= LARGE_PATCH_THRESHOLD:
+            return lambda: run_git_buffered(repo_path, args)
+        return lambda: run_git(repo_path, args)
+
+    def _store_patch(self, cache_key: tuple[str, str], patch: object, request_key: tuple[object, ...] | None = None) -> None:
+        # Drop results computed for an older repo state or word-diff mode.
+        if request_key is not None and request_key != self._patch_request_key(cache_key):
+            return
+        self.patch_cache[cache_key] = patch  # type: ignore[assignment]
+
+    def _prefetch_neighbor_patches(self, commit_hash: str, file_index: int) -> None:
+        for neighbor in (file_index + 1, file_index - 1):
+            stat = self.file_stats_by_index.get(neighbor)
+            if stat is None or stat.is_binary:
+                continue
+            cache_key = (commit_hash, stat.path)
+            if cache_key in self.patch_cache:
+                continue
+            request_key = self._patch_request_key(cache_key)
+            self.diff_service.prefetch(
+                request_key,
+                self._make_patch_loader(commit_hash, stat),
+                lambda patch, key=cache_key, req=request_key: self._store_patch(key, patch, req),
+            )
+
+    def _update_load_patch_button(self) -> None:
+        if self._has_pending_read_mode(self.patch_text):
             self.load_patch_button.configure(state="normal")
             self.load_patch_button.grid()
         else:
@@ -565,7 +890,7 @@ class HistoryTabMixin:
         selection = self.commit_listbox.curselection()
         if not selection:
             return None
-        return self.commit_summaries[selection[0]].commit_hash
+        return self.commit_summaries.hash_at(selection[0])
 
     def _get_commit_details(self, commit_hash: str) -> CommitInfo | None:
         cached = self.commit_details_cache.get(commit_hash)
@@ -653,20 +978,9 @@ class HistoryTabMixin:
         self.update()
 
     def _load_full_patch_for_selected_file(self) -> None:
-        commit = self._get_selected_commit()
-        stat = self._get_selected_file_stat()
-        if not commit or not stat:
-            return
-        try:
-            patch = self._get_patch(commit.commit_hash, stat.path)
-        except RuntimeError as exc:
-            messagebox.showerror("Erro", str(exc))
-            return
-        cache_key = (commit.commit_hash, stat.path)
-        self.patch_cache[cache_key] = patch
-        self._render_patch(patch)
-        self.load_patch_button.configure(state="normal")
-        self.load_patch_button.grid()
+        # The full patch is already buffered; only the omitted middle is rendered.
+        self._expand_read_mode(self.patch_text, None)
+        self._update_load_patch_button()
 
     def _open_cherry_pick_window(self) -> None:
         if not self.repo_ready:
@@ -739,6 +1053,28 @@ class HistoryTabMixin:
             window.clipboard_append(hashes)
             window.update()
 
+        progress_var = tk.StringVar(value="")
+        ttk.Label(frame, textvariable=progress_var).grid(row=4, column=0, sticky="w", pady=(6, 0))
+        cancel = threading.Event()
+
+        def start_job(job: Callable[..., CherryPickResult], done_message: str) -> None:
+            cancel.clear()
+            for button in (pick_button, continue_button):
+                button.configure(state="disabled")
+            cancel_button.configure(state="normal")
+
+            def finish(result: CherryPickResult | None) -> str:
+                if window.winfo_exists():
+                    window.destroy()
+                if result is None:
+                    return ""
+                message = f"{done_message}: {result.applied} commit(s)."
+                if result.skipped:
+                    message = f"{message} {result.skipped} já presente(s)."
+                return message
+
+            self._start_cherry_pick_job("Cherry-pick", job, progress_var, cancel, finish)
+
         def run_cherry_pick() -> None:
             target = target_var.get().strip()
             if not target:
@@ -746,27 +1082,12 @@ class HistoryTabMixin:
                 return
             if not self._checkout_to_branch(target):
                 return
-            applied: list[str] = []
-            for commit in commits:
-                try:
-                    run_git(self.repo_path, ["cherry-pick", commit.commit_hash])
-                except RuntimeError as exc:
-                    messagebox.showerror(
-                        "Cherry-pick",
-                        f"Falha ao aplicar {commit.commit_hash[:7]}.\n{exc}\n"
-                        "Resolva conflitos e finalize ou aborte o cherry-pick.",
-                    )
-                    self._show_conflicts_window()
-                    break
-                applied.append(commit.commit_hash)
-            if applied:
-                if hasattr(self, "_bump_repo_state"):
-                    self._bump_repo_state()
-                self._reload_commits()
-                self._refresh_status()
-                self._update_pull_push_labels()
-                self._set_status(f"Cherry-pick aplicado em {target}.")
-            window.destroy()
+            repo_path = self.repo_path
+            hashes = [commit.commit_hash for commit in commits]
+            start_job(
+                lambda stage, progress, cancel: apply_commits(repo_path, hashes, stage, progress, cancel),
+                f"Cherry-pick aplicado em {target}",
+            )
 
         def abort_cherry_pick() -> None:
             try:
@@ -774,30 +1095,24 @@ class HistoryTabMixin:
             except RuntimeError as exc:
                 messagebox.showerror("Cherry-pick", str(exc))
                 return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            self._set_status("Cherry-pick abortado.")
-            self._refresh_status()
-            self._update_pull_push_labels()
+            self._refresh_repo_views("Cherry-pick abortado.")
 
         def continue_cherry_pick() -> None:
-            try:
-                run_git(self.repo_path, ["cherry-pick", "--continue"])
-            except RuntimeError as exc:
-                messagebox.showerror("Cherry-pick", str(exc))
-                return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            self._set_status("Cherry-pick continuado.")
-            self._reload_commits()
-            self._refresh_status()
-            self._update_pull_push_labels()
+            repo_path = self.repo_path
+            start_job(
+                lambda _stage, progress, cancel: resume_cherry_pick(repo_path, "continue", progress, cancel),
+                "Cherry-pick continuado",
+            )
 
         ttk.Button(actions, text="Copiar hashes", command=copy_hashes).grid(row=0, column=0, padx=(0, 6))
-        ttk.Button(actions, text="Cherry-pick", command=run_cherry_pick).grid(row=0, column=1, padx=(0, 6))
+        pick_button = ttk.Button(actions, text="Cherry-pick", command=run_cherry_pick)
+        pick_button.grid(row=0, column=1, padx=(0, 6))
         ttk.Button(actions, text="Abortar", command=abort_cherry_pick).grid(row=0, column=2, padx=(0, 6))
-        ttk.Button(actions, text="Continuar", command=continue_cherry_pick).grid(row=0, column=3, padx=(0, 6))
-        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=4)
+        continue_button = ttk.Button(actions, text="Continuar", command=continue_cherry_pick)
+        continue_button.grid(row=0, column=3, padx=(0, 6))
+        cancel_button = ttk.Button(actions, text="Cancelar", command=cancel.set, state="disabled")
+        cancel_button.grid(row=0, column=4, padx=(0, 6))
+        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=5)
 
     def _open_import_commits_window(self) -> None:
         if not self.repo_ready:
@@ -844,6 +1159,10 @@ class HistoryTabMixin:
             tokens = [token.strip() for token in raw.replace(",", " ").split()]
             return [token for token in tokens if token]
 
+        progress_var = tk.StringVar(value="")
+        ttk.Label(frame, textvariable=progress_var).grid(row=5, column=0, columnspan=3, sticky="w", pady=(6, 0))
+        cancel = threading.Event()
+
         def run_import() -> None:
             source_path = source_var.get().strip()
             if not source_path:
@@ -861,39 +1180,103 @@ class HistoryTabMixin:
                 messagebox.showwarning("Importar", "Branch atual não encontrada.")
                 return
 
-            applied: list[str] = []
-            for commit_hash in hashes:
-                try:
-                    run_git(self.repo_path, ["fetch", source_path, commit_hash])
-                except RuntimeError as exc:
-                    messagebox.showerror("Importar", f"Falha ao buscar {commit_hash[:7]}.\n{exc}")
-                    break
-                try:
-                    run_git(self.repo_path, ["cherry-pick", commit_hash])
-                except RuntimeError as exc:
-                    messagebox.showerror(
-                        "Importar",
-                        f"Falha ao aplicar {commit_hash[:7]}.\n{exc}\n"
-                        "Resolva conflitos e finalize ou aborte o cherry-pick.",
-                    )
-                    self._show_conflicts_window()
-                    break
-                applied.append(commit_hash)
-
-            if applied:
-                self._reload_commits()
-                self._refresh_status()
-                self._update_pull_push_labels()
-                self._set_status(f"Importado em {target}: {len(applied)} commit(s).")
-            window.destroy()
+            repo_path = self.repo_path
+            cancel.clear()
+            import_button.configure(state="disabled")
+            cancel_button.configure(state="normal")
+
+            def finish(result: CherryPickResult | None) -> str:
+                if window.winfo_exists():
+                    window.destroy()
+                if result is None:
+                    return ""
+                message = f"Importado em {target}: {result.applied} commit(s)."
+                if result.skipped:
+                    message = f"{message} {result.skipped} já presente(s)."
+                return message
+
+            self._start_cherry_pick_job(
+                "Importar",
+                lambda stage, progress, cancel: import_commits(repo_path, source_path, hashes, stage, progress, cancel),
+                progress_var,
+                cancel,
+                finish,
+            )
 
         def open_hashes() -> None:
             hashes = "\n".join(parse_hashes())
             self._open_text_window("Hashes informados", hashes, render_patch=False)
 
         ttk.Button(actions, text="Ver hashes", command=open_hashes).grid(row=0, column=0, padx=(0, 6))
-        ttk.Button(actions, text="Importar", command=run_import).grid(row=0, column=1, padx=(0, 6))
-        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=2)
+        import_button = ttk.Button(actions, text="Importar", command=run_import)
+        import_button.grid(row=0, column=1, padx=(0, 6))
+        cancel_button = ttk.Button(actions, text="Cancelar", command=cancel.set, state="disabled")
+        cancel_button.grid(row=0, column=2, padx=(0, 6))
+        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=3)
+
+    def _start_cherry_pick_job(
+        self,
+        title: str,
+        job: Callable[
+            [Callable[[str], None], Callable[[int, int], None], threading.Event],
+            CherryPickResult,
+        ],
+        progress_var: tk.StringVar,
+        cancel: threading.Event,
+        on_finish: Callable[[CherryPickResult | None], str],
+    ) -> None:
+        # Runs a whole cherry-pick sequence off the UI thread. The stage and
+        # the sequencer progress go to progress_var; on_finish returns the
+        # status line for the single refresh at the end, and a stop on a
+        # conflict opens the conflicts window so the sequence can go on.
+        start = self._perf_start(title)
+
+        def post(text: str) -> None:
+            self.after(0, lambda: progress_var.set(text))
+
+        def finish(result: CherryPickResult | None, exc: Exception | None) -> None:
+            self._perf_end(title, start)
+            progress_var.set("")
+            message = on_finish(result)
+            if isinstance(exc, GitCancelled):
+                # Stopped while resolving, fetching or ordering; the branch
+                # may have been checked out already.
+                self._refresh_repo_views(f"{title}: cancelado antes de aplicar.")
+                return
+            if result is None:
+                messagebox.showerror(title, str(exc))
+                return
+            if result.aborted:
+                self._refresh_repo_views(f"{title}: cancelado, a sequência foi desfeita.")
+                return
+            if result.cancelled:
+                self._refresh_repo_views(
+                    f"{title}: cancelado após {result.applied} de {result.total}; os commits aplicados foram mantidos."
+                )
+                return
+            if result.stopped:
+                message = f"{title}: parado em {result.applied + 1} de {result.total}."
+            if result.applied or result.stopped:
+                self._refresh_repo_views(message)
+            elif message:
+                self._set_status(message)
+            if result.stopped:
+                messagebox.showwarning(
+                    title,
+                    f"Parado após {result.applied} de {result.total} commit(s).\n{result.message}\n"
+                    "Resolva os conflitos e continue, pule ou aborte o cherry-pick.",
+                )
+                self._show_conflicts_window()
+
+        def worker() -> None:
+            try:
+                result = job(post, lambda done, total: post(f"Aplicando {done}/{total}..."), cancel)
+            except Exception as exc:
+                self.after(0, lambda: finish(None, exc))
+                return
+            self.after(0, lambda: finish(result, None))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _is_git_repo(self, path: str) -> bool:
         return is_git_repo(path)
@@ -905,7 +1288,9 @@ class HistoryTabMixin:
             messagebox.showerror("Conflitos", str(exc))
             return
         files = [line.strip() for line in output.splitlines() if line.strip()]
-        if not files:
+        # A sequence can also stop on a commit that became empty; it still
+        # needs Pular or Abortar.
+        if not files and not cherry_pick_in_progress(self.repo_path):
             messagebox.showinfo("Conflitos", "Nenhum conflito detectado.")
             return
 
@@ -948,30 +1333,45 @@ class HistoryTabMixin:
             except RuntimeError as exc:
                 messagebox.showerror("Cherry-pick", str(exc))
                 return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            self._set_status("Cherry-pick abortado.")
-            self._refresh_status()
-            self._update_pull_push_labels()
-
-        def continue_cherry_pick() -> None:
-            try:
-                run_git(self.repo_path, ["cherry-pick", "--continue"])
-            except RuntimeError as exc:
-                messagebox.showerror("Cherry-pick", str(exc))
-                return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            self._set_status("Cherry-pick continuado.")
-            self._reload_commits()
-            self._refresh_status()
-            self._update_pull_push_labels()
-            window.destroy()
+            self._refresh_repo_views("Cherry-pick abortado.")
+
+        progress_var = tk.StringVar(value="")
+        ttk.Label(frame, textvariable=progress_var).grid(row=3, column=0, sticky="w", pady=(6, 0))
+        cancel = threading.Event()
+
+        def resume_cherry_pick_sequence(action: str) -> None:
+            # --continue/--skip run the rest of the sequence in one git call.
+            repo_path = self.repo_path
+            for button in (continue_button, skip_button):
+                button.configure(state="disabled")
+            cancel_button.configure(state="normal")
+
+            def finish(result: CherryPickResult | None) -> str:
+                if window.winfo_exists():
+                    window.destroy()
+                return f"Cherry-pick concluído: {result.applied} commit(s)." if result is not None else ""
+
+            self._start_cherry_pick_job(
+                "Cherry-pick",
+                lambda _stage, progress, cancel: resume_cherry_pick(repo_path, action, progress, cancel),
+                progress_var,
+                cancel,
+                finish,
+            )
 
         ttk.Button(actions, text="Abrir no VS Code", command=open_in_vscode).grid(row=0, column=0, padx=(0, 6))
         ttk.Button(actions, text="Abortar", command=abort_cherry_pick).grid(row=0, column=1, padx=(0, 6))
-        ttk.Button(actions, text="Continuar", command=continue_cherry_pick).grid(row=0, column=2, padx=(0, 6))
-        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=3)
+        continue_button = ttk.Button(
+            actions,
+            text="Continuar",
+            command=lambda: resume_cherry_pick_sequence("continue"),
+        )
+        continue_button.grid(row=0, column=2, padx=(0, 6))
+        skip_button = ttk.Button(actions, text="Pular", command=lambda: resume_cherry_pick_sequence("skip"))
+        skip_button.grid(row=0, column=3, padx=(0, 6))
+        cancel_button = ttk.Button(actions, text="Cancelar", command=cancel.set, state="disabled")
+        cancel_button.grid(row=0, column=4, padx=(0, 6))
+        ttk.Button(actions, text="Fechar", command=window.destroy).grid(row=0, column=5)
 
     def _get_tags(self) -> list[str]:
         output = run_git(self.repo_path, ["tag", "--list"])
@@ -1000,22 +1400,36 @@ class HistoryTabMixin:
     def _reload_commits(self) -> None:
         if not self.repo_ready:
             return
+        self._cancel_content_search()
+        filters = self.commit_filters
+        if filters.search_mode and filters.text and self._repo_status_matches_filter(filters.repo_status):
+            self._start_content_search()
+            return
         self.commit_list_epoch += 1
         epoch = self.commit_list_epoch
+        filters = self.commit_filters
+        self.commit_window = None
+        self.commit_graph = None
         self.loading_commits = True
         self.loading_more = False
         self.no_more_commits = False
-        self.commit_listbox.delete(0, tk.END)
-        self.commit_listbox.insert(tk.END, "(carregando commits...)")
+        self.commit_listbox.set_size(0)
+        self.commit_listbox.set_message("(carregando commits...)")
 
-        def task() -> list[CommitSummary]:
+        def task() -> CommitStore:
             return self._load_commit_summaries()
 
         def success(summaries: object) -> None:
-            self.loading_commits = False
             if epoch != self.commit_list_epoch:
                 return
-            self.commit_summaries = list(summaries)  # type: ignore[list-item]
+            self.loading_commits = False
+            self.commit_summaries = summaries  # type: ignore[assignment]
+            self.commit_window = CommitWindow(
+                filters=filters,
+                store=self.commit_summaries,
+                exhausted=len(self.commit_summaries) < self.commit_limit,
+            )
+            self._update_commit_graph()
             self.commit_details_cache.clear()
             self.current_commit_hash = None
             self._populate_commit_list()
@@ -1028,6 +1442,106 @@ class HistoryTabMixin:
 
         self._run_async("commit_list", "Recarregar commits", task, success, error)
 
+    def _start_content_search(self) -> None:
+        # -S/-G diff every commit: matches stream in while git scans, and the
+        # last finished result of the same query is resumed from its tip.
+        self.commit_list_epoch += 1
+        epoch = self.commit_list_epoch
+        filters = self.commit_filters
+        cancel = threading.Event()
+        self.content_search_cancel = cancel
+        self.commit_window = None
+        self.commit_graph = None
+        self.loading_commits = True
+        self.loading_more = False
+        self.no_more_commits = True
+        self.commit_summaries = CommitStore()
+        self.commit_offset = 0
+        self.commit_details_cache.clear()
+        self.current_commit_hash = None
+        self.commit_listbox.selection_clear(0, tk.END)
+        self.commit_listbox.set_size(0)
+        self.commit_listbox.set_message("(buscando no conteudo dos commits...)")
+        self.content_search_button.grid()
+        self.filter_status_var.set("Buscando no conteudo dos commits...")
+        repo_path = self.repo_path
+        key = (repo_path, filters)
+        start = self._perf_start("Busca no conteudo")
+
+        def progress(scanned: int, total: int, page: CommitStore) -> None:
+            if epoch != self.commit_list_epoch:
+                return
+            store = self.commit_summaries
+            first = not store
+            store.extend(page)
+            self.commit_offset = len(store)
+            self.commit_listbox.set_size(len(store))
+            if first and store:
+                self.commit_listbox.set_message("")
+                self.commit_listbox.selection_set(0)
+                self.commit_listbox.activate(0)
+                self._show_commit(0)
+            self.filter_status_var.set(
+                f"Buscando no conteudo: {scanned}/{total} commits verificados, {len(store)} encontrados."
+            )
+
+        def finish(result: PickaxeResult) -> None:
+            if epoch != self.commit_list_epoch:
+                return
+            self.loading_commits = False
+            self.content_search_cancel = None
+            self.content_search_button.grid_remove()
+            if result.complete and len(result.matches) != len(self.commit_summaries):
+                # Same tip as the cached search: nothing was walked.
+                self.commit_summaries = result.matches
+                self._populate_commit_list()
+                self.no_more_commits = True
+            self.commit_listbox.set_message("" if self.commit_summaries else "(nenhum commit encontrado)")
+            self._update_filter_status()
+            if not result.complete:
+                self.filter_status_var.set(
+                    f"{self.filter_status_var.get()} Busca cancelada apos {result.scanned} commits verificados."
+                )
+            self._perf_end("Busca no conteudo", start)
+
+        def failed(exc: Exception) -> None:
+            if epoch != self.commit_list_epoch:
+                return
+            self.loading_commits = False
+            self.content_search_cancel = None
+            self.content_search_button.grid_remove()
+            self.commit_listbox.set_message("")
+            self._update_filter_status()
+            messagebox.showerror("Erro", str(exc))
+
+        def worker() -> None:
+            try:
+                tip = resolve_tip(repo_path, filters)
+                result = search_content(
+                    repo_path,
+                    filters,
+                    tip,
+                    self.pickaxe_cache.get(key),
+                    lambda scanned, total, page: self.after(0, lambda: progress(scanned, total, page)),
+                    cancel,
+                )
+            except Exception as exc:
+                self.after(0, lambda: failed(exc))
+                return
+            self.pickaxe_cache.put(key, result)
+            self.after(0, lambda: finish(result))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _cancel_content_search(self) -> None:
+        cancel = self.content_search_cancel
+        if cancel is None:
+            return
+        cancel.set()
+        self.content_search_cancel = None
+        if hasattr(self, "content_search_button"):
+            self.content_search_button.grid_remove()
+
     def _refresh_history_patch_view(self) -> None:
         selection = self.files_listbox.curselection()
         if selection:
@@ -1084,20 +1598,9 @@ class HistoryTabMixin:
 
         ttk.Button(actions, text="Copiar tudo", command=copy_all).pack(side="right")
 
-    def _render_patch(self, patch: str) -> None:
-        display_patch, truncated, shown, total = self._apply_read_mode_to_diff(patch)
-        render_patch_to_widget(
-            self.patch_text,
-            display_patch,
-            read_only=True,
-            show_file_headers=False,
-            word_diff=self._word_diff_enabled(),
-        )
-        if hasattr(self, "patch_read_mode_var"):
-            if truncated:
-                self.patch_read_mode_var.set(f"Modo leitura: {shown}/{total} linhas")
-            else:
-                self.patch_read_mode_var.set("")
+    def _render_patch(self, patch: str | PatchBuffer, path: str) -> None:
+        source = (("history", self.repo_path, self.current_commit_hash, path), path)
+        self._render_diff_view(self.patch_text, patch, getattr(self, "patch_read_mode_var", None), highlight=source)
 
 
 def parse_args() -> argparse.Namespace:
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import threading
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+
+from ..core.repo_scanner import FoundRepo, ScanStats, parse_ignore_rules, scan_repos
+
+SCAN_FLUSH_MS = 100
+
+
+class RepoScanWindow(tk.Toplevel):
+    # Walks a root folder for repositories; results show up while the scan
+    # runs, and a second scan of the same tree reuses the app's ScanCache.
+    def __init__(self, app: tk.Tk) -> None:
+        super().__init__(app)
+        self.app = app
+        self.cancel = threading.Event()
+        self.found: list[FoundRepo] = []
+        self.found_lock = threading.Lock()
+        self.flush_job: str | None = None
+        self.title("Procurar repositórios")
+        self.geometry("900x560")
+        self.grid_rowconfigure(3, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        bar = ttk.Frame(self)
+        bar.grid(row=0, column=0, columnspan=2, sticky="ew", padx=8, pady=(8, 4))
+        bar.grid_columnconfigure(1, weight=1)
+        ttk.Label(bar, text="Pasta raiz:").grid(row=0, column=0, sticky="w", padx=(0, 4))
+        self.root_var = tk.StringVar(value=app.scan_root)
+        ttk.Entry(bar, textvariable=self.root_var).grid(row=0, column=1, sticky="ew", padx=(0, 6))
+        ttk.Button(bar, text="Procurar", command=self._browse).grid(row=0, column=2, padx=(0, 6))
+        self.start_button = ttk.Button(bar, text="Iniciar", command=self._start)
+        self.start_button.grid(row=0, column=3, padx=(0, 6))
+        self.cancel_button = ttk.Button(bar, text="Cancelar", command=self.cancel.set, state="disabled")
+        self.cancel_button.grid(row=0, column=4)
+        ttk.Label(bar, text="Ignorar:").grid(row=1, column=0, sticky="w", padx=(0, 4), pady=(6, 0))
+        self.ignore_var = tk.StringVar(value=", ".join(app.scan_ignore))
+        ttk.Entry(bar, textvariable=self.ignore_var).grid(row=1, column=1, columnspan=4, sticky="ew", pady=(6, 0))
+
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.status_var).grid(row=2, column=0, columnspan=2, sticky="w", padx=8)
+
+        self.tree = ttk.Treeview(self, columns=("kind",), selectmode="extended")
+        self.tree.heading("#0", text="Repositório", anchor="w")
+        self.tree.column("#0", width=680)
+        self.tree.heading("kind", text="Tipo", anchor="w")
+        self.tree.column("kind", width=120, stretch=False)
+        self.tree.grid(row=3, column=0, sticky="nsew", padx=(8, 0), pady=(4, 0))
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        scroll.grid(row=3, column=1, sticky="ns", padx=(0, 8), pady=(4, 0))
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.bind("<Double-Button-1>", lambda _e: self._open_selected())
+
+        actions = ttk.Frame(self)
+        actions.grid(row=4, column=0, columnspan=2, sticky="w", padx=8, pady=8)
+        ttk.Button(actions, text="Abrir", command=self._open_selected).grid(row=0, column=0, padx=(0, 6))
+        ttk.Button(actions, text="Favoritar", command=self._favorite_selected).grid(row=0, column=1)
+
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+    def _browse(self) -> None:
+        path = filedialog.askdirectory(parent=self)
+        if path:
+            self.root_var.set(path)
+
+    def _start(self) -> None:
+        root = self.root_var.get().strip()
+        if not root or not os.path.isdir(root):
+            messagebox.showwarning("Procurar repositórios", "Informe uma pasta existente.", parent=self)
+            return
+        ignore = parse_ignore_rules(self.ignore_var.get())
+        self.app.scan_root = root
+        self.app.scan_ignore = list(ignore)
+        self.app._persist_settings()
+
+        self.cancel = threading.Event()
+        cancel = self.cancel
+        cache = self.app.repo_scan_cache
+        self.cancel_button.configure(command=cancel.set, state="normal")
+        self.start_button.configure(state="disabled")
+        self.tree.delete(*self.tree.get_children())
+        with self.found_lock:
+            self.found = []
+        self.status_var.set("Procurando...")
+        start = self.app._perf_start("Procurar repositórios")
+
+        def found(repo: FoundRepo) -> None:
+            with self.found_lock:
+                self.found.append(repo)
+
+        def done(stats: ScanStats | None, exc: Exception | None) -> None:
+            if not self.winfo_exists():
+                return
+            self._flush()
+            self.app._perf_end("Procurar repositórios", start)
+            self.start_button.configure(state="normal")
+            self.cancel_button.configure(state="disabled")
+            if exc is not None or stats is None:
+                self.status_var.set("")
+                messagebox.showerror("Procurar repositórios", str(exc), parent=self)
+                return
+            prefix = "Cancelado" if cancel.is_set() else "Concluído"
+            self.status_var.set(
+                f"{prefix}: {stats.repos} repositório(s) em {stats.directories} pasta(s) "
+                f"({stats.cached} do cache), {stats.elapsed:.1f}s."
+            )
+
+        def worker() -> None:
+            try:
+                stats = scan_repos(root, ignore, cache, found, cancel)
+            except Exception as exc:
+                self.app.after(0, lambda: done(None, exc))
+                return
+            self.app.after(0, lambda: done(stats, None))
+
+        threading.Thread(target=worker, daemon=True).start()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # Found repos are handed over in batches, not one `after` per repo.
+        self._flush()
+        if self.start_button.instate(["disabled"]):
+            self.flush_job = self.after(SCAN_FLUSH_MS, self._schedule_flush)
+
+    def _flush(self) -> None:
+        with self.found_lock:
+            batch, self.found = self.found, []
+        for repo in batch:
+            if not self.tree.exists(repo.path):
+                self.tree.insert("", "end", iid=repo.path, text=repo.path, values=(repo.kind,))
+        if batch:
+            self.status_var.set(f"Procurando... {len(self.tree.get_children())} repositório(s)")
+
+    def _selected_paths(self) -> list[str]:
+        return list(self.tree.selection())
+
+    def _open_selected(self) -> None:
+        paths = self._selected_paths()
+        if paths:
+            self.app._open_repo_from_path(paths[0])
+
+    def _favorite_selected(self) -> None:
+        for path in self._selected_paths():
+            self.app._add_favorite_repo(path)
+
+    def _close(self) -> None:
+        self.cancel.set()
+        if self.flush_job is not None:
+            self.after_cancel(self.flush_job)
+        self.destroy()
+
+
+class RepoScanMixin:
+    def _open_repo_scan(self) -> None:
+        RepoScanWindow(self)
@@ -1,9 +1,32 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import os
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+from ..core.repo_dashboard import RepoStatus
+
+REPO_DASHBOARD_TICK_MS = 2000
+DASHBOARD_COLUMNS = (
+    ("branch", "Branch", 160),
+    ("changes", "Alterações", 90),
+    ("divergence", "Ahead/Behind", 100),
+    ("upstream", "Upstream", 200),
+    ("age", "Atualizado", 90),
+)
+
+
+def format_age(seconds: float) -> str:
+    if seconds < 5:
+        return "agora"
+    if seconds < 60:
+        return f"há {int(seconds)}s"
+    if seconds < 3600:
+        return f"há {int(seconds // 60)}min"
+    return f"há {int(seconds // 3600)}h"
+
 
 class ReposTabMixin:
     def _build_repos_tab(self) -> None:
@@ -65,7 +88,10 @@ class ReposTabMixin:
             row=0, column=0, padx=(0, 6)
         )
         ttk.Button(global_actions, text="Abrir pasta...", command=self._open_repo_from_dialog).grid(
-            row=0, column=1
+            row=0, column=1, padx=(0, 6)
+        )
+        ttk.Button(global_actions, text="Procurar repositórios...", command=self._open_repo_scan).grid(
+            row=0, column=2
         )
 
         status_frame = ttk.LabelFrame(self.repos_tab, text="Status do repositório")
@@ -102,8 +128,39 @@ class ReposTabMixin:
             row=4, column=1, sticky="w", padx=8, pady=(2, 6)
         )
 
+        dashboard_frame = ttk.LabelFrame(self.repos_tab, text="Painel de favoritos e recentes")
+        dashboard_frame.grid(row=5, column=0, columnspan=2, sticky="nsew", padx=8, pady=(0, 8))
+        dashboard_frame.grid_rowconfigure(0, weight=1)
+        dashboard_frame.grid_columnconfigure(0, weight=1)
+        self.repos_tab.grid_rowconfigure(5, weight=1)
+
+        self.repo_dashboard_tree = ttk.Treeview(
+            dashboard_frame,
+            columns=[name for name, _label, _width in DASHBOARD_COLUMNS],
+            selectmode="browse",
+            height=8,
+        )
+        self.repo_dashboard_tree.heading("#0", text="Repositório", anchor="w")
+        self.repo_dashboard_tree.column("#0", width=200)
+        for name, label, width in DASHBOARD_COLUMNS:
+            self.repo_dashboard_tree.heading(name, text=label, anchor="w")
+            self.repo_dashboard_tree.column(name, width=width, stretch=name == "upstream")
+        self.repo_dashboard_tree.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=(6, 0))
+        dashboard_scroll = ttk.Scrollbar(dashboard_frame, orient="vertical", command=self.repo_dashboard_tree.yview)
+        dashboard_scroll.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=(6, 0))
+        self.repo_dashboard_tree.configure(yscrollcommand=dashboard_scroll.set)
+        self.repo_dashboard_tree.tag_configure("dirty", foreground="#9a6700")
+        self.repo_dashboard_tree.tag_configure("error", foreground="#b42318")
+        self.repo_dashboard_tree.bind("<Double-Button-1>", lambda _e: self._open_dashboard_repo())
+        ttk.Button(
+            dashboard_frame,
+            text="Atualizar painel",
+            command=lambda: self._poll_repo_dashboard(force=True),
+        ).grid(row=1, column=0, sticky="w", padx=8, pady=(6, 6))
+
         self._refresh_repo_lists()
         self._refresh_repo_status_panel()
+        self.repo_dashboard_job = self.after(0, self._tick_repo_dashboard)
 
     def _refresh_repo_lists(self) -> None:
         if not hasattr(self, "favorite_listbox"):
@@ -114,6 +171,77 @@ class ReposTabMixin:
             self.favorite_listbox.insert(tk.END, path)
         for path in self.recent_repos:
             self.recent_listbox.insert(tk.END, path)
+        self._sync_repo_dashboard()
+
+    def _dashboard_paths(self) -> list[str]:
+        return list(dict.fromkeys([*self.favorite_repos, *self.recent_repos]))
+
+    def _sync_repo_dashboard(self) -> None:
+        if not hasattr(self, "repo_dashboard_tree"):
+            return
+        paths = self._dashboard_paths()
+        self.repo_dashboard.retain(paths)
+        tree = self.repo_dashboard_tree
+        listed = set(paths)
+        for iid in tree.get_children():
+            if iid not in listed:
+                tree.delete(iid)
+        for index, path in enumerate(paths):
+            if tree.exists(path):
+                tree.move(path, "", index)
+            else:
+                tree.insert("", index, iid=path, text=os.path.basename(path.rstrip("/\\")) or path)
+            status = self.repo_dashboard.get(path)
+            if status is not None:
+                self._render_dashboard_row(status)
+
+    def _render_dashboard_row(self, status: RepoStatus) -> None:
+        tree = self.repo_dashboard_tree
+        if not tree.exists(status.path):
+            return
+        age = format_age(time.time() - status.checked_at)
+        if status.error:
+            reason = status.error.splitlines()[0] if status.error else ""
+            tree.item(status.path, values=("", "erro", "", reason, age), tags=("error",))
+            return
+        divergence = f"+{status.ahead}/-{status.behind}" if status.upstream else ""
+        tree.item(
+            status.path,
+            values=(status.branch, status.changes or "", divergence, status.upstream or "(sem upstream)", age),
+            tags=("dirty",) if status.changes else (),
+        )
+
+    def _poll_repo_dashboard(self, force: bool = False) -> None:
+        # Results arrive on the dashboard's workers and are rendered here.
+        self.repo_dashboard.poll(
+            self._dashboard_paths(),
+            lambda status: self.after(0, lambda: self._render_dashboard_row(status)),
+            force,
+        )
+
+    def _stop_repo_dashboard(self) -> None:
+        if self.repo_dashboard_job is not None:
+            self.after_cancel(self.repo_dashboard_job)
+            self.repo_dashboard_job = None
+        self.repo_dashboard.shutdown()
+
+    def _tick_repo_dashboard(self) -> None:
+        self.repo_dashboard_job = self.after(REPO_DASHBOARD_TICK_MS, self._tick_repo_dashboard)
+        # Polls only while the tab is on screen; each repo is submitted only
+        # when its own interval is up.
+        if self.tabs.select() != str(self.repos_tab):
+            return
+        now = time.time()
+        for path in self.repo_dashboard_tree.get_children():
+            status = self.repo_dashboard.get(path)
+            if status is not None:
+                self.repo_dashboard_tree.set(path, "age", format_age(now - status.checked_at))
+        self._poll_repo_dashboard()
+
+    def _open_dashboard_repo(self) -> None:
+        path = self.repo_dashboard_tree.focus()
+        if path:
+            self._open_repo_from_path(path)
 
     def _open_repo_from_dialog(self) -> None:
         path = filedialog.askdirectory()
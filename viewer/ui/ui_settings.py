@@ -113,14 +113,21 @@ class SettingsTabMixin:
         self.mono_font_size_entry = ttk.Entry(self.settings_tab, textvariable=self.mono_font_size_var, width=12)
         self.mono_font_size_entry.grid(row=8, column=1, sticky="w", padx=8, pady=4)
 
+        self.syntax_highlight_var = tk.BooleanVar(value=getattr(self, "syntax_highlight", True))
+        ttk.Checkbutton(
+            self.settings_tab,
+            text="Realce de sintaxe nos diffs",
+            variable=self.syntax_highlight_var,
+        ).grid(row=9, column=0, columnspan=2, sticky="w", padx=8, pady=4)
+
         actions = ttk.Frame(self.settings_tab)
-        actions.grid(row=9, column=0, columnspan=2, sticky="w", padx=8, pady=(8, 0))
+        actions.grid(row=10, column=0, columnspan=2, sticky="w", padx=8, pady=(8, 0))
         ttk.Button(actions, text="Aplicar", command=self._apply_settings).grid(row=0, column=0, padx=(0, 6))
         ttk.Button(actions, text="Restaurar padrão", command=self._reset_settings).grid(row=0, column=1)
 
         self.settings_status_var = tk.StringVar(value="")
         ttk.Label(self.settings_tab, textvariable=self.settings_status_var).grid(
-            row=10,
+            row=11,
             column=0,
             columnspan=2,
             sticky="w",
@@ -152,6 +159,7 @@ class SettingsTabMixin:
         self.ui_font_size = ui_font_size
         self.mono_font_family = self.mono_font_family_var.get().strip()
         self.mono_font_size = mono_font_size
+        self.syntax_highlight = bool(self.syntax_highlight_var.get())
         if not self.ui_font_family or not self.mono_font_family:
             if hasattr(self, "_get_default_font_settings"):
                 default_ui_family, _, default_mono_family, _ = self._get_default_font_settings()
@@ -164,6 +172,8 @@ class SettingsTabMixin:
         self.settings_status_var.set("Configurações aplicadas.")
         if hasattr(self, "_apply_theme_settings"):
             self._apply_theme_settings()
+        if hasattr(self, "_apply_syntax_highlight_setting"):
+            self._apply_syntax_highlight_setting()
         if hasattr(self, "_persist_settings"):
             self._persist_settings()
         if self.repo_ready:
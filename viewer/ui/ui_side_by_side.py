@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import difflib
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+from ..core.models import AlignedRow
+
+_ROW_TAGS = {
+    "hunk": ("meta", "meta"),
+    "context": ("", ""),
+    "changed": ("removed", "added"),
+    "removed": ("removed", "filler"),
+    "added": ("filler", "added"),
+}
+
+
+class SideBySideDiffView(ttk.Frame):
+    # Old/new panes share one virtual scroll: only the rows that fit on screen
+    # are ever inserted, so render cost does not grow with the patch size.
+    def __init__(self, master: tk.Misc, unified: tuple[tk.Widget, ...]) -> None:
+        super().__init__(master)
+        self.unified = unified
+        self.rows: list[AlignedRow] = []
+        self.top = 0
+        self.limit: int | None = None
+        self.chunk = 0
+        self.status_var: tk.StringVar | None = None
+        self.active = False
+        # False while the full rows are still being aligned off the Tk thread.
+        self.complete = True
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1, uniform="side")
+        self.grid_columnconfigure(1, weight=1, uniform="side")
+        self.old_text = tk.Text(self, wrap="none", font="TkFixedFont", state="disabled")
+        self.old_text.grid(row=0, column=0, sticky="nsew")
+        self.new_text = tk.Text(self, wrap="none", font="TkFixedFont", state="disabled")
+        self.new_text.grid(row=0, column=1, sticky="nsew", padx=(2, 0))
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=2, sticky="ns")
+        self.panes = (self.old_text, self.new_text)
+        for pane in self.panes:
+            pane.bind("<MouseWheel>", self._on_mousewheel)
+            pane.bind("<Button-4>", lambda _e: self._scroll_by(-3))
+            pane.bind("<Button-5>", lambda _e: self._scroll_by(3))
+            pane.bind("<Up>", lambda _e: self._scroll_by(-1))
+            pane.bind("<Down>", lambda _e: self._scroll_by(1))
+            pane.bind("<Prior>", lambda _e: self._scroll_by(-self._page_size()))
+            pane.bind("<Next>", lambda _e: self._scroll_by(self._page_size()))
+            pane.bind("<Home>", lambda _e: self._scroll_to(0))
+            pane.bind("<End>", lambda _e: self._scroll_to(self._total_rows()))
+            pane.bind("<Button-1>", lambda _e, widget=pane: widget.focus_set())
+            pane.tag_bind("read_more", "<Button-1>", lambda _e: self.expand(self.chunk))
+        self.old_text.bind("<Configure>", lambda _e: self._render())
+
+    @property
+    def omitted(self) -> int:
+        if self.limit is None:
+            return 0
+        return max(len(self.rows) - self.limit, 0)
+
+    def show_rows(
+        self,
+        rows: list[AlignedRow],
+        limit: int | None,
+        chunk: int,
+        status_var: tk.StringVar | None,
+        complete: bool = True,
+    ) -> None:
+        self.rows = rows
+        self.complete = complete
+        self.limit = limit if limit is not None and (limit < len(rows) or not complete) else None
+        self.chunk = chunk
+        self.status_var = status_var
+        self.top = 0
+        self.activate()
+        self._render()
+
+    def update_rows(self, rows: list[AlignedRow]) -> None:
+        # The full alignment arrived: keeps the scroll and the read-mode cap.
+        self.rows = rows
+        self.complete = True
+        if self.limit is not None and self.limit >= len(rows):
+            self.limit = None
+        self._render()
+
+    def expand(self, count: int | None) -> bool:
+        if self.limit is None or not self.complete:
+            return False
+        self.limit = None if count is None else self.limit + count
+        if self.limit is not None and self.limit >= len(self.rows):
+            self.limit = None
+        self._render()
+        return True
+
+    def activate(self) -> None:
+        if self.active:
+            return
+        for widget in self.unified:
+            widget.grid_remove()
+        self.grid()
+        self.active = True
+
+    def deactivate(self) -> None:
+        if not self.active:
+            return
+        self.grid_remove()
+        for widget in self.unified:
+            widget.grid()
+        self.active = False
+
+    def _shown_rows(self) -> int:
+        return len(self.rows) if self.limit is None else min(self.limit, len(self.rows))
+
+    def _total_rows(self) -> int:
+        return self._shown_rows() + (1 if self.omitted or not self.complete else 0)
+
+    def _page_size(self) -> int:
+        linespace = tkfont.nametofont("TkFixedFont").metrics("linespace") or 1
+        return max(self.old_text.winfo_height() // linespace, 1)
+
+    def _scroll_to(self, top: int) -> str:
+        top = max(min(top, self._total_rows() - self._page_size()), 0)
+        if top != self.top:
+            self.top = top
+            self._render()
+        return "break"
+
+    def _scroll_by(self, delta: int) -> str:
+        return self._scroll_to(self.top + delta)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        step = -1 if event.delta > 0 else 1
+        return self._scroll_by(step * max(abs(event.delta) // 40, 1))
+
+    def _on_scrollbar(self, action: str, *args: str) -> None:
+        total = self._total_rows()
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * total))
+        elif action == "scroll":
+            amount = int(args[0])
+            self._scroll_by(amount * self._page_size() if args[1] == "pages" else amount)
+
+    def _render(self) -> None:
+        if not self.active:
+            return
+        total = self._total_rows()
+        page = self._page_size()
+        end = min(self.top + page, total)
+        shown = self._shown_rows()
+        old_lines: list[str] = []
+        new_lines: list[str] = []
+        old_tags: dict[str, list[str]] = {}
+        new_tags: dict[str, list[str]] = {}
+        for offset, index in enumerate(range(self.top, end), start=1):
+            if index >= shown and not self.complete:
+                old_lines.append("... (alinhando o restante do diff...) ...")
+                new_lines.append("")
+                old_tags.setdefault("meta", []).extend((f"{offset}.0", f"{offset}.end"))
+                continue
+            if index >= shown:
+                marker = (
+                    f"... ({self.omitted} linhas omitidas no modo leitura, "
+                    f"clique para carregar mais {min(self.chunk, self.omitted)}) ..."
+                )
+                old_lines.append(marker)
+                new_lines.append("")
+                old_tags.setdefault("read_more", []).extend((f"{offset}.0", f"{offset}.end"))
+                continue
+            row = self.rows[index]
+            old_tag, new_tag = _ROW_TAGS.get(row.kind, ("", ""))
+            old_lines.append(self._format_side(row.kind, row.old_line, row.old_text))
+            new_lines.append(self._format_side(row.kind, row.new_line, row.new_text))
+            if old_tag:
+                old_tags.setdefault(old_tag, []).extend((f"{offset}.0", f"{offset + 1}.0"))
+            if new_tag:
+                new_tags.setdefault(new_tag, []).extend((f"{offset}.0", f"{offset + 1}.0"))
+            if row.kind == "changed":
+                self._collect_word_changes(offset, row, old_tags, new_tags)
+        self._fill_pane(self.old_text, old_lines, old_tags)
+        self._fill_pane(self.new_text, new_lines, new_tags)
+        if total:
+            self.scrollbar.set(self.top / total, end / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        if self.status_var is not None:
+            if not self.complete:
+                self.status_var.set("Alinhando diff lado a lado...")
+            elif self.omitted:
+                self.status_var.set(f"Modo leitura: {shown}/{len(self.rows)} linhas")
+            else:
+                self.status_var.set("")
+
+    @staticmethod
+    def _format_side(kind: str, line: int, text: str) -> str:
+        if kind == "hunk":
+            return text
+        if not line:
+            return ""
+        return f"{line:>6}  {text}"
+
+    @staticmethod
+    def _collect_word_changes(
+        offset: int,
+        row: AlignedRow,
+        old_tags: dict[str, list[str]],
+        new_tags: dict[str, list[str]],
+    ) -> None:
+        # Only visible rows reach here, so the intraline diff stays cheap.
+        prefix = 8
+        matcher = difflib.SequenceMatcher(None, row.old_text, row.new_text, autojunk=False)
+        for op, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+            if op == "equal":
+                continue
+            if old_end > old_start:
+                old_tags.setdefault("removed_word", []).extend(
+                    (f"{offset}.{prefix + old_start}", f"{offset}.{prefix + old_end}")
+                )
+            if new_end > new_start:
+                new_tags.setdefault("added_word", []).extend(
+                    (f"{offset}.{prefix + new_start}", f"{offset}.{prefix + new_end}")
+                )
+
+    @staticmethod
+    def _fill_pane(pane: tk.Text, lines: list[str], tags: dict[str, list[str]]) -> None:
+        pane.configure(state="normal")
+        pane.delete("1.0", tk.END)
+        pane.insert("1.0", "\n".join(lines))
+        for tag, indexes in tags.items():
+            pane.tag_add(tag, *indexes)
+        pane.configure(state="disabled")
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import tkinter as tk
+from typing import Callable
 from tkinter import messagebox, ttk
 
-from ..core.diff_utils import render_patch_to_widget
 from ..core.git_client import run_git
+from ..core.stash_store import StashEntry, load_stash_diff, load_stashes, run_stash_action
 
 
 class StashMixin:
@@ -38,16 +39,13 @@ class StashMixin:
             args = ["stash", "push", "-u"]
             if message:
                 args.extend(["-m", message])
-            try:
-                run_git(self.repo_path, args)
-            except RuntimeError as exc:
-                messagebox.showerror("Stash", str(exc))
-                return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            stash_message_var.set("")
-            self._refresh_status()
-            refresh_list()
+            repo_path = self.repo_path
+
+            def done() -> None:
+                stash_message_var.set("")
+                self._refresh_status()
+
+            run_action("Criar stash", lambda: run_git(repo_path, args), done)
 
         ttk.Button(top_bar, text="Criar stash", command=create_stash).grid(row=0, column=2, padx=(0, 6))
         ttk.Button(top_bar, text="Atualizar", command=lambda: refresh_list()).grid(row=0, column=3)
@@ -91,86 +89,137 @@ class StashMixin:
         actions = ttk.Frame(container)
         actions.grid(row=2, column=0, columnspan=2, sticky="w", pady=(6, 0))
 
-        stash_refs: list[str] = []
+        # Entries carry their stash commit; diffs are cached by it in
+        # self.stash_diff_cache, so they survive stash@{n} renumbering.
+        stash_entries: list[StashEntry] = []
+        stash_channel = f"stash_diff:{window}"
+        busy = [False]
 
-        def selected_ref() -> str | None:
+        def selected_entry() -> StashEntry | None:
             selection = stash_listbox.curselection()
-            if not selection:
+            if not selection or selection[0] >= len(stash_entries):
                 return None
-            return stash_refs[selection[0]]
+            return stash_entries[selection[0]]
+
+        def diff_loader(entry: StashEntry) -> Callable[[], str]:
+            repo_path = self.repo_path
+            return lambda: load_stash_diff(repo_path, entry.commit_hash, self.stash_diff_cache)
 
         def show_selected_stash() -> None:
-            ref = selected_ref()
-            if not ref:
+            entry = selected_entry()
+            if not entry:
+                self.diff_service.cancel(stash_channel)
                 self._set_text(stash_diff_text, "(sem stash selecionado)")
                 stash_read_mode_var.set("")
                 return
-            try:
-                diff = run_git(self.repo_path, ["stash", "show", "-p", ref])
-            except RuntimeError as exc:
-                messagebox.showerror("Stash", str(exc))
-                return
-            display_diff, truncated, shown, total = self._apply_read_mode_to_diff(diff)
-            render_patch_to_widget(
-                stash_diff_text,
-                display_diff,
-                read_only=True,
-                show_file_headers=True,
-                word_diff=self._word_diff_enabled(),
-            )
-            if truncated:
-                stash_read_mode_var.set(f"Modo leitura: {shown}/{total} linhas")
+            cached = self.stash_diff_cache.get(entry.commit_hash)
+            if cached is not None:
+                self.diff_service.cancel(stash_channel)
+                self._render_diff_view(stash_diff_text, cached, stash_read_mode_var, show_file_headers=True)
             else:
+                self._set_text(stash_diff_text, "Carregando stash...")
                 stash_read_mode_var.set("")
 
-        def refresh_list() -> None:
-            stash_listbox.delete(0, tk.END)
-            stash_refs.clear()
-            try:
-                entries = run_git(self.repo_path, ["stash", "list"]).splitlines()
-            except RuntimeError as exc:
-                messagebox.showerror("Stash", str(exc))
+                def done(diff: object) -> None:
+                    if stash_diff_text.winfo_exists():
+                        self._render_diff_view(stash_diff_text, str(diff), stash_read_mode_var, show_file_headers=True)
+
+                def error(exc: Exception) -> None:
+                    messagebox.showerror("Stash", str(exc), parent=window)
+
+                self.diff_service.request(
+                    stash_channel,
+                    ("stash", self.repo_path, entry.commit_hash),
+                    diff_loader(entry),
+                    done,
+                    error,
+                )
+            # Walking down the list is the common case.
+            index = stash_entries.index(entry) + 1
+            if index < len(stash_entries):
+                neighbor = stash_entries[index]
+                if self.stash_diff_cache.get(neighbor.commit_hash) is None:
+                    self.diff_service.prefetch(
+                        ("stash", self.repo_path, neighbor.commit_hash),
+                        diff_loader(neighbor),
+                        lambda _diff: None,
+                    )
+
+        def render_list(entries: list[StashEntry]) -> None:
+            if not stash_listbox.winfo_exists():
                 return
-            for line in entries:
-                ref, _, desc = line.partition(":")
-                stash_refs.append(ref.strip())
-                stash_listbox.insert(tk.END, f"{ref.strip()}:{desc}")
-            if stash_refs:
-                stash_listbox.selection_set(0)
-                show_selected_stash()
-            else:
+            previous = selected_entry()
+            stash_entries[:] = entries
+            stash_listbox.delete(0, tk.END)
+            for entry in entries:
+                stash_listbox.insert(tk.END, entry.label)
+            if not entries:
                 self._set_text(stash_diff_text, "(sem stashes)")
+                return
+            hashes = [entry.commit_hash for entry in entries]
+            index = hashes.index(previous.commit_hash) if previous and previous.commit_hash in hashes else 0
+            stash_listbox.selection_set(index)
+            stash_listbox.see(index)
+            show_selected_stash()
+
+        def refresh_list() -> None:
+            repo_path = self.repo_path
+            self._run_async(
+                f"stash_list:{window}",
+                "Listar stashes",
+                lambda: load_stashes(repo_path),
+                render_list,
+                lambda exc: messagebox.showerror("Stash", str(exc), parent=window),
+            )
+
+        def run_action(
+            label: str,
+            task: Callable[[], object],
+            on_done: Callable[[], None] | None = None,
+        ) -> None:
+            # One git write at a time; the list reloads afterwards either way.
+            if busy[0]:
+                return
+            busy[0] = True
+
+            def success(_result: object) -> None:
+                busy[0] = False
+                if hasattr(self, "_bump_repo_state"):
+                    self._bump_repo_state()
+                if on_done is not None:
+                    on_done()
+                if window.winfo_exists():
+                    refresh_list()
+
+            def error(exc: Exception) -> None:
+                busy[0] = False
+                messagebox.showerror("Stash", str(exc), parent=window if window.winfo_exists() else None)
+                if window.winfo_exists():
+                    refresh_list()
+
+            self._run_async(f"stash_action:{window}", label, task, success, error)
 
         def apply_stash(pop: bool) -> None:
-            ref = selected_ref()
-            if not ref:
+            entry = selected_entry()
+            if not entry:
                 messagebox.showinfo("Stash", "Selecione um stash.")
                 return
-            cmd = ["stash", "pop" if pop else "apply", ref]
-            try:
-                run_git(self.repo_path, cmd)
-            except RuntimeError as exc:
-                messagebox.showerror("Stash", str(exc))
-                return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            self._refresh_status()
-            self._reload_commits()
-            refresh_list()
+            repo_path = self.repo_path
+
+            def done() -> None:
+                self._refresh_status()
+                self._reload_commits()
+
+            action = "pop" if pop else "apply"
+            run_action("Aplicar stash", lambda: run_stash_action(repo_path, action, entry), done)
 
         def drop_stash() -> None:
-            ref = selected_ref()
-            if not ref:
+            entry = selected_entry()
+            if not entry:
                 messagebox.showinfo("Stash", "Selecione um stash.")
                 return
-            try:
-                run_git(self.repo_path, ["stash", "drop", ref])
-            except RuntimeError as exc:
-                messagebox.showerror("Stash", str(exc))
-                return
-            if hasattr(self, "_bump_repo_state"):
-                self._bump_repo_state()
-            refresh_list()
+            repo_path = self.repo_path
+            run_action("Descartar stash", lambda: run_stash_action(repo_path, "drop", entry))
 
         ttk.Button(actions, text="Aplicar", command=lambda: apply_stash(pop=False)).grid(row=0, column=0, padx=(0, 6))
         ttk.Button(actions, text="Aplicar e remover", command=lambda: apply_stash(pop=True)).grid(
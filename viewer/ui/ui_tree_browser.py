@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ..core.models import TreeEntry
+from ..core.revision_tree import BLOB_PREVIEW_BYTES, is_binary, load_tree, read_blob_head, resolve_tree
+
+# Children inserted per expansion; the rest wait behind a "more" row so a
+# directory with 100k entries opens as fast as a small one.
+TREE_PAGE_ENTRIES = 1000
+_PLACEHOLDER = "(carregando...)"
+# Row ids are paths; helper rows append a separator that paths never contain.
+_MORE = "\x1fmore"
+_PLACEHOLDER_SUFFIX = "\x1fplaceholder"
+
+
+def format_size(size: int) -> str:
+    if size < 0:
+        return ""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return ""
+
+
+class TreeBrowserWindow(tk.Toplevel):
+    # Files of one commit. Directories are listed when first opened and the
+    # listings come from the app-wide TreeCache, keyed by tree id.
+    def __init__(self, app: tk.Tk, commit_hash: str) -> None:
+        super().__init__(app)
+        self.app = app
+        self.commit_hash = commit_hash
+        # iid -> (path, entry); directories also track their pending entries.
+        self.nodes: dict[str, tuple[str, TreeEntry]] = {}
+        self.pending: dict[str, list[TreeEntry]] = {}
+        self.loaded: set[str] = set()
+        self.title(f"Arvore - {commit_hash[:10]}")
+        self.geometry("1100x700")
+
+        paned = ttk.PanedWindow(self, orient="horizontal")
+        paned.pack(fill="both", expand=True, padx=8, pady=8)
+
+        tree_frame = ttk.Frame(paned)
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        self.tree = ttk.Treeview(tree_frame, columns=("size",), selectmode="browse")
+        self.tree.heading("#0", text="Nome", anchor="w")
+        self.tree.heading("size", text="Tamanho", anchor="e")
+        self.tree.column("size", width=90, stretch=False, anchor="e")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        tree_scroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        tree_scroll.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree.bind("<<TreeviewOpen>>", lambda _e: self._on_open())
+        self.tree.bind("<<TreeviewSelect>>", lambda _e: self._on_select())
+        self.tree.bind("<Double-Button-1>", lambda _e: self._open_content())
+        self.tree.bind("<Return>", lambda _e: self._open_content())
+
+        preview_frame = ttk.Frame(paned)
+        preview_frame.grid_rowconfigure(1, weight=1)
+        preview_frame.grid_columnconfigure(0, weight=1)
+        self.preview_var = tk.StringVar(value="")
+        ttk.Label(preview_frame, textvariable=self.preview_var).grid(row=0, column=0, sticky="w", pady=(0, 4))
+        self.preview_text = tk.Text(preview_frame, wrap="none", font="TkFixedFont", state="disabled")
+        self.preview_text.grid(row=1, column=0, sticky="nsew")
+        preview_scroll = ttk.Scrollbar(preview_frame, orient="vertical", command=self.preview_text.yview)
+        preview_scroll.grid(row=1, column=1, sticky="ns")
+        self.preview_text.configure(yscrollcommand=preview_scroll.set)
+
+        palette = getattr(app, "theme_palette", None)
+        if palette and hasattr(app, "_apply_text_widget_theme"):
+            app._apply_text_widget_theme(self.preview_text, palette)
+
+        paned.add(tree_frame, weight=1)
+        paned.add(preview_frame, weight=2)
+        self._load_root()
+
+    def _load_root(self) -> None:
+        repo_path = self.app.repo_path
+        cache = self.app.tree_cache
+        commit_hash = self.commit_hash
+
+        def task() -> tuple[str, list[TreeEntry]]:
+            tree_id = resolve_tree(repo_path, commit_hash)
+            return tree_id, load_tree(repo_path, tree_id, cache)
+
+        def success(result: tuple[str, list[TreeEntry]]) -> None:
+            if not self.winfo_exists():
+                return
+            _tree_id, entries = result
+            self.pending[""] = list(entries)
+            self.loaded.add("")
+            self._insert_page("")
+
+        def error(exc: Exception) -> None:
+            messagebox.showerror("Arvore", str(exc), parent=self)
+
+        self.app._run_async(f"tree_root:{id(self)}", "Carregar arvore", task, success, error)
+
+    def _insert_page(self, parent: str) -> None:
+        # Inserts the next page of ``parent``'s children and, when more are
+        # waiting, a row that loads the following page when selected.
+        more = f"{parent}{_MORE}"
+        if self.tree.exists(more):
+            self.tree.delete(more)
+        entries = self.pending.get(parent, [])
+        page, rest = entries[:TREE_PAGE_ENTRIES], entries[TREE_PAGE_ENTRIES:]
+        base = self.nodes[parent][0] + "/" if parent else ""
+        for entry in page:
+            path = base + entry.name
+            iid = path
+            self.nodes[iid] = (path, entry)
+            if entry.kind == "tree":
+                self.tree.insert(parent, "end", iid=iid, text=f"{entry.name}/", open=False)
+                self.tree.insert(iid, "end", iid=f"{iid}{_PLACEHOLDER_SUFFIX}", text=_PLACEHOLDER)
+            elif entry.kind == "commit":
+                self.tree.insert(parent, "end", iid=iid, text=f"{entry.name} (submodulo)")
+            else:
+                self.tree.insert(parent, "end", iid=iid, text=entry.name, values=(format_size(entry.size),))
+        if rest:
+            self.pending[parent] = rest
+            self.tree.insert(parent, "end", iid=more, text=f"(+{len(rest)} itens, clique para carregar)")
+        else:
+            self.pending.pop(parent, None)
+
+    def _on_open(self) -> None:
+        iid = self.tree.focus()
+        node = self.nodes.get(iid)
+        if node is None or iid in self.loaded:
+            return
+        self.loaded.add(iid)
+        _path, entry = node
+        repo_path = self.app.repo_path
+        cache = self.app.tree_cache
+        cached = cache.get(entry.object_id)
+        if cached is not None:
+            self._show_children(iid, cached)
+            return
+
+        def task() -> list[TreeEntry]:
+            return load_tree(repo_path, entry.object_id, cache)
+
+        def success(entries: list[TreeEntry]) -> None:
+            if self.winfo_exists() and self.tree.exists(iid):
+                self._show_children(iid, entries)
+
+        def error(exc: Exception) -> None:
+            self.loaded.discard(iid)
+            messagebox.showerror("Arvore", str(exc), parent=self)
+
+        self.app._run_async(f"tree:{id(self)}:{iid}", "", task, success, error)
+
+    def _show_children(self, iid: str, entries: list[TreeEntry]) -> None:
+        placeholder = f"{iid}{_PLACEHOLDER_SUFFIX}"
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+        self.pending[iid] = list(entries)
+        self._insert_page(iid)
+
+    def _on_select(self) -> None:
+        iid = self.tree.focus()
+        if iid.endswith(_MORE):
+            self._insert_page(iid[: -len(_MORE)])
+            return
+        node = self.nodes.get(iid)
+        if node is None or node[1].kind != "blob":
+            return
+        path, entry = node
+        repo_path = self.app.repo_path
+        self.preview_var.set(f"{path} ({format_size(entry.size)})")
+        self.app._set_text(self.preview_text, "Carregando...")
+
+        def task() -> tuple[bytes, bool]:
+            return read_blob_head(repo_path, entry.object_id)
+
+        def success(result: tuple[bytes, bool]) -> None:
+            if not self.winfo_exists() or self.tree.focus() != iid:
+                return
+            data, truncated = result
+            if is_binary(data):
+                content = f"Arquivo binario ({format_size(entry.size)}). Duplo clique abre a visao hex."
+            else:
+                content = data.decode("utf-8", errors="replace")
+                if truncated:
+                    content += (
+                        f"\n... (previa limitada a {format_size(BLOB_PREVIEW_BYTES)}; duplo clique abre o arquivo todo)"
+                    )
+            self.app._set_text(self.preview_text, content)
+
+        def error(exc: Exception) -> None:
+            if self.winfo_exists():
+                self.app._set_text(self.preview_text, str(exc))
+
+        self.app._run_async(f"tree_blob:{id(self)}", "", task, success, error)
+
+    def _open_content(self) -> None:
+        node = self.nodes.get(self.tree.focus())
+        if node is not None and node[1].kind == "blob":
+            path, entry = node
+            self.app._open_blob_viewer(self.commit_hash, path, entry.object_id)
+
+
+class TreeBrowserMixin:
+    def _open_tree_browser(self, commit_hash: str | None = None) -> None:
+        commit_hash = commit_hash or self.current_commit_hash
+        if not self.repo_ready or not commit_hash:
+            messagebox.showinfo("Arvore", "Selecione um commit no Historico.")
+            return
+        TreeBrowserWindow(self, commit_hash)
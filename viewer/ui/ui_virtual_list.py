@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Callable
+
+from ..core.virtual_list import ListViewport
+
+_BINDTAG = "VirtualListbox"
+
+
+class VirtualListbox(tk.Canvas):
+    # Listbox look-alike that draws only the rows on screen from ``row_text``.
+    # Canvas items are pooled per visible slot, so scrolling 1M rows costs the
+    # same as scrolling 100. Exposes the Listbox calls the History tab uses.
+    def __init__(
+        self,
+        master: tk.Misc,
+        row_text: Callable[[int], str],
+        yscrollcommand: Callable[[str, str], None] | None = None,
+        on_redraw: Callable[[range, int], None] | None = None,
+    ) -> None:
+        super().__init__(master, highlightthickness=1, borderwidth=0, takefocus=1)
+        self.viewport = ListViewport()
+        self.row_text = row_text
+        self.yscrollcommand = yscrollcommand
+        # Side columns (the commit graph) repaint from the same visible rows.
+        self.on_redraw = on_redraw
+        self.message = ""
+        self.font = tkfont.nametofont("TkDefaultFont")
+        self.foreground = "#1f2328"
+        self.select_background = "#cce0ff"
+        self.select_foreground = "#1f2328"
+        self._rects: list[int] = []
+        self._texts: list[int] = []
+        self._active_outline = self.create_rectangle(0, 0, 0, 0, outline="", dash=(1, 1))
+        if not self.bind_class(_BINDTAG):
+            self._bind_class_events()
+        self.bindtags((str(self), _BINDTAG, str(self.winfo_toplevel()), "all"))
+
+    def configure_colors(self, background: str, foreground: str, select_background: str, select_foreground: str) -> None:
+        self.configure(background=background)
+        self.foreground = foreground
+        self.select_background = select_background
+        self.select_foreground = select_foreground
+        self.redraw()
+
+    def set_size(self, size: int) -> None:
+        self.viewport.set_size(size)
+        self.redraw()
+
+    def set_message(self, message: str) -> None:
+        self.message = message
+        self.redraw()
+
+    def size(self) -> int:
+        return self.viewport.size
+
+    def curselection(self) -> tuple[int, ...]:
+        return self.viewport.curselection()
+
+    def selection_set(self, first: int, last: int | None = None) -> None:
+        self.viewport.select_range(first, first if last is None else last)
+        self.redraw()
+
+    def selection_clear(self, _first: int | str = 0, _last: int | str | None = None) -> None:
+        self.viewport.clear_selection()
+        self.redraw()
+
+    def activate(self, index: int) -> None:
+        if 0 <= index < self.viewport.size:
+            self.viewport.active = index
+            self.viewport.anchor = index
+            self.redraw()
+
+    def see(self, index: int) -> None:
+        if self.viewport.see(index):
+            self.redraw()
+
+    def yview(self, *args: str) -> tuple[float, float] | None:  # type: ignore[override]
+        if not args:
+            return self.viewport.fractions()
+        if args[0] == "moveto":
+            changed = self.viewport.moveto(float(args[1]))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            step = self.viewport.visible if len(args) > 2 and args[2] == "pages" else 1
+            changed = self.viewport.scroll_by(amount * step)
+        else:
+            changed = False
+        if changed:
+            self.redraw()
+        return None
+
+    def redraw(self) -> None:
+        row_height = self._row_height()
+        rows = self.viewport.visible_range()
+        self._ensure_pool(max(len(rows), 1))
+        width = max(self.winfo_width(), 1)
+        selection = self.viewport.selection
+        for slot, (rect, text) in enumerate(zip(self._rects, self._texts)):
+            if slot >= len(rows):
+                self.itemconfigure(rect, state="hidden")
+                self.itemconfigure(text, state="hidden")
+                continue
+            index = rows[slot]
+            top = slot * row_height
+            selected = index in selection
+            self.coords(rect, 0, top, width, top + row_height)
+            self.itemconfigure(rect, state="normal", fill=self.select_background if selected else "")
+            self.coords(text, 4, top + 1)
+            self.itemconfigure(
+                text,
+                state="normal",
+                text=self.row_text(index),
+                fill=self.select_foreground if selected else self.foreground,
+            )
+        if not rows and self.message:
+            self.coords(self._texts[0], 4, 1)
+            self.itemconfigure(self._texts[0], state="normal", text=self.message, fill=self.foreground)
+        self._draw_active(rows, row_height, width)
+        if self.on_redraw is not None:
+            self.on_redraw(rows, row_height)
+        if self.yscrollcommand is not None:
+            first, last = self.viewport.fractions()
+            self.yscrollcommand(str(first), str(last))
+
+    def _draw_active(self, rows: range, row_height: int, width: int) -> None:
+        active = self.viewport.active
+        try:
+            focused = self.focus_get() is self
+        except KeyError:
+            # focus_get fails while a ttk popdown owns the focus.
+            focused = False
+        if active in rows and focused:
+            top = (active - rows.start) * row_height
+            self.coords(self._active_outline, 1, top, width - 1, top + row_height - 1)
+            self.itemconfigure(self._active_outline, outline=self.foreground)
+            self.tag_raise(self._active_outline)
+        else:
+            self.itemconfigure(self._active_outline, outline="")
+
+    def _row_height(self) -> int:
+        return self.font.metrics("linespace") + 2
+
+    def _ensure_pool(self, count: int) -> None:
+        while len(self._rects) < count:
+            self._rects.append(self.create_rectangle(0, 0, 0, 0, outline="", state="hidden"))
+            self._texts.append(
+                self.create_text(0, 0, anchor="nw", font=self.font, state="hidden"),
+            )
+
+    def _row_at(self, y: int) -> int | None:
+        return self.viewport.index_at(y // self._row_height())
+
+    def _select_at(self, y: int, mode: str) -> None:
+        index = self._row_at(y)
+        if index is None:
+            return
+        self.viewport.select(index, mode)
+        self.redraw()
+        self.event_generate("<<ListboxSelect>>")
+
+    def _move_active(self, delta: int, mode: str) -> None:
+        if self.viewport.size == 0:
+            return
+        index = max(0, min(self.viewport.active + delta, self.viewport.size - 1))
+        self.viewport.select(index, mode)
+        self.viewport.see(index)
+        self.redraw()
+        self.event_generate("<<ListboxSelect>>")
+
+    def _on_configure(self) -> None:
+        self.viewport.set_visible(self.winfo_height() // self._row_height())
+        self.redraw()
+
+    def _on_wheel(self, delta: int) -> None:
+        # Redraw even at the edges so yscrollcommand still reports the end.
+        self.viewport.scroll_by(delta)
+        self.redraw()
+
+    def _on_drag(self, y: int) -> None:
+        if y < 0:
+            self.viewport.scroll_by(-1)
+            y = 0
+        elif y >= self.winfo_height():
+            self.viewport.scroll_by(1)
+            y = self.winfo_height() - 1
+        index = self._row_at(y)
+        if index is not None and index != self.viewport.active:
+            self._select_at(y, "extend")
+        else:
+            self.redraw()
+
+    def _bind_class_events(self) -> None:
+        def on(sequence: str, handler: Callable[[VirtualListbox, tk.Event], None]) -> None:
+            def dispatch(event: tk.Event) -> str:
+                widget = event.widget
+                if isinstance(widget, VirtualListbox):
+                    handler(widget, event)
+                return "break"
+
+            self.bind_class(_BINDTAG, sequence, dispatch)
+
+        def click(widget: VirtualListbox, event: tk.Event, mode: str) -> None:
+            widget.focus_set()
+            widget._select_at(event.y, mode)
+
+        on("<Configure>", lambda w, _e: w._on_configure())
+        on("<FocusIn>", lambda w, _e: w.redraw())
+        on("<FocusOut>", lambda w, _e: w.redraw())
+        on("<Button-1>", lambda w, e: click(w, e, "set"))
+        on("<Shift-Button-1>", lambda w, e: click(w, e, "extend"))
+        on("<Control-Button-1>", lambda w, e: click(w, e, "toggle"))
+        on("<B1-Motion>", lambda w, e: w._on_drag(e.y))
+        on("<MouseWheel>", lambda w, e: w._on_wheel(-3 if e.delta > 0 else 3))
+        on("<Button-4>", lambda w, _e: w._on_wheel(-3))
+        on("<Button-5>", lambda w, _e: w._on_wheel(3))
+        on("<Up>", lambda w, _e: w._move_active(-1, "set"))
+        on("<Down>", lambda w, _e: w._move_active(1, "set"))
+        on("<Shift-Up>", lambda w, _e: w._move_active(-1, "extend"))
+        on("<Shift-Down>", lambda w, _e: w._move_active(1, "extend"))
+        on("<Prior>", lambda w, _e: w._move_active(-w.viewport.visible, "set"))
+        on("<Next>", lambda w, _e: w._move_active(w.viewport.visible, "set"))
+        on("<Home>", lambda w, _e: w._move_active(-w.viewport.size, "set"))
+        on("<End>", lambda w, _e: w._move_active(w.viewport.size, "set"))